@@ -1013,7 +1013,11 @@ async def main():
         return
 
     try:
+        from robothor.memory.ingestion import extraction_stats, reset_extraction_stats
+
+        reset_extraction_stats()
         results = await run_continuous_ingest()
+        extraction = extraction_stats()
 
         total_new = sum(r.get("new", 0) for r in results.values())
         total_errors = sum(r.get("errors", 0) for r in results.values())
@@ -1028,6 +1032,12 @@ async def main():
             total_errors,
             duration,
         )
+        if extraction["cache_hits"]:
+            logger.info(
+                "  extraction cache: %d LLM calls saved (%d made)",
+                extraction["cache_hits"],
+                extraction["llm_extractions"],
+            )
 
         # Write quality metrics to log file for observability
         metrics = {
@@ -1036,6 +1046,7 @@ async def main():
             "facts_extracted": total_new,
             "facts_skipped_dedup": total_skipped,
             "errors": total_errors,
+            "extraction": extraction,
             "sources": {name: dict(r) for name, r in results.items()},
         }
         metrics_path = LOGS_DIR / "ingest-metrics.jsonl"
@@ -26,6 +26,7 @@ Model: Llama 3.2 Vision 11B (44 tok/s on GB10, clean structured output)
 
 import asyncio
 import fcntl
+import hashlib
 import json
 import logging
 import os
@@ -95,9 +96,105 @@ async def phase_1_catchup_retry() -> dict[str, Any]:
 # ═══════════════════════════════════════════════════════════════════
 
 
+# Concurrent LLM calls per phase (Ollama serves a few requests in parallel)
+LLM_CONCURRENCY = 4
+
+# Evidence hashes from the last run — contacts whose inputs are unchanged
+# are skipped instead of re-prompting the LLM with identical evidence.
+EVIDENCE_STATE_PATH = MEMORY_DIR / "contact-evidence-hashes.json"
+
+_EMAIL_ADDR_RE = re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)+")
+
+
+def _load_email_entries() -> dict[str, Any]:
+    """Read the email log entries (empty when the log is missing/corrupt)."""
+    email_log_path = MEMORY_DIR / "email-log.json"
+    if not email_log_path.exists():
+        return {}
+    try:
+        return json.loads(email_log_path.read_text()).get("entries", {})
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _index_emails_by_sender(email_entries: dict[str, Any]) -> dict[str, list[dict]]:
+    """Map lowercased sender address → log entries, in log order.
+
+    Built once per phase so per-contact lookups don't rescan the whole log.
+    """
+    index: dict[str, list[dict]] = {}
+    for entry in email_entries.values():
+        for addr in set(_EMAIL_ADDR_RE.findall(entry.get("from", "") or "")):
+            index.setdefault(addr.lower(), []).append(entry)
+    return index
+
+
+def _index_conversations_by_email(conversations: list[dict]) -> dict[str, list[dict]]:
+    """Map contact email → CRM conversations."""
+    index: dict[str, list[dict]] = {}
+    for conv in conversations:
+        email = conv.get("contact_email", "")
+        if email:
+            index.setdefault(email, []).append(conv)
+    return index
+
+
+def _evidence_hash(evidence: str) -> str:
+    return hashlib.sha256(evidence.encode()).hexdigest()
+
+
+def _load_evidence_hashes() -> dict[str, dict[str, str]]:
+    if not EVIDENCE_STATE_PATH.exists():
+        return {}
+    try:
+        data = json.loads(EVIDENCE_STATE_PATH.read_text())
+        return data if isinstance(data, dict) else {}
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _save_evidence_hashes(section: str, hashes: dict[str, str]) -> None:
+    """Persist one phase's evidence hashes, preserving other phases' entries."""
+    state = _load_evidence_hashes()
+    state[section] = hashes
+    try:
+        EVIDENCE_STATE_PATH.write_text(json.dumps(state, indent=2))
+    except OSError as e:
+        logger.warning("Could not save evidence hashes: %s", e)
+
+
+def _contact_key(contact: dict) -> str:
+    return str(contact.get("id") or contact.get("email") or "")
+
+
+def _facts_mentioning(name: str) -> list[str]:
+    """Recent memory facts about a contact (blocking; run it in a thread)."""
+    with _get_dal_connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        cur.execute(
+            """
+            SELECT fact_text FROM memory_facts
+            WHERE %s = ANY(entities) OR fact_text ILIKE %s
+            ORDER BY created_at DESC LIMIT 10
+        """,
+            (name, f"%{name}%"),
+        )
+        return [r["fact_text"] for r in cur.fetchall()]
+
+
 async def phase_2_relationship_intelligence(llm_client) -> dict[str, Any]:
-    """Per-contact relationship analysis using Llama."""
-    results = {"contacts_analyzed": 0, "briefs_generated": 0, "errors": []}
+    """Per-contact relationship analysis using Llama.
+
+    Email and conversation indexes are built once; briefs are generated
+    concurrently (LLM_CONCURRENCY) and skipped when a contact's evidence
+    hash matches the one recorded at the last brief.
+    """
+    results = {
+        "contacts_analyzed": 0,
+        "briefs_generated": 0,
+        "skipped_unchanged": 0,
+        "errors": [],
+    }
 
     try:
         from crm_fetcher import fetch_all_contacts, fetch_conversations
@@ -107,69 +204,67 @@ async def phase_2_relationship_intelligence(llm_client) -> dict[str, Any]:
         contacts = fetch_all_contacts()
         conversations = fetch_conversations(hours=168)  # 7 days
 
-        # Index conversations by contact email
-        conv_by_email = {}
-        for conv in conversations:
-            email = conv.get("contact_email", "")
-            if email:
-                conv_by_email.setdefault(email, []).append(conv)
+        conv_by_email = _index_conversations_by_email(conversations)
+        emails_by_sender = _index_emails_by_sender(_load_email_entries())
 
-        # Read email log for cross-referencing
-        email_log_path = MEMORY_DIR / "email-log.json"
-        email_entries = {}
-        if email_log_path.exists():
-            email_log = json.loads(email_log_path.read_text())
-            email_entries = email_log.get("entries", {})
+        previous_hashes = _load_evidence_hashes().get("relationship_briefs", {})
+        brief_hashes = dict(previous_hashes)
+        semaphore = asyncio.Semaphore(LLM_CONCURRENCY)
 
-        for contact in contacts[:30]:  # cap at 30 contacts per run
-            try:
-                name = f"{contact['firstName']} {contact['lastName']}".strip()
-                if not name:
-                    continue
+        async def analyze(contact: dict) -> None:
+            name = f"{contact['firstName']} {contact['lastName']}".strip()
+            if not name:
+                return
 
-                results["contacts_analyzed"] += 1
+            results["contacts_analyzed"] += 1
 
-                # Gather data from all sources
-                contact_convs = conv_by_email.get(contact.get("email", ""), [])
-                contact_emails = [
-                    e
-                    for e in email_entries.values()
-                    if contact.get("email", "N/A") in e.get("from", "")
-                ][-5:]  # last 5 emails
+            # Gather data from all sources
+            contact_email = contact.get("email", "")
+            contact_convs = conv_by_email.get(contact_email, [])
+            contact_emails = emails_by_sender.get(contact_email.lower(), [])[-5:]
 
+            async with semaphore:
                 memory_facts = await search_facts(name, limit=5)
 
-                # Build context for Llama
-                context_parts = [f"Contact: {name}"]
-                if contact.get("jobTitle"):
-                    context_parts.append(f"Title: {contact['jobTitle']}")
-                if contact.get("company"):
-                    context_parts.append(f"Company: {contact['company']}")
-
-                if contact_emails:
-                    context_parts.append(f"\nRecent emails ({len(contact_emails)}):")
-                    for e in contact_emails[-3:]:
-                        context_parts.append(
-                            f"  - {e.get('subject', '')} ({e.get('processedAt', '')[:10]})"
-                        )
+            # Build context for Llama
+            context_parts = [f"Contact: {name}"]
+            if contact.get("jobTitle"):
+                context_parts.append(f"Title: {contact['jobTitle']}")
+            if contact.get("company"):
+                context_parts.append(f"Company: {contact['company']}")
+
+            if contact_emails:
+                context_parts.append(f"\nRecent emails ({len(contact_emails)}):")
+                for e in contact_emails[-3:]:
+                    context_parts.append(
+                        f"  - {e.get('subject', '')} ({e.get('processedAt', '')[:10]})"
+                    )
+
+            if contact_convs:
+                context_parts.append(f"\nCRM conversations ({len(contact_convs)}):")
+                for c in contact_convs[-3:]:
+                    last_msg = c["messages"][-1]["content"][:100] if c.get("messages") else ""
+                    context_parts.append(f"  - Conv #{c['id']}: {last_msg}")
 
-                if contact_convs:
-                    context_parts.append(f"\nCRM conversations ({len(contact_convs)}):")
-                    for c in contact_convs[-3:]:
-                        last_msg = c["messages"][-1]["content"][:100] if c.get("messages") else ""
-                        context_parts.append(f"  - Conv #{c['id']}: {last_msg}")
+            if memory_facts:
+                context_parts.append(f"\nMemory facts ({len(memory_facts)}):")
+                for f in memory_facts[:3]:
+                    context_parts.append(f"  - {f.get('fact_text', '')[:100]}")
 
-                if memory_facts:
-                    context_parts.append(f"\nMemory facts ({len(memory_facts)}):")
-                    for f in memory_facts[:3]:
-                        context_parts.append(f"  - {f.get('fact_text', '')[:100]}")
+            context = "\n".join(context_parts)
 
-                context = "\n".join(context_parts)
+            # Skip contacts with no recent activity
+            if not contact_emails and not contact_convs and not memory_facts:
+                return
 
-                # Skip contacts with no recent activity
-                if not contact_emails and not contact_convs and not memory_facts:
-                    continue
+            # Skip contacts whose evidence hasn't changed since the last brief
+            key = _contact_key(contact) or name
+            evidence_hash = _evidence_hash(context)
+            if previous_hashes.get(key) == evidence_hash:
+                results["skipped_unchanged"] += 1
+                return
 
+            async with semaphore:
                 brief = await llm_client.generate(
                     prompt=f"""Analyze this contact's relationship with the user. Write a concise brief (3-5 sentences) covering:
 - Engagement level (how often they interact)
@@ -186,28 +281,36 @@ Write the brief directly, no preamble.""",
                     max_tokens=300,
                 )
 
-                # Store as fact
-                try:
-                    from robothor.memory.ingestion import ingest_content
-
-                    await ingest_content(
-                        content=f"Relationship Brief for {name}: {brief}",
-                        source_channel="crm",
-                        content_type="contact",
-                        metadata={
-                            "type": "relationship_brief",
-                            "contact_name": name,
-                            "contact_email": contact.get("email"),
-                            "generated_at": datetime.now(UTC).isoformat(),
-                        },
-                    )
-                    results["briefs_generated"] += 1
-                except Exception as e:
-                    results["errors"].append(f"brief_store:{name}:{e}")
+            # Store as fact
+            try:
+                from robothor.memory.ingestion import ingest_content
 
+                await ingest_content(
+                    content=f"Relationship Brief for {name}: {brief}",
+                    source_channel="crm",
+                    content_type="contact",
+                    metadata={
+                        "type": "relationship_brief",
+                        "contact_name": name,
+                        "contact_email": contact.get("email"),
+                        "generated_at": datetime.now(UTC).isoformat(),
+                    },
+                )
+                results["briefs_generated"] += 1
+                brief_hashes[key] = evidence_hash
+            except Exception as e:
+                results["errors"].append(f"brief_store:{name}:{e}")
+
+        async def analyze_safely(contact: dict) -> None:
+            try:
+                await analyze(contact)
             except Exception as e:
                 results["errors"].append(f"contact_analysis:{contact.get('email', 'unknown')}:{e}")
 
+        # cap at 30 contacts per run
+        await asyncio.gather(*(analyze_safely(c) for c in contacts[:30]))
+        _save_evidence_hashes("relationship_briefs", brief_hashes)
+
     except Exception as e:
         logger.error("Phase 2 (Relationship Intelligence) failed: %s", e)
         results["errors"].append(f"phase2:{e}")
@@ -262,9 +365,17 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
 
     Only fills empty fields — never overwrites existing data.
     Uses deterministic extraction first (email domain → company),
-    then LLM for non-obvious fields (job title, city).
+    then LLM for non-obvious fields (job title, city). Contacts are worked
+    through by LLM_CONCURRENCY concurrent workers, with CRM and database
+    calls in threads. LLM extractions are skipped when a contact's evidence
+    is unchanged since the last extraction.
     """
-    results = {"contacts_checked": 0, "fields_updated": 0, "errors": []}
+    results = {
+        "contacts_checked": 0,
+        "fields_updated": 0,
+        "skipped_unchanged": 0,
+        "errors": [],
+    }
 
     try:
         import sys
@@ -276,11 +387,8 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
 
         contacts = fetch_all_contacts()
 
-        # Load email log for cross-referencing
-        email_entries = {}
-        email_log_path = MEMORY_DIR / "email-log.json"
-        if email_log_path.exists():
-            email_entries = json.loads(email_log_path.read_text()).get("entries", {})
+        # Index email log by sender once for cross-referencing
+        emails_by_sender = _index_emails_by_sender(_load_email_entries())
 
         # Load meeting transcripts for context
         transcript_excerpts = {}
@@ -310,10 +418,13 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
             except (json.JSONDecodeError, TypeError):
                 pass
 
-        for contact in contacts:
+        previous_hashes = _load_evidence_hashes().get("enrichment", {})
+        extraction_hashes = dict(previous_hashes)
+
+        async def enrich(contact: dict) -> None:
             name = f"{contact['firstName']} {contact['lastName']}".strip()
             if not name:
-                continue
+                return
 
             results["contacts_checked"] += 1
 
@@ -323,16 +434,19 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
 
             # Skip fully populated contacts
             if has_job_title and has_company and has_city:
-                continue
+                return
 
             updates = {}
+            parsed_hash = None
 
             # --- Deterministic: email domain → company ---
             if not has_company and contact.get("email"):
                 company = _extract_company_from_email(contact["email"])
                 if company:
                     try:
-                        company_id = crm_dal.find_or_create_company(company)
+                        company_id = await asyncio.to_thread(
+                            crm_dal.find_or_create_company, company
+                        )
                         if company_id:
                             updates["company_id"] = company_id
                     except Exception as e:
@@ -345,17 +459,7 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
 
                 # Memory facts
                 try:
-                    with _get_dal_connection() as conn:
-                        cur = conn.cursor(cursor_factory=RealDictCursor)
-                        cur.execute(
-                            """
-                            SELECT fact_text FROM memory_facts
-                            WHERE %s = ANY(entities) OR fact_text ILIKE %s
-                            ORDER BY created_at DESC LIMIT 10
-                        """,
-                            (name, f"%{name}%"),
-                        )
-                        facts = [r["fact_text"] for r in cur.fetchall()]
+                    facts = await asyncio.to_thread(_facts_mentioning, name)
                     if facts:
                         evidence_parts.append(
                             "Memory facts:\n" + "\n".join(f"- {f[:200]}" for f in facts[:5])
@@ -365,9 +469,7 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
 
                 # Email subjects
                 if contact.get("email"):
-                    contact_emails = [
-                        e for e in email_entries.values() if contact["email"] in e.get("from", "")
-                    ][-5:]
+                    contact_emails = emails_by_sender.get(contact["email"].lower(), [])[-5:]
                     if contact_emails:
                         evidence_parts.append(
                             "Emails:\n"
@@ -385,12 +487,17 @@ async def phase_2_5_contact_enrichment(llm_client) -> dict[str, Any]:
                         "Meeting context:\n" + "\n".join(f"- {e}" for e in excerpts)
                     )
 
+                evidence = "\n\n".join(evidence_parts)
+                key = _contact_key(contact) or name
+                evidence_hash = _evidence_hash(evidence)
+
                 if not evidence_parts:
                     # No evidence to extract from — skip LLM call
                     pass
+                elif previous_hashes.get(key) == evidence_hash:
+                    # Same evidence as the last extraction — same answer
+                    results["skipped_unchanged"] += 1
                 else:
-                    evidence = "\n\n".join(evidence_parts)
-
                     try:
                         extraction = await llm_client.generate(
                             prompt=f"""Extract structured information about {name} from the evidence below.
@@ -438,12 +545,17 @@ Only include fields you're confident about. Use null for uncertain fields.""",
                                     and len(co) > 1
                                 ):
                                     try:
-                                        company_id = crm_dal.find_or_create_company(co)
+                                        company_id = await asyncio.to_thread(
+                                            crm_dal.find_or_create_company, co
+                                        )
                                         if company_id:
                                             updates["company_id"] = company_id
                                     except Exception as e:
                                         results["errors"].append(f"llm_company:{name}:{e}")
 
+                            # Memoized once the CRM update below goes through
+                            parsed_hash = evidence_hash
+
                         except (json.JSONDecodeError, KeyError, ValueError):
                             pass
 
@@ -453,7 +565,8 @@ Only include fields you're confident about. Use null for uncertain fields.""",
             # --- Apply updates to CRM ---
             if updates:
                 try:
-                    ok = crm_dal.update_person(
+                    ok = await asyncio.to_thread(
+                        crm_dal.update_person,
                         contact["id"],
                         job_title=updates.get("jobTitle"),
                         company_id=updates.get("company_id"),
@@ -464,8 +577,32 @@ Only include fields you're confident about. Use null for uncertain fields.""",
                         logger.info("  Enriched '%s': %s", name, list(updates.keys()))
                     else:
                         logger.warning("  Failed to update '%s'", name)
+                        parsed_hash = None
                 except Exception as e:
                     results["errors"].append(f"update:{name}:{e}")
+                    parsed_hash = None
+
+            if parsed_hash is not None:
+                extraction_hashes[key] = parsed_hash
+
+        async def enrich_safely(contact: dict) -> None:
+            try:
+                await enrich(contact)
+            except Exception as e:
+                results["errors"].append(
+                    f"contact_enrichment:{contact.get('email', 'unknown')}:{e}"
+                )
+
+        # A fixed pool of workers shares one iterator, so only LLM_CONCURRENCY
+        # contacts are in progress at a time however many the CRM returns
+        pending = iter(contacts)
+
+        async def worker() -> None:
+            for contact in pending:
+                await enrich_safely(contact)
+
+        await asyncio.gather(*(worker() for _ in range(LLM_CONCURRENCY)))
+        _save_evidence_hashes("enrichment", extraction_hashes)
 
     except Exception as e:
         logger.error("Phase 2.5 (Contact Enrichment) failed: %s", e)
@@ -386,7 +386,7 @@ def contact_reconciliation() -> dict[str, Any]:
 
     try:
         from robothor.crm.dal import get_owner_person
-        from robothor.memory.contact_matching import find_best_match
+        from robothor.memory.contact_matching import ContactMatchIndex
         from robothor.owner_config import load_owner_config
 
         with get_connection() as conn:
@@ -451,16 +451,17 @@ def contact_reconciliation() -> dict[str, Any]:
                     FROM memory_entities
                     WHERE entity_type = 'person'
                 """)
-                person_entities = cur.fetchall()
+                # Block candidates once; each lookup only scores entities
+                # sharing a name token, nickname or prefix with the input.
+                person_index = ContactMatchIndex(cur.fetchall())
 
                 for row in unlinked:
                     display_name = row.get("display_name", "")
                     if not display_name:
                         continue
 
-                    match = find_best_match(
+                    match = person_index.find_best_match(
                         display_name,
-                        person_entities,
                         threshold=0.75,
                         owner_candidate_id=owner_candidate_id,
                         owner_nicknames=owner_nicknames,
@@ -555,7 +556,7 @@ def contact_reconciliation() -> dict[str, Any]:
                     pass
 
             # Build candidates list from existing names for fuzzy dedup
-            existing_name_list = [{"name": n} for n in existing_names]
+            existing_name_index = ContactMatchIndex([{"name": n} for n in existing_names])
 
             # Build set of known last names to detect reversed/artifact names
             known_last_names = set()
@@ -569,13 +570,14 @@ def contact_reconciliation() -> dict[str, Any]:
 
             # Process high-mention entities
             discovered = []
+            discovered_index = ContactMatchIndex()
             for entity in high_mention_entities:
                 if entity["id"] in linked_entity_ids:
                     continue
                 if entity["name"].lower() in existing_names:
                     continue
                 # Fuzzy check against existing CRM contacts
-                if find_best_match(entity["name"], existing_name_list, threshold=0.8):
+                if existing_name_index.find_best_match(entity["name"], threshold=0.8):
                     continue
                 # Skip reversed names (last name first) — parsing artifacts
                 name_parts = entity["name"].split()
@@ -587,6 +589,7 @@ def contact_reconciliation() -> dict[str, Any]:
                     continue
 
                 discovered.append(entity)
+                discovered_index.add({"name": entity["name"]})
                 results["contacts_discovered"] += 1
 
             # Process meeting attendees not in CRM
@@ -594,7 +597,7 @@ def contact_reconciliation() -> dict[str, Any]:
                 if attendee.lower() in existing_names:
                     continue
                 # Fuzzy check against existing CRM contacts
-                if find_best_match(attendee, existing_name_list, threshold=0.8):
+                if existing_name_index.find_best_match(attendee, threshold=0.8):
                     continue
                 # Skip reversed names like "Doe Smith" or "Johnson Jane"
                 att_parts = attendee.split()
@@ -602,9 +605,7 @@ def contact_reconciliation() -> dict[str, Any]:
                     logger.debug("  Skipping reversed name: '%s'", attendee)
                     continue
                 # Check if already in discovered entities
-                if discovered and find_best_match(
-                    attendee, [{"name": d["name"]} for d in discovered], threshold=0.85
-                ):
+                if discovered and discovered_index.find_best_match(attendee, threshold=0.85):
                     continue
 
                 discovered.append(
@@ -615,6 +616,7 @@ def contact_reconciliation() -> dict[str, Any]:
                         "source": "meeting",
                     }
                 )
+                discovered_index.add({"name": attendee})
                 results["contacts_discovered"] += 1
 
             # Create CRM records for discovered contacts
@@ -43,12 +43,22 @@ async def memory_store(body: MemoryStoreRequest):
 
 
 @router.get("/entity/{name}")
-async def memory_entity(name: str):
-    """Get entity with relationships from the knowledge graph."""
+async def memory_entity(
+    name: str,
+    depth: int = 1,
+    relation_types: str = "",
+    tenant_id: str = Depends(get_tenant_id),
+):
+    """Get entity with relationships from the knowledge graph.
+
+    ``depth`` > 1 adds a multi-hop ``graph``; ``relation_types`` is a
+    comma-separated filter on followed relations.
+    """
     try:
         from robothor.memory.entities import get_all_about
 
-        result = await get_all_about(name)
+        types = [t.strip() for t in relation_types.split(",") if t.strip()] or None
+        result = await get_all_about(name, tenant_id=tenant_id, depth=depth, relation_types=types)
         return result or {"entity": name, "relations": []}
     except Exception as e:
         return JSONResponse({"error": str(e)}, status_code=500)
@@ -85,6 +95,18 @@ async def list_memory_blocks():
         return JSONResponse({"error": str(e)}, status_code=500)
 
 
+@router.get("/blocks/batch")
+async def get_memory_blocks(names: str):
+    """Read several memory blocks in one query (``names`` is comma-separated)."""
+    try:
+        from robothor.memory.blocks import read_blocks
+
+        block_names = [n.strip() for n in names.split(",") if n.strip()]
+        return {"blocks": read_blocks(block_names)}
+    except Exception as e:
+        return JSONResponse({"error": str(e)}, status_code=500)
+
+
 @router.get("/blocks/{block_name}")
 async def get_memory_block(block_name: str):
     """Read a named memory block."""
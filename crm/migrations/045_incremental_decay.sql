@@ -0,0 +1,15 @@
+-- Migration 045: Incremental decay maintenance
+--
+-- Nightly lifecycle recomputes decay_score with a single set-based UPDATE.
+-- decay_inputs_sig fingerprints the non-time inputs of the decay formula
+-- (last_accessed, access_count, reinforcement_count, importance_score,
+-- outcome_failures) and decay_computed_at records when the score was last
+-- written, so passes only touch rows whose score can actually have moved.
+
+BEGIN;
+
+ALTER TABLE memory_facts
+    ADD COLUMN IF NOT EXISTS decay_computed_at TIMESTAMPTZ,
+    ADD COLUMN IF NOT EXISTS decay_inputs_sig TEXT;
+
+COMMIT;
@@ -0,0 +1,24 @@
+-- Migration 046: Memoized fact extraction
+--
+-- Caches LLM fact extraction results keyed by (content hash, extraction
+-- prompt version, generation model) so identical content arriving via a
+-- different source or channel (forwarded emails, re-synced calendar
+-- entries) replays the cached facts instead of calling the LLM again.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS memory_extraction_cache (
+    content_hash TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    model TEXT NOT NULL,
+    facts JSONB NOT NULL,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    last_hit_at TIMESTAMPTZ,
+    PRIMARY KEY (content_hash, prompt_version, model)
+);
+
+CREATE INDEX IF NOT EXISTS idx_extraction_cache_created
+    ON memory_extraction_cache(created_at);
+
+COMMIT;
@@ -0,0 +1,26 @@
+-- Migration 047: Deterministic LLM response cache
+--
+-- Persistent tier of robothor.engine.llm_cache. Temperature-0 structured
+-- calls (planning, verification) that opt in are keyed by a hash of
+-- (model, normalized messages, request params); identical calls within the
+-- call site's TTL replay the stored response instead of calling the provider.
+-- cost_usd is the provider cost of the original response, so hit_count *
+-- cost_usd is the spend avoided.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS llm_response_cache (
+    cache_key TEXT PRIMARY KEY,
+    model TEXT NOT NULL,
+    response JSONB NOT NULL,
+    cost_usd DOUBLE PRECISION NOT NULL DEFAULT 0,
+    hit_count INTEGER NOT NULL DEFAULT 0,
+    created_at TIMESTAMPTZ NOT NULL DEFAULT NOW(),
+    expires_at TIMESTAMPTZ NOT NULL,
+    last_hit_at TIMESTAMPTZ
+);
+
+CREATE INDEX IF NOT EXISTS idx_llm_response_cache_expires
+    ON llm_response_cache(expires_at);
+
+COMMIT;
@@ -3,13 +3,14 @@ MCP Server for Genus OS Memory System.
 
 Provides a Model Context Protocol (MCP) interface so external models
 (Claude Code, Cursor, etc.) can access the memory system. Runs locally
-with stdio transport.
+with stdio transport; requests are handled concurrently (see mcp_stdio.py).
 
 Architecture:
     MCP Client -> stdio -> this server -> robothor.* modules -> PostgreSQL
 
 Tools (44):
-    - Memory: search_memory, store_memory, get_stats, get_entity
+    - Memory: search_memory, store_memory, search_memories, store_memories,
+      get_stats, get_entity
     - Vision: look, who_is_here, enroll_face, set_vision_mode
     - Memory blocks: memory_block_read, memory_block_write, memory_block_list, append_to_block
     - CRM interaction: log_interaction
@@ -35,10 +36,13 @@ from __future__ import annotations
 import asyncio
 import json
 import os
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+if TYPE_CHECKING:
+    from robothor.api.mcp_stdio import StdioJsonRpcServer
+
 # ─── Service URL Resolution ──────────────────────────────────────────
 
 BRIDGE_URL = os.environ.get("BRIDGE_URL", "http://localhost:9100")
@@ -97,6 +101,57 @@ def get_tool_definitions() -> list[dict[str, Any]]:
                 "required": ["content", "content_type"],
             },
         },
+        {
+            "name": "search_memories",
+            "description": (
+                "Search memory for several queries at once (max 50). "
+                "Returns one result list per query."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "queries": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "The search queries",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum number of results per query (default 10)",
+                        "default": 10,
+                    },
+                },
+                "required": ["queries"],
+            },
+        },
+        {
+            "name": "store_memories",
+            "description": (
+                "Store several pieces of content in memory at once (max 50). "
+                "Extracts facts from each automatically."
+            ),
+            "inputSchema": {
+                "type": "object",
+                "properties": {
+                    "items": {
+                        "type": "array",
+                        "items": {
+                            "type": "object",
+                            "properties": {
+                                "content": {"type": "string"},
+                                "content_type": {"type": "string"},
+                            },
+                            "required": ["content"],
+                        },
+                        "description": (
+                            "Content to store; content_type as in store_memory "
+                            "(default conversation)"
+                        ),
+                    },
+                },
+                "required": ["items"],
+            },
+        },
         {
             "name": "get_stats",
             "description": "Get memory system statistics.",
@@ -104,11 +159,23 @@ def get_tool_definitions() -> list[dict[str, Any]]:
         },
         {
             "name": "get_entity",
-            "description": "Look up an entity and its relationships in the knowledge graph.",
+            "description": (
+                "Look up an entity and its relationships in the knowledge graph. "
+                "Set depth > 1 to walk multi-hop connections."
+            ),
             "inputSchema": {
                 "type": "object",
                 "properties": {
-                    "name": {"type": "string", "description": "The entity name to look up"}
+                    "name": {"type": "string", "description": "The entity name to look up"},
+                    "depth": {
+                        "type": "integer",
+                        "description": "Hops to follow from the entity (1-4, default 1)",
+                    },
+                    "relation_types": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Only follow these relation types (e.g. works_at)",
+                    },
                 },
                 "required": ["name"],
             },
@@ -198,16 +265,20 @@ def get_tool_definitions() -> list[dict[str, Any]]:
         # Memory block tools
         {
             "name": "memory_block_read",
-            "description": "Read a named memory block. Blocks are persistent, structured working memory.",
+            "description": "Read a named memory block, or several at once with block_names. Blocks are persistent, structured working memory.",
             "inputSchema": {
                 "type": "object",
                 "properties": {
                     "block_name": {
                         "type": "string",
                         "description": "Name of the memory block to read",
-                    }
+                    },
+                    "block_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Read several blocks in one call (returns {blocks: {name: block}})",
+                    },
                 },
-                "required": ["block_name"],
             },
         },
         {
@@ -873,6 +944,15 @@ def get_tool_definitions() -> list[dict[str, Any]]:
 # ─── Tool Handlers ───────────────────────────────────────────────────
 
 
+def _memory_hit(r: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "fact": r["fact_text"],
+        "category": r["category"],
+        "confidence": r["confidence"],
+        "similarity": round(r.get("similarity", 0), 4),
+    }
+
+
 async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
     """Handle an MCP tool call and return result."""
 
@@ -884,17 +964,7 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, An
         from robothor.memory.facts import search_facts
 
         results = await search_facts(arguments.get("query", ""), limit=arguments.get("limit", 10))
-        return {
-            "results": [
-                {
-                    "fact": r["fact_text"],
-                    "category": r["category"],
-                    "confidence": r["confidence"],
-                    "similarity": round(r.get("similarity", 0), 4),
-                }
-                for r in results
-            ]
-        }
+        return {"results": [_memory_hit(r) for r in results]}
 
     if name == "store_memory":
         from robothor.memory.facts import extract_facts, store_fact
@@ -909,15 +979,52 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, An
         fact_id = await store_fact(fact, content, content_type)
         return {"id": fact_id, "facts_stored": 1}
 
+    if name == "search_memories":
+        from robothor.memory.facts import MAX_BATCH_ITEMS, search_facts_batch
+
+        queries = [str(q) for q in arguments.get("queries") or []]
+        if not queries or len(queries) > MAX_BATCH_ITEMS:
+            return {"error": f"queries must hold 1 to {MAX_BATCH_ITEMS} queries"}
+        batches = await search_facts_batch(queries, limit=arguments.get("limit", 10))
+        return {
+            "results": [
+                {"query": query, "results": [_memory_hit(r) for r in results]}
+                for query, results in zip(queries, batches, strict=True)
+            ]
+        }
+
+    if name == "store_memories":
+        from robothor.memory.facts import MAX_BATCH_ITEMS, store_memories_batch
+
+        items = arguments.get("items") or []
+        if not items or len(items) > MAX_BATCH_ITEMS:
+            return {"error": f"items must hold 1 to {MAX_BATCH_ITEMS} entries"}
+        stored = await store_memories_batch(
+            [(i.get("content", ""), i.get("content_type", "conversation")) for i in items]
+        )
+        return {
+            "results": stored,
+            "facts_stored": sum(r.get("facts_stored", 0) for r in stored),
+        }
+
     if name == "get_stats":
         from robothor.memory.facts import get_memory_stats
 
-        return get_memory_stats()
+        return await asyncio.to_thread(get_memory_stats)
 
     if name == "get_entity":
-        from robothor.memory.entities import get_entity
+        from robothor.memory.entities import get_entity, traverse_graph
 
         try:
+            if int(arguments.get("depth") or 1) > 1 or arguments.get("relation_types"):
+                graph = await traverse_graph(
+                    arguments.get("name", ""),
+                    max_depth=int(arguments.get("depth") or 1),
+                    relation_types=arguments.get("relation_types"),
+                )
+                if graph["root"] is None:
+                    return {"name": arguments.get("name", ""), "found": False}
+                return graph
             result = await get_entity(arguments.get("name", ""))
             return result or {"name": arguments.get("name", ""), "found": False}
         except Exception:
@@ -1025,19 +1132,23 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, An
     # ── Memory block tools ──
 
     elif name == "memory_block_read":
-        from robothor.memory.blocks import read_block
+        from robothor.memory.blocks import read_block, read_blocks
 
-        return read_block(arguments.get("block_name", ""))
+        if arguments.get("block_names"):
+            return {"blocks": await asyncio.to_thread(read_blocks, list(arguments["block_names"]))}
+        return await asyncio.to_thread(read_block, arguments.get("block_name", ""))
 
     elif name == "memory_block_write":
         from robothor.memory.blocks import write_block
 
-        return write_block(arguments.get("block_name", ""), arguments.get("content", ""))
+        return await asyncio.to_thread(
+            write_block, arguments.get("block_name", ""), arguments.get("content", "")
+        )
 
     elif name == "memory_block_list":
         from robothor.memory.blocks import list_blocks
 
-        return list_blocks()
+        return await asyncio.to_thread(list_blocks)
 
     # ── CRM interaction ──
 
@@ -1062,9 +1173,18 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, An
         except Exception as e:
             return {"error": f"Failed to log interaction: {e}"}
 
+    # ── CRM (blocking DAL calls, run off the event loop) ──
+
+    crm_result = await asyncio.to_thread(_handle_crm_tool, name, arguments)
+    return crm_result if crm_result is not None else {"error": f"Unknown tool: {name}"}
+
+
+def _handle_crm_tool(name: str, arguments: dict[str, Any]) -> dict[str, Any] | None:
+    """Handle a CRM tool call synchronously; None if ``name`` is not a CRM tool."""
+
     # ── CRM People ──
 
-    elif name == "create_person":
+    if name == "create_person":
         from robothor.crm.dal import create_person
 
         person_id = create_person(
@@ -1460,41 +1580,63 @@ async def handle_tool_call(name: str, arguments: dict[str, Any]) -> dict[str, An
         )
         return {"success": ok, "conversationId": arguments["conversationId"]}
 
-    return {"error": f"Unknown tool: {name}"}
+    return None
 
 
 # ─── MCP Server ──────────────────────────────────────────────────────
 
+SERVER_NAME = "robothor-memory"
+PROTOCOL_VERSION = "2024-11-05"
+
 
-def create_server() -> Any:
-    """Create and configure the MCP server."""
-    import mcp.types as types
-    from mcp.server import Server
+async def _rpc_initialize(params: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "protocolVersion": params.get("protocolVersion") or PROTOCOL_VERSION,
+        "capabilities": {"tools": {}},
+        "serverInfo": {"name": SERVER_NAME, "version": "1.0"},
+    }
 
-    server = Server("robothor-memory")
 
-    @server.list_tools()  # type: ignore[untyped-decorator]
-    async def list_tools() -> list[types.Tool]:
-        return [
-            types.Tool(name=d["name"], description=d["description"], inputSchema=d["inputSchema"])
-            for d in get_tool_definitions()
-        ]
+async def _rpc_ping(params: dict[str, Any]) -> dict[str, Any]:
+    return {}
 
-    @server.call_tool()  # type: ignore[untyped-decorator]
-    async def call_tool(name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
-        result = await handle_tool_call(name, arguments or {})
-        return [types.TextContent(type="text", text=json.dumps(result, default=str))]
 
-    return server
+async def _rpc_list_tools(params: dict[str, Any]) -> dict[str, Any]:
+    return {"tools": get_tool_definitions()}
+
+
+async def _rpc_call_tool(params: dict[str, Any]) -> dict[str, Any]:
+    try:
+        result = await handle_tool_call(params.get("name", ""), params.get("arguments") or {})
+    except Exception as e:
+        return {"content": [{"type": "text", "text": str(e)}], "isError": True}
+    return {
+        "content": [{"type": "text", "text": json.dumps(result, default=str)}],
+        "isError": False,
+    }
+
+
+def create_server() -> StdioJsonRpcServer:
+    """Create the MCP server. Requests are handled concurrently (see mcp_stdio)."""
+    from robothor.api.mcp_stdio import StdioJsonRpcServer
+
+    return StdioJsonRpcServer(
+        {
+            "initialize": _rpc_initialize,
+            "ping": _rpc_ping,
+            "tools/list": _rpc_list_tools,
+            "tools/call": _rpc_call_tool,
+        }
+    )
 
 
 async def run_server() -> None:
     """Run the MCP server with stdio transport."""
-    from mcp.server.stdio import stdio_server
+    from robothor.api.mcp_stdio import open_stdio
 
     server = create_server()
-    async with stdio_server() as (read_stream, write_stream):
-        await server.run(read_stream, write_stream, server.create_initialization_options())
+    reader, write = await open_stdio()
+    await server.serve(reader, write)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,182 @@
+"""Concurrent stdio JSON-RPC transport for the MCP server.
+
+Each request runs in its own task, at most ``ROBOTHOR_MCP_MAX_CONCURRENCY``
+at a time. Its response is written, tagged with the request's id, as soon as
+it is ready, so one slow tool call does not hold up the others and responses
+may arrive out of request order. ``notifications/cancelled`` cancels the
+named in-flight request; per the MCP spec no response is sent for it.
+
+Messages are newline-delimited JSON, as the MCP stdio transport specifies.
+Content-Length framed messages (as sent by ``robothor.engine.mcp_client``)
+are accepted too, and responses then use the same framing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+MAX_CONCURRENCY = int(os.environ.get("ROBOTHOR_MCP_MAX_CONCURRENCY", "8"))
+
+# JSON-RPC 2.0 error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+
+class JsonRpcError(Exception):
+    """Raised by a handler to answer with a specific JSON-RPC error."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class StdioJsonRpcServer:
+    """Dispatches JSON-RPC requests to handlers concurrently, with bounded parallelism.
+
+    ``handlers`` maps a method name to a coroutine function taking the
+    request params and returning the result.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, Callable[[dict[str, Any]], Awaitable[Any]]],
+        *,
+        max_concurrency: int = MAX_CONCURRENCY,
+    ) -> None:
+        self.handlers = handlers
+        self._slots = asyncio.Semaphore(max(1, max_concurrency))
+        self._tasks: dict[Any, asyncio.Task[None]] = {}
+        self._write: Callable[[bytes], Awaitable[None]] | None = None
+        self._write_lock = asyncio.Lock()
+        self._framed = False
+
+    async def serve(
+        self, reader: asyncio.StreamReader, write: Callable[[bytes], Awaitable[None]]
+    ) -> None:
+        """Handle messages until ``reader`` reaches EOF, then finish in-flight requests."""
+        self._write = write
+        try:
+            while True:
+                try:
+                    message = await self._read_message(reader)
+                except (ValueError, asyncio.IncompleteReadError) as e:
+                    await self._send(
+                        {"jsonrpc": "2.0", "id": None, "error": _error(PARSE_ERROR, str(e))}
+                    )
+                    continue
+                if message is None:
+                    break
+                for item in message if isinstance(message, list) else [message]:
+                    await self._dispatch(item)
+        finally:
+            if self._tasks:
+                await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+
+    async def _read_message(self, reader: asyncio.StreamReader) -> Any:
+        """Next message, or None at EOF. Raises ValueError on malformed input."""
+        while True:
+            line = await reader.readline()
+            if not line:
+                return None
+            if line.strip():
+                break
+        if not line.lower().startswith(b"content-length:"):
+            return json.loads(line)
+
+        self._framed = True
+        length = int(line.split(b":", 1)[1])
+        while (header := await reader.readline()) not in (b"\r\n", b"\n"):
+            if not header:
+                return None
+        return json.loads(await reader.readexactly(length))
+
+    async def _dispatch(self, message: Any) -> None:
+        if not isinstance(message, dict) or not isinstance(message.get("method"), str):
+            if isinstance(message, dict) and ("result" in message or "error" in message):
+                return  # a response from the client; this server sends no requests
+            await self._send(
+                {"jsonrpc": "2.0", "id": None, "error": _error(INVALID_REQUEST, "Invalid request")}
+            )
+            return
+
+        if "id" not in message:
+            if message["method"] == "notifications/cancelled":
+                request_id = (message.get("params") or {}).get("requestId")
+                task = self._tasks.get(request_id)
+                if task:
+                    task.cancel()
+            return
+
+        request_id = message["id"]
+        task = asyncio.create_task(self._run(request_id, message))
+        self._tasks[request_id] = task
+        task.add_done_callback(lambda t: self._forget(request_id, t))
+
+    def _forget(self, request_id: Any, task: asyncio.Task[None]) -> None:
+        if self._tasks.get(request_id) is task:  # a client may reuse a finished id
+            del self._tasks[request_id]
+
+    async def _run(self, request_id: Any, message: dict[str, Any]) -> None:
+        method = message["method"]
+        handler = self.handlers.get(method)
+        try:
+            if handler is None:
+                raise JsonRpcError(METHOD_NOT_FOUND, f"Method not found: {method}")
+            async with self._slots:
+                result = await handler(message.get("params") or {})
+            response: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "result": result}
+        except asyncio.CancelledError:
+            logger.debug("MCP request %s (%s) cancelled by client", request_id, method)
+            return
+        except JsonRpcError as e:
+            response = {"jsonrpc": "2.0", "id": request_id, "error": _error(e.code, e.message)}
+        except Exception as e:
+            logger.exception("MCP request %s (%s) failed", request_id, method)
+            response = {"jsonrpc": "2.0", "id": request_id, "error": _error(INTERNAL_ERROR, str(e))}
+        await self._send(response)
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        assert self._write is not None
+        data = json.dumps(message, default=str).encode()
+        if self._framed:
+            data = b"Content-Length: %d\r\n\r\n" % len(data) + data
+        else:
+            data += b"\n"
+        async with self._write_lock:
+            await self._write(data)
+
+
+def _error(code: int, message: str) -> dict[str, Any]:
+    return {"code": code, "message": message}
+
+
+async def open_stdio() -> tuple[asyncio.StreamReader, Callable[[bytes], Awaitable[None]]]:
+    """Async reader for stdin and a writer coroutine for stdout."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=16 * 1024 * 1024)
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    transport, protocol = await loop.connect_write_pipe(
+        asyncio.streams.FlowControlMixin, sys.stdout
+    )
+    writer = asyncio.StreamWriter(transport, protocol, reader, loop)
+
+    async def write(data: bytes) -> None:
+        writer.write(data)
+        with contextlib.suppress(ConnectionError):
+            await writer.drain()
+
+    return reader, write
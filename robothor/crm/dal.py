@@ -2077,6 +2077,13 @@ def list_notifications(
 # ─── Tenants ─────────────────────────────────────────────────────────────
 
 
+def _tenant_hierarchy_changed(tenant_id: str) -> None:
+    """Drop cached tenant access sets after parent links or activity change."""
+    from robothor.engine.permissions import permissions_changed
+
+    permissions_changed(tenant_id)
+
+
 def create_tenant(
     tenant_id: str,
     display_name: str,
@@ -2094,6 +2101,8 @@ def create_tenant(
             )
             conn.commit()
             _safe_audit("create", "tenant", tenant_id, details={"display_name": display_name})
+            if parent_tenant_id:
+                _tenant_hierarchy_changed(tenant_id)
             return tenant_id
         except Exception as e:
             conn.rollback()
@@ -2133,6 +2142,8 @@ def create_tenant_with_user(
                 tenant_id,
                 details={"display_name": display_name, "telegram_user_id": telegram_user_id},
             )
+            if parent_tenant_id:
+                _tenant_hierarchy_changed(tenant_id)
             # Seed memory blocks for new tenant
             try:
                 from robothor.memory.blocks import seed_blocks_for_tenant
@@ -2204,6 +2215,8 @@ def update_tenant(tenant_id: str, **fields: Any) -> bool:
             )
             ok: bool = cur.rowcount > 0
             conn.commit()
+            if ok and ("parent_tenant_id" in fields or "active" in fields):
+                _tenant_hierarchy_changed(tenant_id)
             return ok
         except Exception as e:
             conn.rollback()
@@ -2252,12 +2265,16 @@ def append_to_block(
                 (tenant_id, block_name, new_content),
             )
             conn.commit()
-            return True
         except Exception as e:
             conn.rollback()
             logger.error("Failed to append to block %s: %s", block_name.replace("\n", "\\n"), e)
             return False
 
+    from robothor.memory.blocks import block_changed
+
+    block_changed(block_name, tenant_id)
+    return True
+
 
 # ─── Search & Metadata ───────────────────────────────────────────────────
 
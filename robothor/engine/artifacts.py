@@ -0,0 +1,214 @@
+"""Content-addressed store for offloaded tool results.
+
+Large tool outputs are written once per distinct content, keyed by SHA-256,
+under ``ROBOTHOR_ARTIFACT_DIR``. Writing the same output again only refreshes
+its recency. The directory is capped at ``ROBOTHOR_ARTIFACT_QUOTA_MB``, and the
+least recently used artifacts are evicted first. Recency is kept in file mtimes,
+so LRU order survives a restart.
+
+Agents page through an artifact with ``read_range()`` (the ``read_artifact``
+tool) without loading the whole file into context.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from robothor.engine.file_reader import read_byte_range
+
+logger = logging.getLogger(__name__)
+
+ARTIFACT_DIR = Path(
+    os.environ.get("ROBOTHOR_ARTIFACT_DIR") or Path(tempfile.gettempdir()) / "robothor-artifacts"
+)
+ARTIFACT_QUOTA_BYTES = int(os.environ.get("ROBOTHOR_ARTIFACT_QUOTA_MB", "512")) * 1024 * 1024
+
+# Default page size for range reads (bytes).
+DEFAULT_PAGE_BYTES = 20_000
+MAX_PAGE_BYTES = 100_000
+
+# Hex digits of the SHA-256 used as the artifact ID.
+ID_LENGTH = 32
+_SUFFIX = ".txt"
+
+
+@dataclass
+class Artifact:
+    """A stored tool output."""
+
+    id: str
+    path: Path
+    size: int  # bytes
+    deduplicated: bool = False  # identical content was already stored
+
+
+@dataclass
+class ArtifactStats:
+    """Counters for one store."""
+
+    artifacts: int = 0
+    bytes_stored: int = 0
+    bytes_deduplicated: int = 0
+    evictions: int = 0
+
+
+class ArtifactStore:
+    """SHA-256-keyed files with a byte quota and LRU eviction. Thread-safe."""
+
+    def __init__(self, root: Path | str, quota_bytes: int = ARTIFACT_QUOTA_BYTES) -> None:
+        self.root = Path(root)
+        self.quota_bytes = quota_bytes
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, int] = OrderedDict()  # id → size, oldest first
+        self._stats = ArtifactStats()
+        self._loaded = False
+
+    def _path(self, artifact_id: str) -> Path:
+        return self.root / f"{artifact_id}{_SUFFIX}"
+
+    def _load(self) -> None:
+        """Index artifacts left by a previous process, oldest first."""
+        if self._loaded:
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        found: list[tuple[float, str, int]] = []
+        with os.scandir(self.root) as it:
+            for entry in it:
+                name = entry.name
+                if not name.endswith(_SUFFIX) or len(name) != ID_LENGTH + len(_SUFFIX):
+                    continue
+                with contextlib.suppress(OSError):
+                    st = entry.stat()
+                    found.append((st.st_mtime, name[:ID_LENGTH], st.st_size))
+        for _mtime, artifact_id, size in sorted(found):
+            self._entries[artifact_id] = size
+            self._stats.bytes_stored += size
+        self._loaded = True
+        self._evict(keep=None)
+        self._publish()
+
+    def _touch(self, artifact_id: str) -> None:
+        self._entries.move_to_end(artifact_id)
+        with contextlib.suppress(OSError):
+            os.utime(self._path(artifact_id))
+
+    def _evict(self, keep: str | None) -> None:
+        from robothor.engine.metrics import ARTIFACT_EVICTIONS
+
+        while self._stats.bytes_stored > self.quota_bytes and self._entries:
+            victim = next(iter(self._entries))
+            if victim == keep:
+                if len(self._entries) == 1:
+                    break  # a single artifact larger than the quota is kept until replaced
+                self._entries.move_to_end(victim)
+                continue
+            size = self._entries.pop(victim)
+            self._stats.bytes_stored -= size
+            self._stats.evictions += 1
+            ARTIFACT_EVICTIONS.inc()
+            with contextlib.suppress(FileNotFoundError):
+                self._path(victim).unlink()
+
+    def _publish(self) -> None:
+        from robothor.engine.metrics import ARTIFACT_STORE_BYTES
+
+        ARTIFACT_STORE_BYTES.set(self._stats.bytes_stored)
+
+    def put(self, content: str) -> Artifact:
+        """Store ``content`` (once per distinct value) and return its artifact."""
+        from robothor.engine.metrics import ARTIFACT_BYTES_TOTAL
+
+        data = content.encode("utf-8")
+        artifact_id = hashlib.sha256(data).hexdigest()[:ID_LENGTH]
+        path = self._path(artifact_id)
+        with self._lock:
+            self._load()
+            if artifact_id in self._entries and path.exists():
+                self._touch(artifact_id)
+                self._stats.bytes_deduplicated += len(data)
+                ARTIFACT_BYTES_TOTAL.labels(outcome="deduplicated").inc(len(data))
+                return Artifact(artifact_id, path, len(data), deduplicated=True)
+
+            fd, tmp = tempfile.mkstemp(dir=self.root, prefix=".tmp_", suffix=_SUFFIX)
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                Path(tmp).replace(path)
+            except BaseException:
+                with contextlib.suppress(OSError):
+                    Path(tmp).unlink()
+                raise
+
+            self._stats.bytes_stored += len(data) - self._entries.pop(artifact_id, 0)
+            self._entries[artifact_id] = len(data)
+            ARTIFACT_BYTES_TOTAL.labels(outcome="stored").inc(len(data))
+            self._evict(keep=artifact_id)
+            self._publish()
+        return Artifact(artifact_id, path, len(data))
+
+    def read_range(
+        self, artifact_id: str, offset: int = 0, length: int = DEFAULT_PAGE_BYTES
+    ) -> dict[str, Any]:
+        """Read up to ``length`` bytes starting at byte ``offset``.
+
+        Both ends are moved to UTF-8 character boundaries. ``next_offset`` is
+        where the following page starts, or None at the end of the artifact.
+        """
+        if len(artifact_id) != ID_LENGTH or not all(c in "0123456789abcdef" for c in artifact_id):
+            return {"error": f"Invalid artifact id: {artifact_id!r}"}
+        offset = max(0, int(offset))
+        length = max(1, min(int(length), MAX_PAGE_BYTES))
+        path = self._path(artifact_id)
+        with self._lock:
+            self._load()
+            if artifact_id in self._entries:
+                self._touch(artifact_id)
+        try:
+            with path.open("rb") as f:
+                data, start, next_offset, total = read_byte_range(f, offset, length)
+        except FileNotFoundError:
+            return {"error": f"Artifact {artifact_id} not found (it may have been evicted)"}
+
+        return {
+            "id": artifact_id,
+            "content": data.decode("utf-8", errors="replace"),
+            "offset": start,
+            "next_offset": next_offset,
+            "total_bytes": total,
+        }
+
+    def stats(self) -> ArtifactStats:
+        with self._lock:
+            self._load()
+            return ArtifactStats(
+                artifacts=len(self._entries),
+                bytes_stored=self._stats.bytes_stored,
+                bytes_deduplicated=self._stats.bytes_deduplicated,
+                evictions=self._stats.evictions,
+            )
+
+
+_store: ArtifactStore | None = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> ArtifactStore:
+    """Return the process-wide artifact store."""
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArtifactStore(ARTIFACT_DIR)
+                logger.debug(
+                    "Artifact store at %s (quota %d bytes)", ARTIFACT_DIR, _store.quota_bytes
+                )
+    return _store
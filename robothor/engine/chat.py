@@ -24,6 +24,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import uuid
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
@@ -36,10 +37,12 @@ from fastapi import APIRouter, Request
 from fastapi.responses import JSONResponse
 from starlette.responses import StreamingResponse
 
+from robothor.constants import DEFAULT_TENANT
 from robothor.engine.chat_store import (
     clear_plan_state_async,
     clear_session_async,
-    load_all_sessions,
+    iter_sessions,
+    load_session,
     save_exchange_async,
     save_message_async,
     save_plan_state_async,
@@ -55,6 +58,9 @@ logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/chat")
 
 MAX_HISTORY = 40  # 20 turns (user + assistant)
+# Sessions idle longer than this are restored on first access instead of at
+# startup. 0 restores every session within the TTL eagerly.
+RESTORE_HOT_HOURS = float(os.environ.get("ROBOTHOR_CHAT_RESTORE_HOT_HOURS", "0"))
 SSE_KEEPALIVE_INTERVAL = 15.0  # seconds between keepalive comments
 
 # Module-level references injected by init_chat()
@@ -76,11 +82,15 @@ class ChatSession:
 
 # In-memory session store
 _sessions: dict[str, ChatSession] = {}
+# Persisted sessions not loaded yet — hydrated by _get_session() on first access
+_cold_sessions: set[str] = set()
 
 
 def _get_session(session_key: str) -> ChatSession:
     if session_key not in _sessions:
-        _sessions[session_key] = ChatSession()
+        session = _sessions[session_key] = ChatSession()
+        if session_key in _cold_sessions:
+            _load_cold_session(session_key, session)
     return _sessions[session_key]
 
 
@@ -99,43 +109,73 @@ def get_main_session_key() -> str:
     return "agent:main:primary"
 
 
+def _hydrate_session(key: str, session: ChatSession, data: dict[str, Any]) -> None:
+    """Apply persisted history, model override and pending plan to a session."""
+    history = data.get("history", [])
+    if history:
+        session.history = history
+    model = data.get("model_override")
+    if model:
+        session.model_override = model
+    # Hydrate pending plan if present and not expired
+    plan_data = data.get("plan_state")
+    if plan_data and isinstance(plan_data, dict):
+        plan = PlanState(
+            plan_id=plan_data.get("plan_id", ""),
+            plan_text=plan_data.get("plan_text", ""),
+            original_message=plan_data.get("original_message", ""),
+            status=plan_data.get("status", "pending"),
+            created_at=plan_data.get("created_at", ""),
+            exploration_run_id=plan_data.get("exploration_run_id", ""),
+            rejection_feedback=plan_data.get("rejection_feedback", ""),
+            revision_count=plan_data.get("revision_count", 0),
+            revision_history=plan_data.get("revision_history", []),
+            execution_run_id=plan_data.get("execution_run_id", ""),
+        )
+        if plan.status == "pending" and not _plan_is_expired(plan):
+            session.active_plan = plan
+            logger.info("Restored pending plan %s for session %s", plan.plan_id, key)
+
+
+def _load_cold_session(key: str, session: ChatSession) -> None:
+    """Load a session that startup skipped (idle past RESTORE_HOT_HOURS)."""
+    _cold_sessions.discard(key)
+    tenant_id = _config.tenant_id if _config is not None else DEFAULT_TENANT
+    try:
+        data = load_session(key, limit=MAX_HISTORY, tenant_id=tenant_id)
+    except Exception as e:
+        logger.warning("Failed to load persisted chat session %s: %s", key, e)
+        return
+    if data:
+        _hydrate_session(key, session, data)
+
+
 def _restore_sessions(config: EngineConfig) -> None:
-    """Restore webchat sessions from PostgreSQL at startup."""
+    """Restore webchat sessions from PostgreSQL at startup.
+
+    One streamed query covers every session; with RESTORE_HOT_HOURS set,
+    idle sessions are only noted here and loaded on first access.
+    """
     try:
-        sessions = load_all_sessions(
+        restored = deferred = 0
+        for key, data in iter_sessions(
             limit_per_session=MAX_HISTORY,
             tenant_id=config.tenant_id,
-        )
-        restored = 0
-        for key, data in sessions.items():
-            session = _get_session(key)
-            history = data.get("history", [])
-            if history:
-                session.history = history
-            model = data.get("model_override")
-            if model:
-                session.model_override = model
-            # Hydrate pending plan if present and not expired
-            plan_data = data.get("plan_state")
-            if plan_data and isinstance(plan_data, dict):
-                plan = PlanState(
-                    plan_id=plan_data.get("plan_id", ""),
-                    plan_text=plan_data.get("plan_text", ""),
-                    original_message=plan_data.get("original_message", ""),
-                    status=plan_data.get("status", "pending"),
-                    created_at=plan_data.get("created_at", ""),
-                    exploration_run_id=plan_data.get("exploration_run_id", ""),
-                    rejection_feedback=plan_data.get("rejection_feedback", ""),
-                    revision_count=plan_data.get("revision_count", 0),
-                    revision_history=plan_data.get("revision_history", []),
-                    execution_run_id=plan_data.get("execution_run_id", ""),
-                )
-                if plan.status == "pending" and not _plan_is_expired(plan):
-                    session.active_plan = plan
-                    logger.info("Restored pending plan %s for session %s", plan.plan_id, key)
+            hot_hours=RESTORE_HOT_HOURS or None,
+        ):
+            if data.get("cold"):
+                if key not in _sessions:
+                    _cold_sessions.add(key)
+                    deferred += 1
+                continue
+            _hydrate_session(key, _get_session(key), data)
             restored += 1
-        if restored:
-            logger.info("Restored %d chat sessions from DB", restored)
+        if restored or deferred:
+            logger.info(
+                "Restored %d chat sessions from DB (%d deferred until first use)",
+                restored,
+                deferred,
+            )
     except Exception as e:
         logger.warning("Failed to load persisted webchat sessions: %s", e)
 
@@ -6,23 +6,38 @@ as JSONB (LangChain pattern). In-memory dicts in telegram.py and chat.py
 remain the hot path; this module provides durability across engine restarts.
 
 All DB writes are fire-and-forget via async wrappers. Reads happen once
-at startup via load_all_sessions().
+at startup via iter_sessions(), which streams every active session and its
+recent messages from a single query; sessions restored lazily are read
+later, one at a time, via load_session().
+
+Saved turns are embedded in the background by a coalescing queue that
+batches turns across sessions and yields to interactive embedding calls.
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import json
 import logging
-from typing import Any
+import os
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any
 
 from psycopg2.extras import RealDictCursor
 
 from robothor.constants import DEFAULT_TENANT
 from robothor.db.connection import get_connection
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
 logger = logging.getLogger(__name__)
 
+# Rows per round trip when streaming sessions at startup (server-side cursor).
+RESTORE_FETCH_SIZE = 2000
+
 
 # ── Sync functions (called from async wrappers via run_in_executor) ──
 
@@ -152,7 +167,7 @@ def load_session(
 
         cur.execute(
             """
-            SELECT s.id, s.model_override
+            SELECT s.id, s.model_override, s.plan_state
             FROM chat_sessions s
             WHERE s.tenant_id = %s AND s.session_key = %s
             """,
@@ -177,66 +192,106 @@ def load_session(
         # Reverse to chronological order (fetched DESC for LIMIT)
         messages = [row["message"] for row in reversed(rows)]
 
-        return {
+        data: dict[str, Any] = {
             "history": messages,
             "model_override": session_row["model_override"],
         }
+        if session_row.get("plan_state"):
+            data["plan_state"] = session_row["plan_state"]
+        return data
 
 
-def load_all_sessions(
+def iter_sessions(
     limit_per_session: int = 20,
     ttl_days: int = 7,
     tenant_id: str = DEFAULT_TENANT,
-) -> dict[str, dict[str, Any]]:
-    """Load all active sessions with their messages.
-
-    Returns {session_key: {"history": [...], "model_override": str|None}}.
-    Used at startup to populate in-memory caches.
+    key_prefix: str = "",
+    hot_hours: float | None = None,
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Stream active sessions with their last messages from one query.
+
+    Yields (session_key, {"history": [...], "model_override": str|None,
+    ["plan_state": {...}]}) per session, most recently active first, as soon
+    as that session's rows have arrived. Each session's newest
+    ``limit_per_session`` messages come from a LATERAL top-N over the
+    (session_id, created_at) index, so the cost no longer grows with one
+    round trip per session.
+
+    ``key_prefix`` restricts the session keys. With ``hot_hours`` set,
+    sessions idle for longer are yielded with ``"cold": True`` and no
+    history — the caller loads them later with load_session().
     """
     with get_connection() as conn:
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        # Get active sessions within TTL
-        cur.execute(
-            """
-            SELECT id, session_key, model_override, plan_state
-            FROM chat_sessions
-            WHERE tenant_id = %s
-              AND last_active_at >= NOW() - INTERVAL '%s days'
-            ORDER BY last_active_at DESC
-            """,
-            (tenant_id, ttl_days),
-        )
-        sessions = cur.fetchall()
-
-        if not sessions:
-            return {}
-
-        result: dict[str, dict[str, Any]] = {}
-
-        for sess in sessions:
+        cur = conn.cursor(name="chat_session_restore", cursor_factory=RealDictCursor)
+        cur.itersize = RESTORE_FETCH_SIZE
+        try:
             cur.execute(
                 """
-                SELECT message
-                FROM chat_messages
-                WHERE session_id = %s
-                ORDER BY created_at DESC
-                LIMIT %s
+                WITH active AS (
+                    SELECT id, session_key, model_override, plan_state, last_active_at,
+                           (%s::float8 IS NOT NULL
+                            AND last_active_at < NOW() - %s::float8 * INTERVAL '1 hour') AS cold
+                    FROM chat_sessions
+                    WHERE tenant_id = %s
+                      AND last_active_at >= NOW() - INTERVAL '%s days'
+                      AND starts_with(session_key, %s)
+                )
+                SELECT a.session_key, a.model_override, a.plan_state, a.cold, m.message
+                FROM active a
+                LEFT JOIN LATERAL (
+                    SELECT message, created_at, id
+                    FROM chat_messages
+                    WHERE session_id = a.id AND NOT a.cold
+                    ORDER BY created_at DESC, id DESC
+                    LIMIT %s
+                ) m ON TRUE
+                ORDER BY a.last_active_at DESC, a.id, m.created_at, m.id
                 """,
-                (sess["id"], limit_per_session),
+                (hot_hours, hot_hours, tenant_id, ttl_days, key_prefix, limit_per_session),
             )
-            rows = cur.fetchall()
-            messages = [row["message"] for row in reversed(rows)]
 
-            data: dict[str, Any] = {
-                "history": messages,
-                "model_override": sess["model_override"],
-            }
-            if sess.get("plan_state"):
-                data["plan_state"] = sess["plan_state"]
-            result[sess["session_key"]] = data
+            key: str | None = None
+            data: dict[str, Any] = {}
+            while rows := cur.fetchmany(RESTORE_FETCH_SIZE):
+                for row in rows:
+                    if row["session_key"] != key:
+                        if key is not None:
+                            yield key, data
+                        key = row["session_key"]
+                        data = {"history": [], "model_override": row["model_override"]}
+                        if row.get("plan_state"):
+                            data["plan_state"] = row["plan_state"]
+                        if row.get("cold"):
+                            data["cold"] = True
+                    if row["message"] is not None:
+                        data["history"].append(row["message"])
+            if key is not None:
+                yield key, data
+        finally:
+            cur.close()
 
-        return result
+
+def load_all_sessions(
+    limit_per_session: int = 20,
+    ttl_days: int = 7,
+    tenant_id: str = DEFAULT_TENANT,
+    key_prefix: str = "",
+    hot_hours: float | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Load all active sessions with their messages.
+
+    Returns {session_key: {"history": [...], "model_override": str|None}}.
+    Used at startup to populate in-memory caches. See iter_sessions().
+    """
+    return dict(
+        iter_sessions(
+            limit_per_session=limit_per_session,
+            ttl_days=ttl_days,
+            tenant_id=tenant_id,
+            key_prefix=key_prefix,
+            hot_hours=hot_hours,
+        )
+    )
 
 
 def clear_session(
@@ -399,47 +454,191 @@ async def save_exchange_async(
 
     if inserted_ids:
         texts = [user_content, assistant_content]
-        asyncio.create_task(_embed_turns(inserted_ids, texts))
+        _embedding_queue.enqueue(inserted_ids, texts)
 
 
-async def _embed_turns(message_ids: list[int], texts: list[str]) -> None:
-    """Background task: embed chat turns and store the vectors.
+async def _embed_turns(message_ids: list[int], texts: list[str]) -> int:
+    """Embed chat turns in one Ollama call and bulk-update the vectors.
 
-    Best-effort — failures are logged but never propagate. Embeddings are
-    batched in one Ollama call for efficiency.
+    Best-effort — failures are logged but never propagate. Returns the
+    number of turns whose embedding was stored.
     """
     if not message_ids:
-        return
+        return 0
     try:
         from robothor.llm import ollama as llm_client
 
         embeddings = await llm_client.get_embeddings_batch_async(texts)
     except Exception as e:
         logger.warning("chat turn embedding failed: %s", e)
-        return
+        return 0
+
+    rows = [(mid, emb) for mid, emb in zip(message_ids, embeddings, strict=True) if emb is not None]
+    if not rows:
+        return 0
 
     try:
         loop = asyncio.get_running_loop()
 
         def _update() -> None:
+            from psycopg2.extras import execute_values
+
             with get_connection() as conn:
                 cur = conn.cursor()
-                for mid, emb in zip(message_ids, embeddings, strict=True):
-                    if emb is None:
-                        continue
-                    cur.execute(
-                        """
-                        UPDATE chat_messages
-                        SET embedding = %s, embedded_at = NOW()
-                        WHERE id = %s
-                        """,
-                        (emb, mid),
-                    )
+                execute_values(
+                    cur,
+                    """
+                    UPDATE chat_messages AS m
+                    SET embedding = v.embedding::vector, embedded_at = NOW()
+                    FROM (VALUES %s) AS v(id, embedding)
+                    WHERE m.id = v.id
+                    """,
+                    rows,
+                    page_size=len(rows),
+                )
                 conn.commit()
 
         await loop.run_in_executor(None, _update)
     except Exception as e:
         logger.warning("chat turn embedding persist failed: %s", e)
+        return 0
+    return len(rows)
+
+
+# ── Background embedding queue ──
+
+EMBED_BATCH_SIZE = int(os.environ.get("ROBOTHOR_CHAT_EMBED_BATCH", "64"))
+# How long to wait for more turns before embedding a partial batch.
+EMBED_COALESCE_S = float(os.environ.get("ROBOTHOR_CHAT_EMBED_COALESCE_S", "2.0"))
+# Upper bound on how long a batch yields to interactive embedding calls.
+EMBED_MAX_DEFER_S = float(os.environ.get("ROBOTHOR_CHAT_EMBED_MAX_DEFER_S", "30.0"))
+_EMBED_IDLE_POLL_S = 0.25
+
+
+class ChatEmbeddingQueue:
+    """Coalesces chat turns across sessions into batched background embeds.
+
+    Turns are embedded once EMBED_BATCH_SIZE are pending or EMBED_COALESCE_S
+    has passed since the first one arrived. Before each batch the worker
+    waits (up to EMBED_MAX_DEFER_S) until no interactive single-text
+    embeddings are in flight, so retrieval keeps priority on Ollama.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = EMBED_BATCH_SIZE,
+        coalesce_s: float = EMBED_COALESCE_S,
+        max_defer_s: float = EMBED_MAX_DEFER_S,
+    ) -> None:
+        self.batch_size = max(1, batch_size)
+        self.coalesce_s = coalesce_s
+        self.max_defer_s = max_defer_s
+        self._pending: deque[tuple[int, str, float]] = deque()
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._embedded = 0
+        self._failed = 0
+        self._batches = 0
+        self._last_lag_s = 0.0
+
+    def enqueue(self, message_ids: list[int], texts: list[str]) -> None:
+        """Queue turns for embedding and make sure the worker is running."""
+        now = time.monotonic()
+        for mid, text in zip(message_ids, texts, strict=True):
+            self._pending.append((mid, text, now))
+        self._publish_metrics()
+        self._ensure_worker()
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def stats(self) -> dict[str, Any]:
+        """Backlog depth and lag for health/metrics reporting."""
+        return {
+            "backlog": len(self._pending),
+            "oldest_pending_s": round(self._oldest_age(), 3),
+            "last_batch_lag_s": round(self._last_lag_s, 3),
+            "embedded": self._embedded,
+            "failed": self._failed,
+            "batches": self._batches,
+        }
+
+    async def drain(self) -> None:
+        """Embed everything pending now, without coalescing or deferral."""
+        while self._pending:
+            await self._embed_next_batch()
+
+    def _oldest_age(self) -> float:
+        if not self._pending:
+            return 0.0
+        return time.monotonic() - self._pending[0][2]
+
+    def _ensure_worker(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._task is not None and not self._task.done() and self._task.get_loop() is loop:
+            return
+        self._wakeup = asyncio.Event()
+        self._task = loop.create_task(self._run(), name="chat-embedding-queue")
+
+    async def _run(self) -> None:
+        assert self._wakeup is not None
+        wakeup = self._wakeup
+        while True:
+            if not self._pending:
+                wakeup.clear()
+                await wakeup.wait()
+                continue
+            # Give other sessions a chance to add turns to this batch.
+            wait = self.coalesce_s - self._oldest_age()
+            if len(self._pending) < self.batch_size and wait > 0:
+                wakeup.clear()
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), timeout=wait)
+                continue
+            await self._wait_for_idle()
+            try:
+                await self._embed_next_batch()
+            except Exception as e:
+                logger.warning("chat embedding queue batch failed: %s", e)
+
+    async def _wait_for_idle(self) -> None:
+        from robothor.llm import ollama as llm_client
+
+        deadline = time.monotonic() + self.max_defer_s
+        while llm_client.embeddings_in_flight() > 0 and time.monotonic() < deadline:
+            await asyncio.sleep(_EMBED_IDLE_POLL_S)
+
+    async def _embed_next_batch(self) -> None:
+        batch = [self._pending.popleft() for _ in range(min(self.batch_size, len(self._pending)))]
+        if not batch:
+            return
+        self._last_lag_s = time.monotonic() - batch[0][2]
+        stored = await _embed_turns([mid for mid, _, _ in batch], [text for _, text, _ in batch])
+        self._embedded += stored
+        self._failed += len(batch) - stored
+        self._batches += 1
+        self._publish_metrics()
+
+    def _publish_metrics(self) -> None:
+        try:
+            from robothor.engine.metrics import CHAT_EMBED_BACKLOG, CHAT_EMBED_LAG
+
+            CHAT_EMBED_BACKLOG.set(len(self._pending))
+            CHAT_EMBED_LAG.set(self._oldest_age())
+        except Exception:
+            pass
+
+
+_embedding_queue = ChatEmbeddingQueue()
+
+
+def embedding_queue_stats() -> dict[str, Any]:
+    """Backlog depth and embedding lag of the chat turn embedding queue."""
+    return _embedding_queue.stats()
+
+
+async def drain_embedding_queue() -> None:
+    """Embed all pending chat turns immediately (shutdown, tests)."""
+    await _embedding_queue.drain()
 
 
 def search_chat_turns(
@@ -287,7 +287,7 @@ async def compact(
     Returns:
         CompactionResult with compacted messages and metadata.
     """
-    from robothor.engine.context import KEEP_RECENT, estimate_tokens
+    from robothor.engine.context import KEEP_RECENT, TokenCountedMessages, estimate_tokens
 
     tokens_before = estimate_tokens(messages)
 
@@ -308,7 +308,7 @@ async def compact(
         )
 
     summary_model = models[0] if models else FACT_EXTRACTION_MODEL
-    working = list(messages)  # Shallow copy
+    working = TokenCountedMessages(messages)  # Shallow copy, counted incrementally
     all_facts: list[CompactionFact] = []
 
     # ── Pass 1: Tool result thinning ──────────────────────────────────
@@ -404,13 +404,14 @@ async def compact(
         segment_summaries.append(summary)
 
     # Build compacted message list
-    result_msgs = [system_msg]
+    result_msgs = TokenCountedMessages([system_msg])
 
     # Retained facts always first (after system)
     if all_facts:
         result_msgs.append(_build_retained_context_message(all_facts))
 
     # Segment summaries as a combined user message
+    summary_idx = len(result_msgs)
     if segment_summaries:
         combined_summary = "[Conversation summary]\n" + "\n---\n".join(segment_summaries)
         result_msgs.append({"role": "user", "content": combined_summary})
@@ -435,22 +436,12 @@ async def compact(
         )
 
     # ── Pass 4: Progressive pruning ───────────────────────────────────
-    # Drop oldest segment summaries, keep facts
+    # Drop oldest segment summaries, keep facts. Only the summary message
+    # changes, so the running count is updated rather than recomputed.
     while est >= drain_to and len(segment_summaries) > 1:
         segment_summaries.pop(0)
-        result_msgs = [system_msg]
-        if all_facts:
-            result_msgs.append(_build_retained_context_message(all_facts))
-        if segment_summaries:
-            combined_summary = "[Conversation summary]\n" + "\n---\n".join(segment_summaries)
-            result_msgs.append({"role": "user", "content": combined_summary})
-            result_msgs.append(
-                {
-                    "role": "assistant",
-                    "content": "Understood. I have context from our previous conversation.",
-                }
-            )
-        result_msgs.extend(recent_messages)
+        combined_summary = "[Conversation summary]\n" + "\n---\n".join(segment_summaries)
+        result_msgs[summary_idx] = {"role": "user", "content": combined_summary}
         est = estimate_tokens(result_msgs)
 
     logger.info("Pass 4 (progressive pruning): ~%d → ~%d tokens", tokens_before, est)
@@ -3,15 +3,18 @@ Context Window Management — prevents unbounded growth in persistent sessions.
 
 Estimates token usage, compresses old messages via LLM summary,
 and provides stats for the /context command.
+
+Agent sessions keep their messages in a TokenCountedMessages list whose
+running counters make estimate_tokens() O(1) on the hot path.
 """
 
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, SupportsIndex
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Iterable
 
 logger = logging.getLogger(__name__)
 
@@ -40,24 +43,234 @@ def register_post_compress_hook(fn: Callable[..., Any]) -> None:
     _post_compress_hooks.append(fn)
 
 
+def _message_cost(msg: dict[str, Any]) -> tuple[int, int]:
+    """(chars, tool_calls) one message contributes to estimate_tokens()."""
+    chars = 0
+    content = msg.get("content")
+    if content:
+        chars += len(content)
+    tool_calls = msg.get("tool_calls")
+    if not tool_calls:
+        return chars, 0
+    for tc in tool_calls:
+        fn = tc.get("function", {})
+        chars += len(fn.get("arguments", ""))
+        chars += len(fn.get("name", ""))
+    return chars, len(tool_calls)
+
+
+def _estimate_from(chars: int, tool_calls: int) -> int:
+    return (chars // 4) + (tool_calls * 400)
+
+
 def estimate_tokens(messages: list[dict[str, Any]]) -> int:
-    """Fast token estimate: total chars / 4, plus 400 per tool call."""
+    """Fast token estimate: total chars / 4, plus 400 per tool call.
+
+    O(1) for a TokenCountedMessages list (running counters).
+    """
+    if isinstance(messages, TokenCountedMessages):
+        return messages.estimated_tokens
+
     total_chars = 0
     tool_call_count = 0
-
     for msg in messages:
-        content = msg.get("content")
-        if content:
-            total_chars += len(content)
-        tool_calls = msg.get("tool_calls")
-        if tool_calls:
-            tool_call_count += len(tool_calls)
-            for tc in tool_calls:
-                fn = tc.get("function", {})
-                total_chars += len(fn.get("arguments", ""))
-                total_chars += len(fn.get("name", ""))
-
-    return (total_chars // 4) + (tool_call_count * 400)
+        chars, calls = _message_cost(msg)
+        total_chars += chars
+        tool_call_count += calls
+    return _estimate_from(total_chars, tool_call_count)
+
+
+# ── Exact tokenizers (optional, per provider) ─────────────────────
+
+_tokenizers: dict[str, Callable[[str], int]] = {}
+
+
+def register_tokenizer(provider: str, tokenizer: Callable[[str], int]) -> None:
+    """Register an exact token counter for models under a provider prefix.
+
+    ``provider`` is matched against the model id as a path prefix, e.g.
+    ``"openrouter/anthropic"`` covers ``"openrouter/anthropic/claude-sonnet-4.6"``.
+    The longest matching prefix wins.
+    """
+    _tokenizers[provider.rstrip("/")] = tokenizer
+
+
+def unregister_tokenizer(provider: str) -> None:
+    _tokenizers.pop(provider.rstrip("/"), None)
+
+
+def get_tokenizer(model: str) -> Callable[[str], int] | None:
+    """Exact tokenizer registered for a model's provider, or None."""
+    best: str | None = None
+    for prefix in _tokenizers:
+        if (model == prefix or model.startswith(prefix + "/")) and (
+            best is None or len(prefix) > len(best)
+        ):
+            best = prefix
+    return _tokenizers[best] if best is not None else None
+
+
+def _message_text(msg: dict[str, Any]) -> str:
+    """Text an exact tokenizer should count for one message."""
+    parts: list[str] = []
+    content = msg.get("content")
+    if isinstance(content, str):
+        parts.append(content)
+    elif isinstance(content, list):
+        parts.extend(
+            b["text"] for b in content if isinstance(b, dict) and isinstance(b.get("text"), str)
+        )
+    for tc in msg.get("tool_calls") or []:
+        fn = tc.get("function", {})
+        parts.append(fn.get("name", "") or "")
+        parts.append(fn.get("arguments", "") or "")
+    return "\n".join(p for p in parts if p)
+
+
+class TokenCountedMessages(list[dict[str, Any]]):
+    """Message list that keeps running token counters.
+
+    Appends, removals and index assignment update the counters in O(1)
+    per message. Slice assignment and reordering recount the whole list.
+    Messages edited in place (``msgs[i]["content"] = ...``) must be
+    followed by ``refresh(i)`` — or use ``set_content(i, ...)``.
+
+    With an exact tokenizer, ``exact_tokens`` sums the tokenizer over
+    each message's text; otherwise it is None.
+    """
+
+    def __init__(
+        self,
+        messages: Iterable[dict[str, Any]] = (),
+        tokenizer: Callable[[str], int] | None = None,
+    ) -> None:
+        super().__init__(messages)
+        self._tokenizer = tokenizer
+        self.recount()
+
+    # ── Counters ──
+
+    @property
+    def estimated_tokens(self) -> int:
+        return _estimate_from(self._chars, self._tool_calls)
+
+    @property
+    def exact_tokens(self) -> int | None:
+        return self._exact if self._tokenizer is not None else None
+
+    @property
+    def tokens(self) -> int:
+        """Exact count when a tokenizer is set, else the char-based estimate."""
+        return self._exact if self._tokenizer is not None else self.estimated_tokens
+
+    @property
+    def tokenizer(self) -> Callable[[str], int] | None:
+        return self._tokenizer
+
+    def set_tokenizer(self, tokenizer: Callable[[str], int] | None) -> None:
+        self._tokenizer = tokenizer
+        self.recount()
+
+    def recount(self) -> None:
+        """Recompute all counters from scratch."""
+        self._costs = [self._cost(m) for m in self]
+        self._chars = sum(c[0] for c in self._costs)
+        self._tool_calls = sum(c[1] for c in self._costs)
+        self._exact = sum(c[2] for c in self._costs)
+
+    def refresh(self, index: SupportsIndex) -> None:
+        """Re-count one message after it was edited in place."""
+        i = range(len(self))[index]
+        self._sub(self._costs[i])
+        self._costs[i] = self._cost(self[i])
+        self._add(self._costs[i])
+
+    def set_content(self, index: SupportsIndex, content: Any) -> None:
+        """Replace a message's content and update the counters."""
+        self[index]["content"] = content
+        self.refresh(index)
+
+    def _cost(self, msg: dict[str, Any]) -> tuple[int, int, int]:
+        chars, calls = _message_cost(msg)
+        exact = self._tokenizer(_message_text(msg)) if self._tokenizer is not None else 0
+        return chars, calls, exact
+
+    def _add(self, cost: tuple[int, int, int]) -> None:
+        self._chars += cost[0]
+        self._tool_calls += cost[1]
+        self._exact += cost[2]
+
+    def _sub(self, cost: tuple[int, int, int]) -> None:
+        self._chars -= cost[0]
+        self._tool_calls -= cost[1]
+        self._exact -= cost[2]
+
+    # ── Mutators ──
+
+    def append(self, msg: dict[str, Any]) -> None:
+        super().append(msg)
+        cost = self._cost(msg)
+        self._costs.append(cost)
+        self._add(cost)
+
+    def extend(self, msgs: Iterable[dict[str, Any]]) -> None:
+        for msg in msgs:
+            self.append(msg)
+
+    def __iadd__(self, msgs: Iterable[dict[str, Any]]) -> TokenCountedMessages:  # type: ignore[override,misc]
+        self.extend(msgs)
+        return self
+
+    def pop(self, index: SupportsIndex = -1) -> dict[str, Any]:
+        msg = super().pop(index)
+        self._sub(self._costs.pop(index))
+        return msg
+
+    def __setitem__(self, index: Any, value: Any) -> None:
+        if isinstance(index, slice):
+            if value is self:
+                return
+            super().__setitem__(index, list(value))
+            self.recount()
+            return
+        i = range(len(self))[index]
+        super().__setitem__(i, value)
+        self._sub(self._costs[i])
+        self._costs[i] = self._cost(value)
+        self._add(self._costs[i])
+
+    def __delitem__(self, index: Any) -> None:
+        super().__delitem__(index)
+        if isinstance(index, slice):
+            self.recount()
+            return
+        self._sub(self._costs.pop(index))
+
+    def insert(self, index: SupportsIndex, msg: dict[str, Any]) -> None:
+        super().insert(index, msg)
+        cost = self._cost(msg)
+        self._costs.insert(index, cost)
+        self._add(cost)
+
+    def remove(self, msg: dict[str, Any]) -> None:
+        del self[self.index(msg)]
+
+    def clear(self) -> None:
+        super().clear()
+        self.recount()
+
+    def sort(self, *args: Any, **kwargs: Any) -> None:
+        super().sort(*args, **kwargs)
+        self.recount()
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._costs.reverse()
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # Rebuild through __init__ so copies and unpickled lists get their
+        # counters from a recount, not from list items replayed via append()
+        return (type(self), (list(self), self._tokenizer))
 
 
 def _clear_old_tool_results(
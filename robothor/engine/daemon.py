@@ -220,6 +220,20 @@ async def main() -> None:
         config.hourly_cost_cap_usd,
     )
 
+    # Follow memory block writes from other processes (opt-in via
+    # ROBOTHOR_BLOCK_CHANGE_EVENTS) so cached warmup blocks stay fresh.
+    from robothor.memory.blocks import start_block_change_listener
+
+    if start_block_change_listener():
+        logger.info("Memory block cache listening for change events")
+
+    # Same for role permissions and the tenant hierarchy (opt-in via
+    # ROBOTHOR_PERMISSION_CHANGE_EVENTS); the TTL bounds staleness otherwise.
+    from robothor.engine.permissions import start_permission_change_listener
+
+    if start_permission_change_listener():
+        logger.info("Permission cache listening for change events")
+
     # Initialize lifecycle hook registry
     from robothor.engine.hook_registry import (
         init_hook_registry,
@@ -345,6 +359,28 @@ async def main() -> None:
 
     await get_task_registry().drain()
 
+    # Stop persistent command-hook workers
+    try:
+        await hook_registry.shutdown()
+    except Exception as e:
+        logger.debug("Hook worker shutdown failed: %s", e)
+
+    # Close keep-alive connections of the tool handlers' shared HTTP pool
+    try:
+        from robothor.engine.http_pool import close_http_clients
+
+        await close_http_clients()
+    except Exception as e:
+        logger.debug("HTTP pool shutdown failed: %s", e)
+
+    # Flush chat turns still waiting for background embedding
+    try:
+        from robothor.engine.chat_store import drain_embedding_queue
+
+        await asyncio.wait_for(drain_embedding_queue(), timeout=30)
+    except Exception as e:
+        logger.debug("Chat embedding queue drain failed: %s", e)
+
     await scheduler.stop()
     await hooks.stop()
     await bot.stop()
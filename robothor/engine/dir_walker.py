@@ -0,0 +1,294 @@
+"""Ignore-aware directory walker for the list_directory tool.
+
+Walks breadth-first with ``os.scandir``. Entries are only stat'ed when they
+are returned. Directories matched by ignore rules are pruned before
+descending. The rules are:
+
+- ``DEFAULT_IGNORES`` (VCS metadata, dependency and cache directories);
+- ``.gitignore`` files of enclosing directories up to the repository root;
+- ``.gitignore`` files found during the walk, scoped to their subtree.
+
+Ignore files follow gitignore syntax: ``#`` comments, ``!`` negation, a
+trailing ``/`` for directories only, a leading or inner ``/`` anchors the
+pattern to its directory, and ``*``/``?``/``[...]``/``**`` globs. Within a
+file, and from outer files to inner ones, the last matching rule wins.
+
+Directory listings and parsed ignore files are cached for up to
+``LISTING_TTL_S`` and revalidated against the directory's mtime.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fnmatch
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+DEFAULT_IGNORES = (
+    ".git/",
+    ".hg/",
+    ".svn/",
+    "node_modules/",
+    "__pycache__/",
+    ".venv/",
+    ".mypy_cache/",
+    ".pytest_cache/",
+    ".ruff_cache/",
+    ".tox/",
+)
+
+# Directories visited per walk before giving up (reported as truncated)
+MAX_DIRS = 5000
+
+LISTING_TTL_S = 10.0
+LISTING_CACHE_SIZE = 2048
+
+# Levels searched upwards for the repository root
+_MAX_ANCESTORS = 32
+
+
+@dataclass(frozen=True)
+class IgnoreRule:
+    regex: re.Pattern[str]
+    negate: bool
+    dir_only: bool
+
+
+def _translate(pattern: str) -> str:
+    """Translate one gitignore glob into a regex over ``/``-separated paths."""
+    out: list[str] = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+            continue
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[" and (j := pattern.find("]", i + 2)) != -1:
+            body = pattern[i + 1 : j]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = j + 1
+            continue
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+            continue
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def parse_ignore(lines: list[str] | tuple[str, ...]) -> list[IgnoreRule]:
+    """Compile gitignore-style lines into rules."""
+    rules = []
+    for raw in lines:
+        line = raw.rstrip("\n").rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negate = line.startswith("!")
+        if negate or line.startswith(("\\!", "\\#")):
+            line = line[1:]
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        if not line:
+            continue
+        anchored = "/" in line
+        regex = _translate(line.lstrip("/"))
+        if not anchored:
+            regex = f"(?:.*/)?{regex}"
+        rules.append(IgnoreRule(re.compile(regex + r"\Z"), negate, dir_only))
+    return rules
+
+
+_DEFAULT_RULES = parse_ignore(DEFAULT_IGNORES)
+
+# A rule set applies to paths under ``base`` (absolute, without trailing slash)
+RuleSet = tuple[str, list[IgnoreRule]]
+
+
+def is_ignored(rule_sets: list[RuleSet], path: str, is_dir: bool) -> bool:
+    ignored = False
+    for base, rules in rule_sets:
+        rel = path[len(base) + 1 :]
+        for rule in rules:
+            if rule.dir_only and not is_dir:
+                continue
+            if rule.regex.match(rel):
+                ignored = not rule.negate
+    return ignored
+
+
+# ── Cached scandir and ignore files ────────────────────────────────────
+
+
+@dataclass
+class _Listing:
+    mtime_ns: int
+    checked: float
+    entries: list[tuple[str, bool, bool]]  # (name, is_dir, is_symlink), sorted by name
+
+
+_listings: OrderedDict[str, _Listing] = OrderedDict()
+_ignore_files: OrderedDict[str, tuple[int, list[IgnoreRule]]] = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def _remember(cache: OrderedDict[str, Any], key: str, value: Any) -> None:
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > LISTING_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+def scan(directory: str) -> list[tuple[str, bool, bool]]:
+    """Sorted ``(name, is_dir, is_symlink)`` entries of ``directory``, cached by mtime."""
+    mtime_ns = Path(directory).stat().st_mtime_ns
+    now = time.monotonic()
+    with _cache_lock:
+        cached = _listings.get(directory)
+        if cached and cached.mtime_ns == mtime_ns and now - cached.checked < LISTING_TTL_S:
+            _listings.move_to_end(directory)
+            return cached.entries
+    with os.scandir(directory) as it:
+        entries = sorted((e.name, e.is_dir(), e.is_symlink()) for e in it)
+    with _cache_lock:
+        _remember(_listings, directory, _Listing(mtime_ns, now, entries))
+    return entries
+
+
+def _load_ignore_file(path: Path) -> list[IgnoreRule]:
+    key = str(path)
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:
+        return []
+    with _cache_lock:
+        cached = _ignore_files.get(key)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+    try:
+        with path.open(encoding="utf-8", errors="replace") as f:
+            rules = parse_ignore(f.readlines())
+    except OSError:
+        return []
+    with _cache_lock:
+        _remember(_ignore_files, key, (mtime_ns, rules))
+    return rules
+
+
+def clear_cache() -> None:
+    with _cache_lock:
+        _listings.clear()
+        _ignore_files.clear()
+
+
+def _ancestor_rules(root: str) -> list[RuleSet]:
+    """Ignore files of directories above ``root``, up to the enclosing repository root."""
+    found: list[RuleSet] = []
+    current = Path(root)
+    for _ in range(_MAX_ANCESTORS):
+        if (current / ".git").is_dir():
+            return found
+        if current.parent == current:
+            break
+        current = current.parent
+        rules = _load_ignore_file(current / ".gitignore")
+        if rules:
+            found.insert(0, (str(current).rstrip("/"), rules))
+    return []  # not inside a repository
+
+
+# ── Walk ───────────────────────────────────────────────────────────────
+
+
+def _entry(name: str, path: str, is_dir: bool) -> dict[str, Any]:
+    size = 0
+    if not is_dir:
+        with contextlib.suppress(OSError):
+            size = Path(path).stat().st_size
+    return {"name": name, "type": "dir" if is_dir else "file", "size": size}
+
+
+def walk(
+    root: str,
+    *,
+    max_depth: int | None = 1,
+    pattern: str = "",
+    max_entries: int = 200,
+    respect_ignores: bool = True,
+) -> tuple[list[dict[str, Any]], bool]:
+    """List entries under ``root`` breadth-first, sorted within each directory.
+
+    ``max_depth`` of 1 lists only ``root`` itself; None is unlimited.
+    ``pattern`` is a glob matched against the entry name, or against its
+    path relative to ``root`` when it contains ``/``. Path patterns use
+    ``Path.glob`` semantics: ``*`` stays within one directory and ``**/``
+    matches zero or more directories. A path pattern raises ``max_depth``
+    to the depth it names, and one containing ``**`` walks without a depth
+    limit. Non-matching directories are still descended. Symlinked directories are listed but
+    not followed. Returns ``(entries, truncated)``.
+    """
+    root = str(Path(root).absolute())
+    rule_sets: list[RuleSet] = []
+    if respect_ignores:
+        rule_sets = [(root.rstrip("/"), _DEFAULT_RULES), *_ancestor_rules(root)]
+    path_regex = re.compile(_translate(pattern) + r"\Z") if "/" in pattern else None
+    if path_regex is not None and max_depth is not None:
+        if "**" in pattern:
+            max_depth = None
+        else:
+            max_depth = max(max_depth, pattern.count("/") + 1)
+
+    entries: list[dict[str, Any]] = []
+    queue: deque[tuple[str, str, int, list[RuleSet]]] = deque([(root, "", 1, rule_sets)])
+    visited = 0
+    while queue:
+        directory, prefix, depth, rules = queue.popleft()
+        visited += 1
+        if visited > MAX_DIRS:
+            return entries, True
+        try:
+            listing = scan(directory)
+        except OSError:
+            if directory == root:
+                raise
+            continue
+        base = directory.rstrip("/")
+        if respect_ignores and any(name == ".gitignore" for name, _, _ in listing):
+            own = _load_ignore_file(Path(directory, ".gitignore"))
+            if own:
+                rules = [*rules, (base, own)]
+
+        for name, is_dir, is_symlink in listing:
+            path = f"{base}/{name}"
+            if rules and is_ignored(rules, path, is_dir):
+                continue
+            rel = f"{prefix}{name}"
+            if path_regex is not None:
+                matched = path_regex.match(rel) is not None
+            else:
+                matched = not pattern or fnmatch.fnmatchcase(name, pattern)
+            if matched:
+                if len(entries) >= max_entries:
+                    return entries, True
+                entries.append(_entry(rel, path, is_dir))
+            if is_dir and not is_symlink and (max_depth is None or depth < max_depth):
+                queue.append((path, f"{rel}/", depth + 1, rules))
+    return entries, False
@@ -0,0 +1,234 @@
+"""Bounded-memory file reads for the read_file tool.
+
+Every read seeks and returns at most ``limit`` bytes, so memory use does not
+depend on file size:
+
+- ``read_byte_range`` — a byte window, with both ends moved to UTF-8
+  character boundaries.
+- ``read_lines`` — a 1-based line range. A sparse line index (one checkpoint
+  every ``LINE_INDEX_STRIDE`` lines) is built by streaming the file in chunks.
+  It is extended only as far as the requested line and cached per file stat.
+  Later reads then seek near their target instead of rescanning from the start.
+- ``read_tail`` — the last N lines, read backwards from the end in blocks.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import TYPE_CHECKING, Any, BinaryIO
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+DEFAULT_LIMIT = 50_000
+MAX_LIMIT = 200_000
+
+LINE_INDEX_STRIDE = 1000
+LINE_INDEX_CACHE_SIZE = 64
+_CHUNK = 1 << 20
+_TAIL_BLOCK = 64 * 1024
+
+
+def char_start(data: bytes, pos: int) -> int:
+    """Move ``pos`` forward past UTF-8 continuation bytes."""
+    while pos < len(data) and (data[pos] & 0xC0) == 0x80:
+        pos += 1
+    return pos
+
+
+def _char_end(data: bytes, pos: int) -> int:
+    """Move ``pos`` back so ``data[:pos]`` does not end inside a character."""
+    while 0 < pos < len(data) and (data[pos] & 0xC0) == 0x80:
+        pos -= 1
+    return pos
+
+
+def read_byte_range(f: BinaryIO, offset: int, limit: int) -> tuple[bytes, int, int | None, int]:
+    """Read up to ``limit`` bytes of an open file from byte ``offset``.
+
+    Returns ``(data, start, next_offset, size)``. ``start`` is the offset
+    moved to a character boundary. ``next_offset`` is None at end of file.
+    """
+    size = os.fstat(f.fileno()).st_size
+    f.seek(offset)
+    # Up to 3 extra bytes complete a character cut by the window end
+    data = f.read(limit + 3)
+    start = char_start(data, 0)
+    end = char_start(data, min(limit, len(data)))
+    next_offset = offset + end
+    return data[start:end], offset + start, next_offset if next_offset < size else None, size
+
+
+@dataclass
+class _LineIndex:
+    """Byte offsets of every ``LINE_INDEX_STRIDE``-th line, built lazily."""
+
+    stat_key: tuple[int, int, int]
+    checkpoints: list[int] = field(default_factory=lambda: [0])  # [k] → start of line k*STRIDE+1
+    newlines: int = 0
+    scanned_to: int = 0
+    trailing_newline: bool = True
+    complete: bool = False
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def extend(self, f: BinaryIO, line: int) -> None:
+        """Scan forward until the checkpoint at or before 0-based ``line`` is known."""
+        f.seek(self.scanned_to)
+        while not self.complete and (len(self.checkpoints) - 1) * LINE_INDEX_STRIDE < line:
+            chunk = f.read(_CHUNK)
+            if not chunk:
+                self.complete = True
+                break
+            parts = chunk.split(b"\n")
+            found = len(parts) - 1
+            if found:
+                # Newline number newlines+j+1 ends at chunk offset ends[j] + j + 1
+                ends = list(accumulate(map(len, parts)))
+                first = (self.newlines // LINE_INDEX_STRIDE + 1) * LINE_INDEX_STRIDE
+                for j in range(first - self.newlines - 1, found, LINE_INDEX_STRIDE):
+                    self.checkpoints.append(self.scanned_to + ends[j] + j + 1)
+            self.newlines += found
+            self.scanned_to += len(chunk)
+            self.trailing_newline = chunk.endswith(b"\n")
+
+    @property
+    def total_lines(self) -> int | None:
+        if not self.complete:
+            return None
+        return self.newlines + (0 if self.trailing_newline or not self.scanned_to else 1)
+
+
+_index_cache: OrderedDict[str, _LineIndex] = OrderedDict()
+_index_lock = threading.Lock()
+
+
+def _get_index(path: Path, f: BinaryIO) -> _LineIndex:
+    st = os.fstat(f.fileno())
+    stat_key = (st.st_ino, st.st_size, st.st_mtime_ns)
+    key = str(path)
+    with _index_lock:
+        index = _index_cache.get(key)
+        if index is None or index.stat_key != stat_key:
+            index = _LineIndex(stat_key)
+            _index_cache[key] = index
+        _index_cache.move_to_end(key)
+        while len(_index_cache) > LINE_INDEX_CACHE_SIZE:
+            _index_cache.popitem(last=False)
+        return index
+
+
+def clear_line_index_cache() -> None:
+    with _index_lock:
+        _index_cache.clear()
+
+
+def read_lines(
+    path: Path, start_line: int, end_line: int | None = None, limit: int = DEFAULT_LIMIT
+) -> dict[str, Any]:
+    """Read lines ``start_line``..``end_line`` (1-based, inclusive), capped at ``limit`` bytes.
+
+    ``next_line`` is where to continue, or None at end of file. Pages end on
+    whole lines; only a single line longer than the cap is returned in part.
+    ``next_line`` then moves past it and ``next_offset`` gives the byte
+    offset of the rest of that line, for reading it with ``read_byte_range``.
+    """
+    start_line = max(1, start_line)
+    with path.open("rb") as f:
+        index = _get_index(path, f)
+        with index.lock:
+            index.extend(f, start_line - 1)
+            slot = min((start_line - 1) // LINE_INDEX_STRIDE, len(index.checkpoints) - 1)
+            pos = index.checkpoints[slot]
+            total_lines = index.total_lines
+        current = slot * LINE_INDEX_STRIDE + 1
+
+        f.seek(pos)
+        while current < start_line:
+            piece = f.readline(_CHUNK)  # lines may be longer than a chunk
+            if not piece:
+                break
+            if piece.endswith(b"\n"):
+                current += 1
+
+        out: list[bytes] = []
+        used = 0
+        rest_offset: int | None = None
+        cut_short = hit_cap = False
+        while current >= start_line and (end_line is None or current <= end_line):
+            if used >= limit:
+                hit_cap = True
+                break
+            line_start = f.tell()
+            piece = f.readline(limit - used + 1)
+            if not piece:
+                break
+            if used + len(piece) > limit:
+                if not out:  # a single line longer than the cap is returned in part
+                    part = piece[: _char_end(piece, limit - used)]
+                    out.append(part)
+                    rest_offset = line_start + len(part)
+                    while piece and not piece.endswith(b"\n"):
+                        piece = f.readline(_CHUNK)
+                    current += 1
+                else:
+                    cut_short = True
+                break
+            out.append(piece)
+            used += len(piece)
+            current += 1
+        at_eof = not f.read(1)
+
+    result: dict[str, Any] = {
+        "content": b"".join(out).decode("utf-8"),
+        "start_line": start_line,
+        "end_line": max(start_line - 1, current - 1),
+        "next_line": None if at_eof and not cut_short else current,
+        "truncated": cut_short or rest_offset is not None or (hit_cap and not at_eof),
+    }
+    if rest_offset is not None:
+        result["next_offset"] = rest_offset
+    if total_lines is not None:
+        result["total_lines"] = total_lines
+    return result
+
+
+def read_tail(path: Path, lines: int, limit: int = DEFAULT_LIMIT) -> dict[str, Any]:
+    """Read the last ``lines`` lines, capped at ``limit`` bytes."""
+    with path.open("rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        trailing = 0
+        if size:
+            f.seek(size - 1)
+            trailing = 1 if f.read(1) == b"\n" else 0
+        pos = size
+        buf = b""
+        # Read backwards until the window holds a full line before the last
+        # ``lines`` lines, reaches the start of the file, or passes the cap.
+        while pos > 0 and buf.count(b"\n") < lines + trailing and len(buf) <= limit:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+
+    parts = buf[: len(buf) - trailing].split(b"\n")
+    truncated = False
+    if pos > 0 and len(parts) <= lines:
+        # Stopped at the cap, so the first part may be a partial line
+        truncated = True
+        if len(parts) > 1:
+            parts = parts[1:]
+    data = b"\n".join(parts[-lines:]) + (b"\n" if trailing else b"")
+    if len(data) > limit:
+        # Start at a line boundary inside the last ``limit`` bytes if there is one
+        nl = data.find(b"\n", len(data) - limit, len(data) - trailing)
+        data = data[nl + 1 if nl >= 0 else char_start(data, len(data) - limit) :]
+        truncated = True
+    return {
+        "content": data.decode("utf-8"),
+        "lines": data.count(b"\n") + (1 if data and not data.endswith(b"\n") else 0),
+        "truncated": truncated,
+    }
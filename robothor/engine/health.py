@@ -355,6 +355,9 @@ def create_health_app(
                     "consecutive_errors": s.get("consecutive_errors", 0),
                 }
 
+            from robothor.engine.chat_store import embedding_queue_stats
+            from robothor.engine.model_health import get_model_health
+
             return {
                 "status": "healthy",
                 "timestamp": datetime.now(UTC).isoformat(),
@@ -362,11 +365,26 @@ def create_health_app(
                 "tenant_id": config.tenant_id,
                 "bot_configured": bool(config.bot_token),
                 "agents": agents,
+                "chat_embedding": embedding_queue_stats(),
+                "models": get_model_health().snapshot(),
             }
         except Exception:
             logger.exception("Health check failed")
             return {"status": "error", "error": "Internal server error"}
 
+    @app.get("/health/models")
+    async def model_health() -> dict[str, Any]:
+        """Circuit breaker state and rolling latency/error stats per LLM model."""
+        from robothor.engine.model_health import get_model_health
+
+        health = get_model_health()
+        return {
+            "models": health.snapshot(),
+            "window_s": health.window_s,
+            "failure_threshold": health.failure_threshold,
+            "cooldown_s": health.cooldown_s,
+        }
+
     # Startup state tracking
     _startup_complete = {"ready": False}
 
@@ -6,11 +6,16 @@ them at lifecycle points in the runner execution loop.
 Separate from hooks.py (Redis Stream event triggers) — this system handles
 fine-grained lifecycle interception with blocking, filtering, and multiple
 handler types.
+
+Command hooks run one-shot (a shell per event, the default) or, with
+``mode: worker``, as persistent processes speaking line-delimited JSON
+(see hook_workers.py).
 """
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
 import fnmatch
 import importlib
 import json
@@ -28,10 +33,19 @@ from robothor.engine.task_registry import get_task_registry
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from robothor.engine.hook_workers import HookWorkerPool, HookWorkerStats
+
 import yaml
 
 logger = logging.getLogger(__name__)
 
+# Per-event deadline for command hooks (one-shot and worker mode).
+COMMAND_TIMEOUT_S = 10
+
+# HTTP hooks share one pooled client session.
+HTTP_TIMEOUT_S = 10
+HTTP_POOL_SIZE = 20
+
 
 # ─── Enums ───────────────────────────────────────────────────────────
 
@@ -81,6 +95,8 @@ class LifecycleHook:
     agent_id: str = ""  # which agent this belongs to ("" = global)
     chain_mode: str = "short_circuit"  # "short_circuit" or "chain"
     timeout: int = 30  # seconds; 0 = no timeout
+    mode: str = "oneshot"  # command hooks: "oneshot" or "worker" (persistent process)
+    workers: int = 1  # worker mode: max concurrent worker processes
 
 
 @dataclass
@@ -102,6 +118,21 @@ class HookMetrics:
     total_duration_ms: float = 0.0
     timeouts: int = 0
     last_executed: float = 0.0  # time.monotonic()
+    last_duration_ms: float = 0.0
+    max_duration_ms: float = 0.0
+
+    @property
+    def avg_duration_ms(self) -> float:
+        return self.total_duration_ms / self.executions if self.executions else 0.0
+
+    def record(self, start: float) -> None:
+        """Record one execution that began at ``start`` (time.monotonic())."""
+        elapsed_ms = (time.monotonic() - start) * 1000
+        self.executions += 1
+        self.total_duration_ms += elapsed_ms
+        self.last_duration_ms = elapsed_ms
+        self.max_duration_ms = max(self.max_duration_ms, elapsed_ms)
+        self.last_executed = start
 
 
 @dataclass
@@ -131,6 +162,9 @@ class HookRegistry:
         self._hooks: list[LifecycleHook] = []
         self._python_handlers: dict[str, Callable[..., Any]] = {}
         self._metrics: dict[tuple[str, str], HookMetrics] = {}  # (handler, event) -> metrics
+        self._worker_pools: dict[str, HookWorkerPool] = {}  # command -> pool
+        self._http_session: Any = None  # shared aiohttp.ClientSession
+        self._http_loop: asyncio.AbstractEventLoop | None = None
 
     def register(self, hook: LifecycleHook) -> None:
         """Register a lifecycle hook."""
@@ -177,14 +211,23 @@ class HookRegistry:
         """Dispatch hooks for an event.
 
         Blocking hooks with chain_mode="short_circuit" (default):
-            first BLOCK or MODIFY wins.
+            first BLOCK or MODIFY wins. Consecutive async python and http
+            short-circuit hooks run concurrently under one shared deadline
+            (the longest of their timeouts); other handler types run in
+            turn. Verdicts are still taken in priority order, so the result
+            is the same as evaluating them one by one.
         Blocking hooks with chain_mode="chain":
             MODIFY updates context.tool_args and continues.
             BLOCK accumulates but continues.
             After all chain hooks: BLOCK > MODIFY > ALLOW.
-        Non-blocking hooks: fire-and-forget via asyncio.create_task.
+        Non-blocking hooks: fire-and-forget via asyncio.create_task, once
+            every blocking hook ahead of them has allowed.
         """
-        hooks = self.get_hooks_for_event(event, agent_id=context.agent_id)
+        hooks = [
+            h
+            for h in self.get_hooks_for_event(event, agent_id=context.agent_id)
+            if self._matches_filter(h, context)
+        ]
         if not hooks:
             return HookResult()
 
@@ -193,43 +236,38 @@ class HookRegistry:
         chain_block_reason = ""
         chain_modified = False
 
-        for hook in hooks:
-            if not self._matches_filter(hook, context):
+        i = 0
+        while i < len(hooks):
+            hook = hooks[i]
+            if not (hook.blocking and hook.chain_mode == "chain"):
+                # Maximal run of short-circuit and non-blocking hooks
+                j = i
+                while j < len(hooks) and not (hooks[j].blocking and hooks[j].chain_mode == "chain"):
+                    j += 1
+                decided = await self._dispatch_short_circuit(hooks[i:j], context)
+                if decided is not None:
+                    return decided
+                i = j
                 continue
 
-            if hook.blocking:
-                try:
-                    hr = await self._execute_handler(hook, context)
-
-                    if hook.chain_mode == "chain":
-                        # Chain mode: accumulate results, continue
-                        if hr.action == HookAction.BLOCK:
-                            chain_blocked = True
-                            if hr.reason:
-                                chain_block_reason = hr.reason
-                        elif hr.action == HookAction.MODIFY:
-                            chain_modified = True
-                            if hr.modified_args:
-                                context.tool_args = hr.modified_args
-                                result.modified_args = hr.modified_args
-                            if hr.system_message:
-                                result.system_message = hr.system_message
-                    else:
-                        # Short-circuit mode (default): first BLOCK or MODIFY wins
-                        if hr.action == HookAction.BLOCK:
-                            return hr
-                        if hr.action == HookAction.MODIFY:
-                            if hr.modified_args:
-                                context.tool_args = hr.modified_args
-                            return hr
-                except Exception as e:
-                    logger.error("Blocking hook %s failed: %s", hook.handler, e)
-                    # Fail-open: blocking hook error = allow
-            else:
-                get_task_registry().spawn(
-                    self._execute_handler_safe(hook, context),
-                    name=f"hook:{hook.event.value}:{hook.handler}",
-                )
+            # Chain mode: accumulate results, continue
+            i += 1
+            try:
+                hr = await self._execute_handler(hook, context)
+            except Exception as e:
+                logger.error("Blocking hook %s failed: %s", hook.handler, e)
+                continue  # Fail-open: blocking hook error = allow
+            if hr.action == HookAction.BLOCK:
+                chain_blocked = True
+                if hr.reason:
+                    chain_block_reason = hr.reason
+            elif hr.action == HookAction.MODIFY:
+                chain_modified = True
+                if hr.modified_args:
+                    context.tool_args = hr.modified_args
+                    result.modified_args = hr.modified_args
+                if hr.system_message:
+                    result.system_message = hr.system_message
 
         # Resolve accumulated chain results: BLOCK > MODIFY > ALLOW
         if chain_blocked:
@@ -240,6 +278,69 @@ class HookRegistry:
 
         return result
 
+    async def _dispatch_short_circuit(
+        self, hooks: list[LifecycleHook], context: HookContext
+    ) -> HookResult | None:
+        """Evaluate short-circuit and non-blocking hooks; return the first BLOCK/MODIFY.
+
+        Blocking hooks that can be cancelled (async python and http) start
+        together; the rest run one at a time when their turn comes, so a
+        command hook never starts after a BLOCK. Verdicts are read in
+        priority order and started hooks are cancelled once one decides.
+        Returns None when every blocking hook allowed (or failed open).
+        """
+        concurrent = [h for h in hooks if h.blocking and self._cancellable(h)]
+        tasks: dict[int, asyncio.Task[HookResult]] = {}
+        deadline: float | None = None
+        loop = asyncio.get_running_loop()
+        if len(concurrent) > 1:
+            tasks = {
+                idx: asyncio.ensure_future(self._execute_handler(h, context))
+                for idx, h in enumerate(hooks)
+                if h.blocking and self._cancellable(h)
+            }
+            if all(h.timeout > 0 for h in concurrent):
+                deadline = loop.time() + max(h.timeout for h in concurrent)
+
+        try:
+            for idx, hook in enumerate(hooks):
+                if not hook.blocking:
+                    get_task_registry().spawn(
+                        self._execute_handler_safe(hook, context),
+                        name=f"hook:{hook.event.value}:{hook.handler}",
+                    )
+                    continue
+
+                try:
+                    task = tasks.get(idx)
+                    if task is None:
+                        hr = await self._execute_handler(hook, context)
+                    else:
+                        timeout = None if deadline is None else max(0.0, deadline - loop.time())
+                        done, _ = await asyncio.wait({task}, timeout=timeout)
+                        if not done:
+                            self._get_metrics(hook).timeouts += 1
+                            logger.warning(
+                                "Hook %s missed the shared deadline (fail-open)", hook.handler
+                            )
+                            continue
+                        hr = task.result()
+                except Exception as e:
+                    logger.error("Blocking hook %s failed: %s", hook.handler, e)
+                    continue  # Fail-open: blocking hook error = allow
+
+                if hr.action == HookAction.BLOCK:
+                    return hr
+                if hr.action == HookAction.MODIFY:
+                    if hr.modified_args:
+                        context.tool_args = hr.modified_args
+                    return hr
+            return None
+        finally:
+            for task in tasks.values():
+                if not task.done():
+                    task.cancel()
+
     def _matches_filter(self, hook: LifecycleHook, context: HookContext) -> bool:
         """Check if a hook's filter matches the current context."""
         if not hook.filter:
@@ -267,6 +368,18 @@ class HookRegistry:
         """Return all hook metrics keyed by (handler, event)."""
         return dict(self._metrics)
 
+    def _cancellable(self, hook: LifecycleHook) -> bool:
+        """Whether cancelling the hook's task stops its work.
+
+        Command hooks and sync python handlers run in a thread (or a
+        subprocess) that keeps going after cancellation.
+        """
+        if hook.handler_type == "http":
+            return True
+        if hook.handler_type == "python":
+            return asyncio.iscoroutinefunction(self._python_handlers.get(hook.handler))
+        return False
+
     async def _execute_handler(self, hook: LifecycleHook, context: HookContext) -> HookResult:
         """Execute a single hook handler and return its result.
 
@@ -282,11 +395,9 @@ class HookRegistry:
             else:
                 result = await coro
         except TimeoutError:
-            elapsed_ms = (time.monotonic() - start) * 1000
             metrics.timeouts += 1
-            metrics.executions += 1
-            metrics.total_duration_ms += elapsed_ms
-            metrics.last_executed = start
+            metrics.record(start)
+            _observe_duration(hook, context, start)
             logger.warning(
                 "Hook %s timed out after %ds (fail-open)",
                 hook.handler,
@@ -294,17 +405,13 @@ class HookRegistry:
             )
             return HookResult()
         except Exception:
-            elapsed_ms = (time.monotonic() - start) * 1000
             metrics.failures += 1
-            metrics.executions += 1
-            metrics.total_duration_ms += elapsed_ms
-            metrics.last_executed = start
+            metrics.record(start)
+            _observe_duration(hook, context, start)
             raise
         else:
-            elapsed_ms = (time.monotonic() - start) * 1000
-            metrics.executions += 1
-            metrics.total_duration_ms += elapsed_ms
-            metrics.last_executed = start
+            metrics.record(start)
+            _observe_duration(hook, context, start)
             return result
 
     async def _dispatch_handler(self, hook: LifecycleHook, context: HookContext) -> HookResult:
@@ -350,7 +457,13 @@ class HookRegistry:
         return result if isinstance(result, HookResult) else HookResult()
 
     async def _run_command(self, hook: LifecycleHook, context: HookContext) -> HookResult:
-        """Run shell command. Exit 0 = allow, 1 = block."""
+        """Run shell command. Exit 0 = allow, 1 = block.
+
+        Hooks with ``mode: worker`` go to a persistent worker instead.
+        """
+        if hook.mode == "worker":
+            return await self._run_command_worker(hook, context)
+
         env = {
             **os.environ,
             "HOOK_EVENT": context.event.value,
@@ -367,7 +480,7 @@ class HookRegistry:
                     shell=True,
                     capture_output=True,
                     text=True,
-                    timeout=10,
+                    timeout=COMMAND_TIMEOUT_S,
                     env=env,
                 ),
             )
@@ -396,6 +509,78 @@ class HookRegistry:
             logger.warning("Hook command timed out: %s", hook.handler)
             return HookResult()
 
+    def _get_worker_pool(self, hook: LifecycleHook) -> HookWorkerPool:
+        from robothor.engine.hook_workers import HookWorkerPool
+
+        pool = self._worker_pools.get(hook.handler)
+        if pool is None:
+            pool = HookWorkerPool(hook.handler, size=hook.workers)
+            self._worker_pools[hook.handler] = pool
+        return pool
+
+    async def _run_command_worker(self, hook: LifecycleHook, context: HookContext) -> HookResult:
+        """Send the event to a persistent worker; fail open if it misbehaves."""
+        from robothor.engine.hook_workers import HookWorkerError
+
+        payload = {
+            "event": context.event.value,
+            "agent_id": context.agent_id,
+            "run_id": context.run_id,
+            "tool_name": context.tool_name,
+            "tool_args": context.tool_args,
+        }
+        try:
+            data = await self._get_worker_pool(hook).request(payload, timeout=COMMAND_TIMEOUT_S)
+        except HookWorkerError as e:
+            logger.warning("Hook worker %s failed: %s (fail-open)", hook.handler, e)
+            return HookResult()
+
+        try:
+            action = HookAction(data.get("action", "allow"))
+        except ValueError:
+            logger.warning("Hook worker %s returned unknown action, allowing", hook.handler)
+            return HookResult()
+        if action == HookAction.BLOCK:
+            return HookResult(action=action, reason=data.get("reason") or "Blocked by hook")
+        return HookResult(
+            action=action,
+            modified_args=data.get("args", data.get("modified_args"))
+            if action == HookAction.MODIFY
+            else None,
+            system_message=data.get("system_message", ""),
+        )
+
+    def get_worker_stats(self) -> dict[str, HookWorkerStats]:
+        """Worker pool counters keyed by hook command."""
+        return {command: pool.stats() for command, pool in self._worker_pools.items()}
+
+    async def shutdown(self) -> None:
+        """Stop all persistent hook workers and close the shared HTTP session."""
+        pools = list(self._worker_pools.values())
+        self._worker_pools.clear()
+        await asyncio.gather(*(pool.close() for pool in pools), return_exceptions=True)
+
+        session, self._http_session = self._http_session, None
+        if session is not None and not session.closed:
+            with contextlib.suppress(Exception):
+                await session.close()
+
+    def _get_http_session(self) -> Any:
+        """Shared pooled aiohttp session for HTTP hooks (one per event loop)."""
+        import aiohttp
+
+        loop = asyncio.get_running_loop()
+        session = self._http_session
+        if session is None or session.closed or self._http_loop is not loop:
+            session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=HTTP_POOL_SIZE, limit_per_host=HTTP_POOL_SIZE, ttl_dns_cache=300
+                ),
+            )
+            self._http_session = session
+            self._http_loop = loop
+        return session
+
     async def _run_http(self, hook: LifecycleHook, context: HookContext) -> HookResult:
         """POST to URL with event payload, parse response."""
         try:
@@ -413,26 +598,26 @@ class HookRegistry:
         }
 
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    hook.handler,
-                    json=payload,
-                    timeout=aiohttp.ClientTimeout(total=10),
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        try:
-                            action = HookAction(data.get("action", "allow"))
-                        except ValueError:
-                            action = HookAction.ALLOW
-                        return HookResult(
-                            action=action,
-                            modified_args=data.get("modified_args"),
-                            reason=data.get("reason", ""),
-                            system_message=data.get("system_message", ""),
-                        )
-                    logger.warning("HTTP hook returned %d", resp.status)
-                    return HookResult()
+            session = self._get_http_session()
+            async with session.post(
+                hook.handler,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=HTTP_TIMEOUT_S),
+            ) as resp:
+                if resp.status == 200:
+                    data = await resp.json()
+                    try:
+                        action = HookAction(data.get("action", "allow"))
+                    except ValueError:
+                        action = HookAction.ALLOW
+                    return HookResult(
+                        action=action,
+                        modified_args=data.get("modified_args"),
+                        reason=data.get("reason", ""),
+                        system_message=data.get("system_message", ""),
+                    )
+                logger.warning("HTTP hook returned %d", resp.status)
+                return HookResult()
         except Exception as e:
             logger.error("HTTP hook failed: %s", e)
             return HookResult()
@@ -490,6 +675,18 @@ class HookRegistry:
             return HookResult()
 
 
+def _observe_duration(hook: LifecycleHook, context: HookContext, start: float) -> None:
+    try:
+        from robothor.engine.metrics import HOOK_DURATION
+
+        mode = hook.mode if hook.handler_type == "command" else ""
+        HOOK_DURATION.labels(hook.handler_type, mode, context.event.value).observe(
+            time.monotonic() - start
+        )
+    except Exception:
+        pass
+
+
 # ─── Manifest loading ────────────────────────────────────────────────
 
 
@@ -523,6 +720,8 @@ def load_hooks_from_manifest(
                 agent_id=agent_id,
                 chain_mode=raw.get("chain_mode", "short_circuit"),
                 timeout=int(raw.get("timeout", 30)),
+                mode=raw.get("mode", "oneshot"),
+                workers=int(raw.get("workers", 1)),
             )
         )
 
@@ -568,6 +767,8 @@ def load_global_hooks(hooks_dir: Any) -> list[LifecycleHook]:
                 agent_id="",
                 chain_mode=raw.get("chain_mode", "short_circuit"),
                 timeout=int(raw.get("timeout", 30)),
+                mode=raw.get("mode", "oneshot"),
+                workers=int(raw.get("workers", 1)),
             )
         )
 
@@ -0,0 +1,217 @@
+"""Persistent worker processes for command lifecycle hooks.
+
+A command hook with ``mode: worker`` is started once and kept running
+instead of being spawned per event. The engine writes one JSON request per
+line to the worker's stdin and reads one JSON response per line from its
+stdout::
+
+    → {"id": 7, "event": "pre_tool_use", "agent_id": "main", "run_id": "...",
+       "tool_name": "exec", "tool_args": {...}}
+    ← {"id": 7, "action": "allow"}
+    ← {"id": 7, "action": "block", "reason": "..."}
+    ← {"id": 7, "action": "modify", "args": {...}, "system_message": "..."}
+
+Each worker handles one request at a time; a hook gets a pool of up to
+``workers`` processes. A worker that exits, writes malformed output or
+misses the deadline is killed and started again on its next request. The
+request that hit the failure raises HookWorkerError (callers fail open).
+
+Worker stderr is inherited, so hook diagnostics land in the engine log.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Longest accepted response line (bytes).
+MAX_RESPONSE_BYTES = 1024 * 1024
+
+# Grace period for a worker to exit after stdin closes on shutdown.
+SHUTDOWN_GRACE_S = 2.0
+
+
+class HookWorkerError(Exception):
+    """A worker failed to answer a request (crash, timeout, bad output)."""
+
+
+@dataclass
+class HookWorkerStats:
+    """Counters for one hook's worker pool."""
+
+    requests: int = 0
+    failures: int = 0
+    starts: int = 0
+    restarts: int = 0  # starts that replaced a worker which had died or been killed
+    alive: int = 0
+
+
+class HookWorker:
+    """One long-lived hook process speaking line-delimited JSON over stdio."""
+
+    def __init__(self, command: str, env: dict[str, str] | None = None) -> None:
+        self.command = command
+        self._env = env
+        self._proc: asyncio.subprocess.Process | None = None
+        self._next_id = 0
+        self._ever_started = False
+        self.started_at = 0.0
+
+    @property
+    def alive(self) -> bool:
+        return self._proc is not None and self._proc.returncode is None
+
+    @property
+    def pid(self) -> int | None:
+        return self._proc.pid if self._proc is not None else None
+
+    async def start(self) -> bool:
+        """Spawn the process. Returns True if this replaced an earlier one."""
+        restart = self._ever_started
+        self._proc = await asyncio.create_subprocess_shell(
+            self.command,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            env={**os.environ, **(self._env or {}), "HOOK_WORKER": "1"},
+            limit=MAX_RESPONSE_BYTES,
+            start_new_session=True,  # own process group, so kill() reaches shell children
+        )
+        self._ever_started = True
+        self.started_at = time.monotonic()
+        return restart
+
+    async def request(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Send one request and wait for its response line."""
+        proc = self._proc
+        if proc is None or proc.returncode is not None:
+            raise HookWorkerError("worker not running")
+        assert proc.stdin is not None and proc.stdout is not None
+
+        self._next_id += 1
+        request_id = self._next_id
+        line = json.dumps({"id": request_id, **payload}, default=str) + "\n"
+        try:
+            proc.stdin.write(line.encode())
+            await asyncio.wait_for(proc.stdin.drain(), timeout=timeout)
+            raw = await asyncio.wait_for(proc.stdout.readline(), timeout=timeout)
+        except TimeoutError:
+            await self.kill()
+            raise HookWorkerError(f"no response within {timeout}s") from None
+        except (ConnectionError, ValueError) as e:
+            # ValueError: response line longer than MAX_RESPONSE_BYTES
+            await self.kill()
+            raise HookWorkerError(str(e) or type(e).__name__) from e
+        except asyncio.CancelledError:
+            # The response may still arrive; never hand it to the next request.
+            self._abandon()
+            raise
+
+        if not raw:
+            await self.kill()
+            raise HookWorkerError("worker exited")
+        try:
+            data = json.loads(raw)
+        except json.JSONDecodeError:
+            await self.kill()
+            raise HookWorkerError(f"malformed response: {raw[:200]!r}") from None
+        if not isinstance(data, dict) or data.get("id") != request_id:
+            await self.kill()
+            raise HookWorkerError("response id mismatch")
+        return data
+
+    @staticmethod
+    def _kill_group(proc: asyncio.subprocess.Process) -> None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (ProcessLookupError, PermissionError):
+            with contextlib.suppress(ProcessLookupError):
+                proc.kill()
+
+    def _abandon(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is not None and proc.returncode is None:
+            self._kill_group(proc)
+
+    async def kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None or proc.returncode is not None:
+            return
+        self._kill_group(proc)
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(proc.wait(), timeout=SHUTDOWN_GRACE_S)
+
+    async def close(self) -> None:
+        """Close stdin so the worker can exit on its own, then kill stragglers."""
+        proc = self._proc
+        if proc is None or proc.returncode is not None:
+            self._proc = None
+            return
+        if proc.stdin is not None:
+            with contextlib.suppress(Exception):
+                proc.stdin.close()
+        try:
+            await asyncio.wait_for(proc.wait(), timeout=SHUTDOWN_GRACE_S)
+            self._proc = None
+        except TimeoutError:
+            await self.kill()
+
+
+class HookWorkerPool:
+    """Up to ``size`` workers for one hook command, started on demand."""
+
+    def __init__(self, command: str, size: int = 1, env: dict[str, str] | None = None) -> None:
+        self.command = command
+        self.size = max(1, size)
+        self._workers = [HookWorker(command, env) for _ in range(self.size)]
+        self._idle: asyncio.Queue[HookWorker] | None = None
+        self._stats = HookWorkerStats()
+
+    def _queue(self) -> asyncio.Queue[HookWorker]:
+        if self._idle is None:
+            self._idle = asyncio.Queue()
+            for worker in self._workers:
+                self._idle.put_nowait(worker)
+        return self._idle
+
+    async def request(self, payload: dict[str, Any], timeout: float) -> dict[str, Any]:
+        """Run one request on the next idle worker, (re)starting it if needed."""
+        idle = self._queue()
+        worker = await idle.get()
+        self._stats.requests += 1
+        try:
+            if not worker.alive:
+                if await worker.start():
+                    self._stats.restarts += 1
+                    logger.warning("Restarted hook worker: %s", self.command)
+                self._stats.starts += 1
+            return await worker.request(payload, timeout)
+        except HookWorkerError:
+            self._stats.failures += 1
+            raise
+        except OSError as e:
+            self._stats.failures += 1
+            raise HookWorkerError(f"could not start worker: {e}") from e
+        finally:
+            idle.put_nowait(worker)
+
+    def stats(self) -> HookWorkerStats:
+        alive = sum(1 for w in self._workers if w.alive)
+        return HookWorkerStats(
+            requests=self._stats.requests,
+            failures=self._stats.failures,
+            starts=self._stats.starts,
+            restarts=self._stats.restarts,
+            alive=alive,
+        )
+
+    async def close(self) -> None:
+        await asyncio.gather(*(w.close() for w in self._workers), return_exceptions=True)
@@ -0,0 +1,275 @@
+"""Shared HTTP client pool for integration tool handlers.
+
+Handlers use ``async with http_client(timeout=...) as client:`` where they
+used to open a fresh ``httpx.AsyncClient`` per call. All calls made on one
+event loop share one client, so connections and TLS sessions are reused
+across tool calls. The pool provides:
+
+- keep-alive connections, at most ``ROBOTHOR_HTTP_MAX_CONNECTIONS`` in
+  total. Idle connections are closed after ``ROBOTHOR_HTTP_KEEPALIVE_S``.
+- HTTP/2 when ``ROBOTHOR_HTTP2=1`` and the ``h2`` package is installed.
+- at most ``ROBOTHOR_HTTP_MAX_PER_HOST`` requests in flight per host. Further
+  requests to that host wait for a free slot. A host is keyed as
+  ``host:port``, so local services on different ports get separate slots.
+- per-host latency and error metrics (``robothor_http_client_*``).
+
+The client keeps no cookie jar: ``Set-Cookie`` from one handler's response
+must not be sent on another handler's requests to the same host. Per-host
+slots and stats are kept for the ``MAX_TRACKED_HOSTS`` most recently used
+hosts.
+
+Leaving ``http_client()`` does not close the shared client. The daemon calls
+``close_http_clients()`` at shutdown.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import http.cookiejar
+import importlib.util
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+logger = logging.getLogger(__name__)
+
+MAX_CONNECTIONS = int(os.environ.get("ROBOTHOR_HTTP_MAX_CONNECTIONS", "100"))
+MAX_PER_HOST = int(os.environ.get("ROBOTHOR_HTTP_MAX_PER_HOST", "8"))
+KEEPALIVE_S = float(os.environ.get("ROBOTHOR_HTTP_KEEPALIVE_S", "30"))
+HTTP2 = os.environ.get("ROBOTHOR_HTTP2", "").lower() in ("1", "true", "yes")
+
+# Hosts given their own metric label. Later hosts are reported as "other",
+# so arbitrary web_fetch targets cannot grow label cardinality without bound.
+MAX_HOST_LABELS = 200
+
+# Hosts whose concurrency slot and stats are kept. The least recently used
+# idle host is forgotten beyond this, so web_fetch cannot grow them either.
+MAX_TRACKED_HOSTS = 1000
+
+
+@dataclass
+class HostStats:
+    """Counters for one host."""
+
+    requests: int = 0
+    errors: int = 0
+    in_flight: int = 0
+    peak_in_flight: int = 0
+    total_seconds: float = 0.0
+
+
+@dataclass
+class _Host:
+    slot: asyncio.Semaphore
+    stats: HostStats = field(default_factory=HostStats)
+    users: int = 0  # requests waiting for or holding the slot
+
+
+def _h2_available() -> bool:
+    return importlib.util.find_spec("h2") is not None
+
+
+def _host_key(url: str | httpx.URL) -> str:
+    """``host:port`` of a URL, with the scheme's default port filled in."""
+    u = httpx.URL(url)
+    port = u.port or (443 if u.scheme in ("https", "wss") else 80)
+    return f"{u.host}:{port}"
+
+
+def _error_kind(exc: Exception) -> str:
+    if isinstance(exc, httpx.TimeoutException):
+        return "timeout"
+    if isinstance(exc, httpx.ConnectError):
+        return "connect"
+    if isinstance(exc, httpx.TransportError):
+        return "transport"
+    return "other"
+
+
+class HttpClientPool:
+    """One keep-alive ``httpx.AsyncClient`` with per-host concurrency caps.
+
+    A pool is bound to the event loop it is used on. Use ``get_http_pool()``.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = MAX_CONNECTIONS,
+        max_per_host: int = MAX_PER_HOST,
+        keepalive_s: float = KEEPALIVE_S,
+        http2: bool = HTTP2,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        if http2 and not _h2_available():
+            logger.warning("ROBOTHOR_HTTP2 is set but h2 is not installed; using HTTP/1.1")
+            http2 = False
+        self.max_per_host = max(1, max_per_host)
+        self.http2 = http2
+        self._client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+                keepalive_expiry=keepalive_s,
+            ),
+            http2=http2,
+            transport=transport,
+            # A policy with no allowed domains: responses never set cookies
+            cookies=http.cookiejar.CookieJar(
+                http.cookiejar.DefaultCookiePolicy(allowed_domains=[])
+            ),
+        )
+        self._hosts: OrderedDict[str, _Host] = OrderedDict()
+        self._labels: set[str] = set()
+
+    @property
+    def closed(self) -> bool:
+        return self._client.is_closed
+
+    def _label(self, host: str) -> str:
+        if host in self._labels:
+            return host
+        if len(self._labels) < MAX_HOST_LABELS:
+            self._labels.add(host)
+            return host
+        return "other"
+
+    def _host(self, host: str) -> _Host:
+        entry = self._hosts.get(host)
+        if entry is not None:
+            self._hosts.move_to_end(host)
+            return entry
+        entry = self._hosts[host] = _Host(asyncio.Semaphore(self.max_per_host))
+        if len(self._hosts) > MAX_TRACKED_HOSTS:
+            # A host with requests in flight keeps its slot, or its cap would reset
+            idle = [h for h, e in self._hosts.items() if e.users == 0]
+            for stale in idle[: len(self._hosts) - MAX_TRACKED_HOSTS]:
+                del self._hosts[stale]
+        return entry
+
+    async def request(
+        self,
+        method: str,
+        url: str | httpx.URL,
+        *,
+        timeout: float | httpx.Timeout | None = None,
+        follow_redirects: bool = False,
+        **kwargs: Any,
+    ) -> httpx.Response:
+        """Send a request through the shared client, waiting for a per-host slot."""
+        from robothor.engine.metrics import HTTP_CLIENT_DURATION, HTTP_CLIENT_ERRORS
+
+        host = _host_key(url)
+        entry = self._host(host)
+        stats = entry.stats
+        label = self._label(host)
+
+        entry.users += 1
+        try:
+            async with entry.slot:
+                stats.in_flight += 1
+                stats.peak_in_flight = max(stats.peak_in_flight, stats.in_flight)
+                start = time.monotonic()
+                try:
+                    resp = await self._client.request(
+                        method, url, timeout=timeout, follow_redirects=follow_redirects, **kwargs
+                    )
+                except Exception as e:
+                    stats.errors += 1
+                    HTTP_CLIENT_ERRORS.labels(host=label, kind=_error_kind(e)).inc()
+                    raise
+                finally:
+                    elapsed = time.monotonic() - start
+                    stats.in_flight -= 1
+                    stats.requests += 1
+                    stats.total_seconds += elapsed
+                    HTTP_CLIENT_DURATION.labels(host=label).observe(elapsed)
+        finally:
+            entry.users -= 1
+
+        if resp.status_code >= 400:
+            stats.errors += 1
+            HTTP_CLIENT_ERRORS.labels(host=label, kind=f"{resp.status_code // 100}xx").inc()
+        return resp
+
+    def host_stats(self) -> dict[str, HostStats]:
+        return {host: replace(entry.stats) for host, entry in self._hosts.items()}
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+class PooledClient:
+    """Request methods of a pool with per-call default timeout and redirects.
+
+    Mirrors the subset of the ``httpx.AsyncClient`` API the handlers use.
+    """
+
+    def __init__(
+        self,
+        pool: HttpClientPool,
+        timeout: float | httpx.Timeout | None,
+        follow_redirects: bool,
+    ) -> None:
+        self._pool = pool
+        self.timeout = timeout
+        self.follow_redirects = follow_redirects
+
+    async def request(self, method: str, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        kwargs.setdefault("follow_redirects", self.follow_redirects)
+        return await self._pool.request(method, url, **kwargs)
+
+    async def get(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def put(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.request("PUT", url, **kwargs)
+
+    async def patch(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.request("PATCH", url, **kwargs)
+
+    async def delete(self, url: str | httpx.URL, **kwargs: Any) -> httpx.Response:
+        return await self.request("DELETE", url, **kwargs)
+
+
+# One pool per event loop: httpx connections cannot be shared across loops.
+_pools: dict[asyncio.AbstractEventLoop, HttpClientPool] = {}
+
+
+def get_http_pool() -> HttpClientPool:
+    """Return the shared pool for the running event loop."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is None or pool.closed:
+        for other in [lp for lp in _pools if lp.is_closed()]:
+            del _pools[other]  # sockets of a dead loop are released with it
+        pool = _pools[loop] = HttpClientPool()
+    return pool
+
+
+@contextlib.asynccontextmanager
+async def http_client(
+    timeout: float | httpx.Timeout | None = 30.0, follow_redirects: bool = False
+) -> AsyncIterator[PooledClient]:
+    """Borrow the shared client with the given defaults."""
+    yield PooledClient(get_http_pool(), timeout, follow_redirects)
+
+
+async def close_http_clients() -> None:
+    """Close the running loop's pool; the next request opens a new one."""
+    pool = _pools.pop(asyncio.get_running_loop(), None)
+    if pool is not None:
+        await pool.aclose()
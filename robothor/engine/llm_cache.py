@@ -0,0 +1,245 @@
+"""Deterministic response cache for structured LLM calls.
+
+Temperature-0 utility calls such as planning and verification often repeat
+with identical inputs. A scheduled agent, for example, sends the same
+instruction on every run. ``llm_call(..., cache_ttl=...)`` serves such
+repeats from here instead of calling the provider again. There are two tiers:
+
+- an in-process LRU of up to ``ROBOTHOR_LLM_CACHE_MAX_ENTRIES`` entries,
+  checked first.
+- the ``llm_response_cache`` table, which survives restarts and is shared
+  between processes. It is best-effort: if the database is unavailable,
+  only the in-process tier is used.
+
+Entries are keyed by (model, normalized messages, request params) and
+expire after the TTL given by the call site. Each hit adds the token cost
+of the original response to ``robothor_llm_cache_saved_usd_total``.
+
+``ROBOTHOR_LLM_CACHE=0`` disables the cache; ``ROBOTHOR_LLM_CACHE_PERSIST=0``
+keeps it in memory only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.environ.get("ROBOTHOR_LLM_CACHE", "1").lower() not in ("0", "false", "no")
+PERSIST = os.environ.get("ROBOTHOR_LLM_CACHE_PERSIST", "1").lower() not in ("0", "false", "no")
+MAX_ENTRIES = int(os.environ.get("ROBOTHOR_LLM_CACHE_MAX_ENTRIES", "1024"))
+
+
+@dataclass
+class CacheStats:
+    """Counters for the running process."""
+
+    memory_hits: int = 0
+    db_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    saved_usd: float = 0.0
+    saved_tokens: int = 0
+
+
+@dataclass
+class _Entry:
+    model: str
+    response: dict[str, Any]
+    cost_usd: float
+    tokens: int
+    expires_at: float  # time.monotonic()
+
+
+def _normalize_message(message: dict[str, Any]) -> dict[str, Any]:
+    """Drop unset fields and surrounding whitespace; key order is fixed by the dump."""
+    normalized: dict[str, Any] = {}
+    for key, value in message.items():
+        if value is None:
+            continue
+        normalized[key] = value.strip() if isinstance(value, str) else value
+    return normalized
+
+
+def cache_key(model: str, messages: list[dict[str, Any]], params: dict[str, Any]) -> str:
+    """Hash of everything that determines a temperature-0 response."""
+    spec = json.dumps(
+        {
+            "model": model,
+            "messages": [_normalize_message(m) for m in messages],
+            "params": params,
+        },
+        sort_keys=True,
+        default=str,
+    )
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()
+
+
+def _usage_tokens(response: dict[str, Any]) -> tuple[int, int]:
+    usage = response.get("usage") or {}
+    try:
+        return int(usage.get("prompt_tokens") or 0), int(usage.get("completion_tokens") or 0)
+    except (TypeError, ValueError):
+        return 0, 0
+
+
+def response_cost(model: str, response: dict[str, Any]) -> float:
+    """What a serialized response cost, from its usage and the model registry."""
+    from robothor.engine.model_registry import get_model_limits
+
+    limits = get_model_limits(model)
+    prompt_tokens, completion_tokens = _usage_tokens(response)
+    return (
+        prompt_tokens * limits.input_cost_per_token
+        + completion_tokens * limits.output_cost_per_token
+    )
+
+
+class LlmResponseCache:
+    """Two-tier (memory, then Postgres) cache of serialized LLM responses."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, persist: bool = PERSIST) -> None:
+        self.max_entries = max(1, max_entries)
+        self.persist = persist
+        self._memory: OrderedDict[str, _Entry] = OrderedDict()
+        self._stats = CacheStats()
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """Return the cached response for *key*, or None on a miss."""
+        entry = self._memory.get(key)
+        if entry is not None and entry.expires_at <= time.monotonic():
+            del self._memory[key]
+            entry = None
+        tier = "memory"
+        if entry is None and self.persist:
+            entry = await asyncio.to_thread(self._db_get, key)
+            if entry is not None:
+                tier = "db"
+                self._remember(key, entry)
+        if entry is None:
+            self._stats.misses += 1
+            self._record("miss", None)
+            return None
+
+        self._memory.move_to_end(key)
+        if tier == "memory":
+            self._stats.memory_hits += 1
+        else:
+            self._stats.db_hits += 1
+        self._stats.saved_usd += entry.cost_usd
+        self._stats.saved_tokens += entry.tokens
+        self._record(f"hit_{tier}", entry)
+        return entry.response
+
+    async def put(self, key: str, model: str, response: dict[str, Any], ttl: float) -> None:
+        """Cache a serialized response for *ttl* seconds."""
+        entry = _Entry(
+            model=model,
+            response=response,
+            cost_usd=response_cost(model, response),
+            tokens=sum(_usage_tokens(response)),
+            expires_at=time.monotonic() + ttl,
+        )
+        self._remember(key, entry)
+        self._stats.stores += 1
+        if self.persist:
+            await asyncio.to_thread(self._db_put, key, entry, ttl)
+
+    def clear(self) -> None:
+        """Drop the in-process tier (the table is left alone)."""
+        self._memory.clear()
+
+    def stats(self) -> CacheStats:
+        return replace(self._stats)
+
+    def _remember(self, key: str, entry: _Entry) -> None:
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    @staticmethod
+    def _record(outcome: str, entry: _Entry | None) -> None:
+        from robothor.engine.metrics import LLM_CACHE_LOOKUPS, LLM_CACHE_SAVED_USD
+
+        LLM_CACHE_LOOKUPS.labels(outcome=outcome).inc()
+        if entry is not None and entry.cost_usd:
+            LLM_CACHE_SAVED_USD.labels(model=entry.model).inc(entry.cost_usd)
+
+    @staticmethod
+    def _db_get(key: str) -> _Entry | None:
+        from robothor.db.connection import get_connection
+
+        try:
+            with get_connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    """
+                    UPDATE llm_response_cache
+                    SET hit_count = hit_count + 1, last_hit_at = NOW()
+                    WHERE cache_key = %s AND expires_at > NOW()
+                    RETURNING model, response, cost_usd,
+                              EXTRACT(EPOCH FROM expires_at - NOW())
+                    """,
+                    (key,),
+                )
+                row = cur.fetchone()
+                conn.commit()
+        except Exception as e:
+            logger.debug("LLM cache lookup failed: %s", e)
+            return None
+        if row is None:
+            return None
+        model, response, cost_usd, remaining = row
+        if isinstance(response, str):
+            response = json.loads(response)
+        return _Entry(
+            model=model,
+            response=response,
+            cost_usd=float(cost_usd or 0.0),
+            tokens=sum(_usage_tokens(response)),
+            expires_at=time.monotonic() + float(remaining),
+        )
+
+    @staticmethod
+    def _db_put(key: str, entry: _Entry, ttl: float) -> None:
+        from robothor.db.connection import get_connection
+
+        try:
+            with get_connection() as conn:
+                cur = conn.cursor()
+                cur.execute(
+                    """
+                    INSERT INTO llm_response_cache
+                        (cache_key, model, response, cost_usd, expires_at)
+                    VALUES (%s, %s, %s, %s, NOW() + make_interval(secs => %s))
+                    ON CONFLICT (cache_key) DO UPDATE SET
+                        response = EXCLUDED.response,
+                        cost_usd = EXCLUDED.cost_usd,
+                        created_at = NOW(),
+                        expires_at = EXCLUDED.expires_at
+                    """,
+                    (key, entry.model, json.dumps(entry.response), entry.cost_usd, ttl),
+                )
+                conn.commit()
+        except Exception as e:
+            logger.debug("LLM cache store failed: %s", e)
+
+
+_cache: LlmResponseCache | None = None
+
+
+def get_llm_cache() -> LlmResponseCache:
+    """Return the process-wide cache."""
+    global _cache
+    if _cache is None:
+        _cache = LlmResponseCache()
+    return _cache
@@ -7,6 +7,13 @@ timeout handling, retry logic, and multi-model fallback:
 - :func:`llm_call_with_fallback` — multi-model fallback (non-streaming).
 - :func:`llm_call_streaming` — multi-model fallback with streaming.
 
+Every call feeds :mod:`robothor.engine.model_health`; the fallback variants
+try models in the order it reports, so models with open circuit breakers are
+tried last instead of timing out first on every run.
+
+Temperature-0 :func:`llm_call` calls can opt into the response cache in
+:mod:`robothor.engine.llm_cache` by passing ``cache_ttl``.
+
 This module is Phase 3A of the enterprise-hardening effort.  Callers
 (planner, verifier, compaction, PDF handler) will be migrated in Phase 3B.
 """
@@ -14,6 +21,8 @@ This module is Phase 3A of the enterprise-hardening effort.  Callers
 from __future__ import annotations
 
 import asyncio
+import copy
+import json
 import logging
 import time as _time
 from collections.abc import Awaitable, Callable  # noqa: TC003
@@ -21,7 +30,9 @@ from typing import Any
 
 import litellm
 
+from robothor.engine import llm_cache
 from robothor.engine.metrics import LLM_CALL_DURATION, LLM_CALLS_TOTAL, LLM_TOKENS_TOTAL
+from robothor.engine.model_health import get_model_health
 from robothor.engine.retry import retry_async
 
 logger = logging.getLogger(__name__)
@@ -59,6 +70,7 @@ async def llm_call(
     timeout: int | float = 120,
     max_retries: int = 1,
     max_tokens: int | None = None,
+    cache_ttl: float | None = None,
 ) -> Any:
     """Single-model LLM call with timeout and optional retry.
 
@@ -70,6 +82,9 @@ async def llm_call(
         timeout: Per-attempt timeout in seconds.
         max_retries: Total attempts (1 = no retry, 2 = one retry, etc.).
         max_tokens: Optional max output tokens.
+        cache_ttl: Seconds to cache the response for. Only honoured when
+            ``temperature`` is 0; identical calls within the TTL are then
+            answered from :mod:`robothor.engine.llm_cache`.
 
     Returns:
         The ``litellm.ModelResponse`` object.
@@ -87,12 +102,22 @@ async def llm_call(
     if max_tokens is not None:
         kwargs["max_tokens"] = max_tokens
 
+    key: str | None = None
+    if cache_ttl and temperature == 0 and llm_cache.ENABLED:
+        params = {k: v for k, v in kwargs.items() if k not in ("model", "messages")}
+        key = llm_cache.cache_key(model, messages, params)
+        cached = await llm_cache.get_llm_cache().get(key)
+        if cached is not None:
+            return litellm.ModelResponse(**copy.deepcopy(cached))
+
     async def _attempt() -> Any:
         t0 = _time.monotonic()
         try:
             resp = await asyncio.wait_for(litellm.acompletion(**kwargs), timeout=timeout)
+            elapsed = _time.monotonic() - t0
             LLM_CALLS_TOTAL.labels(model=model, status="success").inc()
-            LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
+            LLM_CALL_DURATION.labels(model=model).observe(elapsed)
+            get_model_health().record_success(model, elapsed)
             usage = getattr(resp, "usage", None)
             if usage:
                 LLM_TOKENS_TOTAL.labels(model=model, direction="input").inc(
@@ -102,17 +127,40 @@ async def llm_call(
                     _safe_token_count(usage, "completion_tokens")
                 )
             return resp
-        except Exception:
+        except Exception as e:
             LLM_CALLS_TOTAL.labels(model=model, status="error").inc()
             LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
+            get_model_health().record_failure(model, e)
             raise
 
-    return await retry_async(
+    resp = await retry_async(
         _attempt,
         max_attempts=max_retries,
         retryable_exceptions=_RETRYABLE_EXCEPTIONS,
         backoff_base=1.0,
     )
+    if key is not None and cache_ttl:
+        await _cache_response(key, model, resp, cache_ttl, json_mode=json_mode)
+    return resp
+
+
+async def _cache_response(key: str, model: str, resp: Any, ttl: float, *, json_mode: bool) -> None:
+    """Store a response unless it is empty or, in JSON mode, not valid JSON.
+
+    Malformed output is a failure the caller will retry; caching it would
+    replay the failure for the whole TTL.
+    """
+    try:
+        content = resp.choices[0].message.content
+        if not content:
+            return
+        if json_mode:
+            json.loads(content)
+        data = json.loads(json.dumps(resp.model_dump()))
+    except Exception as e:
+        logger.debug("Not caching response from %s: %s", model, e)
+        return
+    await llm_cache.get_llm_cache().put(key, model, data, ttl)
 
 
 async def llm_call_with_fallback(
@@ -126,7 +174,9 @@ async def llm_call_with_fallback(
 ) -> Any:
     """Multi-model fallback LLM call (non-streaming).
 
-    Iterates through *models* in order, moving to the next on failure.
+    Iterates through *models*, moving to the next on failure. Models are
+    tried in configured order, except that unhealthy ones (see
+    :mod:`robothor.engine.model_health`) are moved to the end.
 
     Args:
         messages: Chat messages in OpenAI format.
@@ -147,8 +197,9 @@ async def llm_call_with_fallback(
 
     per_model_timeout = max(30, int(timeout_budget) // len(models))
     last_error: Exception | None = None
+    health = get_model_health()
 
-    for model in models:
+    for model in health.order(models):
         t0 = _time.monotonic()
         try:
             kwargs: dict[str, Any] = {
@@ -162,8 +213,10 @@ async def llm_call_with_fallback(
                 kwargs["max_tokens"] = max_tokens
 
             resp = await asyncio.wait_for(litellm.acompletion(**kwargs), timeout=per_model_timeout)
+            elapsed = _time.monotonic() - t0
             LLM_CALLS_TOTAL.labels(model=model, status="success").inc()
-            LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
+            LLM_CALL_DURATION.labels(model=model).observe(elapsed)
+            health.record_success(model, elapsed)
             usage = getattr(resp, "usage", None)
             if usage:
                 LLM_TOKENS_TOTAL.labels(model=model, direction="input").inc(
@@ -178,11 +231,13 @@ async def llm_call_with_fallback(
             LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
             logger.warning("Model %s timed out after %ds, trying next", model, per_model_timeout)
             last_error = TimeoutError(f"Model {model} timed out after {per_model_timeout}s")
+            health.record_failure(model, last_error)
         except Exception as e:
             LLM_CALLS_TOTAL.labels(model=model, status="error").inc()
             LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
             logger.warning("Model %s failed: %s, trying next", model, e)
             last_error = e
+            health.record_failure(model, e)
 
     raise AllModelsFailedError(f"All models failed. Last error: {last_error}") from last_error
 
@@ -225,8 +280,9 @@ async def llm_call_streaming(
 
     per_model_timeout = max(30, int(timeout_budget) // len(models))
     last_error: Exception | None = None
+    health = get_model_health()
 
-    for model in models:
+    for model in health.order(models):
         t0 = _time.monotonic()
         try:
             kwargs: dict[str, Any] = {
@@ -250,8 +306,10 @@ async def llm_call_streaming(
                 return collected
 
             chunks = await asyncio.wait_for(_consume_stream(), timeout=per_model_timeout)
+            elapsed = _time.monotonic() - t0
             LLM_CALLS_TOTAL.labels(model=model, status="success").inc()
-            LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
+            LLM_CALL_DURATION.labels(model=model).observe(elapsed)
+            health.record_success(model, elapsed)
             return chunks
         except TimeoutError:
             LLM_CALLS_TOTAL.labels(model=model, status="error").inc()
@@ -262,11 +320,13 @@ async def llm_call_streaming(
                 per_model_timeout,
             )
             last_error = TimeoutError(f"Model {model} timed out after {per_model_timeout}s")
+            health.record_failure(model, last_error)
         except Exception as e:
             LLM_CALLS_TOTAL.labels(model=model, status="error").inc()
             LLM_CALL_DURATION.labels(model=model).observe(_time.monotonic() - t0)
             logger.warning("Model %s failed (streaming): %s, trying next", model, e)
             last_error = e
+            health.record_failure(model, e)
 
     raise AllModelsFailedError(
         f"All models failed (streaming). Last error: {last_error}"
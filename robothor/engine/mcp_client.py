@@ -3,9 +3,15 @@
 Supports two transports:
 
 * **stdio** — subprocess communicating via JSON-RPC 2.0 over stdin/stdout
-  with Content-Length framing per the MCP specification.
+  with Content-Length framing per the MCP specification. Requests are
+  multiplexed by id, so several can be in flight per server.
 * **HTTP** — JSON-RPC 2.0 POST to an ``/_mcp`` endpoint with Bearer token
-  auth and MCP-Session-Id tracking.
+  auth and MCP-Session-Id tracking, over a keep-alive client per server.
+
+``McpClientPool`` caches each server's ``tools/list`` result by config hash
+for ``ROBOTHOR_MCP_TOOLS_TTL_S``, so agent runs after the first skip the
+discovery round trip. A stdio server's ``notifications/tools/list_changed``
+drops its entry early.
 
 Business adapters (see ``adapters.py``) use this module to talk to external
 MCP servers so their tools are available as first-class agent tools.
@@ -14,13 +20,28 @@ MCP servers so their tools are available as first-class agent tools.
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import dataclasses
+import hashlib
 import json
 import logging
+import os
+import time
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger(__name__)
 
+# Seconds a discovered tool list is reused before asking the server again
+TOOLS_CACHE_TTL_S = float(os.environ.get("ROBOTHOR_MCP_TOOLS_TTL_S", "600"))
+
+# Keep-alive connections held open per HTTP MCP server
+HTTP_KEEPALIVE_CONNECTIONS = 10
+HTTP_KEEPALIVE_S = 60.0
+
 
 @dataclass(frozen=True)
 class McpServerConfig:
@@ -44,18 +65,45 @@ class McpServerConfig:
         return "http" if self.url else "stdio"
 
 
+def config_hash(config: McpServerConfig) -> str:
+    """Stable digest of a server config; changes whenever any field does."""
+    data = json.dumps(dataclasses.asdict(config), sort_keys=True)
+    return hashlib.sha256(data.encode()).hexdigest()[:16]
+
+
 class McpClientSession:
-    """Manages a single stdio-based MCP server connection."""
+    """Manages a single stdio-based MCP server connection.
+
+    Requests are multiplexed: each one is written as its own frame, and a
+    single reader task routes responses to the waiting caller by request id,
+    so concurrent tool calls to one server run in parallel. A request that
+    times out or is cancelled is abandoned (a late response is dropped) and
+    the server is sent ``notifications/cancelled`` for it.
+    """
 
     def __init__(self, config: McpServerConfig) -> None:
         self.config = config
         self._process: asyncio.subprocess.Process | None = None
         self._request_id: int = 0
-        self._lock = asyncio.Lock()
+        self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        self._reader: asyncio.Task[None] | None = None
+        self._init_lock = asyncio.Lock()
         self._initialized = False
+        # Called when the server sends notifications/tools/list_changed
+        self.on_tools_changed: Callable[[], None] | None = None
+
+    @property
+    def running(self) -> bool:
+        """True while the subprocess is alive and its output is being read."""
+        return bool(
+            self._process
+            and self._process.returncode is None
+            and self._reader
+            and not self._reader.done()
+        )
 
     async def start(self) -> None:
-        """Start the MCP server subprocess."""
+        """Start the MCP server subprocess and its response reader."""
         import os
 
         env = {**os.environ, **self.config.env}
@@ -66,10 +114,17 @@ class McpClientSession:
             stderr=asyncio.subprocess.PIPE,
             env=env,
         )
+        self._reader = asyncio.create_task(self._read_loop(), name=f"mcp-reader-{self.config.name}")
         logger.info("MCP server '%s' started (pid=%d)", self.config.name, self._process.pid)
 
     async def stop(self) -> None:
         """Stop the MCP server subprocess."""
+        if self._reader:
+            self._reader.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reader
+            self._reader = None
+        self._fail_pending(RuntimeError(f"MCP server '{self.config.name}' stopped"))
         if self._process and self._process.returncode is None:
             self._process.terminate()
             try:
@@ -80,47 +135,75 @@ class McpClientSession:
         self._process = None
         self._initialized = False
 
-    async def _send_request(self, method: str, params: dict[str, Any] | None = None) -> Any:
-        """Send a JSON-RPC 2.0 request and read the response."""
-        if not self._process or not self._process.stdin or not self._process.stdout:
+    def _write(self, message: dict[str, Any]) -> None:
+        """Queue one framed message; a single write keeps frames from interleaving."""
+        if not self._process or not self._process.stdin:
+            raise RuntimeError(f"MCP server '{self.config.name}' not running")
+        payload = json.dumps(message).encode()
+        self._process.stdin.write(b"Content-Length: %d\r\n\r\n" % len(payload) + payload)
+
+    async def _send_request(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Send a JSON-RPC 2.0 request and wait for its response.
+
+        ``timeout`` defaults to the server's ``timeout_seconds``.
+        """
+        if not self.running:
             raise RuntimeError(f"MCP server '{self.config.name}' not running")
+        assert self._process and self._process.stdin
 
-        async with self._lock:
-            self._request_id += 1
-            request = {
-                "jsonrpc": "2.0",
-                "id": self._request_id,
-                "method": method,
-            }
-            if params is not None:
-                request["params"] = params
+        self._request_id += 1
+        request_id = self._request_id
+        request: dict[str, Any] = {"jsonrpc": "2.0", "id": request_id, "method": method}
+        if params is not None:
+            request["params"] = params
 
-            payload = json.dumps(request)
-            header = f"Content-Length: {len(payload)}\r\n\r\n"
-            self._process.stdin.write(header.encode() + payload.encode())
+        future: asyncio.Future[dict[str, Any]] = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            self._write(request)
             await self._process.stdin.drain()
-
-            # Read response with Content-Length framing
             response = await asyncio.wait_for(
-                self._read_response(),
-                timeout=self.config.timeout_seconds,
+                future, timeout=self.config.timeout_seconds if timeout is None else timeout
+            )
+        except (TimeoutError, asyncio.CancelledError):
+            self._cancel_remote(request_id)
+            raise
+        finally:
+            self._pending.pop(request_id, None)
+
+        if "error" in response:
+            err = response["error"]
+            raise RuntimeError(f"MCP error {err.get('code', '?')}: {err.get('message', '')}")
+
+        return response.get("result")
+
+    def _cancel_remote(self, request_id: int) -> None:
+        """Tell the server an abandoned request's result is no longer wanted."""
+        with contextlib.suppress(Exception):
+            self._write(
+                {
+                    "jsonrpc": "2.0",
+                    "method": "notifications/cancelled",
+                    "params": {"requestId": request_id, "reason": "client cancelled"},
+                }
             )
 
-            if "error" in response:
-                err = response["error"]
-                raise RuntimeError(f"MCP error {err.get('code', '?')}: {err.get('message', '')}")
-
-            return response.get("result")
-
-    async def _read_response(self) -> dict[str, Any]:
-        """Read a JSON-RPC response with Content-Length framing."""
+    async def _read_message(self) -> dict[str, Any] | None:
+        """Read one JSON-RPC message with Content-Length framing; None at EOF."""
         assert self._process and self._process.stdout
 
         # Read headers until empty line
         content_length = 0
         while True:
             line = await self._process.stdout.readline()
-            if not line or line == b"\r\n" or line == b"\n":
+            if not line:
+                return None
+            if line == b"\r\n" or line == b"\n":
                 break
             if line.lower().startswith(b"content-length:"):
                 content_length = int(line.split(b":")[1].strip())
@@ -132,6 +215,53 @@ class McpClientSession:
         result: dict[str, Any] = json.loads(data)
         return result
 
+    async def _read_loop(self) -> None:
+        """Route responses to pending requests until the server's output closes."""
+        error: Exception = RuntimeError(f"MCP server '{self.config.name}' exited")
+        try:
+            while (message := await self._read_message()) is not None:
+                if "method" in message:
+                    self._handle_server_message(message)
+                    continue
+                request_id = message.get("id")
+                # Our request ids are ints; anything else cannot match one
+                future = self._pending.get(request_id) if isinstance(request_id, int) else None
+                if future is None:
+                    logger.debug(
+                        "MCP server '%s': dropping response to abandoned request %s",
+                        self.config.name,
+                        request_id,
+                    )
+                elif not future.done():
+                    future.set_result(message)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning("MCP server '%s' reader failed: %s", self.config.name, e)
+            error = RuntimeError(f"MCP server '{self.config.name}' connection lost: {e}")
+        self._fail_pending(error)
+
+    def _handle_server_message(self, message: dict[str, Any]) -> None:
+        """Handle tools/list_changed; refuse server-to-client requests."""
+        if "id" not in message:
+            if message["method"] == "notifications/tools/list_changed" and self.on_tools_changed:
+                self.on_tools_changed()
+            return
+        with contextlib.suppress(Exception):
+            self._write(
+                {
+                    "jsonrpc": "2.0",
+                    "id": message["id"],
+                    "error": {"code": -32601, "message": f"Method not found: {message['method']}"},
+                }
+            )
+
+    def _fail_pending(self, error: Exception) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(error)
+        self._pending.clear()
+
     async def initialize(self) -> dict[str, Any]:
         """Send the initialize handshake."""
         result: dict[str, Any] = await self._send_request(
@@ -144,16 +274,17 @@ class McpClientSession:
         )
         # Send initialized notification
         if self._process and self._process.stdin:
-            notif = json.dumps({"jsonrpc": "2.0", "method": "notifications/initialized"})
-            header = f"Content-Length: {len(notif)}\r\n\r\n"
-            self._process.stdin.write(header.encode() + notif.encode())
+            self._write({"jsonrpc": "2.0", "method": "notifications/initialized"})
             await self._process.stdin.drain()
         self._initialized = True
         return result
 
     async def _ensure_initialized(self) -> None:
-        if not self._initialized:
-            await self.initialize()
+        if self._initialized:
+            return
+        async with self._init_lock:  # concurrent first calls share one handshake
+            if not self._initialized:
+                await self.initialize()
 
     async def list_tools(self) -> list[dict[str, Any]]:
         """List tools available on this MCP server."""
@@ -161,7 +292,9 @@ class McpClientSession:
         result = await self._send_request("tools/list")
         return result.get("tools", []) if result else []
 
-    async def call_tool(self, name: str, arguments: dict[str, Any]) -> Any:
+    async def call_tool(
+        self, name: str, arguments: dict[str, Any], timeout: float | None = None
+    ) -> Any:
         """Call a tool on this MCP server."""
         await self._ensure_initialized()
         return await self._send_request(
@@ -170,6 +303,7 @@ class McpClientSession:
                 "name": name,
                 "arguments": arguments,
             },
+            timeout=timeout,
         )
 
     async def list_resources(self) -> list[dict[str, Any]]:
@@ -196,14 +330,30 @@ class McpHttpSession:
         self._session_id: str | None = None
         self._initialized = False
         self._request_id: int = 0
+        self._client: Any = None  # httpx.AsyncClient, created on first request
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    def _get_client(self) -> Any:
+        """Long-lived keep-alive client for this server (one per event loop)."""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                timeout=float(self.config.timeout_seconds),
+                limits=httpx.Limits(
+                    max_keepalive_connections=HTTP_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=HTTP_KEEPALIVE_S,
+                ),
+            )
+            self._client_loop = loop
+        return self._client
 
     def _next_id(self) -> int:
         self._request_id += 1
         return self._request_id
 
     async def _send(self, message: dict[str, Any]) -> dict[str, Any]:
-        import httpx
-
         headers = {
             "Content-Type": "application/json",
             **self.config.headers,
@@ -211,8 +361,7 @@ class McpHttpSession:
         if self._session_id:
             headers["Mcp-Session-Id"] = self._session_id
 
-        async with httpx.AsyncClient(timeout=float(self.config.timeout_seconds)) as client:
-            r = await client.post(self.config.url, headers=headers, json=message)
+        r = await self._get_client().post(self.config.url, headers=headers, json=message)
 
         if sid := r.headers.get("Mcp-Session-Id"):
             self._session_id = sid
@@ -227,10 +376,14 @@ class McpHttpSession:
             return {"error": f"Unexpected response ({r.status_code}): {text[:200]}"}
 
     async def start(self) -> None:
-        """No-op for HTTP — connection is stateless per-request."""
+        """No-op for HTTP — connections are opened on the first request."""
 
     async def stop(self) -> None:
-        """Reset session state."""
+        """Close pooled connections and reset session state."""
+        client, self._client = self._client, None
+        if client is not None and self._client_loop is asyncio.get_running_loop():
+            with contextlib.suppress(Exception):
+                await client.aclose()
         self._session_id = None
         self._initialized = False
 
@@ -338,6 +491,8 @@ class McpClientPool:
     def __init__(self) -> None:
         self._sessions: dict[str, McpClientSession | McpHttpSession] = {}
         self._configs: dict[str, McpServerConfig] = {}
+        # config hash → (fetched at, tools)
+        self._tools_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
 
     def register(self, config: McpServerConfig) -> None:
         """Register an MCP server configuration (auto-detects transport)."""
@@ -349,9 +504,11 @@ class McpClientPool:
             session = self._sessions[server_name]
             # For stdio sessions, check if process is still alive
             if isinstance(session, McpClientSession):
-                if session._process and session._process.returncode is None:
+                if session.running:
                     return session
                 del self._sessions[server_name]
+                await session.stop()
+                self.invalidate_tools(server_name)  # a restarted server may offer other tools
             else:
                 return session  # HTTP sessions are always valid
 
@@ -363,17 +520,65 @@ class McpClientPool:
             session = McpHttpSession(config)
         else:
             session = McpClientSession(config)
+            session.on_tools_changed = lambda: self.invalidate_tools(server_name)
         await session.start()
         self._sessions[server_name] = session
         return session
 
+    async def list_tools(self, server_name: str) -> list[dict[str, Any]]:
+        """Tools of the named server, from the cache while it is fresh."""
+        from robothor.engine.metrics import MCP_TOOLS_CACHE
+
+        config = self._configs.get(server_name)
+        if not config:
+            raise ValueError(f"MCP server '{server_name}' not configured")
+        key = config_hash(config)
+        cached = self._tools_cache.get(key)
+        if cached and time.monotonic() - cached[0] < TOOLS_CACHE_TTL_S:
+            MCP_TOOLS_CACHE.labels(outcome="hit").inc()
+            return list(cached[1])
+
+        MCP_TOOLS_CACHE.labels(outcome="miss").inc()
+        session = await self.get_session(server_name)
+        tools = await session.list_tools()
+        self._tools_cache[key] = (time.monotonic(), tools)
+        return list(tools)
+
+    def invalidate_tools(self, server_name: str) -> None:
+        """Drop the cached tool list of the named server."""
+        config = self._configs.get(server_name)
+        if config:
+            self._tools_cache.pop(config_hash(config), None)
+
+    async def call_tool(self, server_name: str, name: str, arguments: dict[str, Any]) -> Any:
+        """Call a tool on the named server, recording cold vs warm latency.
+
+        A call is cold when it has to start or initialize the session first.
+        """
+        from robothor.engine.metrics import MCP_CALL_DURATION
+
+        session = self._sessions.get(server_name)
+        warm = bool(
+            session
+            and session._initialized
+            and (not isinstance(session, McpClientSession) or session.running)
+        )
+        start = time.monotonic()
+        try:
+            session = await self.get_session(server_name)
+            return await session.call_tool(name, arguments)
+        finally:
+            MCP_CALL_DURATION.labels(server=server_name, phase="warm" if warm else "cold").observe(
+                time.monotonic() - start
+            )
+
     def list_servers(self) -> list[dict[str, Any]]:
         """List configured servers with status."""
         result = []
         for name, config in self._configs.items():
             session = self._sessions.get(name)
             if isinstance(session, McpClientSession):
-                running = bool(session._process and session._process.returncode is None)
+                running = session.running
             else:
                 running = session is not None  # HTTP sessions are always "running"
             result.append(
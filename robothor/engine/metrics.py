@@ -67,6 +67,15 @@ TOOL_CALL_DURATION = Histogram(
     buckets=[0.1, 0.5, 1, 2, 5, 10, 30, 60],
 )
 
+# ── Lifecycle Hooks ─────────────────────────────────────────────────────
+
+HOOK_DURATION = Histogram(
+    "robothor_hook_duration_seconds",
+    "Lifecycle hook handler duration in seconds",
+    ["handler_type", "mode", "event"],  # mode: oneshot/worker for command hooks
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5, 10],
+)
+
 # ── Database Pool ───────────────────────────────────────────────────────
 
 DB_POOL_CONNECTIONS = Gauge(
@@ -75,6 +84,18 @@ DB_POOL_CONNECTIONS = Gauge(
     ["state"],  # state: used, free
 )
 
+# ── Chat Turn Embedding ─────────────────────────────────────────────────
+
+CHAT_EMBED_BACKLOG = Gauge(
+    "robothor_chat_embed_backlog",
+    "Chat turns waiting for background embedding",
+)
+
+CHAT_EMBED_LAG = Gauge(
+    "robothor_chat_embed_lag_seconds",
+    "Age of the oldest chat turn waiting for embedding",
+)
+
 # ── Adapter ─────────────────────────────────────────────────────────────
 
 ADAPTER_FAILURES = Counter(
@@ -82,3 +103,93 @@ ADAPTER_FAILURES = Counter(
     "Adapter connection failures",
     ["adapter_name"],
 )
+
+# ── Artifact Store ──────────────────────────────────────────────────────
+
+ARTIFACT_BYTES_TOTAL = Counter(
+    "robothor_artifact_bytes_total",
+    "Bytes offered to the tool-result artifact store",
+    ["outcome"],  # outcome: stored, deduplicated
+)
+
+ARTIFACT_STORE_BYTES = Gauge(
+    "robothor_artifact_store_bytes",
+    "Bytes currently held in the artifact store",
+)
+
+ARTIFACT_EVICTIONS = Counter(
+    "robothor_artifact_evictions_total",
+    "Artifacts evicted to stay under the store quota",
+)
+
+# ── Exec Tool ───────────────────────────────────────────────────────────
+
+EXEC_DURATION = Histogram(
+    "robothor_exec_duration_seconds",
+    "Wall time of exec tool commands",
+    buckets=[0.1, 0.5, 1, 5, 10, 30, 60, 120, 300],
+)
+
+EXEC_OUTPUT_BYTES = Counter(
+    "robothor_exec_output_bytes_total",
+    "Bytes written by exec tool commands, before truncation",
+    ["stream"],  # stream: stdout, stderr
+)
+
+# ── Integration HTTP Pool ───────────────────────────────────────────────
+
+HTTP_CLIENT_DURATION = Histogram(
+    "robothor_http_client_request_duration_seconds",
+    "Latency of tool handler HTTP requests through the shared pool",
+    ["host"],
+    buckets=[0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 120],
+)
+
+HTTP_CLIENT_ERRORS = Counter(
+    "robothor_http_client_errors_total",
+    "Failed tool handler HTTP requests through the shared pool",
+    ["host", "kind"],  # kind: timeout, connect, transport, other, 4xx, 5xx
+)
+
+# ── MCP Adapters ────────────────────────────────────────────────────────
+
+MCP_CALL_DURATION = Histogram(
+    "robothor_mcp_call_duration_seconds",
+    "Adapter tool call latency; cold calls include session start and handshake",
+    ["server", "phase"],  # phase: cold, warm
+    buckets=[0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30],
+)
+
+MCP_TOOLS_CACHE = Counter(
+    "robothor_mcp_tools_cache_total",
+    "MCP tools/list lookups served from cache or fetched from the server",
+    ["outcome"],  # outcome: hit, miss
+)
+
+# ── LLM Response Cache ──────────────────────────────────────────────────
+
+LLM_CACHE_LOOKUPS = Counter(
+    "robothor_llm_cache_lookups_total",
+    "Cacheable LLM calls served from the response cache or sent to the provider",
+    ["outcome"],  # outcome: hit_memory, hit_db, miss
+)
+
+LLM_CACHE_SAVED_USD = Counter(
+    "robothor_llm_cache_saved_usd_total",
+    "Estimated provider cost avoided by response cache hits",
+    ["model"],
+)
+
+# ── Model Health ────────────────────────────────────────────────────────
+
+MODEL_CIRCUIT_STATE = Gauge(
+    "robothor_model_circuit_state",
+    "Circuit breaker state per model (0 closed, 1 half-open, 2 open)",
+    ["model"],
+)
+
+MODEL_CIRCUIT_OPENED = Counter(
+    "robothor_model_circuit_opened_total",
+    "Times a model's circuit breaker opened",
+    ["model"],
+)
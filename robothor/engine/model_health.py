@@ -0,0 +1,249 @@
+"""Model health tracking and circuit breakers shared by all LLM fallback chains.
+
+Without shared state, every run has to rediscover a provider outage by
+waiting out the timeout on the first model in its chain. This tracker is
+process-wide, so all runs in the daemon learn from what earlier calls saw.
+It keeps two things per model:
+
+- rolling latency percentiles and the error rate over the last
+  ``ROBOTHOR_MODEL_HEALTH_WINDOW_S`` seconds.
+- a circuit breaker. It opens after ``ROBOTHOR_MODEL_BREAKER_FAILURES``
+  consecutive provider failures. After ``ROBOTHOR_MODEL_BREAKER_COOLDOWN_S``
+  it half-opens: one caller at a time may probe the model, and the probe's
+  outcome closes or re-opens the circuit.
+
+:meth:`ModelHealthTracker.order` sorts a fallback chain into three groups:
+
+1. healthy models, and a half-open model for the one chain that claims its
+   probe.
+2. degraded models: an error rate of ``DEGRADED_ERROR_RATE`` or more, or
+   p95 latency above ``ROBOTHOR_MODEL_SLOW_P95_S``.
+3. models whose circuit is open, and half-open models whose probe is
+   already claimed.
+
+Models keep their configured order within each group, so a healthy primary
+still goes first, and a recovering primary is probed in its own slot rather
+than waiting behind a fallback that keeps succeeding. A probe claim that is
+never resolved (the chain succeeded on an earlier model, or the call hung)
+lapses after one cooldown. Open models stay at the end of the chain as a
+last resort rather than being dropped.
+
+Only provider failures count against a model: timeouts, connection errors,
+rate limits, auth or billing errors, and 5xx responses. A rejected request,
+such as a context overflow, says nothing about the provider.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+WINDOW_S = float(os.environ.get("ROBOTHOR_MODEL_HEALTH_WINDOW_S", "300"))
+FAILURE_THRESHOLD = int(os.environ.get("ROBOTHOR_MODEL_BREAKER_FAILURES", "3"))
+COOLDOWN_S = float(os.environ.get("ROBOTHOR_MODEL_BREAKER_COOLDOWN_S", "60"))
+SLOW_P95_S = float(os.environ.get("ROBOTHOR_MODEL_SLOW_P95_S", "120"))
+
+DEGRADED_ERROR_RATE = 0.25
+# Samples needed in the window before error rate or latency can demote a model
+MIN_SAMPLES = 4
+MAX_SAMPLES = 500
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+_STATE_GAUGE = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+# Same statuses the runner treats as "remove from rotation", plus 408 (litellm.Timeout)
+_PROVIDER_FAILURE_STATUS = frozenset({401, 402, 403, 408, 429, 500, 502, 503, 504})
+
+
+def is_provider_failure(exc: BaseException) -> bool:
+    """True when *exc* says the provider is unhealthy, not that the request was bad."""
+    if isinstance(exc, TimeoutError):
+        return True
+    return getattr(exc, "status_code", None) in _PROVIDER_FAILURE_STATUS
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@dataclass
+class _ModelState:
+    # (time, latency_s or None for failures, ok)
+    samples: deque[tuple[float, float | None, bool]] = field(
+        default_factory=lambda: deque(maxlen=MAX_SAMPLES)
+    )
+    consecutive_failures: int = 0
+    opened_at: float | None = None
+    probe_claimed_at: float | None = None
+
+
+class ModelHealthTracker:
+    """Rolling per-model health and circuit breakers. Use ``get_model_health()``."""
+
+    def __init__(
+        self,
+        *,
+        window_s: float = WINDOW_S,
+        failure_threshold: int = FAILURE_THRESHOLD,
+        cooldown_s: float = COOLDOWN_S,
+        slow_p95_s: float = SLOW_P95_S,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.window_s = window_s
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown_s = cooldown_s
+        self.slow_p95_s = slow_p95_s
+        self._clock = clock
+        self._models: dict[str, _ModelState] = {}
+
+    def _get(self, model: str) -> _ModelState:
+        state = self._models.get(model)
+        if state is None:
+            state = self._models[model] = _ModelState()
+        return state
+
+    def _window(self, state: _ModelState) -> list[tuple[float, float | None, bool]]:
+        cutoff = self._clock() - self.window_s
+        while state.samples and state.samples[0][0] < cutoff:
+            state.samples.popleft()
+        return list(state.samples)
+
+    def state(self, model: str) -> str:
+        """Circuit state of *model*: closed, half_open or open."""
+        state = self._models.get(model)
+        if state is None or state.opened_at is None:
+            return CLOSED
+        if self._clock() - state.opened_at >= self.cooldown_s:
+            return HALF_OPEN
+        return OPEN
+
+    def record_success(self, model: str, latency_s: float) -> None:
+        state = self._get(model)
+        state.samples.append((self._clock(), latency_s, True))
+        state.consecutive_failures = 0
+        state.probe_claimed_at = None
+        if state.opened_at is not None:
+            state.opened_at = None
+            # The outage is over; its failures must not keep the model demoted
+            state.samples = deque((s for s in state.samples if s[2]), maxlen=MAX_SAMPLES)
+            logger.info("Model %s recovered, circuit closed", model)
+        self._publish(model)
+
+    def record_failure(self, model: str, exc: BaseException) -> bool:
+        """Count a failed call. Returns False if *exc* is not a provider failure."""
+        if not is_provider_failure(exc):
+            return False
+        state = self._get(model)
+        circuit = self.state(model)
+        state.samples.append((self._clock(), None, False))
+        state.consecutive_failures += 1
+        state.probe_claimed_at = None
+        if circuit == HALF_OPEN or (
+            circuit == CLOSED and state.consecutive_failures >= self.failure_threshold
+        ):
+            from robothor.engine.metrics import MODEL_CIRCUIT_OPENED
+
+            state.opened_at = self._clock()
+            MODEL_CIRCUIT_OPENED.labels(model=model).inc()
+            logger.warning(
+                "Model %s circuit opened after %d consecutive failures (%s); "
+                "demoted in fallback chains for %ds",
+                model,
+                state.consecutive_failures,
+                type(exc).__name__,
+                int(self.cooldown_s),
+            )
+        self._publish(model)
+        return True
+
+    def _stats(self, model: str) -> dict[str, Any]:
+        state = self._models.get(model)
+        samples = self._window(state) if state else []
+        latencies = [lat for _, lat, ok in samples if ok and lat is not None]
+        errors = sum(1 for _, _, ok in samples if not ok)
+        return {
+            "samples": len(samples),
+            "error_rate": round(errors / len(samples), 3) if samples else 0.0,
+            "p50_s": round(_percentile(latencies, 50), 3) if latencies else None,
+            "p95_s": round(_percentile(latencies, 95), 3) if latencies else None,
+        }
+
+    def _claim_probe(self, model: str) -> bool:
+        """Claim the half-open probe for *model*; False if another caller holds it."""
+        state = self._get(model)
+        now = self._clock()
+        if state.probe_claimed_at is not None and now - state.probe_claimed_at < self.cooldown_s:
+            return False
+        state.probe_claimed_at = now
+        return True
+
+    def _tier(self, model: str) -> int:
+        circuit = self.state(model)
+        if circuit == OPEN:
+            return 2
+        if circuit == HALF_OPEN:
+            return 0 if self._claim_probe(model) else 2
+        stats = self._stats(model)
+        if stats["samples"] >= MIN_SAMPLES and (
+            stats["error_rate"] >= DEGRADED_ERROR_RATE
+            or (stats["p95_s"] is not None and stats["p95_s"] > self.slow_p95_s)
+        ):
+            return 1
+        return 0
+
+    def order(self, models: list[str]) -> list[str]:
+        """Reorder a fallback chain by health, keeping configured order within a tier."""
+        ordered = sorted(models, key=self._tier)
+        if ordered != models:
+            logger.debug("Fallback chain reordered by health: %s -> %s", models, ordered)
+        return ordered
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Per-model circuit state and rolling stats, for the health endpoint."""
+        now = self._clock()
+        result: dict[str, dict[str, Any]] = {}
+        for model, state in self._models.items():
+            circuit = self.state(model)
+            entry: dict[str, Any] = {
+                "circuit": circuit,
+                "consecutive_failures": state.consecutive_failures,
+                **self._stats(model),
+            }
+            if circuit == OPEN and state.opened_at is not None:
+                entry["retry_in_s"] = round(self.cooldown_s - (now - state.opened_at), 1)
+            if circuit == HALF_OPEN:
+                entry["probe_in_flight"] = (
+                    state.probe_claimed_at is not None
+                    and now - state.probe_claimed_at < self.cooldown_s
+                )
+            result[model] = entry
+            self._publish(model)
+        return result
+
+    def _publish(self, model: str) -> None:
+        from robothor.engine.metrics import MODEL_CIRCUIT_STATE
+
+        MODEL_CIRCUIT_STATE.labels(model=model).set(_STATE_GAUGE[self.state(model)])
+
+
+_tracker = ModelHealthTracker()
+
+
+def get_model_health() -> ModelHealthTracker:
+    """Return the process-wide tracker."""
+    return _tracker
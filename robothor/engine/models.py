@@ -511,6 +511,7 @@ class WorkflowStepDef:
 
     # Flow control
     next: str = ""  # Explicit next step ID (overrides sequential)
+    depends_on: list[str] = field(default_factory=list)  # Step IDs (parallel workflows)
 
 
 @dataclass
@@ -535,6 +536,7 @@ class WorkflowDef:
     triggers: list[WorkflowTriggerDef] = field(default_factory=list)
     steps: list[WorkflowStepDef] = field(default_factory=list)
     timeout_seconds: int = 900
+    max_parallel: int = 1  # >1 schedules steps by dependency instead of in order
     delivery_mode: str = "none"
     delivery_channel: str = ""
     delivery_to: str = ""
@@ -23,19 +23,225 @@ Hierarchical tenant access resolution:
     can access.  Owner/admin roles get access to child tenants; regular
     users only see their own tenant.
 
-    The hierarchy is read from ``crm_tenants.parent_tenant_id``.
+    The hierarchy is read from ``crm_tenants.parent_tenant_id`` with a
+    single recursive query.
+
+Caching:
+    Rules for a (role, tenant) pair are compiled once into a
+    ``CompiledPermissions`` (patterns precompiled, decisions memoized per
+    tool) and kept for PERMISSION_CACHE_TTL_S, as are resolved tenant
+    sets. ``permissions_changed()`` drops both caches and, when
+    ROBOTHOR_PERMISSION_CHANGE_EVENTS is enabled, publishes a change event
+    so processes running ``start_permission_change_listener()`` drop theirs.
 """
 
 from __future__ import annotations
 
 import fnmatch
 import logging
+import os
+import re
+import threading
+import time
 from typing import Any
 
 from robothor.constants import DEFAULT_TENANT
 
 logger = logging.getLogger(__name__)
 
+PERMISSION_CACHE_TTL_S = float(os.environ.get("ROBOTHOR_PERMISSION_CACHE_TTL", "30"))
+
+# Publish permissions.changed events so other processes can invalidate.
+PERMISSION_CHANGE_EVENTS = os.environ.get("ROBOTHOR_PERMISSION_CHANGE_EVENTS", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+PERMISSION_CHANGE_STREAM = "agent"
+PERMISSION_CHANGE_EVENT = "permissions.changed"
+
+
+class CompiledPermissions:
+    """Ordered permission rules for one (role, tenant), ready to evaluate.
+
+    Rules keep the query's priority order (tenant-specific before
+    ``__default__``, deny before allow); the first matching pattern decides.
+    Decisions are memoized per tool name.
+    """
+
+    def __init__(self, role: str, rules: list[tuple[str, str]]) -> None:
+        self.role = role
+        self.rules = tuple(rules)
+        self._matchers = tuple(
+            (re.compile(fnmatch.translate(pattern)).match, pattern, access)
+            for pattern, access in rules
+        )
+        self._decisions: dict[str, str | None] = {}
+
+    def check(self, tool_name: str) -> str | None:
+        """Denial reason string, or None if allowed."""
+        try:
+            return self._decisions[tool_name]
+        except KeyError:
+            pass
+        decision = self._evaluate(tool_name)
+        self._decisions[tool_name] = decision
+        return decision
+
+    def _evaluate(self, tool_name: str) -> str | None:
+        if not self._matchers:
+            return f"No permission rules for role '{self.role}' — access denied"
+        for match, pattern, access in self._matchers:
+            if match(tool_name):
+                if access == "deny":
+                    return f"Role '{self.role}' denied '{tool_name}' (pattern: {pattern})"
+                return None  # Explicitly allowed
+        return f"No permission rule matched for role '{self.role}' on '{tool_name}' — access denied"
+
+
+class _TTLCache:
+    """Thread-safe TTL cache with a generation counter.
+
+    ``clear()`` bumps the generation; a ``put()`` for a value fetched before
+    the clear is dropped, so a lookup that raced a permission change cannot
+    re-populate the cache with stale rules.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[Any, tuple[float, Any]] = {}
+        self.generation = 0
+
+    def get(self, key: Any) -> Any | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if time.monotonic() - stored_at > PERMISSION_CACHE_TTL_S:
+                del self._entries[key]
+                return None
+            return value
+
+    def put(self, key: Any, value: Any, generation: int) -> None:
+        with self._lock:
+            if generation == self.generation:
+                self._entries[key] = (time.monotonic(), value)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.generation += 1
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_rules_cache = _TTLCache()
+_tenant_cache = _TTLCache()
+
+
+def clear_permission_cache() -> None:
+    """Drop every cached permission set and tenant resolution."""
+    _rules_cache.clear()
+    _tenant_cache.clear()
+
+
+def permissions_changed(tenant_id: str | None = None) -> None:
+    """Record that role_permissions or the tenant hierarchy changed.
+
+    Drops the local caches and, when PERMISSION_CHANGE_EVENTS is enabled,
+    publishes a change event for other processes. Rules under
+    ``__default__`` and parent links affect every tenant, so the whole
+    cache is dropped rather than one tenant's entries.
+    """
+    clear_permission_cache()
+    if not PERMISSION_CHANGE_EVENTS:
+        return
+    try:
+        from robothor.events.bus import publish
+
+        publish(
+            PERMISSION_CHANGE_STREAM,
+            PERMISSION_CHANGE_EVENT,
+            {},
+            source="engine.permissions",
+            tenant_id=tenant_id or DEFAULT_TENANT,
+        )
+    except Exception as e:
+        logger.debug("Permission change notification failed: %s", e)
+
+
+def handle_permission_change_event(event: dict[str, Any]) -> None:
+    """Event bus handler — drop cached permissions after another process changed them."""
+    if event.get("type") == PERMISSION_CHANGE_EVENT:
+        clear_permission_cache()
+
+
+_listener_thread: threading.Thread | None = None
+
+
+def start_permission_change_listener() -> bool:
+    """Follow permission change events in a daemon thread (idempotent).
+
+    Returns:
+        True if a listener is running, False when change events are disabled.
+    """
+    global _listener_thread
+    if not PERMISSION_CHANGE_EVENTS:
+        return False
+    if _listener_thread is not None and _listener_thread.is_alive():
+        return True
+
+    from robothor.events.bus import tail
+
+    _listener_thread = threading.Thread(
+        target=tail,
+        args=(PERMISSION_CHANGE_STREAM,),
+        kwargs={"handler": handle_permission_change_event},
+        name="permission-cache-listener",
+        daemon=True,
+    )
+    _listener_thread.start()
+    return True
+
+
+def compile_permissions(user_role: str, tenant_id: str) -> CompiledPermissions:
+    """Load and compile the rules that apply to ``user_role`` in ``tenant_id``.
+
+    Served from the TTL cache when possible. Raises on database errors
+    (nothing is cached in that case).
+    """
+    key = (user_role, tenant_id)
+    compiled: CompiledPermissions | None = _rules_cache.get(key)
+    if compiled is not None:
+        return compiled
+
+    generation = _rules_cache.generation
+    from robothor.db.connection import get_connection
+
+    with get_connection() as conn:
+        cur = conn.cursor()
+
+        # Fetch matching rules: tenant-specific first, then __default__
+        cur.execute(
+            """
+            SELECT tool_pattern, access, tenant_id
+            FROM role_permissions
+            WHERE role = %s AND tenant_id IN (%s, '__default__')
+            ORDER BY
+                CASE WHEN tenant_id = %s THEN 0 ELSE 1 END,
+                access DESC
+            """,
+            (user_role, tenant_id, tenant_id),
+        )
+        rules = cur.fetchall()
+
+    compiled = CompiledPermissions(user_role, [(pattern, access) for pattern, access, _ in rules])
+    _rules_cache.put(key, compiled, generation)
+    return compiled
+
 
 def check_tool_permission(
     user_role: str,
@@ -57,56 +263,46 @@ def check_tool_permission(
         return None  # System/automated — no user-level enforcement
 
     try:
-        from robothor.db.connection import get_connection
-
-        with get_connection() as conn:
-            cur = conn.cursor()
-
-            # Fetch matching rules: tenant-specific first, then __default__
-            cur.execute(
-                """
-                SELECT tool_pattern, access, tenant_id
-                FROM role_permissions
-                WHERE role = %s AND tenant_id IN (%s, '__default__')
-                ORDER BY
-                    CASE WHEN tenant_id = %s THEN 0 ELSE 1 END,
-                    access DESC
-                """,
-                (user_role, tenant_id, tenant_id),
-            )
-            rules = cur.fetchall()
-
-        if not rules:
-            return f"No permission rules for role '{user_role}' — access denied"
-
-        # Evaluate rules in priority order (tenant-specific before __default__)
-        for pattern, access, _rule_tenant in rules:
-            if fnmatch.fnmatch(tool_name, pattern):
-                if access == "deny":
-                    return f"Role '{user_role}' denied '{tool_name}' (pattern: {pattern})"
-                return None  # Explicitly allowed
-
-        return f"No permission rule matched for role '{user_role}' on '{tool_name}' — access denied"
-
+        return compile_permissions(user_role, tenant_id).check(tool_name)
     except Exception:
         logger.warning("Permission check failed — denying access", exc_info=True)
         return "Permission check unavailable — access denied"
 
 
-def _get_child_tenants(tenant_id: str) -> list[str]:
-    """Return direct child tenant IDs from the CRM database.
+def _get_descendant_tenants(tenant_id: str, max_depth: int) -> list[str]:
+    """Return active descendant tenant IDs, breadth-first, in one query.
 
-    Returns an empty list if the DB is unavailable or the tenant has
-    no children — callers always degrade gracefully.
+    Within a level, children follow their parent's order and then
+    display_name — the order a level-by-level walk would produce.
+    Cycles in parent links are cut by the path check.
     """
-    try:
-        from robothor.crm.dal import list_tenants
+    from robothor.db.connection import get_connection
 
-        children: list[dict[str, Any]] = list_tenants(parent_id=tenant_id, active_only=True)
-        return [t["id"] for t in children if "id" in t]
-    except Exception:
-        logger.debug("Could not fetch child tenants for %s", tenant_id, exc_info=True)
-        return []
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            """
+            WITH RECURSIVE tree AS (
+                SELECT id, 1 AS depth,
+                       ARRAY[%s::text, id::text] AS path,
+                       ARRAY[display_name::text] AS sort_key
+                FROM crm_tenants
+                WHERE parent_tenant_id = %s AND active = TRUE AND id <> %s
+                UNION ALL
+                SELECT t.id, tree.depth + 1,
+                       tree.path || t.id::text,
+                       tree.sort_key || t.display_name::text
+                FROM crm_tenants t
+                JOIN tree ON t.parent_tenant_id = tree.id
+                WHERE tree.depth < %s
+                  AND t.active = TRUE
+                  AND NOT t.id::text = ANY(tree.path)
+            )
+            SELECT id FROM tree ORDER BY depth, sort_key, path
+            """,
+            (tenant_id, tenant_id, tenant_id, max_depth),
+        )
+        return [row[0] for row in cur.fetchall()]
 
 
 def resolve_accessible_tenants(
@@ -137,29 +333,24 @@ def resolve_accessible_tenants(
     if not tenant_id:
         return (DEFAULT_TENANT,)
 
-    accessible = [tenant_id]
+    if user_role not in ("owner", "admin") or max_depth < 1:
+        return (tenant_id,)
 
-    if user_role not in ("owner", "admin"):
-        return tuple(accessible)
+    key = (tenant_id, max_depth)
+    cached: tuple[str, ...] | None = _tenant_cache.get(key)
+    if cached is not None:
+        return cached
 
-    # BFS traversal of child tenants
-    queue = [tenant_id]
-    depth = 0
+    generation = _tenant_cache.generation
     try:
-        while queue and depth < max_depth:
-            next_level: list[str] = []
-            for parent in queue:
-                children = _get_child_tenants(parent)
-                for child in children:
-                    if child not in accessible:
-                        accessible.append(child)
-                        next_level.append(child)
-            queue = next_level
-            depth += 1
+        descendants = _get_descendant_tenants(tenant_id, max_depth)
     except Exception:
-        logger.debug("Tenant hierarchy traversal failed, using partial results", exc_info=True)
+        logger.debug("Could not fetch child tenants for %s", tenant_id, exc_info=True)
+        return (tenant_id,)
 
-    return tuple(accessible)
+    accessible = tuple(dict.fromkeys([tenant_id, *descendants]))
+    _tenant_cache.put(key, accessible, generation)
+    return accessible
 
 
 def seed_default_permissions() -> None:
@@ -196,3 +387,5 @@ def seed_default_permissions() -> None:
                 """,
                 (role, pattern, access),
             )
+
+    permissions_changed()
@@ -18,12 +18,18 @@ from typing import TYPE_CHECKING, Any
 
 import litellm
 
+from robothor.engine.llm_client import llm_call
+
 if TYPE_CHECKING:
     from robothor.engine.escalation import EscalationManager
     from robothor.engine.scratchpad import Scratchpad
 
 logger = logging.getLogger(__name__)
 
+# Plans for an identical task and tool list are reused for this long. Scheduled
+# agents send the same instruction every run.
+PLAN_CACHE_TTL_S = 6 * 3600
+
 PLANNING_PROMPT = """Analyze this task and produce a JSON execution plan.
 
 Task: {message}
@@ -98,8 +104,9 @@ async def generate_plan(
 ) -> PlanResult:
     """Generate an execution plan via a separate LLM call.
 
-    Uses JSON mode, max 500 tokens, cheap model. Non-fatal — returns
-    a default PlanResult on any failure.
+    Uses JSON mode, max 500 tokens, cheap model. Identical requests are
+    answered from the LLM response cache for PLAN_CACHE_TTL_S. Non-fatal —
+    returns a default PlanResult on any failure.
     """
     prompt = PLANNING_PROMPT.format(
         message=message,
@@ -111,12 +118,13 @@ async def generate_plan(
 
     for m in models:
         try:
-            response = await litellm.acompletion(
+            response = await llm_call(
+                [{"role": "user", "content": prompt}],
                 model=m,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
+                temperature=0.0,
+                json_mode=True,
                 max_tokens=500,
-                response_format={"type": "json_object"},
+                cache_ttl=PLAN_CACHE_TTL_S,
             )
             content = response.choices[0].message.content
             if not content:
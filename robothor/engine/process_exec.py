@@ -0,0 +1,189 @@
+"""Bounded streaming execution of shell commands for the exec tool.
+
+Commands run as asyncio subprocesses in their own process group. stdout and
+stderr are read as they arrive into head+tail buffers, so memory stays bounded
+however much a command prints, and no worker thread is held while it runs.
+On timeout or cancellation the whole process group is killed, so background
+children the command started go down with it.
+
+With an ``on_output`` callback, new output is forwarded at most once per
+``PROGRESS_INTERVAL_S`` per stream, as ``{"stream", "text"}`` events.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import codecs
+import contextlib
+import logging
+import os
+import signal
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+_READ_SIZE = 64 * 1024
+
+# Minimum seconds between progress events for one stream
+PROGRESS_INTERVAL_S = 1.0
+# Longest text sent in one progress event (characters, most recent kept)
+PROGRESS_MAX_CHARS = 2000
+
+# Grace period for the killed process group to be reaped
+KILL_GRACE_S = 2.0
+
+
+class HeadTailBuffer:
+    """Keeps the first ``head`` and last ``tail`` bytes written to it."""
+
+    def __init__(self, head: int, tail: int) -> None:
+        self.head_limit = head
+        self.tail_limit = tail
+        self._head = bytearray()
+        self._tail = bytearray()
+        self.total = 0
+
+    def write(self, data: bytes) -> None:
+        self.total += len(data)
+        room = self.head_limit - len(self._head)
+        if room > 0:
+            self._head += data[:room]
+            data = data[room:]
+        if data and self.tail_limit:
+            self._tail += data
+            # Trim lazily so steady output is not copied on every write
+            if len(self._tail) > 2 * self.tail_limit:
+                del self._tail[: -self.tail_limit]
+
+    @property
+    def truncated(self) -> bool:
+        return self.total > self.head_limit + self.tail_limit
+
+    def getvalue(self) -> str:
+        tail = bytes(self._tail[-self.tail_limit :]) if self.tail_limit else b""
+        head = bytes(self._head)
+        if not self.truncated:
+            return (head + tail).decode("utf-8", errors="replace")
+        omitted = self.total - len(head) - len(tail)
+        return (
+            head.decode("utf-8", errors="replace")
+            + f"\n... [{omitted} bytes omitted] ...\n"
+            + tail.decode("utf-8", errors="replace")
+        )
+
+
+@dataclass
+class CommandResult:
+    exit_code: int | None
+    stdout: str
+    stderr: str
+    stdout_bytes: int
+    stderr_bytes: int
+    duration_ms: int
+    timed_out: bool = False
+    truncated: bool = False
+
+
+class _Progress:
+    """Throttles decoded output from one stream into progress events."""
+
+    def __init__(self, stream: str, callback: Callable[[dict[str, Any]], Awaitable[None]]):
+        self.stream = stream
+        self.callback = callback
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._pending = ""
+        self._last = 0.0
+
+    async def feed(self, data: bytes, final: bool = False) -> None:
+        self._pending = (self._pending + self._decoder.decode(data, final))[-PROGRESS_MAX_CHARS:]
+        now = time.monotonic()
+        if self._pending and (final or now - self._last >= PROGRESS_INTERVAL_S):
+            text, self._pending = self._pending, ""
+            self._last = now
+            try:
+                await self.callback({"stream": self.stream, "text": text})
+            except Exception as e:
+                logger.debug("exec progress callback failed: %s", e)
+
+
+def _kill_group(proc: asyncio.subprocess.Process) -> None:
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        with contextlib.suppress(ProcessLookupError):
+            proc.kill()
+
+
+async def _pump(
+    stream: asyncio.StreamReader, buffer: HeadTailBuffer, progress: _Progress | None
+) -> None:
+    while chunk := await stream.read(_READ_SIZE):
+        buffer.write(chunk)
+        if progress:
+            await progress.feed(chunk)
+    if progress:
+        await progress.feed(b"", final=True)
+
+
+async def run_command(
+    command: str,
+    *,
+    timeout: float,
+    cwd: str | None = None,
+    stdout_limits: tuple[int, int] = (2000, 2000),
+    stderr_limits: tuple[int, int] = (1000, 1000),
+    on_output: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
+) -> CommandResult:
+    """Run ``command`` through the shell with bounded output capture.
+
+    ``*_limits`` are ``(head, tail)`` byte counts kept per stream.
+    """
+    from robothor.engine.metrics import EXEC_DURATION, EXEC_OUTPUT_BYTES
+
+    start = time.monotonic()
+    proc = await asyncio.create_subprocess_shell(
+        command,
+        stdin=asyncio.subprocess.DEVNULL,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+        start_new_session=True,  # own process group, so a kill reaches every child
+    )
+    assert proc.stdout is not None and proc.stderr is not None
+    out = HeadTailBuffer(*stdout_limits)
+    err = HeadTailBuffer(*stderr_limits)
+    timed_out = False
+    try:
+        async with asyncio.timeout(timeout):
+            await asyncio.gather(
+                _pump(proc.stdout, out, _Progress("stdout", on_output) if on_output else None),
+                _pump(proc.stderr, err, _Progress("stderr", on_output) if on_output else None),
+            )
+            await proc.wait()
+    except TimeoutError:
+        timed_out = True
+    finally:
+        if proc.returncode is None:
+            _kill_group(proc)
+            with contextlib.suppress(Exception):
+                await asyncio.wait_for(asyncio.shield(proc.wait()), KILL_GRACE_S)
+
+    duration = time.monotonic() - start
+    EXEC_DURATION.observe(duration)
+    EXEC_OUTPUT_BYTES.labels(stream="stdout").inc(out.total)
+    EXEC_OUTPUT_BYTES.labels(stream="stderr").inc(err.total)
+    return CommandResult(
+        exit_code=None if timed_out else proc.returncode,
+        stdout=out.getvalue(),
+        stderr=err.getvalue(),
+        stdout_bytes=out.total,
+        stderr_bytes=err.total,
+        duration_ms=int(duration * 1000),
+        timed_out=timed_out,
+        truncated=out.truncated or err.truncated,
+    )
@@ -35,6 +35,11 @@ RETENTION_POLICY: OrderedDict[str, dict[str, Any]] = OrderedDict(
             "agent_guardrail_events",
             {"days": 30, "timestamp_col": "created_at", "batch_size": 5000},
         ),
+        # Response-cache rows a day past expiry (never served once expired)
+        (
+            "llm_response_cache",
+            {"days": 1, "timestamp_col": "expires_at", "batch_size": 5000},
+        ),
         # ── Warm tier (90 days) — operational audit trail ──
         (
             "audit_log",
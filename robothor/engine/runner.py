@@ -39,6 +39,7 @@ from robothor.engine.config import (
     build_system_prompt,
     load_agent_config,
 )
+from robothor.engine.model_health import get_model_health
 from robothor.engine.models import (
     AgentConfig,
     AgentRun,
@@ -310,13 +311,17 @@ class AgentRunner:
         )
 
         warmup_future: asyncio.Future[str | None] | None = None
+        warmup_timings: list[Any] = []  # SectionTiming per section, replayed into the trace
         if warmup_kind == "cron":
             from robothor.engine.warmup import build_warmth_preamble
 
             warmup_future = loop.run_in_executor(
                 None,
                 lambda: build_warmth_preamble(
-                    agent_config, self.config.workspace, self.config.tenant_id
+                    agent_config,
+                    self.config.workspace,
+                    self.config.tenant_id,
+                    timings=warmup_timings,
                 ),
             )
         elif warmup_kind == "interactive":
@@ -342,6 +347,7 @@ class AgentRunner:
                     extra_memory_blocks=_extra_blocks,
                     tenant_id=_tenant,
                     sender_name=_sender,
+                    timings=warmup_timings,
                 ),
             )
 
@@ -562,6 +568,15 @@ class AgentRunner:
 
                 # ── [TELEMETRY] Create trace context ──
                 trace = self._create_trace(agent_config, session, spawn_context=spawn_context)
+                if trace:
+                    for timing in warmup_timings:
+                        trace.add_span(
+                            f"warmup.{timing.name}",
+                            timing.started_at,
+                            timing.started_at + timing.duration_ms / 1000,
+                            status="error" if timing.status in ("timeout", "error") else "ok",
+                            result=timing.status,
+                        )
 
                 # Resolve effective max_iterations (route may cap it lower, never raise it)
                 max_iterations = agent_config.max_iterations
@@ -894,6 +909,10 @@ class AgentRunner:
         # Track models that hit permanent errors (401/403/429) across iterations
         broken_models: set[str] = set()
 
+        # Exact token counts for the primary model's provider, when registered
+        if models:
+            session.use_tokenizer_for(models[0])
+
         # Error recovery state
         _helper_spawns_used: int = 0
         _replan_count: int = 0
@@ -941,7 +960,9 @@ class AgentRunner:
 
             gr_text = guardrail_summary(guardrail_engine.enabled_policies)
             if gr_text and session.messages and session.messages[0].get("role") == "system":
-                session.messages[0]["content"] += f"\n\n---\n\n{gr_text}"
+                session.messages.set_content(
+                    0, f"{session.messages[0]['content']}\n\n---\n\n{gr_text}"
+                )
 
         # ── v2: Lifecycle hooks ──
         from robothor.engine.hook_registry import (
@@ -1132,10 +1153,10 @@ class AgentRunner:
             # ── [PROACTIVE COMPACTION] Compress before hitting the 75% cliff ──
             if _iteration > 0 and _iteration % 5 == 0:
                 try:
-                    from robothor.engine.context import estimate_tokens, maybe_compress
+                    from robothor.engine.context import maybe_compress
                     from robothor.engine.model_registry import get_model_limits
 
-                    est_tokens = estimate_tokens(session.messages)
+                    est_tokens = session.token_count
                     model_limits = get_model_limits(models[0])
                     proactive_threshold = int(model_limits.max_input_tokens * 0.50)
                     if est_tokens > proactive_threshold:
@@ -1441,6 +1462,23 @@ class AgentRunner:
                             }
                         )
 
+                # Forward handler progress (e.g. exec output) as tool_progress events
+                _on_progress = None
+                if on_tool:
+
+                    async def _on_progress(
+                        event: dict[str, Any], _tool: str = tool_name, _call_id: str = tc.id
+                    ) -> None:
+                        with contextlib.suppress(Exception):
+                            await on_tool(
+                                {
+                                    "event": "tool_progress",
+                                    "tool": _tool,
+                                    "call_id": _call_id,
+                                    **event,
+                                }
+                            )
+
                 # ── [TELEMETRY] Tool span ──
                 tool_start = time.monotonic()
                 _tool_timeout = getattr(agent_config, "tool_timeout_seconds", 120)
@@ -1456,6 +1494,7 @@ class AgentRunner:
                             user_role=session.run.user_role,
                             timeout=_tool_timeout,
                             accessible_tenant_ids=session.run.accessible_tenant_ids,
+                            on_progress=_on_progress,
                         )
                 else:
                     result = await self.registry.execute(
@@ -1468,6 +1507,7 @@ class AgentRunner:
                         user_role=session.run.user_role,
                         timeout=_tool_timeout,
                         accessible_tenant_ids=session.run.accessible_tenant_ids,
+                        on_progress=_on_progress,
                     )
                 tool_elapsed = int((time.monotonic() - tool_start) * 1000)
 
@@ -1540,7 +1580,7 @@ class AgentRunner:
                     items = [TodoItem.from_dict(d) for d in validated]
                     result = session.todo_list.replace(items)
                     # Update the tool result message already in session.messages
-                    session.messages[-1]["content"] = json.dumps(result, default=str)
+                    session.messages.set_content(-1, json.dumps(result, default=str))
 
                 session.record_tool_call(
                     tool_name=tool_name,
@@ -2580,7 +2620,11 @@ class AgentRunner:
         *,
         streaming: bool = False,
     ) -> None:
-        """Handle model failure: mark broken or log warning."""
+        """Handle model failure: mark broken or log warning.
+
+        Provider failures also count toward the model's shared circuit breaker.
+        """
+        get_model_health().record_failure(model, e)
         status = getattr(e, "status_code", None)
         is_timeout = isinstance(e, (asyncio.TimeoutError, TimeoutError))
         # Mark broken for auth, rate limit, provider failures, and timeouts
@@ -2624,12 +2668,15 @@ class AgentRunner:
             _sanitize(models),
             _sanitize(broken_models or set()),
         )
-        for model in models:
+        health = get_model_health()
+        for model in health.order(models):
             if broken_models and model in broken_models:
                 continue
             try:
                 kwargs = self._build_llm_kwargs(model, messages, tools, input_est, temperature)
+                call_start = time.monotonic()
                 result = await litellm.acompletion(**kwargs)
+                health.record_success(model, time.monotonic() - call_start)
                 return result
             except Exception as e:
                 self._handle_model_error(e, model, broken_models)
@@ -2672,7 +2719,8 @@ class AgentRunner:
                 with contextlib.suppress(Exception):
                     await on_stream_event(event)
 
-        for model in models:
+        health = get_model_health()
+        for model in health.order(models):
             if broken_models and model in broken_models:
                 continue
             try:
@@ -2767,6 +2815,7 @@ class AgentRunner:
                                 )
 
                 await _emit({"type": "message_stop"})
+                health.record_success(model, time.monotonic() - stream_start)
                 return litellm.stream_chunk_builder(chunks)
             except TimeoutError as te:
                 self._handle_model_error(
@@ -11,14 +11,13 @@ from __future__ import annotations
 
 import json
 import logging
-import os
-import tempfile
 import time
 import uuid
 from datetime import UTC, datetime
 from typing import TYPE_CHECKING, Any
 
 from robothor.constants import DEFAULT_TENANT
+from robothor.engine.context import TokenCountedMessages, get_tokenizer
 from robothor.engine.models import AgentRun, RunStatus, RunStep, StepType, TriggerType
 
 if TYPE_CHECKING:
@@ -37,6 +36,7 @@ EXTERNAL_DATA_TOOLS: frozenset[str] = frozenset(
         "web_fetch",
         "web_search",
         "search_memory",
+        "search_memories",
         "get_entity",
         "get_conversation",
         "list_messages",
@@ -65,7 +65,7 @@ class AgentSession:
             correlation_id=correlation_id or str(uuid.uuid4()),
             status=RunStatus.PENDING,
         )
-        self.messages: list[dict[str, Any]] = []
+        self._messages = TokenCountedMessages()
         self._step_counter = 0
         self._start_time: float | None = None
         self._tool_offload_threshold = tool_offload_threshold
@@ -76,6 +76,34 @@ class AgentSession:
     def run_id(self) -> str:
         return self.run.id
 
+    # ── Messages and token accounting ──────────────────────────────
+
+    @property
+    def messages(self) -> TokenCountedMessages:
+        """Conversation messages, with running token counters."""
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages: list[dict[str, Any]]) -> None:
+        if messages is self._messages:
+            return
+        self._messages = TokenCountedMessages(messages, tokenizer=self._messages.tokenizer)
+
+    @property
+    def token_count(self) -> int:
+        """Current context size: exact if a tokenizer is set, else the char estimate."""
+        return self._messages.tokens
+
+    def use_tokenizer_for(self, model: str) -> bool:
+        """Switch to the exact tokenizer registered for ``model``'s provider.
+
+        Returns True if one was found; otherwise counting stays estimate-only.
+        """
+        tokenizer = get_tokenizer(model)
+        if tokenizer is not self._messages.tokenizer:
+            self._messages.set_tokenizer(tokenizer)
+        return tokenizer is not None
+
     def start(
         self,
         system_prompt: str,
@@ -298,14 +326,18 @@ class AgentSession:
     # ── Eager tool result compression ──────────────────────────────
 
     def _offload_tool_result(self, content: str, tool_name: str) -> str:
-        """Write large tool result to temp file, return summary + file path."""
+        """Store large tool result in the artifact store, return summary + reference."""
+        from robothor.engine.artifacts import get_artifact_store
         from robothor.engine.compaction import extract_tool_summary
 
         summary = extract_tool_summary(content)
-        fd, path = tempfile.mkstemp(prefix=f"tool_{tool_name}_", suffix=".txt")
-        with os.fdopen(fd, "w") as f:
-            f.write(content)
-        return f"{summary}\n[Full output: {path} — use read_file to retrieve if needed]"
+        artifact = get_artifact_store().put(content)
+        if artifact.deduplicated:
+            logger.debug("Tool result from %s matched artifact %s", tool_name, artifact.id)
+        return (
+            f"{summary}\n[Full output: {artifact.path} ({artifact.size:,} bytes) — "
+            f'use read_artifact with id "{artifact.id}" to page through it if needed]'
+        )
 
     def thin_previous_tool_results(self, protect_after_index: int) -> int:
         """Compress tool results from previous iterations to one-line summaries.
@@ -330,7 +362,7 @@ class AgentSession:
             summary = extract_tool_summary(content)
             if len(summary) < len(content):
                 chars_saved += len(content) - len(summary)
-                msg["content"] = summary
+                self.messages.set_content(i, summary)
         return chars_saved
 
     def get_final_text(self) -> str | None:
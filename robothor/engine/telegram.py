@@ -79,6 +79,8 @@ _TOOL_LABELS = {
     "list_tasks": "Checking tasks",
     "create_task": "Creating task",
     "store_memory": "Saving to memory",
+    "search_memories": "Searching memory",
+    "store_memories": "Saving to memory",
     "get_entity": "Looking up contact",
     "search_records": "Searching records",
     "todo_write": "Updating checklist",
@@ -1880,26 +1882,30 @@ class TelegramBot:
         chat.py's _restore_sessions() at startup — no duplicate load needed.
         Only non-primary telegram: chats need their own restore here.
         """
-        from robothor.engine.chat_store import load_all_sessions
+        from robothor.engine.chat import RESTORE_HOT_HOURS
+        from robothor.engine.chat_store import iter_sessions
 
         try:
-            sessions = load_all_sessions(
+            restored = 0
+            for key, data in iter_sessions(
                 limit_per_session=self._max_history,
                 tenant_id=self.config.tenant_id,
-            )
-            restored = 0
-            for key, data in sessions.items():
-                if not key.startswith("telegram:"):
-                    continue
+                key_prefix="telegram:",
+                hot_hours=RESTORE_HOT_HOURS or None,
+            ):
                 chat_id = key.removeprefix("telegram:")
+                model = data.get("model_override")
+                if model:
+                    self._model_override[chat_id] = model
+                if data.get("cold"):
+                    # History loads on first access via the shared session store
+                    continue
                 # Load into shared session store
                 session = get_shared_session(key)
                 history = data.get("history", [])
                 if history:
                     session.history = history
-                model = data.get("model_override")
                 if model:
-                    self._model_override[chat_id] = model
                     session.model_override = model
                 restored += 1
             if restored:
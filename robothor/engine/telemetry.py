@@ -97,6 +97,21 @@ class TraceContext:
             self._span_stack.pop()
             self.spans.append(s)
 
+    def add_span(
+        self, name: str, start_time: float, end_time: float, status: str = "ok", **attributes: Any
+    ) -> Span:
+        """Record a span that was timed elsewhere (e.g. before the trace existed)."""
+        s = Span(
+            name=name,
+            parent_span_id=self._span_stack[-1].span_id if self._span_stack else None,
+            start_time=start_time,
+            end_time=end_time,
+            attributes=attributes,
+            status=status,
+        )
+        self.spans.append(s)
+        return s
+
     def to_dict(self) -> dict[str, Any]:
         return {
             "trace_id": self.trace_id,
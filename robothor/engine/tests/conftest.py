@@ -26,6 +26,22 @@ if TYPE_CHECKING:
 # test_prefix is inherited from the root conftest.py
 
 
+@pytest.fixture(autouse=True)
+def _isolated_llm_cache(monkeypatch):
+    """Fresh, memory-only LLM response cache per test."""
+    from robothor.engine import llm_cache
+
+    monkeypatch.setattr(llm_cache, "_cache", llm_cache.LlmResponseCache(persist=False))
+
+
+@pytest.fixture(autouse=True)
+def _isolated_model_health(monkeypatch):
+    """Fresh model health tracker per test, so breakers never leak between tests."""
+    from robothor.engine import model_health
+
+    monkeypatch.setattr(model_health, "_tracker", model_health.ModelHealthTracker())
+
+
 @pytest.fixture
 def engine_config(tmp_path: Path) -> EngineConfig:
     """Engine config pointing to temp workspace."""
@@ -303,11 +303,8 @@ class TestRegistryAdapterTools:
             },
         ]
 
-        mock_session = AsyncMock()
-        mock_session.list_tools.return_value = mock_tools
-
         mock_pool = MagicMock()
-        mock_pool.get_session = AsyncMock(return_value=mock_session)
+        mock_pool.list_tools = AsyncMock(return_value=mock_tools)
 
         with patch("robothor.api.mcp.get_tool_definitions", return_value=[]):
             registry = ToolRegistry()
@@ -328,7 +325,7 @@ class TestRegistryAdapterTools:
         from robothor.engine.tools.registry import ToolRegistry
 
         mock_pool = MagicMock()
-        mock_pool.get_session = AsyncMock(side_effect=RuntimeError("connection refused"))
+        mock_pool.list_tools = AsyncMock(side_effect=RuntimeError("connection refused"))
 
         with patch("robothor.api.mcp.get_tool_definitions", return_value=[]):
             registry = ToolRegistry()
@@ -351,11 +348,8 @@ class TestAdapterDispatch:
         from robothor.engine.tools.dispatch import _execute_tool
         from robothor.engine.tools.registry import ToolRegistry
 
-        mock_session = AsyncMock()
-        mock_session.call_tool.return_value = {"data": "result"}
-
         mock_pool = MagicMock()
-        mock_pool.get_session = AsyncMock(return_value=mock_session)
+        mock_pool.call_tool = AsyncMock(return_value={"data": "result"})
 
         # Create a real registry with adapter route injected
         with patch("robothor.api.mcp.get_tool_definitions", return_value=[]):
@@ -369,7 +363,9 @@ class TestAdapterDispatch:
             result = await _execute_tool("search_patients", {"query": "Smith"})
 
         assert result == {"data": "result"}
-        mock_session.call_tool.assert_called_once_with("search_patients", {"query": "Smith"})
+        mock_pool.call_tool.assert_called_once_with(
+            "my-adapter", "search_patients", {"query": "Smith"}
+        )
 
     @pytest.mark.asyncio
     async def test_non_adapter_tool_falls_through(self):
@@ -131,9 +131,7 @@ class TestApolloSearchPeople:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_search_people"]({"q_person_name": "Jane Doe"}, CTX)
 
@@ -153,9 +151,7 @@ class TestApolloSearchPeople:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_search_people"]({}, CTX)
 
@@ -186,9 +182,7 @@ class TestApolloEnrichPerson:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_enrich_person"]({"email": "jane@acme.com"}, CTX)
 
@@ -206,9 +200,7 @@ class TestApolloEnrichPerson:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_enrich_person"]({"email": "nobody@nowhere.com"}, CTX)
 
@@ -235,9 +227,7 @@ class TestApolloSearchCompanies:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_search_companies"]({"q_organization_name": "Acme"}, CTX)
 
@@ -270,9 +260,7 @@ class TestApolloEnrichCompany:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_enrich_company"]({"domain": "acme.com"}, CTX)
 
@@ -290,9 +278,7 @@ class TestApolloEnrichCompany:
 
         with (
             patch("robothor.engine.tools.handlers.apollo._get_api_key", return_value="test-key"),
-            patch(
-                "robothor.engine.tools.handlers.apollo.httpx.AsyncClient", return_value=mock_client
-            ),
+            patch("robothor.engine.tools.handlers.apollo.http_client", return_value=mock_client),
         ):
             result = await HANDLERS["apollo_enrich_company"]({"domain": "doesnotexist.xyz"}, CTX)
 
@@ -0,0 +1,189 @@
+"""Tests for the content-addressed tool-result artifact store."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robothor.engine import artifacts
+from robothor.engine.artifacts import ArtifactStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return ArtifactStore(tmp_path / "artifacts", quota_bytes=1000)
+
+
+class TestPut:
+    def test_identical_content_stored_once(self, store):
+        first = store.put("hello " * 10)
+        second = store.put("hello " * 10)
+
+        assert first.id == second.id
+        assert first.path == second.path
+        assert not first.deduplicated
+        assert second.deduplicated
+        assert len(list(store.root.glob("*.txt"))) == 1
+        stats = store.stats()
+        assert stats.artifacts == 1
+        assert stats.bytes_stored == 60
+        assert stats.bytes_deduplicated == 60
+
+    def test_different_content_gets_different_ids(self, store):
+        assert store.put("a").id != store.put("b").id
+        assert store.stats().artifacts == 2
+
+    def test_no_temp_files_left_behind(self, store):
+        store.put("x" * 100)
+        assert [p.name for p in store.root.iterdir()] == [f"{store.put('x' * 100).id}.txt"]
+
+    def test_rewrites_file_deleted_behind_its_back(self, store):
+        artifact = store.put("payload")
+        artifact.path.unlink()
+        again = store.put("payload")
+        assert not again.deduplicated
+        assert again.path.read_text() == "payload"
+        assert store.stats().bytes_stored == 7
+
+
+class TestEviction:
+    def test_least_recently_used_evicted_first(self, store):
+        a = store.put("a" * 400)
+        b = store.put("b" * 400)
+        store.read_range(a.id)  # a is now more recent than b
+        c = store.put("c" * 400)
+
+        assert a.path.exists()
+        assert not b.path.exists()
+        assert c.path.exists()
+        stats = store.stats()
+        assert stats.evictions == 1
+        assert stats.bytes_stored == 800
+
+    def test_dedup_hit_refreshes_recency(self, store):
+        a = store.put("a" * 400)
+        b = store.put("b" * 400)
+        store.put("a" * 400)
+        store.put("c" * 400)
+        assert a.path.exists()
+        assert not b.path.exists()
+
+    def test_oversized_artifact_kept_alone(self, store):
+        small = store.put("s" * 10)
+        big = store.put("B" * 5000)
+        assert big.path.exists()
+        assert not small.path.exists()
+        assert store.stats().artifacts == 1
+
+    def test_restart_reindexes_in_lru_order(self, store):
+        old = store.put("o" * 400)
+        new = store.put("n" * 400)
+        os.utime(old.path, (1, 1))
+
+        reopened = ArtifactStore(store.root, quota_bytes=1000)
+        assert reopened.stats().bytes_stored == 800
+        reopened.put("z" * 400)
+        assert not old.path.exists()
+        assert new.path.exists()
+
+    def test_restart_enforces_smaller_quota(self, store):
+        store.put("a" * 400)
+        store.put("b" * 400)
+        assert ArtifactStore(store.root, quota_bytes=500).stats().artifacts == 1
+
+
+class TestReadRange:
+    def test_pages_through_content(self, store):
+        text = "".join(f"line {i}\n" for i in range(100))
+        artifact = store.put(text)
+
+        pages, offset = [], 0
+        while offset is not None:
+            page = store.read_range(artifact.id, offset, 64)
+            pages.append(page["content"])
+            offset = page["next_offset"]
+            assert page["total_bytes"] == artifact.size
+
+        assert "".join(pages) == text
+        assert len(pages) == -(-artifact.size // 64)
+
+    def test_multibyte_characters_never_split(self, store):
+        text = "é" * 50 + "日本語" * 20
+        artifact = store.put(text)
+
+        pages, offset = [], 0
+        while offset is not None:
+            page = store.read_range(artifact.id, offset, 7)
+            assert "�" not in page["content"]
+            pages.append(page["content"])
+            offset = page["next_offset"]
+        assert "".join(pages) == text
+
+    def test_offset_inside_character_moves_to_next(self, store):
+        artifact = store.put("日本")
+        page = store.read_range(artifact.id, 1, 100)
+        assert page["offset"] == 3
+        assert page["content"] == "本"
+
+    def test_offset_past_end(self, store):
+        artifact = store.put("abc")
+        page = store.read_range(artifact.id, 10)
+        assert page["content"] == ""
+        assert page["next_offset"] is None
+
+    def test_length_capped(self, store):
+        store.quota_bytes = 10**6
+        artifact = store.put("x" * 200_000)
+        page = store.read_range(artifact.id, 0, 10**9)
+        assert len(page["content"]) == artifact.size // 2
+        assert page["next_offset"] == artifact.size // 2
+
+    def test_invalid_id_rejected(self, store):
+        assert "Invalid" in store.read_range("../../etc/passwd")["error"]
+
+    def test_evicted_artifact_reports_error(self, store):
+        artifact = store.put("a" * 600)
+        store.put("b" * 600)
+        assert "evicted" in store.read_range(artifact.id)["error"]
+
+
+class TestReadArtifactTool:
+    @pytest.mark.asyncio
+    async def test_handler_reads_page(self, store, monkeypatch):
+        from robothor.engine.tools.handlers.artifacts import HANDLERS
+
+        monkeypatch.setattr(artifacts, "_store", store)
+        artifact = store.put("0123456789")
+        result = await HANDLERS["read_artifact"](
+            {"id": artifact.id, "offset": 4, "length": 3}, None
+        )
+        assert result["content"] == "456"
+        assert result["next_offset"] == 7
+
+    @pytest.mark.asyncio
+    async def test_handler_validates_args(self):
+        from robothor.engine.tools.handlers.artifacts import HANDLERS
+
+        assert "error" in await HANDLERS["read_artifact"]({}, None)
+        assert "error" in await HANDLERS["read_artifact"]({"id": "x", "offset": "soon"}, None)
+
+    def test_offered_only_when_offloading(self):
+        with patch("robothor.api.mcp.get_tool_definitions", return_value=[]):
+            from robothor.engine.tools import ToolRegistry
+
+            registry = ToolRegistry()
+        config = MagicMock()
+        config.tools_allowed = ["read_file"]
+        config.tools_denied = []
+        config.tool_offload_threshold = 8000
+        assert registry.get_tool_names(config) == ["read_file", "read_artifact"]
+
+        config.tool_offload_threshold = 0
+        config.tools_allowed = ["read_file", "read_artifact"]
+        assert registry.get_tool_names(config) == ["read_file"]
+
+        config.tool_offload_threshold = 8000
+        config.tools_denied = ["read_artifact"]
+        assert "read_artifact" not in registry.get_tool_names(config)
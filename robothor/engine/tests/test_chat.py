@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -31,7 +32,7 @@ def chat_app(engine_config, mock_runner):
 
     app = FastAPI()
     # Mock DB restore so real DB data doesn't pollute tests
-    with patch("robothor.engine.chat.load_all_sessions", return_value={}):
+    with patch("robothor.engine.chat.iter_sessions", return_value=[]):
         init_chat(mock_runner, engine_config)
     app.include_router(router)
     yield app
@@ -560,3 +561,57 @@ def _parse_sse(body: str) -> list[dict]:
                 data = line[6:]
             events.append({"event": current_event, "data": data})
     return events
+
+
+class TestSessionRestore:
+    def _restore(self, engine_config, rows, hot_hours=0.0):
+        from robothor.engine import chat
+
+        _sessions.clear()
+        chat._cold_sessions.clear()
+        with (
+            patch.object(chat, "RESTORE_HOT_HOURS", hot_hours),
+            patch("robothor.engine.chat.iter_sessions", return_value=rows) as it,
+        ):
+            chat._restore_sessions(engine_config)
+        return it
+
+    def test_restores_history_and_model(self, engine_config):
+        rows = [
+            ("web:a", {"history": [{"role": "user", "content": "hi"}], "model_override": "m/x"}),
+        ]
+        it = self._restore(engine_config, rows)
+        assert it.call_args.kwargs["hot_hours"] is None
+        assert _sessions["web:a"].history == [{"role": "user", "content": "hi"}]
+        assert _sessions["web:a"].model_override == "m/x"
+        _sessions.clear()
+
+    def test_cold_session_loaded_on_first_access(self, engine_config):
+        from robothor.engine import chat
+
+        rows: list[tuple[str, dict[str, Any]]] = [
+            ("web:old", {"history": [], "model_override": None, "cold": True})
+        ]
+        it = self._restore(engine_config, rows, hot_hours=6.0)
+        assert it.call_args.kwargs["hot_hours"] == 6.0
+        assert "web:old" not in _sessions
+        assert "web:old" in chat._cold_sessions
+
+        persisted = {"history": [{"role": "user", "content": "old"}], "model_override": "m/y"}
+        with patch("robothor.engine.chat.load_session", return_value=persisted) as load:
+            session = chat._get_session("web:old")
+            assert chat._get_session("web:old") is session
+        load.assert_called_once()
+        assert session.history == [{"role": "user", "content": "old"}]
+        assert session.model_override == "m/y"
+        assert "web:old" not in chat._cold_sessions
+        _sessions.clear()
+
+    def test_unknown_session_never_hits_db(self, engine_config):
+        from robothor.engine import chat
+
+        self._restore(engine_config, [])
+        with patch("robothor.engine.chat.load_session") as load:
+            chat._get_session("web:new")
+        load.assert_not_called()
+        _sessions.clear()
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import patch
 
 import pytest
 
 from robothor.engine.chat_store import (
+    ChatEmbeddingQueue,
     _embed_turns,
     search_chat_turns,
 )
@@ -40,18 +42,8 @@ class TestEmbedTurns:
 
         captured = []
 
-        class FakeCursor:
-            def __enter__(self):
-                return self
-
-            def __exit__(self, *args):
-                pass
-
-            def execute(self, sql, params):
-                captured.append((sql, params))
-
-            def cursor(self, *a, **kw):
-                return self
+        def _fake_execute_values(cur, sql, rows, page_size=100):
+            captured.append((sql, list(rows)))
 
         class FakeConn:
             def __enter__(self):
@@ -61,18 +53,107 @@ class TestEmbedTurns:
                 pass
 
             def cursor(self, *a, **kw):
-                return FakeCursor()
+                return object()
 
             def commit(self):
                 pass
 
-        with patch("robothor.engine.chat_store.get_connection", return_value=FakeConn()):
-            await _embed_turns([101, 102], ["user says", "assistant says"])
+        with (
+            patch("robothor.engine.chat_store.get_connection", return_value=FakeConn()),
+            patch("psycopg2.extras.execute_values", side_effect=_fake_execute_values),
+        ):
+            stored = await _embed_turns([101, 102], ["user says", "assistant says"])
+
+        # One bulk UPDATE covering both message ids
+        assert stored == 2
+        assert len(captured) == 1
+        assert "FROM (VALUES %s)" in captured[0][0]
+        assert [mid for mid, _ in captured[0][1]] == [101, 102]
+
+
+class TestChatEmbeddingQueue:
+    @pytest.mark.asyncio
+    async def test_coalesces_across_sessions(self):
+        calls = []
+
+        async def _fake_embed_turns(ids, texts):
+            calls.append(list(ids))
+            return len(ids)
+
+        queue = ChatEmbeddingQueue(batch_size=10, coalesce_s=0.05, max_defer_s=0)
+        with patch("robothor.engine.chat_store._embed_turns", side_effect=_fake_embed_turns):
+            queue.enqueue([1, 2], ["a", "b"])
+            queue.enqueue([3, 4], ["c", "d"])
+            assert queue.stats()["backlog"] == 4
+            for _ in range(50):
+                await asyncio.sleep(0.02)
+                if calls:
+                    break
+
+        assert calls == [[1, 2, 3, 4]]
+        stats = queue.stats()
+        assert stats["backlog"] == 0
+        assert stats["embedded"] == 4
+        assert stats["batches"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_batch_skips_coalesce_wait(self):
+        calls = []
+
+        async def _fake_embed_turns(ids, texts):
+            calls.append(list(ids))
+            return len(ids)
+
+        queue = ChatEmbeddingQueue(batch_size=2, coalesce_s=60, max_defer_s=0)
+        with patch("robothor.engine.chat_store._embed_turns", side_effect=_fake_embed_turns):
+            queue.enqueue([1, 2], ["a", "b"])
+            for _ in range(50):
+                await asyncio.sleep(0.01)
+                if calls:
+                    break
+
+        assert calls == [[1, 2]]
+
+    @pytest.mark.asyncio
+    async def test_defers_while_interactive_embeddings_in_flight(self, monkeypatch):
+        from robothor.llm import ollama as llm_client
+
+        calls = []
+
+        async def _fake_embed_turns(ids, texts):
+            calls.append(list(ids))
+            return len(ids)
+
+        monkeypatch.setattr(llm_client, "_embeddings_in_flight", 1)
+        queue = ChatEmbeddingQueue(batch_size=1, coalesce_s=0, max_defer_s=5)
+        with patch("robothor.engine.chat_store._embed_turns", side_effect=_fake_embed_turns):
+            queue.enqueue([1], ["a"])
+            await asyncio.sleep(0.1)
+            assert calls == []
+            monkeypatch.setattr(llm_client, "_embeddings_in_flight", 0)
+            for _ in range(50):
+                await asyncio.sleep(0.05)
+                if calls:
+                    break
+
+        assert calls == [[1]]
+
+    @pytest.mark.asyncio
+    async def test_drain_embeds_everything_in_batches(self):
+        calls = []
+
+        async def _fake_embed_turns(ids, texts):
+            calls.append(list(ids))
+            return len(ids) - 1  # one failure per batch
+
+        queue = ChatEmbeddingQueue(batch_size=2, coalesce_s=60, max_defer_s=0)
+        with patch("robothor.engine.chat_store._embed_turns", side_effect=_fake_embed_turns):
+            queue.enqueue([1, 2, 3], ["a", "b", "c"])
+            await queue.drain()
 
-        # Expect 2 UPDATEs (one per message id)
-        assert len(captured) == 2
-        assert captured[0][1][1] == 101
-        assert captured[1][1][1] == 102
+        assert calls == [[1, 2], [3]]
+        assert queue.stats()["failed"] == 2
+        assert queue.stats()["embedded"] == 1
 
 
 class TestSearchChatTurnsDAL:
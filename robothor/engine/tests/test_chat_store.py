@@ -10,6 +10,7 @@ import pytest
 from robothor.engine.chat_store import (
     cleanup_stale_sessions,
     clear_session,
+    iter_sessions,
     load_all_sessions,
     load_session,
     save_exchange,
@@ -31,6 +32,7 @@ def chat_db():
         cur.rowcount = 1
         cur.fetchone.return_value = {"id": 42}
         cur.fetchall.return_value = []
+        cur.fetchmany.return_value = []
         mock_conn.return_value = conn
         yield {"connection": mock_conn, "conn": conn, "cursor": cur}
 
@@ -141,37 +143,87 @@ class TestLoadSession:
         assert msg_query_params[1] == 10
 
 
+def _row(key, message=None, model=None, plan=None, cold=False):
+    return {
+        "session_key": key,
+        "model_override": model,
+        "plan_state": plan,
+        "cold": cold,
+        "message": message,
+    }
+
+
 class TestLoadAllSessions:
     def test_empty_db_returns_empty_dict(self, chat_db):
-        chat_db["cursor"].fetchall.return_value = []
         result = load_all_sessions()
         assert result == {}
 
     def test_loads_multiple_sessions(self, chat_db):
-        # First fetchall = session list
-        sessions = [
-            {"id": 1, "session_key": "telegram:111", "model_override": None},
-            {"id": 2, "session_key": "web:abc", "model_override": "gemini/gemini-2.5-pro"},
+        # One joined row per message, grouped by session, chronological within each
+        chat_db["cursor"].fetchmany.side_effect = [
+            [
+                _row("telegram:111", {"role": "user", "content": "Hi"}),
+                _row("telegram:111", {"role": "assistant", "content": "Hello"}),
+                _row("web:abc", {"role": "user", "content": "Hey"}, "gemini/gemini-2.5-pro"),
+            ],
+            [],
         ]
-        # Subsequent fetchall calls = messages for each session
-        messages_1 = [{"message": {"role": "user", "content": "Hi"}}]
-        messages_2 = [{"message": {"role": "user", "content": "Hey"}}]
-
-        chat_db["cursor"].fetchall.side_effect = [sessions, messages_1, messages_2]
 
         result = load_all_sessions()
-        assert "telegram:111" in result
-        assert "web:abc" in result
+        assert list(result) == ["telegram:111", "web:abc"]
         assert result["telegram:111"]["model_override"] is None
         assert result["web:abc"]["model_override"] == "gemini/gemini-2.5-pro"
-        assert len(result["telegram:111"]["history"]) == 1
+        assert [m["content"] for m in result["telegram:111"]["history"]] == ["Hi", "Hello"]
         assert len(result["web:abc"]["history"]) == 1
 
-    def test_ttl_passed_to_query(self, chat_db):
-        chat_db["cursor"].fetchall.return_value = []
-        load_all_sessions(ttl_days=3)
+    def test_single_query_for_all_sessions(self, chat_db):
+        chat_db["cursor"].fetchmany.side_effect = [
+            [_row(f"web:{i}", {"role": "user", "content": str(i)}) for i in range(50)],
+            [],
+        ]
+        result = load_all_sessions()
+        assert len(result) == 50
+        assert chat_db["cursor"].execute.call_count == 1
+        sql = chat_db["cursor"].execute.call_args[0][0]
+        assert "LATERAL" in sql
+        # Streams through a server-side cursor, closed afterwards
+        assert chat_db["conn"].cursor.call_args.kwargs["name"]
+        chat_db["cursor"].close.assert_called_once()
+
+    def test_session_split_across_fetch_batches(self, chat_db):
+        chat_db["cursor"].fetchmany.side_effect = [
+            [_row("web:a", {"content": "1"}), _row("web:a", {"content": "2"})],
+            [_row("web:a", {"content": "3"}), _row("web:b", {"content": "x"})],
+            [],
+        ]
+        result = list(iter_sessions())
+        assert [key for key, _ in result] == ["web:a", "web:b"]
+        assert [m["content"] for m in result[0][1]["history"]] == ["1", "2", "3"]
+
+    def test_session_without_messages_and_plan_state(self, chat_db):
+        plan = {"plan_id": "p1", "status": "pending"}
+        chat_db["cursor"].fetchmany.side_effect = [[_row("web:empty", plan=plan)], []]
+        result = load_all_sessions()
+        assert result["web:empty"]["history"] == []
+        assert result["web:empty"]["plan_state"] == plan
+
+    def test_cold_sessions_flagged(self, chat_db):
+        chat_db["cursor"].fetchmany.side_effect = [
+            [_row("web:hot", {"content": "hi"}), _row("web:cold", cold=True)],
+            [],
+        ]
+        result = load_all_sessions(hot_hours=6)
+        assert "cold" not in result["web:hot"]
+        assert result["web:cold"] == {"history": [], "model_override": None, "cold": True}
+        params = chat_db["cursor"].execute.call_args[0][1]
+        assert params[:2] == (6, 6)
+
+    def test_ttl_and_prefix_passed_to_query(self, chat_db):
+        load_all_sessions(ttl_days=3, key_prefix="telegram:", limit_per_session=7)
         query_params = chat_db["cursor"].execute.call_args[0][1]
         assert 3 in query_params
+        assert "telegram:" in query_params
+        assert query_params[-1] == 7
 
 
 class TestClearSession:
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import copy
+import pickle
+import random
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -10,12 +13,34 @@ import pytest
 from robothor.engine.context import (
     COMPRESS_THRESHOLD,
     KEEP_RECENT,
+    TokenCountedMessages,
     estimate_tokens,
     get_context_stats,
+    get_tokenizer,
     maybe_compress,
+    register_tokenizer,
+    unregister_tokenizer,
 )
 
 
+def _word_count(text: str) -> int:
+    return len(text.split())
+
+
+def _random_message(rng: random.Random) -> dict[str, Any]:
+    role = rng.choice(["user", "assistant", "tool", "developer"])
+    msg: dict[str, Any] = {"role": role, "content": "word " * rng.randint(0, 400)}
+    if role == "assistant" and rng.random() < 0.5:
+        msg["tool_calls"] = [
+            {
+                "id": f"call_{i}",
+                "function": {"name": "read_file", "arguments": '{"path": "x"}' * rng.randint(1, 5)},
+            }
+            for i in range(rng.randint(1, 3))
+        ]
+    return msg
+
+
 class TestEstimateTokens:
     def test_empty_messages(self):
         assert estimate_tokens([]) == 0
@@ -56,6 +81,98 @@ class TestEstimateTokens:
         assert estimate_tokens(messages) == 0
 
 
+class TestTokenCountedMessages:
+    def _exact(self, messages: TokenCountedMessages) -> int:
+        recount = TokenCountedMessages(list(messages), tokenizer=messages.tokenizer)
+        return recount.exact_tokens or 0
+
+    def test_counters_match_full_recomputation(self):
+        rng = random.Random(7)
+        msgs = TokenCountedMessages(tokenizer=_word_count)
+        for _ in range(2000):
+            op = rng.random()
+            if op < 0.45 or not msgs:
+                msgs.append(_random_message(rng))
+            elif op < 0.6:
+                msgs.set_content(rng.randrange(len(msgs)), "thinned " * rng.randint(0, 20))
+            elif op < 0.7:
+                msgs[rng.randrange(len(msgs))] = _random_message(rng)
+            elif op < 0.78:
+                msgs.pop(rng.randrange(len(msgs)))
+            elif op < 0.84:
+                msgs.insert(rng.randrange(len(msgs) + 1), _random_message(rng))
+            elif op < 0.9:
+                del msgs[rng.randrange(len(msgs))]
+            elif op < 0.95:
+                i = rng.randrange(len(msgs))
+                msgs[i:] = [_random_message(rng) for _ in range(rng.randint(0, 3))]
+            else:
+                msgs.extend(_random_message(rng) for _ in range(3))
+
+            assert msgs.estimated_tokens == estimate_tokens(list(msgs))
+            assert msgs.exact_tokens == self._exact(msgs)
+
+    def test_in_place_edit_needs_refresh(self):
+        msgs = TokenCountedMessages([{"role": "tool", "content": "x" * 4000}])
+        msgs[0]["content"] = "short"
+        assert msgs.estimated_tokens == 1000
+        msgs.refresh(0)
+        assert msgs.estimated_tokens == estimate_tokens(list(msgs)) == 1
+
+    def test_self_slice_assignment_is_noop(self):
+        msgs = TokenCountedMessages([{"role": "user", "content": "abcd" * 10}])
+        msgs[:] = msgs
+        assert len(msgs) == 1
+        assert msgs.estimated_tokens == 10
+
+    def test_estimate_tokens_uses_counters(self):
+        msgs = TokenCountedMessages([{"role": "user", "content": "abcd" * 10}])
+        with patch("robothor.engine.context._message_cost") as cost:
+            assert estimate_tokens(msgs) == 10
+        cost.assert_not_called()
+
+    def test_exact_tokens_none_without_tokenizer(self):
+        msgs = TokenCountedMessages([{"role": "user", "content": "one two three"}])
+        assert msgs.exact_tokens is None
+        assert msgs.tokens == msgs.estimated_tokens
+        msgs.set_tokenizer(_word_count)
+        assert msgs.exact_tokens == 3
+        assert msgs.tokens == 3
+
+    def test_deepcopy_keeps_counters(self):
+        msgs = TokenCountedMessages([{"role": "user", "content": "one two"}], tokenizer=_word_count)
+        clone = copy.deepcopy(msgs)
+        assert clone == msgs
+        assert clone[0] is not msgs[0]
+        assert len(clone._costs) == 1
+        assert clone.exact_tokens == 2
+        assert clone.estimated_tokens == msgs.estimated_tokens
+        assert len(copy.copy(msgs)._costs) == 1
+
+    def test_pickle_round_trip(self):
+        msgs = TokenCountedMessages([{"role": "user", "content": "abcd" * 10}], tokenizer=len)
+        restored = pickle.loads(pickle.dumps(msgs))
+        assert restored == msgs
+        assert restored.tokenizer is len
+        assert restored.exact_tokens == msgs.exact_tokens
+        restored.append({"role": "user", "content": "abcd"})
+        assert restored.estimated_tokens == estimate_tokens(list(restored))
+
+
+class TestTokenizerRegistry:
+    def test_longest_prefix_wins(self):
+        register_tokenizer("openrouter", len)
+        register_tokenizer("openrouter/anthropic/", _word_count)
+        try:
+            assert get_tokenizer("openrouter/anthropic/claude-sonnet-4.6") is _word_count
+            assert get_tokenizer("openrouter/openai/gpt-5") is len
+            assert get_tokenizer("openrouterx/model") is None
+            assert get_tokenizer("ollama/qwen3") is None
+        finally:
+            unregister_tokenizer("openrouter")
+            unregister_tokenizer("openrouter/anthropic")
+
+
 class TestMaybeCompress:
     @pytest.mark.asyncio
     async def test_no_compression_below_threshold(self):
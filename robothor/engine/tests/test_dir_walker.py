@@ -0,0 +1,190 @@
+"""Tests for the ignore-aware directory walker behind list_directory."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from robothor.engine import dir_walker
+from robothor.engine.dir_walker import is_ignored, parse_ignore, walk
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    dir_walker.clear_cache()
+    yield
+    dir_walker.clear_cache()
+
+
+def _touch(root: Path, *paths: str) -> None:
+    for rel in paths:
+        p = root / rel
+        p.parent.mkdir(parents=True, exist_ok=True)
+        p.write_text("x")
+
+
+def _names(root: Path, **kwargs) -> list[str]:
+    kwargs.setdefault("max_depth", None)
+    entries, _ = walk(str(root), **kwargs)
+    return [e["name"] for e in entries]
+
+
+class TestIgnoreRules:
+    @pytest.mark.parametrize(
+        ("pattern", "path", "is_dir", "ignored"),
+        [
+            ("*.log", "a.log", False, True),
+            ("*.log", "deep/dir/a.log", False, True),
+            ("*.log", "a.logs", False, False),
+            ("build/", "build", True, True),
+            ("build/", "build", False, False),
+            ("build/", "src/build", True, True),
+            ("/build", "build", True, True),
+            ("/build", "src/build", True, False),
+            ("docs/*.md", "docs/a.md", False, True),
+            ("docs/*.md", "docs/sub/a.md", False, False),
+            ("docs/*.md", "x/docs/a.md", False, False),
+            ("**/tmp", "a/b/tmp", True, True),
+            ("**/tmp", "tmp", True, True),
+            ("a/**/z", "a/z", False, True),
+            ("a/**/z", "a/b/c/z", False, True),
+            ("out/**", "out/x/y", False, True),
+            ("out/**", "out", True, False),
+            ("file?.txt", "file1.txt", False, True),
+            ("file[0-2].txt", "file3.txt", False, False),
+            ("file[!0-2].txt", "file3.txt", False, True),
+            ("\\#keep", "#keep", False, True),
+        ],
+    )
+    def test_patterns(self, pattern, path, is_dir, ignored):
+        rules = [("/r", parse_ignore([pattern]))]
+        assert is_ignored(rules, f"/r/{path}", is_dir) is ignored
+
+    def test_comments_blanks_and_last_match_wins(self):
+        rules = [("/r", parse_ignore(["# comment", "", "*.log", "!keep.log", "   "]))]
+        assert is_ignored(rules, "/r/a.log", False)
+        assert not is_ignored(rules, "/r/keep.log", False)
+
+    def test_inner_rules_override_outer(self):
+        rules = [("/r", parse_ignore(["*.gen"])), ("/r/sub", parse_ignore(["!*.gen"]))]
+        assert is_ignored(rules, "/r/a.gen", False)
+        assert not is_ignored(rules, "/r/sub/a.gen", False)
+
+
+class TestWalk:
+    def test_breadth_first_sorted(self, tmp_path):
+        _touch(tmp_path, "b.txt", "a/z.txt", "a/y/x.txt", "c.txt")
+        assert _names(tmp_path) == ["a", "b.txt", "c.txt", "a/y", "a/z.txt", "a/y/x.txt"]
+
+    def test_default_ignores_prune_without_scanning(self, tmp_path):
+        _touch(tmp_path, "src/main.py", "node_modules/pkg/index.js", ".git/HEAD")
+        scanned = []
+        real_scan = dir_walker.scan
+
+        def spy(directory):
+            scanned.append(Path(directory).name)
+            return real_scan(directory)
+
+        with patch.object(dir_walker, "scan", side_effect=spy):
+            assert _names(tmp_path) == ["src", "src/main.py"]
+        assert "node_modules" not in scanned
+        assert ".git" not in scanned
+
+    def test_gitignore_files_scoped_to_subtree(self, tmp_path):
+        _touch(tmp_path, "app.log", "keep.log", "build/out.bin", "pkg/gen.py", "pkg/src.py")
+        (tmp_path / ".gitignore").write_text("*.log\n!keep.log\nbuild/\n")
+        (tmp_path / "pkg" / ".gitignore").write_text("gen.py\n")
+        _touch(tmp_path, "other/gen.py")
+        assert _names(tmp_path) == [
+            ".gitignore",
+            "keep.log",
+            "other",
+            "pkg",
+            "other/gen.py",
+            "pkg/.gitignore",
+            "pkg/src.py",
+        ]
+
+    def test_enclosing_repository_gitignore_applies(self, tmp_path):
+        (tmp_path / ".git").mkdir()
+        (tmp_path / ".gitignore").write_text("*.pyc\n/sub/local/\n")
+        _touch(tmp_path, "sub/a.py", "sub/a.pyc", "sub/local/x.py")
+        assert _names(tmp_path / "sub") == ["a.py"]
+
+    def test_gitignore_outside_repository_ignored(self, tmp_path):
+        (tmp_path / ".gitignore").write_text("*.py\n")
+        _touch(tmp_path, "sub/a.py")
+        assert _names(tmp_path / "sub") == ["a.py"]
+
+    def test_respect_ignores_off(self, tmp_path):
+        _touch(tmp_path, "node_modules/x.js")
+        assert _names(tmp_path, respect_ignores=False) == ["node_modules", "node_modules/x.js"]
+
+    def test_max_depth(self, tmp_path):
+        _touch(tmp_path, "a/b/c/d.txt")
+        assert _names(tmp_path, max_depth=2) == ["a", "a/b"]
+
+    def test_name_and_path_patterns(self, tmp_path):
+        _touch(tmp_path, "x.yaml", "sub/y.yaml", "sub/z.txt", "other/sub/w.yaml")
+        assert _names(tmp_path, pattern="*.yaml") == ["x.yaml", "sub/y.yaml", "other/sub/w.yaml"]
+        assert _names(tmp_path, pattern="sub/*.yaml") == ["sub/y.yaml"]
+        # Path patterns reach their own depth even for flat listings
+        assert _names(tmp_path, pattern="sub/*.yaml", max_depth=1) == ["sub/y.yaml"]
+
+    def test_double_star_pattern_matches_like_glob(self, tmp_path):
+        _touch(tmp_path, "a.py", "src/b.py", "src/pkg/c.py", "src/pkg/d.txt")
+        expected = sorted(str(p.relative_to(tmp_path)) for p in tmp_path.glob("**/*.py"))
+        # Flat listing default: ** still walks every level, top-level files included
+        assert sorted(_names(tmp_path, pattern="**/*.py", max_depth=1)) == expected
+        assert _names(tmp_path, pattern="src/**/*.py") == ["src/b.py", "src/pkg/c.py"]
+        # A single * does not cross directories
+        assert _names(tmp_path, pattern="src/*.py") == ["src/b.py"]
+
+    def test_symlinked_dirs_listed_not_followed(self, tmp_path):
+        _touch(tmp_path, "real/f.txt")
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        entries, _ = walk(str(tmp_path), max_depth=None)
+        assert [(e["name"], e["type"]) for e in entries] == [
+            ("link", "dir"),
+            ("real", "dir"),
+            ("real/f.txt", "file"),
+        ]
+
+    def test_truncation_is_exact(self, tmp_path):
+        _touch(tmp_path, *(f"f{i}.txt" for i in range(5)))
+        assert walk(str(tmp_path), max_entries=5) == (walk(str(tmp_path))[0], False)
+        entries, truncated = walk(str(tmp_path), max_entries=4)
+        assert len(entries) == 4
+        assert truncated
+
+    def test_directory_budget(self, tmp_path, monkeypatch):
+        _touch(tmp_path, *(f"d{i}/f.txt" for i in range(5)))
+        monkeypatch.setattr(dir_walker, "MAX_DIRS", 3)
+        entries, truncated = walk(str(tmp_path), max_depth=None, pattern="*.txt")
+        assert truncated
+        assert [e["name"] for e in entries] == ["d0/f.txt", "d1/f.txt"]
+
+
+class TestListingCache:
+    def test_listing_reused_until_directory_changes(self, tmp_path):
+        _touch(tmp_path, "a.txt")
+        with patch("robothor.engine.dir_walker.os.scandir", wraps=os.scandir) as scandir:
+            assert _names(tmp_path) == ["a.txt"]
+            assert _names(tmp_path) == ["a.txt"]
+            assert scandir.call_count == 1
+
+            _touch(tmp_path, "b.txt")
+            os.utime(tmp_path, ns=(0, 10**18))  # make sure the mtime moves
+            assert _names(tmp_path) == ["a.txt", "b.txt"]
+            assert scandir.call_count == 2
+
+    def test_listing_expires(self, tmp_path, monkeypatch):
+        _touch(tmp_path, "a.txt")
+        monkeypatch.setattr(dir_walker, "LISTING_TTL_S", 0.0)
+        with patch("robothor.engine.dir_walker.os.scandir", wraps=os.scandir) as scandir:
+            _names(tmp_path)
+            _names(tmp_path)
+        assert scandir.call_count == 2
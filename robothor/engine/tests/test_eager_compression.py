@@ -3,8 +3,12 @@
 from __future__ import annotations
 
 import json
+import re
 from pathlib import Path
 
+import pytest
+
+from robothor.engine import artifacts
 from robothor.engine.models import TriggerType
 from robothor.engine.session import AgentSession
 
@@ -126,7 +130,19 @@ class TestThinPreviousToolResults:
 class TestOffloadToolResult:
     """Tests for context offloading of large tool results."""
 
-    def test_large_result_offloaded_to_file(self):
+    @pytest.fixture(autouse=True)
+    def _store(self, tmp_path, monkeypatch):
+        store = artifacts.ArtifactStore(tmp_path / "artifacts")
+        monkeypatch.setattr(artifacts, "_store", store)
+        return store
+
+    @staticmethod
+    def _reference(content: str) -> tuple[Path, str]:
+        match = re.search(r'\[Full output: (\S+) .*read_artifact with id "(\w+)"', content)
+        assert match, content
+        return Path(match.group(1)), match.group(2)
+
+    def test_large_result_offloaded_to_artifact(self, _store):
         s = _make_session(tool_offload_threshold=100)
         large_output = {"data": "x" * 200}
 
@@ -138,17 +154,28 @@ class TestOffloadToolResult:
         )
 
         content = s.messages[-1]["content"]
-        assert "[Full output:" in content
-        assert "read_file to retrieve" in content
-
-        # Extract file path and verify it exists with correct content
-        path_start = content.index("[Full output: ") + len("[Full output: ")
-        path_end = content.index(" — use read_file")
-        offload_path = Path(content[path_start:path_end])
-        assert offload_path.exists()
-        stored = offload_path.read_text()
-        assert json.loads(stored) == large_output
-        offload_path.unlink()
+        offload_path, artifact_id = self._reference(content)
+        assert offload_path.parent == _store.root
+        assert json.loads(offload_path.read_text()) == large_output
+        page = _store.read_range(artifact_id)
+        assert json.loads(page["content"]) == large_output
+        assert page["next_offset"] is None
+
+    def test_identical_results_share_one_artifact(self, _store):
+        s = _make_session(tool_offload_threshold=100)
+        for i in range(3):
+            s.record_tool_call(
+                tool_name="web_fetch",
+                tool_input={"url": "https://example.com"},
+                tool_output={"html": "<div>" + "x" * 500 + "</div>"},
+                tool_call_id=f"tc{i}",
+            )
+
+        refs = {self._reference(m["content"]) for m in s.messages if m["role"] == "tool"}
+        assert len(refs) == 1
+        stats = _store.stats()
+        assert stats.artifacts == 1
+        assert stats.bytes_deduplicated == 2 * stats.bytes_stored
 
     def test_small_result_stays_inline(self):
         s = _make_session(tool_offload_threshold=100)
@@ -165,7 +192,7 @@ class TestOffloadToolResult:
         assert "[Full output:" not in content
         assert json.loads(content) == small_output
 
-    def test_offloading_disabled_when_threshold_zero(self):
+    def test_offloading_disabled_when_threshold_zero(self, _store):
         s = _make_session(tool_offload_threshold=0)
         large_output = {"data": "x" * 10000}
 
@@ -179,8 +206,9 @@ class TestOffloadToolResult:
         content = s.messages[-1]["content"]
         assert "[Full output:" not in content
         assert json.loads(content) == large_output
+        assert _store.stats().artifacts == 0
 
-    def test_offloaded_file_has_tool_name_prefix(self):
+    def test_external_results_keep_untrusted_wrapper(self):
         s = _make_session(tool_offload_threshold=100)
 
         s.record_tool_call(
@@ -193,13 +221,5 @@ class TestOffloadToolResult:
         content = s.messages[-1]["content"]
         # Should still have untrusted_content wrapper since web_fetch is external
         assert "untrusted_content" in content
-        assert "[Full output:" in content
-
-        # Extract path and check prefix
-        # Content is wrapped, so parse inside the wrapper
-        path_start = content.index("[Full output: ") + len("[Full output: ")
-        path_end = content.index(" — use read_file")
-        offload_path = Path(content[path_start:path_end])
-        assert "tool_web_fetch_" in offload_path.name
-        if offload_path.exists():
-            offload_path.unlink()
+        offload_path, _ = self._reference(content)
+        assert offload_path.exists()
@@ -0,0 +1,198 @@
+"""Tests for bounded-memory file reads and the read_file tool."""
+
+from __future__ import annotations
+
+import pytest
+
+from robothor.engine import file_reader
+from robothor.engine.file_reader import read_byte_range, read_lines, read_tail
+from robothor.engine.tools import _execute_tool
+
+
+@pytest.fixture(autouse=True)
+def _small_stride(monkeypatch):
+    monkeypatch.setattr(file_reader, "LINE_INDEX_STRIDE", 10)
+    monkeypatch.setattr(file_reader, "_CHUNK", 64)
+    monkeypatch.setattr(file_reader, "_TAIL_BLOCK", 32)
+    file_reader.clear_line_index_cache()
+    yield
+    file_reader.clear_line_index_cache()
+
+
+@pytest.fixture
+def numbered(tmp_path):
+    path = tmp_path / "numbered.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1, 251)))
+    return path
+
+
+class TestByteRange:
+    def test_window_and_continuation(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("0123456789")
+        with path.open("rb") as f:
+            assert read_byte_range(f, 2, 4) == (b"2345", 2, 6, 10)
+            assert read_byte_range(f, 6, 100) == (b"6789", 6, None, 10)
+            assert read_byte_range(f, 50, 10) == (b"", 50, None, 10)
+
+    def test_multibyte_boundaries(self, tmp_path):
+        path = tmp_path / "f.txt"
+        text = "aé日本語b" * 30
+        path.write_text(text)
+        pieces: list[str] = []
+        offset: int | None = 0
+        with path.open("rb") as f:
+            while offset is not None:
+                data, _start, offset, _size = read_byte_range(f, offset, 5)
+                pieces.append(data.decode("utf-8"))
+        assert "".join(pieces) == text
+
+
+class TestReadLines:
+    def test_range_uses_index_checkpoints(self, numbered):
+        result = read_lines(numbered, 95, 97)
+        assert result["content"] == "line 95\nline 96\nline 97\n"
+        assert result["end_line"] == 97
+        assert result["next_line"] == 98
+        assert "total_lines" not in result  # the scan stopped near line 95
+
+        index = file_reader._index_cache[str(numbered)]
+        assert not index.complete
+        assert index.checkpoints[9] == numbered.read_bytes().index(b"line 91\n")
+
+    def test_every_start_line_matches_splitlines(self, numbered):
+        lines = numbered.read_text().splitlines(keepends=True)
+        for start in (1, 9, 10, 11, 20, 21, 99, 100, 101, 249, 250):
+            assert read_lines(numbered, start, start)["content"] == lines[start - 1]
+
+    def test_open_ended_range_reaches_eof(self, numbered):
+        result = read_lines(numbered, 248)
+        assert result["content"] == "line 248\nline 249\nline 250\n"
+        assert result["next_line"] is None
+        assert not result["truncated"]
+
+    def test_total_lines_once_fully_scanned(self, numbered):
+        assert read_lines(numbered, 1000)["total_lines"] == 250
+        assert read_lines(numbered, 1)["total_lines"] == 250  # cached index
+
+    def test_final_line_without_newline(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("a\nb\nc")
+        result = read_lines(path, 2)
+        assert result["content"] == "b\nc"
+        assert result["end_line"] == 3
+        assert read_lines(path, 100)["total_lines"] == 3
+
+    def test_limit_pages_by_line(self, numbered):
+        result = read_lines(numbered, 1, None, limit=20)
+        assert result["content"] == "line 1\nline 2\n"
+        assert result["truncated"]
+        assert result["end_line"] == 2
+        assert result["next_line"] == 3
+
+    def test_line_longer_than_limit_returned_in_part(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("é" * 100 + "\nnext\n")
+        result = read_lines(path, 1, None, limit=11)
+        assert result["content"] == "é" * 5
+        assert result["truncated"]
+        assert result["end_line"] == 1
+        assert result["next_line"] == 2
+        with path.open("rb") as f:
+            rest, _, _, _ = read_byte_range(f, result["next_offset"], 1000)
+        assert rest.decode() == "é" * 95 + "\nnext\n"
+
+    def test_paging_past_long_lines_terminates(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("a\n" + "x" * 50 + "\nb\n" + "y" * 50)
+        pages = []
+        line: int | None = 1
+        while line is not None:
+            result = read_lines(path, line, None, limit=10)
+            pages.append(result["content"])
+            line = result["next_line"]
+        assert pages == ["a\n", "x" * 10, "b\n", "y" * 10]
+        assert result["truncated"]
+
+    def test_index_rebuilt_when_file_changes(self, numbered):
+        read_lines(numbered, 120, 120)
+        numbered.write_text("".join(f"row {i}\n" for i in range(1, 200)))
+        assert read_lines(numbered, 120, 120)["content"] == "row 120\n"
+
+    def test_long_lines_skip_correctly(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("x" * 500 + "\n" + "short\n")
+        assert read_lines(path, 2, 2)["content"] == "short\n"
+
+
+class TestReadTail:
+    def test_last_lines(self, numbered):
+        result = read_tail(numbered, 3)
+        assert result == {
+            "content": "line 248\nline 249\nline 250\n",
+            "lines": 3,
+            "truncated": False,
+        }
+
+    def test_more_lines_than_file(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("a\nb")
+        assert read_tail(path, 10)["content"] == "a\nb"
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("")
+        assert read_tail(path, 5) == {"content": "", "lines": 0, "truncated": False}
+
+    def test_cap_keeps_whole_lines(self, numbered):
+        result = read_tail(numbered, 100, limit=30)
+        assert result["truncated"]
+        assert result["content"] == "line 248\nline 249\nline 250\n"
+
+    def test_single_huge_line(self, tmp_path):
+        path = tmp_path / "f.txt"
+        path.write_text("é" * 1000 + "\n")
+        result = read_tail(path, 1, limit=101)
+        assert result["truncated"]
+        assert result["content"] == "é" * 50 + "\n"
+
+
+class TestReadFileTool:
+    @pytest.mark.asyncio
+    async def test_default_read_is_capped(self, tmp_path):
+        path = tmp_path / "big.txt"
+        path.write_text("x" * 60_000)
+        result = await _execute_tool("read_file", {"path": str(path)})
+        assert len(result["content"]) == 50_000
+        assert result["truncated"]
+        assert result["next_offset"] == 50_000
+        assert result["size"] == 60_000
+
+        rest = await _execute_tool("read_file", {"path": str(path), "offset": 50_000})
+        assert len(rest["content"]) == 10_000
+        assert rest["next_offset"] is None
+
+    @pytest.mark.asyncio
+    async def test_line_and_tail_modes(self, numbered):
+        lines = await _execute_tool(
+            "read_file",
+            {"path": "numbered.log", "start_line": 10, "end_line": 11},
+            workspace=str(numbered.parent),
+        )
+        assert lines["content"] == "line 10\nline 11\n"
+        assert lines["path"] == str(numbered)
+
+        tail = await _execute_tool("read_file", {"path": str(numbered), "tail": 1})
+        assert tail["content"] == "line 250\n"
+
+    @pytest.mark.asyncio
+    async def test_invalid_arguments(self, numbered):
+        assert "error" in await _execute_tool("read_file", {"path": str(numbered), "tail": 0})
+        assert "error" in await _execute_tool("read_file", {"path": str(numbered), "offset": -1})
+        assert "error" in await _execute_tool("read_file", {"path": str(numbered), "limit": "x"})
+
+    @pytest.mark.asyncio
+    async def test_binary_file_reports_error(self, tmp_path):
+        path = tmp_path / "blob.bin"
+        path.write_bytes(b"\xff\xfe\x00\x01")
+        assert "error" in await _execute_tool("read_file", {"path": str(path)})
@@ -188,7 +188,7 @@ class TestGithubListPrs:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.github_api.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.github_api.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -219,7 +219,7 @@ class TestGithubListPrs:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.github_api.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.github_api.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -278,7 +278,7 @@ class TestGithubGetPr:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.github_api.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.github_api.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -335,7 +335,7 @@ class TestGithubCommitActivity:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.github_api.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.github_api.http_client",
                 return_value=mock_client,
             ),
             patch("asyncio.sleep", new_callable=AsyncMock),
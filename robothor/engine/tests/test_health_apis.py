@@ -203,3 +203,23 @@ class TestExtensionsReloadEndpoint:
         data = resp.json()
         assert data["reloaded"] is True
         assert data["count"] == 1
+
+
+class TestModelHealthEndpoint:
+    """Test GET /health/models."""
+
+    def test_reports_circuit_state(self, client: TestClient) -> None:
+        from robothor.engine.model_health import get_model_health
+
+        health = get_model_health()
+        for _ in range(health.failure_threshold):
+            health.record_failure("down-model", TimeoutError())
+        health.record_success("up-model", 1.5)
+
+        resp = client.get("/health/models")
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["models"]["down-model"]["circuit"] == "open"
+        assert data["models"]["up-model"]["circuit"] == "closed"
+        assert data["models"]["up-model"]["p50_s"] == 1.5
+        assert data["cooldown_s"] == health.cooldown_s
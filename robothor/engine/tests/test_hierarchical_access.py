@@ -14,9 +14,17 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from robothor.engine.models import AgentRun
-from robothor.engine.permissions import resolve_accessible_tenants
+from robothor.engine.permissions import clear_permission_cache, resolve_accessible_tenants
 from robothor.engine.tools.dispatch import ToolContext
 
+
+@pytest.fixture(autouse=True)
+def _fresh_permission_cache():
+    clear_permission_cache()
+    yield
+    clear_permission_cache()
+
+
 # ── resolve_accessible_tenants ──────────────────────────────────────
 
 
@@ -35,11 +43,9 @@ class TestResolveAccessibleTenants:
         result = resolve_accessible_tenants("t1", "viewer")
         assert result == ("t1",)
 
-    @patch("robothor.engine.permissions._get_child_tenants")
-    def test_owner_gets_children(self, mock_children):
-        mock_children.side_effect = lambda tid: {
-            "parent": ["child-a", "child-b"],
-        }.get(tid, [])
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_owner_gets_children(self, mock_descendants):
+        mock_descendants.return_value = ["child-a", "child-b"]
 
         result = resolve_accessible_tenants("parent", "owner")
         assert "parent" in result
@@ -47,61 +53,62 @@ class TestResolveAccessibleTenants:
         assert "child-b" in result
         assert len(result) == 3
 
-    @patch("robothor.engine.permissions._get_child_tenants")
-    def test_admin_gets_children(self, mock_children):
-        mock_children.side_effect = lambda tid: {
-            "parent": ["child-a"],
-        }.get(tid, [])
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_admin_gets_children(self, mock_descendants):
+        mock_descendants.return_value = ["child-a"]
 
         result = resolve_accessible_tenants("parent", "admin")
         assert result == ("parent", "child-a")
 
-    @patch("robothor.engine.permissions._get_child_tenants")
-    def test_owner_gets_grandchildren(self, mock_children):
-        mock_children.side_effect = lambda tid: {
-            "root": ["mid"],
-            "mid": ["leaf"],
-        }.get(tid, [])
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_owner_gets_grandchildren(self, mock_descendants):
+        # Breadth-first order comes from the recursive query
+        mock_descendants.return_value = ["mid", "leaf"]
 
         result = resolve_accessible_tenants("root", "owner")
         assert result == ("root", "mid", "leaf")
 
-    @patch("robothor.engine.permissions._get_child_tenants")
-    def test_max_depth_caps_traversal(self, mock_children):
-        # Build a chain: t0 -> t1 -> t2 -> t3 -> t4
-        mock_children.side_effect = lambda tid: {
-            "t0": ["t1"],
-            "t1": ["t2"],
-            "t2": ["t3"],
-            "t3": ["t4"],
-        }.get(tid, [])
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_max_depth_caps_traversal(self, mock_descendants):
+        mock_descendants.return_value = ["t1", "t2"]
 
         result = resolve_accessible_tenants("t0", "owner", max_depth=2)
-        # depth=0: t0->t1, depth=1: t1->t2, stop at max_depth=2
-        assert "t0" in result
-        assert "t1" in result
-        assert "t2" in result
-        assert "t3" not in result
-
-    @patch("robothor.engine.permissions._get_child_tenants")
-    def test_no_duplicates_in_diamond(self, mock_children):
-        # Diamond: root -> [a, b], a -> [shared], b -> [shared]
-        mock_children.side_effect = lambda tid: {
-            "root": ["a", "b"],
-            "a": ["shared"],
-            "b": ["shared"],
-        }.get(tid, [])
+        mock_descendants.assert_called_once_with("t0", 2)
+        assert result == ("t0", "t1", "t2")
+
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_zero_depth_skips_query(self, mock_descendants):
+        assert resolve_accessible_tenants("t0", "owner", max_depth=0) == ("t0",)
+        mock_descendants.assert_not_called()
+
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_no_duplicates(self, mock_descendants):
+        mock_descendants.return_value = ["a", "b", "shared", "shared", "root"]
 
         result = resolve_accessible_tenants("root", "owner")
-        assert result.count("shared") == 1
+        assert result == ("root", "a", "b", "shared")
 
-    @patch("robothor.engine.permissions._get_child_tenants")
-    def test_db_failure_degrades_to_own_tenant(self, mock_children):
-        mock_children.side_effect = Exception("DB down")
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_db_failure_degrades_to_own_tenant(self, mock_descendants):
+        mock_descendants.side_effect = Exception("DB down")
         # Even though owner, DB failure means no children discovered
         result = resolve_accessible_tenants("t1", "owner")
         assert result == ("t1",)
 
+    @patch("robothor.engine.permissions._get_descendant_tenants")
+    def test_result_cached_until_invalidated(self, mock_descendants):
+        from robothor.engine.permissions import permissions_changed
+
+        mock_descendants.return_value = ["child-a"]
+        assert resolve_accessible_tenants("parent", "owner") == ("parent", "child-a")
+        assert resolve_accessible_tenants("parent", "admin") == ("parent", "child-a")
+        assert mock_descendants.call_count == 1
+
+        mock_descendants.return_value = ["child-a", "child-b"]
+        permissions_changed("parent")
+        assert resolve_accessible_tenants("parent", "owner") == ("parent", "child-a", "child-b")
+        assert mock_descendants.call_count == 2
+
     def test_empty_role_string_returns_own(self):
         result = resolve_accessible_tenants("t1", "")
         assert result == ("t1",)
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+from unittest.mock import patch
 
 import pytest
 
@@ -311,3 +312,173 @@ class TestHookMetrics:
         assert isinstance(m1, dict)
         assert isinstance(m2, dict)
         assert m1 is not m2  # different dict objects
+
+
+# ─── Concurrent short-circuit dispatch ───────────────────────────────
+
+
+def _register_async(reg, name, fn, priority, **kwargs):
+    reg.register_python_handler(name, fn)
+    reg.register(
+        LifecycleHook(
+            event=HookEvent.PRE_TOOL_USE,
+            handler_type="python",
+            handler=name,
+            blocking=kwargs.pop("blocking", True),
+            priority=priority,
+            **kwargs,
+        )
+    )
+
+
+def _sleeper(delay, result=None, calls=None, name=""):
+    async def handler(ctx):
+        await asyncio.sleep(delay)
+        if calls is not None:
+            calls.append(name)
+        return result or HookResult()
+
+    return handler
+
+
+class TestConcurrentDispatch:
+    @pytest.mark.asyncio
+    async def test_independent_hooks_run_concurrently(self):
+        reg = HookRegistry()
+        for i in range(4):
+            _register_async(reg, f"h{i}", _sleeper(0.3), priority=i)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await reg.dispatch(
+            HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+        )
+        assert result.action == HookAction.ALLOW
+        assert loop.time() - start < 0.9
+
+    @pytest.mark.asyncio
+    async def test_priority_order_decides_not_completion_order(self):
+        reg = HookRegistry()
+        _register_async(reg, "slow_allow", _sleeper(0.2), priority=10)
+        _register_async(
+            reg, "mid_block", _sleeper(0.0, HookResult(HookAction.BLOCK, reason="mid")), 20
+        )
+        _register_async(
+            reg, "last_block", _sleeper(0.0, HookResult(HookAction.BLOCK, reason="last")), 30
+        )
+        result = await reg.dispatch(
+            HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+        )
+        assert result.reason == "mid"
+
+    @pytest.mark.asyncio
+    async def test_slow_earlier_block_beats_fast_later_block(self):
+        reg = HookRegistry()
+        _register_async(
+            reg, "slow_block", _sleeper(0.2, HookResult(HookAction.BLOCK, reason="slow")), 10
+        )
+        _register_async(
+            reg, "fast_block", _sleeper(0.0, HookResult(HookAction.BLOCK, reason="fast")), 20
+        )
+        result = await reg.dispatch(
+            HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+        )
+        assert result.reason == "slow"
+
+    @pytest.mark.asyncio
+    async def test_modify_applies_args(self):
+        reg = HookRegistry()
+        _register_async(reg, "allow", _sleeper(0.05), priority=10)
+        _register_async(
+            reg,
+            "modify",
+            _sleeper(0.0, HookResult(HookAction.MODIFY, modified_args={"x": 1})),
+            priority=20,
+        )
+        ctx = HookContext(event=HookEvent.PRE_TOOL_USE, tool_args={"x": 0})
+        result = await reg.dispatch(HookEvent.PRE_TOOL_USE, ctx)
+        assert result.action == HookAction.MODIFY
+        assert ctx.tool_args == {"x": 1}
+
+    @pytest.mark.asyncio
+    async def test_failure_is_fail_open(self):
+        reg = HookRegistry()
+
+        async def broken(ctx):
+            raise RuntimeError("boom")
+
+        _register_async(reg, "broken", broken, priority=10)
+        _register_async(
+            reg, "block", _sleeper(0.0, HookResult(HookAction.BLOCK, reason="b")), priority=20
+        )
+        result = await reg.dispatch(
+            HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+        )
+        assert result.reason == "b"
+
+    @pytest.mark.asyncio
+    async def test_shared_deadline(self):
+        reg = HookRegistry()
+        _register_async(reg, "stuck", _sleeper(10), priority=10, timeout=1)
+        _register_async(reg, "quick", _sleeper(0.0), priority=20, timeout=1)
+
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        result = await reg.dispatch(
+            HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+        )
+        assert result.action == HookAction.ALLOW
+        assert loop.time() - start < 3
+        assert reg.get_metrics()[("stuck", HookEvent.PRE_TOOL_USE.value)].timeouts >= 1
+
+    @pytest.mark.asyncio
+    async def test_non_blocking_after_block_not_spawned(self):
+        reg = HookRegistry()
+        calls: list[str] = []
+        _register_async(
+            reg, "block", _sleeper(0.05, HookResult(HookAction.BLOCK, reason="b")), priority=10
+        )
+        _register_async(reg, "other", _sleeper(0.0), priority=15)
+        _register_async(
+            reg, "observer", _sleeper(0.0, calls=calls, name="observer"), 20, blocking=False
+        )
+        result = await reg.dispatch(
+            HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+        )
+        await asyncio.sleep(0.05)
+        assert result.action == HookAction.BLOCK
+        assert calls == []
+
+    @pytest.mark.asyncio
+    async def test_command_hook_after_block_never_starts(self):
+        reg = HookRegistry()
+        blocked = HookResult(action=HookAction.BLOCK, reason="no")
+        _register_async(reg, "blocker", _sleeper(0.05, blocked), priority=10)
+        reg.register(
+            LifecycleHook(
+                event=HookEvent.PRE_TOOL_USE,
+                handler_type="command",
+                handler="true",
+                blocking=True,
+                priority=20,
+            )
+        )
+        _register_async(reg, "later", _sleeper(0.0), priority=30)
+        with patch("robothor.engine.hook_registry.subprocess.run") as mock_run:
+            result = await reg.dispatch(
+                HookEvent.PRE_TOOL_USE, HookContext(event=HookEvent.PRE_TOOL_USE)
+            )
+        assert result.reason == "no"
+        mock_run.assert_not_called()
+
+
+class TestSharedHttpSession:
+    @pytest.mark.asyncio
+    async def test_session_reused_and_closed(self):
+        reg = HookRegistry()
+        first = reg._get_http_session()
+        assert reg._get_http_session() is first
+        await reg.shutdown()
+        assert first.closed
+        assert reg._get_http_session() is not first
+        await reg.shutdown()
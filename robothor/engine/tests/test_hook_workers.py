@@ -0,0 +1,202 @@
+"""Tests for persistent command-hook workers (mode: worker)."""
+
+from __future__ import annotations
+
+import shlex
+import sys
+import textwrap
+
+import pytest
+
+from robothor.engine.hook_registry import (
+    HookAction,
+    HookContext,
+    HookEvent,
+    HookRegistry,
+    LifecycleHook,
+    load_hooks_from_manifest,
+)
+from robothor.engine.hook_workers import HookWorkerError, HookWorkerPool
+
+# Echoes its pid; blocks "exec", rewrites "rewrite", crashes on "crash",
+# stalls on "stall", answers with the wrong id on "confused".
+_WORKER = textwrap.dedent(
+    """
+    import json, os, sys, time
+    for line in sys.stdin:
+        req = json.loads(line)
+        tool = req.get("tool_name")
+        if tool == "crash":
+            sys.exit(3)
+        if tool == "stall":
+            time.sleep(30)
+        resp = {"id": req["id"], "action": "allow", "system_message": str(os.getpid())}
+        if tool == "exec":
+            resp = {"id": req["id"], "action": "block", "reason": "no exec"}
+        elif tool == "rewrite":
+            resp = {"id": req["id"], "action": "modify", "args": {"safe": True}}
+        elif tool == "confused":
+            resp["id"] = -1
+        print(json.dumps(resp), flush=True)
+    """
+)
+
+
+@pytest.fixture
+def worker_command(tmp_path):
+    script = tmp_path / "hook_worker.py"
+    script.write_text(_WORKER)
+    return f"{shlex.quote(sys.executable)} {shlex.quote(str(script))}"
+
+
+def _hook(command: str, **kwargs) -> LifecycleHook:
+    return LifecycleHook(
+        event=HookEvent.PRE_TOOL_USE,
+        handler_type="command",
+        handler=command,
+        blocking=True,
+        mode="worker",
+        **kwargs,
+    )
+
+
+def _ctx(tool_name: str) -> HookContext:
+    return HookContext(event=HookEvent.PRE_TOOL_USE, tool_name=tool_name, agent_id="main")
+
+
+class TestWorkerMode:
+    @pytest.mark.asyncio
+    async def test_allow_block_modify(self, worker_command):
+        reg = HookRegistry()
+        hook = _hook(worker_command)
+        try:
+            allowed = await reg._run_command(hook, _ctx("read_file"))
+            blocked = await reg._run_command(hook, _ctx("exec"))
+            modified = await reg._run_command(hook, _ctx("rewrite"))
+        finally:
+            await reg.shutdown()
+
+        assert allowed.action == HookAction.ALLOW
+        assert blocked.action == HookAction.BLOCK
+        assert blocked.reason == "no exec"
+        assert modified.action == HookAction.MODIFY
+        assert modified.modified_args == {"safe": True}
+
+    @pytest.mark.asyncio
+    async def test_process_is_reused(self, worker_command):
+        reg = HookRegistry()
+        hook = _hook(worker_command)
+        try:
+            pids = {(await reg._run_command(hook, _ctx("t"))).system_message for _ in range(5)}
+            stats = reg.get_worker_stats()[worker_command]
+        finally:
+            await reg.shutdown()
+
+        assert len(pids) == 1
+        assert stats.requests == 5
+        assert stats.starts == 1
+        assert stats.restarts == 0
+
+    @pytest.mark.asyncio
+    async def test_crash_fails_open_and_restarts(self, worker_command):
+        reg = HookRegistry()
+        hook = _hook(worker_command)
+        try:
+            first = (await reg._run_command(hook, _ctx("t"))).system_message
+            crashed = await reg._run_command(hook, _ctx("crash"))
+            after = (await reg._run_command(hook, _ctx("t"))).system_message
+            stats = reg.get_worker_stats()[worker_command]
+        finally:
+            await reg.shutdown()
+
+        assert crashed.action == HookAction.ALLOW
+        assert after != first
+        assert stats.failures == 1
+        assert stats.restarts == 1
+
+    @pytest.mark.asyncio
+    async def test_id_mismatch_kills_worker(self, worker_command):
+        reg = HookRegistry()
+        hook = _hook(worker_command)
+        try:
+            result = await reg._run_command(hook, _ctx("confused"))
+            stats = reg.get_worker_stats()[worker_command]
+        finally:
+            await reg.shutdown()
+        assert result.action == HookAction.ALLOW
+        assert stats.failures == 1
+        assert stats.alive == 0
+
+    @pytest.mark.asyncio
+    async def test_pool_timeout_raises(self, worker_command):
+        pool = HookWorkerPool(worker_command)
+        try:
+            with pytest.raises(HookWorkerError):
+                await pool.request({"tool_name": "stall"}, timeout=0.5)
+            assert pool.stats().alive == 0
+            reply = await pool.request({"tool_name": "t"}, timeout=5)
+            assert reply["action"] == "allow"
+        finally:
+            await pool.close()
+
+    @pytest.mark.asyncio
+    async def test_pool_runs_requests_concurrently(self, worker_command):
+        import asyncio
+
+        pool = HookWorkerPool(worker_command, size=3)
+        try:
+            replies = await asyncio.gather(
+                *(pool.request({"tool_name": "t"}, timeout=5) for _ in range(6))
+            )
+            assert len({r["system_message"] for r in replies}) <= 3
+            assert pool.stats().alive >= 1
+        finally:
+            await pool.close()
+        assert pool.stats().alive == 0
+
+    @pytest.mark.asyncio
+    async def test_missing_command_fails_open(self):
+        reg = HookRegistry()
+        hook = _hook("/nonexistent/hook-worker-binary")
+        try:
+            result = await reg._run_command(hook, _ctx("t"))
+        finally:
+            await reg.shutdown()
+        assert result.action == HookAction.ALLOW
+
+    @pytest.mark.asyncio
+    async def test_latency_metrics(self, worker_command):
+        reg = HookRegistry()
+        hook = _hook(worker_command)
+        reg.register(hook)
+        try:
+            for _ in range(3):
+                await reg.dispatch(HookEvent.PRE_TOOL_USE, _ctx("t"))
+        finally:
+            await reg.shutdown()
+
+        m = reg.get_metrics()[(worker_command, HookEvent.PRE_TOOL_USE.value)]
+        assert m.executions == 3
+        assert m.max_duration_ms >= m.last_duration_ms > 0
+        assert m.avg_duration_ms == pytest.approx(m.total_duration_ms / 3)
+
+
+class TestWorkerManifest:
+    def test_mode_and_workers_parsed(self):
+        manifest = {
+            "v2": {
+                "lifecycle_hooks": [
+                    {
+                        "event": "pre_tool_use",
+                        "handler_type": "command",
+                        "handler": "guard --serve",
+                        "mode": "worker",
+                        "workers": 2,
+                    },
+                    {"event": "post_tool_use", "handler_type": "command", "handler": "true"},
+                ]
+            }
+        }
+        worker, oneshot = load_hooks_from_manifest(manifest, "main")
+        assert (worker.mode, worker.workers) == ("worker", 2)
+        assert (oneshot.mode, oneshot.workers) == ("oneshot", 1)
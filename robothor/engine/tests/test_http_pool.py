@@ -0,0 +1,269 @@
+"""Tests for the shared HTTP client pool, against a local stub server."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from urllib.parse import parse_qs, urlsplit
+
+import httpx
+import pytest
+
+from robothor.engine import http_pool
+from robothor.engine.http_pool import HttpClientPool, close_http_clients, get_http_pool, http_client
+
+
+class StubServer:
+    """Minimal HTTP/1.1 keep-alive server on 127.0.0.1.
+
+    Routes: ``/slow`` answers after 0.2s, ``/status/<code>`` answers with that
+    status, ``/repos/...?page=<n>`` returns one PR numbered n with a GitHub
+    Link header to page n+1 (up to 2), ``/login`` sets a session cookie.
+    Anything else returns ``{"path": ...}``. The Cookie header of every
+    request is recorded in ``cookies``.
+    """
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests: list[str] = []
+        self.cookies: list[str | None] = []
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def host(self) -> str:
+        assert self._server is not None
+        port = self._server.sockets[0].getsockname()[1]
+        return f"127.0.0.1:{port}"
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}"
+
+    async def __aenter__(self) -> StubServer:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while head := await reader.readuntil(b"\r\n\r\n"):
+                path = head.split(b" ", 2)[1].decode()
+                self.requests.append(path)
+                self.cookies.append(_header(head, "cookie"))
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                try:
+                    status, headers, body = await self._route(path)
+                finally:
+                    self.in_flight -= 1
+                lines = [f"HTTP/1.1 {status} X", f"Content-Length: {len(body)}", *headers]
+                writer.write(("\r\n".join(lines) + "\r\n\r\n").encode() + body)
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def _route(self, path: str) -> tuple[int, list[str], bytes]:
+        route = path.split("?")[0]
+        if route == "/slow":
+            await asyncio.sleep(0.2)
+        if route == "/login":
+            return 200, ["Set-Cookie: session=secret; Path=/"], b"{}"
+        if route.startswith("/status/"):
+            return int(route.rsplit("/", 1)[1]), [], b"{}"
+        if route.startswith("/repos/"):
+            page = int(parse_qs(urlsplit(path).query).get("page", ["1"])[0])
+            headers = []
+            if page < 2:
+                headers.append(f'Link: <{self.url}/repos/o/r/pulls?page={page + 1}>; rel="next"')
+            pr = {"number": page, "title": f"PR {page}", "state": "open", "user": {"login": "a"}}
+            return 200, headers, json.dumps([pr]).encode()
+        return 200, [], json.dumps({"path": path}).encode()
+
+
+def _header(head: bytes, name: str) -> str | None:
+    for line in head.decode().split("\r\n")[1:]:
+        key, _, value = line.partition(":")
+        if key.strip().lower() == name:
+            return value.strip()
+    return None
+
+
+@pytest.fixture
+async def stub():
+    async with StubServer() as server:
+        yield server
+
+
+@pytest.fixture
+async def pool():
+    p = HttpClientPool(max_per_host=2)
+    yield p
+    await p.aclose()
+
+
+class TestHttpClientPool:
+    @pytest.mark.asyncio
+    async def test_connection_reused_across_requests(self, stub, pool):
+        for i in range(5):
+            resp = await pool.request("GET", f"{stub.url}/item/{i}", timeout=5)
+            assert resp.json() == {"path": f"/item/{i}"}
+        assert stub.connections == 1
+        assert pool.host_stats()[stub.host].requests == 5
+
+    @pytest.mark.asyncio
+    async def test_per_host_cap(self, stub, pool):
+        await asyncio.gather(
+            *(pool.request("GET", f"{stub.url}/slow", timeout=5) for _ in range(6))
+        )
+        assert stub.peak_in_flight == 2
+        stats = pool.host_stats()[stub.host]
+        assert stats.peak_in_flight == 2
+        assert stats.in_flight == 0
+        assert stats.requests == 6
+
+    @pytest.mark.asyncio
+    async def test_ports_on_one_host_have_separate_slots(self, stub, pool):
+        async with StubServer() as other:
+            start = time.monotonic()
+            await asyncio.gather(
+                *(
+                    pool.request("GET", f"{server.url}/slow", timeout=5)
+                    for server in (stub, other)
+                    for _ in range(2)
+                )
+            )
+            # Four 0.2s requests under a cap of 2: one round, not two
+            assert time.monotonic() - start < 0.35
+            assert stub.peak_in_flight == other.peak_in_flight == 2
+            assert pool.host_stats()[stub.host].requests == 2
+            assert pool.host_stats()[other.host].requests == 2
+
+    def test_host_key_fills_default_port(self):
+        assert http_pool._host_key("https://api.example.com/x") == "api.example.com:443"
+        assert http_pool._host_key("http://api.example.com/x") == "api.example.com:80"
+        assert http_pool._host_key("http://localhost:8000/x") == "localhost:8000"
+
+    @pytest.mark.asyncio
+    async def test_status_errors_counted(self, stub, pool):
+        from robothor.engine.metrics import HTTP_CLIENT_ERRORS
+
+        metric = HTTP_CLIENT_ERRORS.labels(host=stub.host, kind="5xx")
+        before = metric._value.get()
+        resp = await pool.request("GET", f"{stub.url}/status/503", timeout=5)
+        assert resp.status_code == 503
+        assert metric._value.get() == before + 1
+        assert pool.host_stats()[stub.host].errors == 1
+
+    @pytest.mark.asyncio
+    async def test_connect_error_counted_and_raised(self, pool):
+        from robothor.engine.metrics import HTTP_CLIENT_ERRORS
+
+        async with StubServer() as server:
+            url, host = server.url, server.host
+        metric = HTTP_CLIENT_ERRORS.labels(host=host, kind="connect")
+        before = metric._value.get()
+        with pytest.raises(httpx.ConnectError):
+            await pool.request("GET", f"{url}/gone", timeout=5)
+        assert metric._value.get() == before + 1
+        stats = pool.host_stats()[host]
+        assert stats.errors == 1
+        assert stats.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_latency_observed_per_host(self, stub, pool):
+        from robothor.engine.metrics import HTTP_CLIENT_DURATION
+
+        def observed() -> float:
+            for metric in HTTP_CLIENT_DURATION.collect():
+                for sample in metric.samples:
+                    if sample.name.endswith("_count") and sample.labels["host"] == stub.host:
+                        return sample.value
+            return 0.0
+
+        before = observed()
+        await pool.request("GET", f"{stub.url}/slow", timeout=5)
+        assert observed() == before + 1
+        assert pool.host_stats()[stub.host].total_seconds >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_response_cookies_not_persisted(self, stub, pool):
+        resp = await pool.request("GET", f"{stub.url}/login", timeout=5)
+        assert resp.cookies["session"] == "secret"
+        await pool.request("GET", f"{stub.url}/profile", timeout=5)
+        assert stub.cookies == [None, None]
+
+    def test_tracked_hosts_bounded(self, monkeypatch):
+        monkeypatch.setattr(http_pool, "MAX_TRACKED_HOSTS", 2)
+        p = HttpClientPool()
+        for host in ("a", "b", "a", "c"):
+            p._host(host)
+        assert list(p.host_stats()) == ["a", "c"]
+
+    def test_busy_host_not_evicted(self, monkeypatch):
+        monkeypatch.setattr(http_pool, "MAX_TRACKED_HOSTS", 2)
+        p = HttpClientPool()
+        busy = p._host("a")
+        busy.users = 1
+        for host in ("b", "c"):
+            p._host(host)
+        assert p._host("a") is busy
+        assert list(p.host_stats()) == ["c", "a"]
+
+    def test_host_labels_bounded(self, monkeypatch):
+        monkeypatch.setattr(http_pool, "MAX_HOST_LABELS", 2)
+        p = HttpClientPool()
+        assert [p._label(h) for h in ("a", "b", "c", "a")] == ["a", "b", "other", "a"]
+
+    def test_http2_falls_back_without_h2(self, monkeypatch):
+        monkeypatch.setattr(http_pool, "_h2_available", lambda: False)
+        assert HttpClientPool(http2=True).http2 is False
+
+
+class TestSharedClient:
+    @pytest.mark.asyncio
+    async def test_http_client_shares_pool_and_applies_defaults(self, stub):
+        try:
+            async with http_client(timeout=5.0) as first:
+                await first.get(f"{stub.url}/a")
+            async with http_client(timeout=5.0) as second:
+                await second.post(f"{stub.url}/b", json={"x": 1})
+            assert stub.connections == 1
+            assert first._pool is second._pool is get_http_pool()
+            assert not get_http_pool().closed
+        finally:
+            await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_close_http_clients_replaces_pool(self):
+        pool = get_http_pool()
+        await close_http_clients()
+        assert pool.closed
+        assert get_http_pool() is not pool
+        await close_http_clients()
+
+    @pytest.mark.asyncio
+    async def test_github_pagination_reuses_connection(self, stub, monkeypatch):
+        from robothor.engine.tools.dispatch import ToolContext
+        from robothor.engine.tools.handlers import github_api
+
+        monkeypatch.setattr(github_api, "_GITHUB_API", stub.url)
+        monkeypatch.setenv("GITHUB_TOKEN", "t")
+        try:
+            result = await github_api.HANDLERS["github_list_prs"](
+                {"repo": "o/r", "max_pages": 3}, ToolContext()
+            )
+        finally:
+            await close_http_clients()
+        assert [pr["number"] for pr in result["pull_requests"]] == [1, 2]
+        assert len(stub.requests) == 2
+        assert stub.connections == 1
@@ -242,7 +242,7 @@ class TestJiraSearch:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -267,7 +267,7 @@ class TestJiraSearch:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -289,7 +289,7 @@ class TestJiraSearch:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -321,7 +321,7 @@ class TestJiraGetIssue:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -366,7 +366,7 @@ class TestJiraGetIssue:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -404,7 +404,7 @@ class TestJiraListBoards:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
@@ -493,7 +493,7 @@ class TestJiraGetSprint:
         with (
             patch.dict("os.environ", _ENV),
             patch(
-                "robothor.engine.tools.handlers.jira.httpx.AsyncClient",
+                "robothor.engine.tools.handlers.jira.http_client",
                 return_value=mock_client,
             ),
         ):
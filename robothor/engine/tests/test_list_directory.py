@@ -159,3 +159,28 @@ class TestListDirectoryHandler:
         assert result["count"] == 0
         assert result["entries"] == []
         assert result["truncated"] is False
+
+    def test_recursive_skips_ignored(self, tmp_path: Path):
+        (tmp_path / ".gitignore").write_text("*.log\n")
+        (tmp_path / "app.log").write_text("x")
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+
+        result = self._call({"path": str(tmp_path), "recursive": True})
+        assert {e["name"] for e in result["entries"]} == {".gitignore"}
+
+        result = self._call({"path": str(tmp_path), "recursive": True, "include_ignored": True})
+        assert "node_modules/pkg/index.js" in {e["name"] for e in result["entries"]}
+
+    def test_flat_listing_shows_ignored(self, tmp_path: Path):
+        (tmp_path / "node_modules").mkdir()
+
+        result = self._call({"path": str(tmp_path)})
+        assert result["entries"][0]["name"] == "node_modules"
+
+    def test_max_depth(self, tmp_path: Path):
+        (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+
+        result = self._call({"path": str(tmp_path), "max_depth": 2})
+        assert [e["name"] for e in result["entries"]] == ["a", str(Path("a") / "b")]
+        assert "error" in self._call({"path": str(tmp_path), "max_depth": 0})
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+import time
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import litellm
 import pytest
 
+from robothor.engine import llm_cache
+from robothor.engine.llm_cache import LlmResponseCache, get_llm_cache
 from robothor.engine.llm_client import (
     AllModelsFailedError,
     llm_call,
     llm_call_streaming,
     llm_call_with_fallback,
 )
+from robothor.engine.model_registry import get_model_limits
 
 
 def _make_response(content: str = "Hello") -> MagicMock:
@@ -347,3 +353,137 @@ async def test_streaming_empty_models_raises():
             [{"role": "user", "content": "hi"}],
             models=[],
         )
+
+
+# ---------------------------------------------------------------------------
+# llm_call response cache
+# ---------------------------------------------------------------------------
+
+SONNET = "openrouter/anthropic/claude-sonnet-4.6"
+
+
+def _model_response(content: str = '{"ok": true}') -> litellm.ModelResponse:
+    return litellm.ModelResponse(
+        model=SONNET,
+        choices=[{"message": {"role": "assistant", "content": content}}],
+        usage={"prompt_tokens": 1000, "completion_tokens": 100, "total_tokens": 1100},
+    )
+
+
+async def _cached_call(content: str = "plan this", **kwargs) -> Any:
+    kwargs = {"model": SONNET, "temperature": 0.0, "cache_ttl": 60, **kwargs}
+    return await llm_call([{"role": "user", "content": content}], **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_cache_serves_identical_call():
+    """A repeated temperature-0 call is answered without the provider."""
+    with patch("litellm.acompletion", return_value=_model_response()) as mock_call:
+        first = await _cached_call(json_mode=True)
+        second = await _cached_call(json_mode=True)
+
+    mock_call.assert_called_once()
+    assert second.choices[0].message.content == first.choices[0].message.content
+    assert get_llm_cache().stats().memory_hits == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_key_normalizes_messages():
+    """Surrounding whitespace and unset fields do not split cache entries."""
+    with patch("litellm.acompletion", return_value=_model_response()) as mock_call:
+        await _cached_call("plan this")
+        await llm_call(
+            [{"role": "user", "content": "  plan this\n", "name": None}],
+            model=SONNET,
+            temperature=0.0,
+            cache_ttl=60,
+        )
+
+    mock_call.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cache_key_includes_params():
+    """Different request params are different cache entries."""
+    with patch("litellm.acompletion", return_value=_model_response()) as mock_call:
+        await _cached_call(max_tokens=100)
+        await _cached_call(max_tokens=200)
+        await _cached_call(model="other-model")
+
+    assert mock_call.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_cache_skipped_for_sampled_or_uncached_calls():
+    """Nonzero temperature or no cache_ttl always calls the provider."""
+    with patch("litellm.acompletion", return_value=_model_response()) as mock_call:
+        for _ in range(2):
+            await _cached_call(temperature=0.3)
+            await _cached_call(cache_ttl=None)
+
+    assert mock_call.call_count == 4
+    assert get_llm_cache().stats().stores == 0
+
+
+@pytest.mark.asyncio
+async def test_invalid_json_not_cached():
+    """Malformed JSON-mode output is not replayed."""
+    with patch("litellm.acompletion", return_value=_model_response("not json")) as mock_call:
+        await _cached_call(json_mode=True)
+        await _cached_call(json_mode=True)
+
+    assert mock_call.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cache_hit_accounts_saved_cost():
+    """Each hit adds the original response's token cost to the savings."""
+    limits = get_model_limits(SONNET)
+    expected = 1000 * limits.input_cost_per_token + 100 * limits.output_cost_per_token
+
+    with patch("litellm.acompletion", return_value=_model_response()):
+        for _ in range(3):
+            await _cached_call()
+
+    stats = get_llm_cache().stats()
+    assert stats.memory_hits == 2
+    assert stats.saved_tokens == 2200
+    assert stats.saved_usd == pytest.approx(2 * expected)
+
+
+@pytest.mark.asyncio
+async def test_cache_entry_expires():
+    cache = LlmResponseCache(persist=False)
+    await cache.put("k", SONNET, _model_response().model_dump(), ttl=0)
+    assert await cache.get("k") is None
+    assert cache.stats().misses == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_evicts_least_recently_used():
+    cache = LlmResponseCache(max_entries=2, persist=False)
+    data = _model_response().model_dump()
+    await cache.put("a", SONNET, data, ttl=60)
+    await cache.put("b", SONNET, data, ttl=60)
+    await cache.get("a")
+    await cache.put("c", SONNET, data, ttl=60)
+    assert await cache.get("b") is None
+    assert await cache.get("a") is not None
+
+
+@pytest.mark.asyncio
+async def test_persistent_tier_hit_promoted_to_memory():
+    """A database hit is served and kept in memory for the remaining TTL."""
+    cache = LlmResponseCache(persist=True)
+    data = _model_response().model_dump()
+    entry = llm_cache._Entry(
+        model=SONNET, response=data, cost_usd=0.5, tokens=1100, expires_at=time.monotonic() + 60
+    )
+    with patch.object(LlmResponseCache, "_db_get", return_value=entry) as db_get:
+        assert await cache.get("k") == data
+        assert await cache.get("k") == data
+
+    db_get.assert_called_once_with("k")
+    stats = cache.stats()
+    assert (stats.db_hits, stats.memory_hits) == (1, 1)
+    assert stats.saved_usd == pytest.approx(1.0)
@@ -0,0 +1,308 @@
+"""Tests for MCP client sessions and the client pool."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+import textwrap
+import time
+from typing import cast
+
+import pytest
+
+from robothor.engine import mcp_client
+from robothor.engine.mcp_client import (
+    McpClientPool,
+    McpClientSession,
+    McpHttpSession,
+    McpServerConfig,
+    config_hash,
+)
+
+# A stdio MCP server that answers each tools/call after ``arguments.delay``
+# seconds, concurrently, so responses come back out of request order.
+# ``cancelled`` returns the request ids it was told to cancel, ``list_calls``
+# how often tools/list was asked, ``notify`` sends tools/list_changed first,
+# ``bad_id`` first sends a response whose id is a list; ``exit`` quits.
+FAKE_SERVER = textwrap.dedent(
+    """
+    import asyncio, json, sys
+
+    cancelled = []
+    list_calls = 0
+
+    async def main():
+        loop = asyncio.get_running_loop()
+        reader = asyncio.StreamReader()
+        await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+
+        def send(msg):
+            data = json.dumps(msg).encode()
+            sys.stdout.buffer.write(b"Content-Length: %d\\r\\n\\r\\n" % len(data) + data)
+            sys.stdout.buffer.flush()
+
+        async def answer(msg):
+            global list_calls
+            method, params = msg["method"], msg.get("params") or {}
+            if method == "initialize":
+                result = {"protocolVersion": "2024-11-05", "capabilities": {}}
+            elif method == "tools/list":
+                list_calls += 1
+                result = {"tools": [{"name": "echo"}]}
+            elif params.get("name") == "cancelled":
+                result = {"ids": cancelled}
+            elif params.get("name") == "list_calls":
+                result = {"count": list_calls}
+            elif params.get("name") == "notify":
+                send({"jsonrpc": "2.0", "method": "notifications/tools/list_changed"})
+                result = {}
+            elif params.get("name") == "bad_id":
+                send({"jsonrpc": "2.0", "id": [msg["id"]], "result": {}})
+                result = {"ok": True}
+            elif params.get("name") == "exit":
+                sys.exit(0)
+            elif params.get("name") == "fail":
+                send({"jsonrpc": "2.0", "id": msg["id"], "error": {"code": 7, "message": "boom"}})
+                return
+            else:
+                await asyncio.sleep(params["arguments"].get("delay", 0))
+                result = {"echo": params["arguments"]}
+            send({"jsonrpc": "2.0", "id": msg["id"], "result": result})
+
+        while True:
+            length = 0
+            while (line := await reader.readline()) not in (b"\\r\\n", b"\\n"):
+                if not line:
+                    return
+                if line.lower().startswith(b"content-length:"):
+                    length = int(line.split(b":")[1])
+            msg = json.loads(await reader.readexactly(length))
+            if msg.get("method") == "notifications/cancelled":
+                cancelled.append(msg["params"]["requestId"])
+            elif "id" in msg:
+                asyncio.ensure_future(answer(msg))
+
+    asyncio.run(main())
+    """
+)
+
+
+def _fake_config(tmp_path, **kwargs) -> McpServerConfig:
+    script = tmp_path / "server.py"
+    script.write_text(FAKE_SERVER)
+    return McpServerConfig(name="fake", command=[sys.executable, str(script)], **kwargs)
+
+
+@pytest.fixture
+async def session(tmp_path):
+    s = McpClientSession(_fake_config(tmp_path, timeout_seconds=5))
+    await s.start()
+    yield s
+    await s.stop()
+
+
+class TestMultiplexing:
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_overlap(self, session):
+        await session.list_tools()
+        start = time.monotonic()
+        results = await asyncio.gather(
+            *(session.call_tool("echo", {"delay": 0.3, "n": i}) for i in range(5))
+        )
+        assert time.monotonic() - start < 1.0  # serialized would take 1.5s
+        assert [r["echo"]["n"] for r in results] == list(range(5))
+
+    @pytest.mark.asyncio
+    async def test_out_of_order_responses_routed_by_id(self, session):
+        slow = asyncio.create_task(session.call_tool("echo", {"delay": 0.4, "n": "slow"}))
+        await asyncio.sleep(0.05)
+        fast = await session.call_tool("echo", {"delay": 0, "n": "fast"})
+        assert fast == {"echo": {"delay": 0, "n": "fast"}}
+        assert not slow.done()
+        assert (await slow)["echo"]["n"] == "slow"
+        assert session._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_concurrent_first_calls_initialize_once(self, session, monkeypatch):
+        calls = 0
+        original = session.initialize
+
+        async def counting():
+            nonlocal calls
+            calls += 1
+            return await original()
+
+        monkeypatch.setattr(session, "initialize", counting)
+        await asyncio.gather(*(session.list_tools() for _ in range(3)))
+        assert calls == 1
+
+    @pytest.mark.asyncio
+    async def test_per_request_timeout_cancels_remotely(self, session):
+        with pytest.raises(TimeoutError):
+            await session.call_tool("echo", {"delay": 2}, timeout=0.1)
+        # Other requests are unaffected and the server saw the cancellation
+        result = await session.call_tool("cancelled", {})
+        assert len(result["ids"]) == 1
+        assert session._pending == {}
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation(self, session):
+        await session.list_tools()
+        task = asyncio.create_task(session.call_tool("echo", {"delay": 2}))
+        await asyncio.sleep(0.1)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert session._pending == {}
+        assert (await session.call_tool("cancelled", {}))["ids"]
+
+    @pytest.mark.asyncio
+    async def test_error_response_raises(self, session):
+        with pytest.raises(RuntimeError, match="MCP error 7: boom"):
+            await session.call_tool("fail", {})
+        assert session.running
+
+    @pytest.mark.asyncio
+    async def test_malformed_response_id_dropped(self, session):
+        assert await session.call_tool("bad_id", {}) == {"ok": True}
+        assert session.running
+
+    @pytest.mark.asyncio
+    async def test_server_exit_fails_pending_requests(self, session):
+        await session.list_tools()
+        pending = asyncio.create_task(session.call_tool("echo", {"delay": 5}))
+        await asyncio.sleep(0.05)
+        with pytest.raises(RuntimeError, match="exited"):
+            await session.call_tool("exit", {})
+        with pytest.raises(RuntimeError, match="exited"):
+            await pending
+        assert not session.running
+
+    @pytest.mark.asyncio
+    async def test_pool_replaces_dead_session(self, tmp_path):
+        pool = McpClientPool()
+        pool.register(_fake_config(tmp_path))
+        try:
+            first = await pool.get_session("fake")
+            with pytest.raises(RuntimeError):
+                await first.call_tool("exit", {})
+            second = await pool.get_session("fake")
+            assert second is not first
+            assert (await second.call_tool("echo", {"n": 1}))["echo"]["n"] == 1
+            assert pool.list_servers()[0]["running"] is True
+        finally:
+            await pool.shutdown()
+
+
+@pytest.fixture
+async def pool(tmp_path):
+    p = McpClientPool()
+    p.register(_fake_config(tmp_path))
+    yield p
+    await p.shutdown()
+
+
+async def _list_calls(pool: McpClientPool) -> int:
+    session = await pool.get_session("fake")
+    return cast("int", (await session.call_tool("list_calls", {}))["count"])
+
+
+class TestToolsCache:
+    @pytest.mark.asyncio
+    async def test_second_listing_served_from_cache(self, pool):
+        first = await pool.list_tools("fake")
+        second = await pool.list_tools("fake")
+        assert first == second == [{"name": "echo"}]
+        assert await _list_calls(pool) == 1
+
+    @pytest.mark.asyncio
+    async def test_list_changed_notification_refreshes(self, pool):
+        await pool.list_tools("fake")
+        session = await pool.get_session("fake")
+        await session.call_tool("notify", {})
+        await pool.list_tools("fake")
+        assert await _list_calls(pool) == 2
+
+    @pytest.mark.asyncio
+    async def test_ttl_expiry_refreshes(self, pool, monkeypatch):
+        monkeypatch.setattr(mcp_client, "TOOLS_CACHE_TTL_S", 0.0)
+        await pool.list_tools("fake")
+        await pool.list_tools("fake")
+        assert await _list_calls(pool) == 2
+
+    @pytest.mark.asyncio
+    async def test_config_change_misses_cache(self, pool):
+        await pool.list_tools("fake")
+        old = pool._configs["fake"]
+        pool.register(McpServerConfig(name="fake", command=old.command, timeout_seconds=7))
+        await pool.list_tools("fake")
+        assert await _list_calls(pool) == 2
+
+    def test_config_hash_tracks_every_field(self):
+        base = McpServerConfig(name="a", url="http://x/_mcp")
+        assert config_hash(base) == config_hash(McpServerConfig(name="a", url="http://x/_mcp"))
+        changed = McpServerConfig(name="a", url="http://x/_mcp", headers={"Authorization": "b"})
+        assert config_hash(base) != config_hash(changed)
+
+    @pytest.mark.asyncio
+    async def test_call_latency_labelled_cold_then_warm(self, pool):
+        from robothor.engine.metrics import MCP_CALL_DURATION
+
+        def count(phase: str) -> float:
+            for metric in MCP_CALL_DURATION.collect():
+                for sample in metric.samples:
+                    if sample.name.endswith("_count") and sample.labels == {
+                        "server": "fake",
+                        "phase": phase,
+                    }:
+                        return sample.value
+            return 0.0
+
+        cold, warm = count("cold"), count("warm")
+        await pool.call_tool("fake", "echo", {"n": 1})
+        await pool.call_tool("fake", "echo", {"n": 2})
+        assert (count("cold"), count("warm")) == (cold + 1, warm + 1)
+
+
+class TestHttpSessionKeepAlive:
+    @pytest.mark.asyncio
+    async def test_requests_share_one_connection(self):
+        connections = 0
+
+        async def serve(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+            nonlocal connections
+            connections += 1
+            try:
+                while head := await reader.readuntil(b"\r\n\r\n"):
+                    length = 0
+                    for line in head.split(b"\r\n"):
+                        if line.lower().startswith(b"content-length:"):
+                            length = int(line.split(b":")[1])
+                    msg = json.loads(await reader.readexactly(length))
+                    body = json.dumps({"jsonrpc": "2.0", "id": msg.get("id"), "result": {}})
+                    writer.write(
+                        b"HTTP/1.1 200 OK\r\nContent-Type: application/json\r\n"
+                        b"Mcp-Session-Id: s1\r\nContent-Length: %d\r\n\r\n%s"
+                        % (len(body), body.encode())
+                    )
+                    await writer.drain()
+            except (asyncio.IncompleteReadError, ConnectionError):
+                pass
+            finally:
+                writer.close()
+
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        session = McpHttpSession(McpServerConfig(name="h", url=f"http://127.0.0.1:{port}/_mcp"))
+        try:
+            await session.list_tools()
+            await session.call_tool("t", {})
+            await session.call_tool("t", {})
+            assert connections == 1
+            assert session._session_id == "s1"
+        finally:
+            await session.stop()
+            server.close()
+            await server.wait_closed()
+        assert session._client is None
@@ -0,0 +1,55 @@
+"""Tests for memory tool handlers."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from robothor.engine.tools.handlers.memory import HANDLERS
+
+# ToolContext has no run_id; the runner attaches one when attributing outcomes
+_RUN_CTX = SimpleNamespace(run_id="run-1", agent_id="agent", tenant_id="test-tenant")
+
+_FACT = {"id": 1, "fact_text": "Alice leads Q3", "category": "work", "confidence": 0.9}
+_EXPANDED = {"id": 2, "fact_text": "Bob reports to Alice", "source": "entity_expansion"}
+_INSIGHT = {"id": 3, "insight_text": "Q3 is at risk", "source": "insight"}
+
+
+class TestFactAccessLogging:
+    @pytest.mark.asyncio
+    async def test_search_memory_logs_fact_ids(self):
+        log = MagicMock()
+        with (
+            patch(
+                "robothor.memory.facts.search_facts",
+                AsyncMock(return_value=[_FACT, _INSIGHT]),
+            ),
+            patch("robothor.memory.outcomes.log_fact_access", log),
+        ):
+            await HANDLERS["search_memory"]({"query": "alice"}, _RUN_CTX)
+        log.assert_called_once_with("run-1", [1], "agent", "test-tenant")
+
+    @pytest.mark.asyncio
+    async def test_search_memories_logs_every_query(self):
+        log = MagicMock()
+        batch = AsyncMock(return_value=[[_FACT, _INSIGHT], [_EXPANDED]])
+        with (
+            patch("robothor.memory.facts.search_facts_batch", batch),
+            patch("robothor.memory.outcomes.log_fact_access", log),
+        ):
+            result = await HANDLERS["search_memories"]({"queries": ["alice", "bob"]}, _RUN_CTX)
+        log.assert_called_once_with("run-1", [1, 2], "agent", "test-tenant")
+        assert [r["query"] for r in result["results"]] == ["alice", "bob"]
+
+    @pytest.mark.asyncio
+    async def test_no_logging_without_run(self):
+        log = MagicMock()
+        ctx = SimpleNamespace(agent_id="agent", tenant_id="test-tenant")
+        with (
+            patch("robothor.memory.facts.search_facts_batch", AsyncMock(return_value=[[_FACT]])),
+            patch("robothor.memory.outcomes.log_fact_access", log),
+        ):
+            await HANDLERS["search_memories"]({"queries": ["alice"]}, ctx)
+        log.assert_not_called()
@@ -0,0 +1,277 @@
+"""Tests for shared model health tracking and circuit breakers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robothor.engine.llm_client import llm_call_with_fallback
+from robothor.engine.model_health import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    ModelHealthTracker,
+    get_model_health,
+    is_provider_failure,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _status_error(status: int) -> Exception:
+    err = Exception(f"HTTP {status}")
+    err.status_code = status  # type: ignore[attr-defined]
+    return err
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def tracker(clock: FakeClock) -> ModelHealthTracker:
+    return ModelHealthTracker(
+        window_s=300, failure_threshold=3, cooldown_s=60, slow_p95_s=10, clock=clock
+    )
+
+
+class TestProviderFailure:
+    @pytest.mark.parametrize("status", [401, 408, 429, 500, 503])
+    def test_provider_statuses(self, status):
+        assert is_provider_failure(_status_error(status))
+
+    def test_timeout(self):
+        assert is_provider_failure(TimeoutError())
+
+    @pytest.mark.parametrize("exc", [_status_error(400), ValueError("bad json")])
+    def test_request_errors_ignored(self, exc, tracker):
+        assert not is_provider_failure(exc)
+        assert tracker.record_failure("m", exc) is False
+        assert tracker.snapshot() == {}
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self, tracker):
+        for _ in range(2):
+            tracker.record_failure("m", TimeoutError())
+        assert tracker.state("m") == CLOSED
+        tracker.record_failure("m", TimeoutError())
+        assert tracker.state("m") == OPEN
+
+    def test_success_resets_failure_streak(self, tracker):
+        tracker.record_failure("m", TimeoutError())
+        tracker.record_failure("m", TimeoutError())
+        tracker.record_success("m", 1.0)
+        tracker.record_failure("m", TimeoutError())
+        assert tracker.state("m") == CLOSED
+
+    def test_half_open_probe_success_closes(self, tracker, clock):
+        for _ in range(3):
+            tracker.record_failure("m", _status_error(503))
+        clock.now += 61
+        assert tracker.state("m") == HALF_OPEN
+        tracker.record_success("m", 1.0)
+        assert tracker.state("m") == CLOSED
+
+    def test_half_open_probe_failure_reopens(self, tracker, clock):
+        for _ in range(3):
+            tracker.record_failure("m", _status_error(503))
+        clock.now += 61
+        tracker.record_failure("m", _status_error(503))
+        assert tracker.state("m") == OPEN
+        clock.now += 30
+        assert tracker.state("m") == OPEN
+
+    def test_opening_counted_in_metrics(self, tracker):
+        from robothor.engine.metrics import MODEL_CIRCUIT_OPENED, MODEL_CIRCUIT_STATE
+
+        opened = MODEL_CIRCUIT_OPENED.labels(model="metric-model")
+        before = opened._value.get()
+        for _ in range(3):
+            tracker.record_failure("metric-model", TimeoutError())
+        assert opened._value.get() == before + 1
+        assert MODEL_CIRCUIT_STATE.labels(model="metric-model")._value.get() == 2
+
+
+class TestRecovery:
+    def _open(self, tracker: ModelHealthTracker, clock: FakeClock) -> None:
+        for _ in range(3):
+            tracker.record_failure("primary", TimeoutError())
+        clock.now += 61
+
+    def test_half_open_primary_probed_in_place(self, tracker, clock):
+        self._open(tracker, clock)
+        assert tracker.order(["primary", "fallback"]) == ["primary", "fallback"]
+
+    def test_only_one_caller_probes(self, tracker, clock):
+        self._open(tracker, clock)
+        assert tracker.order(["primary", "fallback"])[0] == "primary"
+        # A concurrent chain must not pile onto the recovering model
+        assert tracker.order(["primary", "fallback"]) == ["fallback", "primary"]
+
+    def test_successful_probe_restores_primary(self, tracker, clock):
+        self._open(tracker, clock)
+        tracker.order(["primary", "fallback"])
+        tracker.record_success("primary", 1.0)
+        assert tracker.state("primary") == CLOSED
+        # The outage's failures no longer count against it
+        assert tracker.snapshot()["primary"]["error_rate"] == 0.0
+        assert tracker.order(["primary", "fallback"]) == ["primary", "fallback"]
+
+    def test_unresolved_probe_claim_lapses(self, tracker, clock):
+        self._open(tracker, clock)
+        tracker.order(["primary", "fallback"])
+        assert tracker.snapshot()["primary"]["probe_in_flight"] is True
+        clock.now += 61
+        assert tracker.order(["primary", "fallback"]) == ["primary", "fallback"]
+
+    def test_failed_probe_reopens_and_demotes(self, tracker, clock):
+        self._open(tracker, clock)
+        tracker.order(["primary", "fallback"])
+        tracker.record_failure("primary", TimeoutError())
+        assert tracker.order(["primary", "fallback"]) == ["fallback", "primary"]
+
+
+class TestOrdering:
+    def test_healthy_chain_keeps_configured_order(self, tracker):
+        tracker.record_success("b", 1.0)
+        assert tracker.order(["a", "b", "c"]) == ["a", "b", "c"]
+
+    def test_open_model_moved_last(self, tracker):
+        for _ in range(3):
+            tracker.record_failure("a", TimeoutError())
+        assert tracker.order(["a", "b", "c"]) == ["b", "c", "a"]
+
+    def test_degraded_between_healthy_and_open(self, tracker):
+        for _ in range(3):
+            tracker.record_failure("a", TimeoutError())
+        # b: 1 failure in 4 calls is a 25% error rate
+        for _ in range(3):
+            tracker.record_success("b", 1.0)
+        tracker.record_failure("b", TimeoutError())
+        assert tracker.order(["a", "b", "c"]) == ["c", "b", "a"]
+
+    def test_slow_model_demoted(self, tracker):
+        for _ in range(4):
+            tracker.record_success("a", 30.0)
+            tracker.record_success("b", 2.0)
+        assert tracker.order(["a", "b"]) == ["b", "a"]
+
+    def test_old_samples_age_out(self, tracker, clock):
+        for _ in range(4):
+            tracker.record_success("a", 30.0)
+        clock.now += 301
+        assert tracker.order(["a", "b"]) == ["a", "b"]
+
+
+class TestSnapshot:
+    def test_rolling_stats(self, tracker):
+        for latency in (1.0, 2.0, 3.0, 4.0):
+            tracker.record_success("m", latency)
+        tracker.record_failure("m", TimeoutError())
+        snap = tracker.snapshot()["m"]
+        assert snap["circuit"] == CLOSED
+        assert snap["samples"] == 5
+        assert snap["error_rate"] == 0.2
+        assert snap["p50_s"] == 2.0
+        assert snap["p95_s"] == 4.0
+
+    def test_open_circuit_reports_retry_time(self, tracker, clock):
+        for _ in range(3):
+            tracker.record_failure("m", TimeoutError())
+        clock.now += 20
+        snap = tracker.snapshot()["m"]
+        assert snap["circuit"] == OPEN
+        assert snap["consecutive_failures"] == 3
+        assert snap["retry_in_s"] == 40.0
+
+
+def _response(model: str) -> MagicMock:
+    resp = MagicMock()
+    resp.choices = [MagicMock()]
+    resp.choices[0].message.content = model
+    return resp
+
+
+class TestSharedAcrossCalls:
+    @pytest.mark.asyncio
+    async def test_fallback_skips_known_outage(self):
+        """Once model-a's circuit opens, later calls go to model-b first."""
+        calls: list[str] = []
+
+        async def completion(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "model-a":
+                raise _status_error(503)
+            return _response(kwargs["model"])
+
+        with patch("litellm.acompletion", side_effect=completion):
+            for _ in range(4):
+                await llm_call_with_fallback(
+                    [{"role": "user", "content": "hi"}], models=["model-a", "model-b"]
+                )
+
+        assert calls == ["model-a", "model-b"] * 3 + ["model-b"]
+        assert get_model_health().state("model-a") == OPEN
+
+    @pytest.mark.asyncio
+    async def test_primary_recovers_after_cooldown(self, monkeypatch, clock):
+        """After the cooldown the primary is probed first and takes traffic back."""
+        from robothor.engine import model_health
+
+        monkeypatch.setattr(model_health, "_tracker", ModelHealthTracker(clock=clock))
+        down = True
+        calls: list[str] = []
+
+        async def completion(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "model-a" and down:
+                raise _status_error(503)
+            return _response(kwargs["model"])
+
+        messages = [{"role": "user", "content": "hi"}]
+        with patch("litellm.acompletion", side_effect=completion):
+            for _ in range(3):
+                await llm_call_with_fallback(messages, models=["model-a", "model-b"])
+            calls.clear()
+            await llm_call_with_fallback(messages, models=["model-a", "model-b"])
+            assert calls == ["model-b"]
+
+            down = False
+            clock.now += model_health.COOLDOWN_S + 1
+            calls.clear()
+            for _ in range(2):
+                await llm_call_with_fallback(messages, models=["model-a", "model-b"])
+
+        assert calls == ["model-a", "model-a"]
+        assert get_model_health().state("model-a") == CLOSED
+
+    @pytest.mark.asyncio
+    async def test_open_model_still_tried_as_last_resort(self):
+        health = get_model_health()
+        for _ in range(3):
+            health.record_failure("model-a", TimeoutError())
+        calls: list[str] = []
+
+        async def completion(**kwargs):
+            calls.append(kwargs["model"])
+            if kwargs["model"] == "model-b":
+                raise _status_error(400)
+            return _response(kwargs["model"])
+
+        with patch("litellm.acompletion", side_effect=completion):
+            resp = await llm_call_with_fallback(
+                [{"role": "user", "content": "hi"}], models=["model-a", "model-b"]
+            )
+
+        assert calls == ["model-b", "model-a"]
+        assert resp.choices[0].message.content == "model-a"
+        assert health.state("model-a") == CLOSED
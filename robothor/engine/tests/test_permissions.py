@@ -2,9 +2,42 @@
 
 from __future__ import annotations
 
+import fnmatch
+import random
 from unittest.mock import patch
 
-from robothor.engine.permissions import check_tool_permission, resolve_accessible_tenants
+import pytest
+
+from robothor.engine.permissions import (
+    PERMISSION_CHANGE_EVENT,
+    CompiledPermissions,
+    check_tool_permission,
+    clear_permission_cache,
+    handle_permission_change_event,
+    permissions_changed,
+    resolve_accessible_tenants,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_permission_cache():
+    clear_permission_cache()
+    yield
+    clear_permission_cache()
+
+
+def _reference_check(
+    user_role: str, tool_name: str, rules: list[tuple[str, str, str]]
+) -> str | None:
+    """The uncached evaluation loop check_tool_permission used before compilation."""
+    if not rules:
+        return f"No permission rules for role '{user_role}' — access denied"
+    for pattern, access, _rule_tenant in rules:
+        if fnmatch.fnmatch(tool_name, pattern):
+            if access == "deny":
+                return f"Role '{user_role}' denied '{tool_name}' (pattern: {pattern})"
+            return None
+    return f"No permission rule matched for role '{user_role}' on '{tool_name}' — access denied"
 
 
 class TestCheckToolPermission:
@@ -131,33 +164,171 @@ class TestResolveAccessibleTenants:
 
     def test_owner_without_children_gets_own_only(self):
         """Owner in tenant with no children gets own tenant only."""
-        with patch("robothor.engine.permissions._get_child_tenants", return_value=[]):
+        with patch("robothor.engine.permissions._get_descendant_tenants", return_value=[]):
             result = resolve_accessible_tenants("parent", "owner")
             assert result == ("parent",)
 
     def test_owner_with_child_access_gets_children(self):
-        """Owner gets own + child tenants via BFS traversal."""
-        with patch("robothor.engine.permissions._get_child_tenants") as mock_children:
-            # First call for "parent" returns two children, subsequent calls return none
-            mock_children.side_effect = lambda tid: (
-                ["child-1", "child-2"] if tid == "parent" else []
-            )
-
+        """Owner gets own + descendant tenants from the recursive query."""
+        with patch(
+            "robothor.engine.permissions._get_descendant_tenants",
+            return_value=["child-1", "child-2"],
+        ):
             result = resolve_accessible_tenants("parent", "owner")
             assert result == ("parent", "child-1", "child-2")
 
     def test_admin_with_child_access(self):
         """Admin role also gets hierarchical access."""
-        with patch("robothor.engine.permissions._get_child_tenants") as mock_children:
-            mock_children.side_effect = lambda tid: ["child-1"] if tid == "parent" else []
-
+        with patch("robothor.engine.permissions._get_descendant_tenants", return_value=["child-1"]):
             result = resolve_accessible_tenants("parent", "admin")
             assert result == ("parent", "child-1")
 
     def test_db_error_returns_own_tenant(self):
         """DB errors return just the user's own tenant."""
         with patch(
-            "robothor.engine.permissions._get_child_tenants", side_effect=Exception("DB down")
+            "robothor.engine.permissions._get_descendant_tenants", side_effect=Exception("DB down")
         ):
             result = resolve_accessible_tenants("test-tenant", "owner")
             assert result == ("test-tenant",)
+
+    def test_single_recursive_query(self):
+        """The hierarchy is resolved with one query, not one per parent."""
+        with patch("robothor.db.connection.get_connection") as mock_conn:
+            mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+            mock_cursor.fetchall.return_value = [("child-1",), ("child-2",), ("grandchild",)]
+
+            result = resolve_accessible_tenants("parent", "owner", max_depth=3)
+
+        assert result == ("parent", "child-1", "child-2", "grandchild")
+        assert mock_cursor.execute.call_count == 1
+        sql, params = mock_cursor.execute.call_args[0]
+        assert "WITH RECURSIVE" in sql
+        assert params[-1] == 3
+
+
+class TestCompiledPermissions:
+    """Compiled, cached evaluation must decide exactly like the uncached loop."""
+
+    PATTERNS = [
+        "*",
+        "search_*",
+        "get_*",
+        "list_*",
+        "create_*",
+        "create_person",
+        "memory_block_*",
+        "memory_block_read",
+        "*_person",
+        "git_?ush",
+        "[gl]*",
+        "vault_*",
+        "*memory*",
+        "exec",
+        "[!a-m]*",
+    ]
+    TOOLS = [
+        "search_memory",
+        "get_entity",
+        "list_tasks",
+        "create_person",
+        "create_task",
+        "update_person",
+        "memory_block_read",
+        "memory_block_write",
+        "git_push",
+        "git_pull",
+        "vault_get",
+        "exec",
+        "read_file",
+        "web_fetch",
+        "",
+        "x",
+    ]
+
+    def _random_rules(self, rng: random.Random, tenant_id: str) -> list[tuple[str, str, str]]:
+        rules = [
+            (pattern, rng.choice(["allow", "deny"]), rng.choice([tenant_id, "__default__"]))
+            for pattern in rng.sample(self.PATTERNS, rng.randint(0, 6))
+        ]
+        # Same ordering as the SQL: tenant-specific first, then deny before allow
+        rules.sort(key=lambda r: (r[2] != tenant_id, r[1] != "deny"))
+        return rules
+
+    def test_differential_against_uncached_evaluation(self):
+        rng = random.Random(1234)
+        for _ in range(300):
+            clear_permission_cache()
+            role = rng.choice(["viewer", "user", "admin"])
+            rules = self._random_rules(rng, "t1")
+            with patch("robothor.db.connection.get_connection") as mock_conn:
+                mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+                mock_cursor.fetchall.return_value = rules
+                for tool in self.TOOLS * 2:  # second pass is served from the memo
+                    assert check_tool_permission(role, "t1", tool) == _reference_check(
+                        role, tool, rules
+                    ), (rules, tool)
+                assert mock_cursor.execute.call_count == 1
+
+    def test_rules_cached_per_role_and_tenant(self):
+        with patch("robothor.db.connection.get_connection") as mock_conn:
+            mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+            mock_cursor.fetchall.return_value = [("*", "allow", "__default__")]
+
+            assert check_tool_permission("user", "t1", "a") is None
+            assert check_tool_permission("user", "t1", "b") is None
+            assert mock_cursor.execute.call_count == 1
+            assert check_tool_permission("user", "t2", "a") is None
+            assert check_tool_permission("viewer", "t1", "a") is None
+            assert mock_cursor.execute.call_count == 3
+
+    def test_permissions_changed_invalidates(self):
+        with patch("robothor.db.connection.get_connection") as mock_conn:
+            mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+            mock_cursor.fetchall.return_value = [("*", "allow", "__default__")]
+            assert check_tool_permission("user", "t1", "exec") is None
+
+            mock_cursor.fetchall.return_value = [("exec", "deny", "t1")]
+            assert check_tool_permission("user", "t1", "exec") is None  # cached
+            permissions_changed("t1")
+            assert check_tool_permission("user", "t1", "exec") is not None
+
+    def test_change_event_invalidates(self):
+        with patch("robothor.db.connection.get_connection") as mock_conn:
+            mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+            mock_cursor.fetchall.return_value = [("*", "allow", "__default__")]
+            check_tool_permission("user", "t1", "exec")
+            handle_permission_change_event({"type": "memory.block_written"})
+            check_tool_permission("user", "t1", "exec")
+            assert mock_cursor.execute.call_count == 1
+
+            handle_permission_change_event({"type": PERMISSION_CHANGE_EVENT})
+            check_tool_permission("user", "t1", "exec")
+            assert mock_cursor.execute.call_count == 2
+
+    def test_ttl_expiry(self):
+        with (
+            patch("robothor.db.connection.get_connection") as mock_conn,
+            patch("robothor.engine.permissions.PERMISSION_CACHE_TTL_S", -1.0),
+        ):
+            mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+            mock_cursor.fetchall.return_value = [("*", "allow", "__default__")]
+            check_tool_permission("user", "t1", "exec")
+            check_tool_permission("user", "t1", "exec")
+            assert mock_cursor.execute.call_count == 2
+
+    def test_db_error_not_cached(self):
+        with patch("robothor.db.connection.get_connection", side_effect=Exception("DB down")):
+            assert check_tool_permission("user", "t1", "exec") is not None
+        with patch("robothor.db.connection.get_connection") as mock_conn:
+            mock_cursor = mock_conn.return_value.__enter__.return_value.cursor.return_value
+            mock_cursor.fetchall.return_value = [("*", "allow", "__default__")]
+            assert check_tool_permission("user", "t1", "exec") is None
+
+    def test_compiled_memoizes_decisions(self):
+        compiled = CompiledPermissions("viewer", [("search_*", "allow"), ("*", "deny")])
+        assert compiled.check("search_memory") is None
+        assert compiled.check("create_person") is not None
+        assert compiled._decisions == {
+            "search_memory": None,
+            "create_person": "Role 'viewer' denied 'create_person' (pattern: *)",
+        }
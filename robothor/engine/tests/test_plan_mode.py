@@ -229,7 +229,7 @@ def chat_app(engine_config, mock_runner):
 
     _sessions.clear()
     app = FastAPI()
-    with patch("robothor.engine.chat.load_all_sessions", return_value={}):
+    with patch("robothor.engine.chat.iter_sessions", return_value=[]):
         init_chat(mock_runner, engine_config)
     app.include_router(router)
     yield app
@@ -89,3 +89,23 @@ def test_format_plan_context_empty_plan():
     """Empty plan produces empty string."""
     plan = PlanResult(success=False)
     assert format_plan_context(plan) == ""
+
+
+@pytest.mark.asyncio
+async def test_generate_plan_repeated_task_served_from_cache():
+    """An identical task and tool list reuses the cached plan."""
+    import litellm
+
+    plan_data = {"difficulty": "simple", "estimated_steps": 1, "plan": [], "risks": []}
+    response = litellm.ModelResponse(
+        choices=[{"message": {"role": "assistant", "content": json.dumps(plan_data)}}]
+    )
+
+    with patch("litellm.acompletion", return_value=response) as mock_call:
+        first = await generate_plan("Daily digest", ["read_file"], "test-model")
+        second = await generate_plan("Daily digest", ["read_file"], "test-model")
+
+    mock_call.assert_called_once()
+    assert mock_call.call_args.kwargs["temperature"] == 0.0
+    assert first.plan == second.plan
+    assert second.difficulty == "simple"
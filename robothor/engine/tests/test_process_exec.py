@@ -0,0 +1,164 @@
+"""Tests for bounded streaming command execution (exec tool)."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+
+import pytest
+
+from robothor.engine import process_exec
+from robothor.engine.process_exec import HeadTailBuffer, run_command
+from robothor.engine.tools import _execute_tool
+
+
+def _alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+async def _wait_dead(pid: int, within: float = 2.0) -> bool:
+    deadline = time.monotonic() + within
+    while time.monotonic() < deadline:
+        if not _alive(pid):
+            return True
+        await asyncio.sleep(0.05)
+    return False
+
+
+class TestHeadTailBuffer:
+    def test_small_output_kept_whole(self):
+        buf = HeadTailBuffer(4, 4)
+        buf.write(b"abc")
+        buf.write(b"defgh")
+        assert buf.getvalue() == "abcdefgh"
+        assert not buf.truncated
+        assert buf.total == 8
+
+    def test_keeps_head_and_tail(self):
+        buf = HeadTailBuffer(3, 3)
+        for chunk in (b"012", b"3456", b"789"):
+            buf.write(chunk)
+        assert buf.truncated
+        assert buf.getvalue() == "012\n... [4 bytes omitted] ...\n789"
+
+    def test_memory_bounded(self):
+        buf = HeadTailBuffer(10, 10)
+        for _ in range(10_000):
+            buf.write(b"x" * 100)
+        assert len(buf._tail) <= 20
+        assert buf.total == 1_000_000
+
+
+class TestRunCommand:
+    @pytest.mark.asyncio
+    async def test_captures_streams_and_exit_code(self, tmp_path):
+        result = await run_command(
+            "echo out; echo err >&2; pwd; exit 3", timeout=5, cwd=str(tmp_path)
+        )
+        assert result.exit_code == 3
+        assert result.stdout == f"out\n{tmp_path}\n"
+        assert result.stderr == "err\n"
+        assert result.stdout_bytes == len(result.stdout)
+        assert not result.timed_out
+        assert result.duration_ms >= 0
+
+    @pytest.mark.asyncio
+    async def test_large_output_bounded(self):
+        result = await run_command(
+            "head -c 3000000 /dev/zero | tr '\\0' a; echo END", timeout=10, stdout_limits=(5, 5)
+        )
+        assert result.stdout_bytes == 3_000_004
+        assert result.truncated
+        assert result.stdout.startswith("aaaaa\n... [2999994 bytes omitted]")
+        assert result.stdout.endswith("aEND\n")
+
+    @pytest.mark.asyncio
+    async def test_stdin_is_closed(self):
+        result = await run_command("cat", timeout=5)
+        assert result.exit_code == 0
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_process_group(self, tmp_path):
+        pidfile = tmp_path / "child.pid"
+        result = await run_command(
+            f"sleep 30 & echo $! > {pidfile}; echo started; wait", timeout=0.5
+        )
+        assert result.timed_out
+        assert result.exit_code is None
+        assert result.stdout == "started\n"
+        assert await _wait_dead(int(pidfile.read_text()))
+
+    @pytest.mark.asyncio
+    async def test_cancellation_kills_process_group(self, tmp_path):
+        pidfile = tmp_path / "child.pid"
+        task = asyncio.create_task(run_command(f"sleep 30 & echo $! > {pidfile}; wait", timeout=30))
+        for _ in range(50):
+            if pidfile.exists() and pidfile.read_text().strip():
+                break
+            await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        assert await _wait_dead(int(pidfile.read_text()))
+
+    @pytest.mark.asyncio
+    async def test_streams_progress(self, monkeypatch):
+        monkeypatch.setattr(process_exec, "PROGRESS_INTERVAL_S", 0.0)
+        events: list[dict] = []
+
+        async def on_output(event):
+            events.append(event)
+
+        await run_command(
+            "for i in 1 2 3; do echo $i; sleep 0.1; done; echo bad >&2",
+            timeout=5,
+            on_output=on_output,
+        )
+        stdout = [e["text"] for e in events if e["stream"] == "stdout"]
+        assert "".join(stdout) == "1\n2\n3\n"
+        assert len(stdout) >= 2
+        assert {"stream": "stderr", "text": "bad\n"} in events
+
+    @pytest.mark.asyncio
+    async def test_progress_throttled_and_failures_ignored(self):
+        calls = 0
+
+        async def on_output(event):
+            nonlocal calls
+            calls += 1
+            raise RuntimeError("listener gone")
+
+        result = await run_command(
+            "for i in $(seq 20); do echo $i; sleep 0.01; done", timeout=5, on_output=on_output
+        )
+        assert result.exit_code == 0
+        assert calls <= 3  # first chunk, then at most one per interval, then the final flush
+
+
+class TestExecTool:
+    @pytest.mark.asyncio
+    async def test_reports_sizes_and_progress(self, monkeypatch):
+        monkeypatch.setattr(process_exec, "PROGRESS_INTERVAL_S", 0.0)
+        events: list[dict] = []
+
+        async def on_progress(event):
+            events.append(event)
+
+        result = await _execute_tool("exec", {"command": "echo hi"}, on_progress=on_progress)
+        assert result["stdout"] == "hi\n"
+        assert result["stdout_bytes"] == 3
+        assert result["stderr_bytes"] == 0
+        assert "duration_ms" in result
+        assert "truncated" not in result
+        assert events == [{"stream": "stdout", "text": "hi\n"}]
+
+    @pytest.mark.asyncio
+    async def test_timeout_keeps_partial_output(self):
+        result = await _execute_tool("exec", {"command": "echo early; sleep 30", "timeout": 1})
+        assert "timed out" in result["error"]
+        assert result["stdout"] == "early\n"
@@ -329,6 +329,37 @@ class TestBrokenModelTracking:
         # model-b handles both iterations
         assert models_called.count("model-b") >= 2
 
+    @pytest.mark.asyncio
+    async def test_open_circuit_from_earlier_runs_tried_last(
+        self, runner, sample_agent_config, mock_litellm_response
+    ):
+        """A new run starts on the fallback when the primary's circuit is open."""
+        from robothor.engine.model_health import get_model_health
+
+        sample_agent_config.model_primary = "model-a"
+        sample_agent_config.model_fallbacks = ["model-b"]
+        for _ in range(3):
+            get_model_health().record_failure("model-a", TimeoutError())
+
+        models_called: list[str] = []
+
+        async def mock_completion(**kwargs):
+            models_called.append(kwargs["model"])
+            return mock_litellm_response(content="Done", model=kwargs["model"])
+
+        with patch("robothor.engine.runner.create_run"):
+            with patch("robothor.engine.runner.update_run"):
+                with patch("robothor.engine.runner.create_step"):
+                    with patch("litellm.acompletion", side_effect=mock_completion):
+                        run = await runner.execute(
+                            "test-agent",
+                            "hello",
+                            agent_config=sample_agent_config,
+                        )
+
+        assert run.status == RunStatus.COMPLETED
+        assert models_called == ["model-b"]
+
     @pytest.mark.asyncio
     async def test_all_models_broken_immediate_failure(
         self, runner, sample_agent_config, mock_litellm_response
@@ -586,6 +617,59 @@ class TestOnToolCallback:
         assert end_evt["error"] is None
         assert "result_preview" in end_evt
 
+    @pytest.mark.asyncio
+    async def test_handler_progress_forwarded_as_tool_progress(
+        self, runner, sample_agent_config, mock_litellm_response
+    ):
+        """Progress reported by a handler reaches on_tool between start and end."""
+        tc = MagicMock()
+        tc.id = "call_1"
+        tc.function.name = "exec"
+        tc.function.arguments = json.dumps({"command": "make"})
+
+        response1 = mock_litellm_response(content=None, tool_calls=[tc])
+        response1.choices[0].message.content = None
+        response2 = mock_litellm_response(content="Done.")
+        responses = iter([response1, response2])
+
+        async def mock_completion(**kwargs):
+            return next(responses)
+
+        async def fake_execute(name, args, **kwargs):
+            await kwargs["on_progress"]({"stream": "stdout", "text": "building\n"})
+            return {"stdout": "building\n", "exit_code": 0}
+
+        runner.registry.execute = AsyncMock(side_effect=fake_execute)
+        runner.registry.build_for_agent.return_value = [
+            {"type": "function", "function": {"name": "exec"}}
+        ]
+        runner.registry.get_tool_names.return_value = ["exec"]
+
+        tool_events: list[dict] = []
+
+        async def on_tool(event: dict) -> None:
+            tool_events.append(event)
+
+        with patch("robothor.engine.runner.create_run"):
+            with patch("robothor.engine.runner.update_run"):
+                with patch("robothor.engine.runner.create_step"):
+                    with patch("litellm.acompletion", side_effect=mock_completion):
+                        await runner.execute(
+                            "test-agent",
+                            "hello",
+                            agent_config=sample_agent_config,
+                            on_tool=on_tool,
+                        )
+
+        assert [e["event"] for e in tool_events] == ["tool_start", "tool_progress", "tool_end"]
+        assert tool_events[1] == {
+            "event": "tool_progress",
+            "tool": "exec",
+            "call_id": "call_1",
+            "stream": "stdout",
+            "text": "building\n",
+        }
+
     @pytest.mark.asyncio
     async def test_on_tool_errors_are_swallowed(
         self, runner, sample_agent_config, mock_litellm_response
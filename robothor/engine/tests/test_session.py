@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
+from robothor.engine.context import estimate_tokens
 from robothor.engine.models import RunStatus, StepType, TriggerType
 from robothor.engine.session import AgentSession
 
@@ -185,3 +188,49 @@ class TestContextPreservation:
         assert session.run.trigger_detail == "0 * * * *"
         assert session.run.tenant_id == "custom-tenant"
         assert session.run.correlation_id == "corr-123"
+
+
+class TestTokenAccounting:
+    def test_counters_follow_recording_and_thinning(self):
+        session = AgentSession("test-agent")
+        session.start("system prompt", "do the thing", [])
+        for i in range(4):
+            session.record_llm_call(
+                model="m",
+                assistant_message={
+                    "role": "assistant",
+                    "content": None,
+                    "tool_calls": [
+                        {"id": f"c{i}", "function": {"name": "exec", "arguments": "{}"}}
+                    ],
+                },
+            )
+            session.record_tool_call(
+                tool_name="exec",
+                tool_input={},
+                tool_output={"stdout": "line\n" * 500},
+                tool_call_id=f"c{i}",
+            )
+            assert session.token_count == estimate_tokens(list(session.messages))
+
+        before = session.token_count
+        assert session.thin_previous_tool_results(len(session.messages) - 1) > 0
+        assert session.token_count < before
+        assert session.token_count == estimate_tokens(list(session.messages))
+
+    def test_assigning_messages_rewraps(self):
+        session = AgentSession("test-agent")
+        session.messages = [{"role": "user", "content": "abcd" * 25}]
+        assert session.token_count == 25
+        session.messages.append({"role": "assistant", "content": "abcd" * 25})
+        assert session.token_count == 50
+
+    def test_use_tokenizer_for(self):
+        session = AgentSession("test-agent")
+        session.messages = [{"role": "user", "content": "one two three four"}]
+        with patch("robothor.engine.session.get_tokenizer", return_value=lambda t: len(t.split())):
+            assert session.use_tokenizer_for("openrouter/anthropic/claude") is True
+        assert session.token_count == 4
+        with patch("robothor.engine.session.get_tokenizer", return_value=None):
+            assert session.use_tokenizer_for("ollama/qwen3") is False
+        assert session.token_count == estimate_tokens(list(session.messages))
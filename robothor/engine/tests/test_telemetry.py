@@ -45,6 +45,15 @@ class TestTraceContext:
         assert data["span_count"] == 1
         assert len(data["spans"]) == 1
 
+    def test_add_span_with_external_timing(self):
+        ctx = TraceContext()
+        s = ctx.add_span("warmup.history", 100.0, 100.25, status="error", result="timeout")
+        assert ctx.spans == [s]
+        assert s.duration_ms == 250
+        assert s.status == "error"
+        assert s.attributes == {"result": "timeout"}
+        assert s.parent_span_id is None
+
     def test_publish_metrics_best_effort(self):
         """publish_metrics doesn't raise even when Redis is unavailable."""
         ctx = TraceContext(run_id="r1", agent_id="a1")
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import importlib
+import json
 import subprocess
+import sys
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -147,8 +151,7 @@ class TestToolExecution:
     @pytest.mark.asyncio
     async def test_exec_tool_timeout(self):
         """Shell exec respects timeout."""
-        with patch("subprocess.run", side_effect=subprocess.TimeoutExpired("sleep", 30)):
-            result = await _execute_tool("exec", {"command": "sleep 60"})
+        result = await _execute_tool("exec", {"command": "sleep 60", "timeout": 1})
         assert "error" in result
         assert "timed out" in result["error"].lower()
 
@@ -606,6 +609,82 @@ class TestMergeAndAliasTools:
         assert "error" in result
 
 
+_LOAD_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+from robothor.engine.tools.dispatch import _get_handlers
+handlers = _get_handlers()
+handlers["wait_seconds"]
+if sys.argv[1] == "eager":
+    handlers.load_all()
+seconds = time.perf_counter() - start
+# VmRSS rather than ru_maxrss: the peak is inherited from the forking parent.
+with open("/proc/self/status") as f:
+    rss_kb = next(int(line.split()[1]) for line in f if line.startswith("VmRSS:"))
+print(json.dumps({
+    "seconds": seconds,
+    "rss_kb": rss_kb,
+    "modules": sorted(sys.modules),
+}))
+"""
+
+
+def _probe_handler_load(mode: str) -> dict[str, Any]:
+    out = subprocess.run(
+        [sys.executable, "-c", _LOAD_PROBE, mode],
+        capture_output=True,
+        text=True,
+        timeout=60,
+        check=True,
+    )
+    result: dict[str, Any] = json.loads(out.stdout.strip().splitlines()[-1])
+    return result
+
+
+class TestLazyHandlers:
+    def test_index_matches_module_handlers(self):
+        """The static index lists exactly the tools each module registers."""
+        from robothor.engine.tools.dispatch import HANDLER_MODULES
+
+        for module, tools in HANDLER_MODULES.items():
+            mod = importlib.import_module(f"robothor.engine.tools.handlers.{module}")
+            assert set(tools) == set(mod.HANDLERS), module
+        all_tools = [t for tools in HANDLER_MODULES.values() for t in tools]
+        assert len(all_tools) == len(set(all_tools))
+
+    def test_loads_only_the_called_module(self):
+        from robothor.engine.tools.dispatch import _TOOL_MODULE, LazyHandlerMap
+
+        handlers = LazyHandlerMap(_TOOL_MODULE)
+        assert handlers.loaded_modules == frozenset()
+        assert "todo_write" in handlers
+        assert handlers.loaded_modules == frozenset()
+
+        handler = handlers["todo_write"]
+        assert callable(handler)
+        assert handlers.loaded_modules == frozenset({"todolist"})
+        assert handlers.get("no_such_tool") is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self):
+        result = await _execute_tool("no_such_tool", {})
+        assert result == {"error": "Unknown tool: no_such_tool"}
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="reads /proc/self/status")
+    def test_import_time_and_rss_regression(self):
+        """A single-tool process must not pay for every handler's import stack."""
+        lazy = _probe_handler_load("lazy")
+        eager = _probe_handler_load("eager")
+
+        prefix = "robothor.engine.tools.handlers."
+        lazy_handlers = {m[len(prefix) :] for m in lazy["modules"] if m.startswith(prefix)}
+        for heavy in ("browser", "desktop", "experiment", "benchmark", "github_api", "jira"):
+            assert heavy not in lazy_handlers
+        assert len(lazy["modules"]) < len(eager["modules"])
+        assert lazy["rss_kb"] < eager["rss_kb"]
+        assert lazy["seconds"] < eager["seconds"]
+
+
 class TestRegistrySingleton:
     def test_singleton(self):
         """get_registry returns the same instance."""
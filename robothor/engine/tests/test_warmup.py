@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import os
+import threading
+import time
 from datetime import UTC, datetime, timedelta
 from typing import TYPE_CHECKING
 from unittest.mock import patch
@@ -12,8 +15,12 @@ from robothor.engine.models import AgentConfig
 from robothor.engine.warmup import (
     _CONTEXT_HOOKS,
     MAX_WARMTH_CHARS,
+    SectionTiming,
+    WarmupSection,
     build_interactive_preamble,
+    build_sections,
     build_warmth_preamble,
+    clear_section_cache,
 )
 
 if TYPE_CHECKING:
@@ -39,6 +46,15 @@ def warm_config() -> AgentConfig:
 # Patch targets — functions are imported lazily inside warmup.py
 TRACKING_PATCH = "robothor.engine.tracking.get_schedule"
 BLOCK_PATCH = "robothor.memory.blocks.read_block"
+BLOCKS_PATCH = "robothor.memory.blocks.read_blocks"
+
+
+def _patch_blocks(value: dict):
+    """Patch the batch block reader so every requested block returns ``value``."""
+    return patch(
+        BLOCKS_PATCH,
+        side_effect=lambda names, **_kw: {name: dict(value) for name in names},
+    )
 
 
 class TestBuildWarmthPreamble:
@@ -94,7 +110,7 @@ class TestBuildWarmthPreamble:
         )
         with (
             patch(TRACKING_PATCH, return_value=None),
-            patch(BLOCK_PATCH, return_value={"content": "Key finding: system is healthy."}),
+            _patch_blocks({"content": "Key finding: system is healthy."}),
         ):
             result = build_warmth_preamble(config, tmp_path)
         assert "MEMORY BLOCKS" in result
@@ -112,7 +128,7 @@ class TestBuildWarmthPreamble:
         try:
             with (
                 patch(TRACKING_PATCH, return_value=None),
-                patch(BLOCK_PATCH, return_value={"content": ""}),
+                _patch_blocks({"content": ""}),
             ):
                 result = build_warmth_preamble(config, tmp_path)
             assert result == ""
@@ -192,7 +208,7 @@ class TestBuildWarmthPreamble:
 
         with (
             patch(TRACKING_PATCH, return_value=None),
-            patch(BLOCK_PATCH, return_value={"content": "x" * 5000}),
+            _patch_blocks({"content": "x" * 5000}),
         ):
             result = build_warmth_preamble(config, tmp_path)
         assert len(result) <= MAX_WARMTH_CHARS + 50  # allow for truncation marker
@@ -246,7 +262,7 @@ class TestBuildWarmthPreamble:
 
         with (
             patch(TRACKING_PATCH, side_effect=schedule_side_effect),
-            patch(BLOCK_PATCH, return_value={"content": "block content here"}),
+            _patch_blocks({"content": "block content here"}),
         ):
             result = build_warmth_preamble(config, tmp_path)
 
@@ -349,3 +365,117 @@ class TestBuildInteractivePreamble:
             )
 
             assert "Alice works at Acme" in result
+
+
+class TestSectionBuilders:
+    """Concurrent, timed and cached section building."""
+
+    def test_sections_run_concurrently_in_order(self) -> None:
+        barrier = threading.Barrier(3, timeout=2)
+
+        def _section(text: str):
+            def build() -> str:
+                barrier.wait()  # only passes if all three run at once
+                return text
+
+            return build
+
+        timings: list[SectionTiming] = []
+        texts = build_sections([WarmupSection(n, _section(n)) for n in ("a", "b", "c")], timings)
+        assert texts == ["a", "b", "c"]
+        assert [t.name for t in timings] == ["a", "b", "c"]
+        assert {t.status for t in timings} == {"built"}
+
+    def test_timeout_and_error_are_dropped(self) -> None:
+        release = threading.Event()
+
+        def slow() -> str:
+            release.wait(2)
+            return "late"
+
+        def broken() -> str:
+            raise RuntimeError("boom")
+
+        timings: list[SectionTiming] = []
+        start = time.monotonic()
+        try:
+            texts = build_sections(
+                [
+                    WarmupSection("slow", slow, timeout_s=0.05),
+                    WarmupSection("broken", broken),
+                    WarmupSection("empty", lambda: None),
+                    WarmupSection("ok", lambda: "fine"),
+                ],
+                timings,
+            )
+        finally:
+            release.set()
+        assert time.monotonic() - start < 1
+        assert texts == ["fine"]
+        assert [(t.name, t.status) for t in timings] == [
+            ("slow", "timeout"),
+            ("broken", "error"),
+            ("empty", "empty"),
+            ("ok", "built"),
+        ]
+
+    def test_stamp_cache(self) -> None:
+        clear_section_cache()
+        calls = []
+        version = [1]
+
+        def build() -> str:
+            calls.append(1)
+            return f"v{version[0]}"
+
+        def section() -> WarmupSection:
+            return WarmupSection("versioned", build, stamp=lambda: version[0])
+
+        timings: list[SectionTiming] = []
+        assert build_sections([section()], timings) == ["v1"]
+        assert build_sections([section()], timings) == ["v1"]
+        version[0] = 2
+        assert build_sections([section()], timings) == ["v2"]
+        assert len(calls) == 2
+        assert [t.status for t in timings] == ["built", "cached", "built"]
+
+    def test_context_files_cached_until_mtime_changes(self, tmp_path: Path) -> None:
+        config = AgentConfig(id="test-agent", name="Test", warmup_context_files=["status.md"])
+        status_file = tmp_path / "status.md"
+        status_file.write_text("first")
+
+        def statuses(timings: list[SectionTiming]) -> str:
+            return next(t.status for t in timings if t.name == "context_files")
+
+        with patch(TRACKING_PATCH, return_value=None):
+            first: list[SectionTiming] = []
+            assert "first" in build_warmth_preamble(config, tmp_path, timings=first)
+            second: list[SectionTiming] = []
+            assert "first" in build_warmth_preamble(config, tmp_path, timings=second)
+        assert statuses(first) == "built"
+        assert statuses(second) == "cached"
+
+        status_file.write_text("second version")
+        future = time.time() + 5
+        os.utime(status_file, (future, future))
+        with patch(TRACKING_PATCH, return_value=None):
+            third: list[SectionTiming] = []
+            assert "second version" in build_warmth_preamble(config, tmp_path, timings=third)
+        assert statuses(third) == "built"
+
+    def test_warmth_preamble_reports_every_section(self, tmp_path: Path) -> None:
+        config = AgentConfig(id="test-agent", name="Test")
+        timings: list[SectionTiming] = []
+        with patch(TRACKING_PATCH, return_value=None):
+            build_warmth_preamble(config, tmp_path, timings=timings)
+        assert [t.name for t in timings] == [
+            "history",
+            "memory_blocks",
+            "context_files",
+            "peers",
+            "context_hooks",
+            "breadcrumbs",
+            "stale_preferences",
+            "agent_hooks",
+        ]
+        assert all(t.duration_ms >= 0 for t in timings)
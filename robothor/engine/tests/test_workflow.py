@@ -0,0 +1,299 @@
+"""Tests for workflow parsing and dependency-aware step scheduling."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from robothor.engine import dedup
+from robothor.engine.models import RunStatus, WorkflowStepStatus
+from robothor.engine.workflow import (
+    WorkflowEngine,
+    _dependency_graph,
+    _step_dependencies,
+    parse_workflow,
+)
+
+
+def _tool(step_id: str, **extra):
+    return {"id": step_id, "type": "tool", "tool_name": "probe", **extra}
+
+
+class _Probe:
+    """Fake tool registry recording overlap between tool calls."""
+
+    def __init__(self, delays: dict[str, float] | None = None, fail: set[str] | None = None):
+        self.delays = delays or {}
+        self.fail = fail or set()
+        self.started: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def execute(self, tool_name, args, **kwargs):
+        name = args["name"]
+        self.started.append(name)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(name, 0.01))
+        finally:
+            self.active -= 1
+        if name in self.fail:
+            return {"error": f"{name} broke"}
+        return {"name": name, "seen": args.get("seen", "")}
+
+
+def _engine(probe: _Probe) -> WorkflowEngine:
+    config = MagicMock()
+    config.tenant_id = "test-tenant"
+    runner = MagicMock()
+    runner.registry = probe
+    return WorkflowEngine(config, runner)
+
+
+def _register(engine: WorkflowEngine, data: dict):
+    wf = parse_workflow(data)
+    engine._workflows[wf.id] = wf
+    return wf
+
+
+@pytest.fixture(autouse=True)
+def _no_persistence():
+    """Keep run and step records out of the database."""
+    with (
+        patch.object(WorkflowEngine, "_persist_run_start"),
+        patch.object(WorkflowEngine, "_persist_run_end"),
+        patch.object(WorkflowEngine, "_persist_step"),
+    ):
+        yield
+
+
+@pytest.fixture(autouse=True)
+def _clear_dedup():
+    dedup.clear()
+    yield
+    dedup.clear()
+
+
+class TestDependencyInference:
+    def test_template_and_explicit_refs(self):
+        wf = parse_workflow(
+            {
+                "id": "wf",
+                "steps": [
+                    _tool("a", tool_args={"name": "a"}),
+                    _tool("b", tool_args={"name": "b"}),
+                    _tool("c", tool_args={"name": "{{ steps.a.output_text }}"}),
+                    {
+                        "id": "d",
+                        "type": "transform",
+                        "expression": "{{ steps['b'].output_text }} {{ trigger }}",
+                        "depends_on": ["c"],
+                    },
+                ],
+            }
+        )
+        deps = {s.id: _step_dependencies(s) for s in wf.steps}
+        assert deps == {"a": set(), "b": set(), "c": {"a"}, "d": {"b", "c"}}
+
+    def test_hyphenated_ids_via_subscript(self):
+        wf = parse_workflow(
+            {
+                "id": "wf",
+                "steps": [
+                    _tool("collect-jira"),
+                    {"id": "sum", "type": "transform", "expression": '{{ steps["collect-jira"] }}'},
+                ],
+            }
+        )
+        assert _step_dependencies(wf.steps[1]) == {"collect-jira"}
+
+    def test_unknown_depends_on_rejected(self):
+        with pytest.raises(ValueError, match="unknown steps"):
+            parse_workflow({"id": "wf", "steps": [_tool("a", depends_on=["nope"])]})
+
+    def test_cycle_rejected_for_parallel_workflows(self):
+        data = {
+            "id": "wf",
+            "max_parallel": 2,
+            "steps": [_tool("a", depends_on=["b"]), _tool("b", depends_on=["a"])],
+        }
+        with pytest.raises(ValueError, match="cycle"):
+            parse_workflow(data)
+        # Sequential workflows run in file order, so depends_on is never scheduled
+        data["max_parallel"] = 1
+        assert len(parse_workflow(data).steps) == 2
+
+    def test_graph_ignores_refs_to_unknown_steps(self):
+        wf = parse_workflow(
+            {
+                "id": "wf",
+                "max_parallel": 2,
+                "steps": [_tool("a", tool_args={"name": "{{ steps.missing.output_text }}"})],
+            }
+        )
+        assert _dependency_graph(wf) == {"a": set()}
+
+    def test_max_parallel_defaults_to_sequential(self):
+        assert parse_workflow({"id": "wf", "steps": []}).max_parallel == 1
+
+
+class TestParallelExecution:
+    @pytest.mark.asyncio
+    async def test_fan_out_then_join(self):
+        probe = _Probe(delays={"a": 0.1, "b": 0.1, "c": 0.1})
+        engine = _engine(probe)
+        _register(
+            engine,
+            {
+                "id": "fan",
+                "max_parallel": 3,
+                "steps": [
+                    _tool("a", tool_args={"name": "a"}),
+                    _tool("b", tool_args={"name": "b"}),
+                    _tool("c", tool_args={"name": "c"}),
+                    _tool(
+                        "join",
+                        tool_args={"name": "join", "seen": "{{ steps.a.status }}"},
+                        depends_on=["b", "c"],
+                    ),
+                ],
+            },
+        )
+
+        with patch.object(engine, "_persist_step") as persist_step:
+            run = await engine.execute("fan")
+
+        assert run.status == RunStatus.COMPLETED
+        assert probe.peak == 3
+        assert probe.started[-1] == "join"
+        assert run.context["steps"]["join"]["tool_output"]["seen"] == "completed"
+        assert [r.step_id for r in run.step_results][-1] == "join"
+        # Each result is persisted as it completes
+        assert persist_step.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_respects_limit(self):
+        probe = _Probe()
+        engine = _engine(probe)
+        _register(
+            engine,
+            {
+                "id": "wide",
+                "max_parallel": 2,
+                "steps": [_tool(f"s{i}", tool_args={"name": f"s{i}"}) for i in range(6)],
+            },
+        )
+        run = await engine.execute("wide")
+        assert run.status == RunStatus.COMPLETED
+        assert probe.peak == 2
+        assert len(run.step_results) == 6
+
+    @pytest.mark.asyncio
+    async def test_abort_stops_new_steps(self):
+        probe = _Probe(delays={"slow": 0.1}, fail={"bad"})
+        engine = _engine(probe)
+        _register(
+            engine,
+            {
+                "id": "abort",
+                "max_parallel": 2,
+                "steps": [
+                    _tool("bad", tool_args={"name": "bad"}),
+                    _tool("slow", tool_args={"name": "slow"}),
+                    _tool("after", tool_args={"name": "after"}, depends_on=["bad"]),
+                ],
+            },
+        )
+        run = await engine.execute("abort")
+        assert run.status == RunStatus.FAILED
+        assert run.error_message is not None
+        assert "bad" in run.error_message
+        assert "after" not in probe.started
+        # The step already in flight still finishes and is recorded
+        statuses = {r.step_id: r.status for r in run.step_results}
+        assert statuses == {
+            "bad": WorkflowStepStatus.FAILED,
+            "slow": WorkflowStepStatus.COMPLETED,
+        }
+
+    @pytest.mark.asyncio
+    async def test_skip_lets_dependents_run(self):
+        probe = _Probe(fail={"bad"})
+        engine = _engine(probe)
+        _register(
+            engine,
+            {
+                "id": "skip",
+                "max_parallel": 2,
+                "steps": [
+                    _tool("bad", tool_args={"name": "bad"}, on_failure="skip"),
+                    _tool("after", tool_args={"name": "after"}, depends_on=["bad"]),
+                ],
+            },
+        )
+        run = await engine.execute("skip")
+        assert run.status == RunStatus.COMPLETED
+        assert probe.started == ["bad", "after"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_cancels_running_steps(self):
+        probe = _Probe(delays={"a": 5, "b": 5})
+        engine = _engine(probe)
+        _register(
+            engine,
+            {
+                "id": "slow",
+                "max_parallel": 2,
+                "timeout_seconds": 0.05,
+                "steps": [
+                    _tool("a", tool_args={"name": "a"}),
+                    _tool("b", tool_args={"name": "b"}),
+                ],
+            },
+        )
+        run = await engine.execute("slow")
+        assert run.status == RunStatus.TIMEOUT
+        assert probe.active == 0
+
+    @pytest.mark.asyncio
+    async def test_branching_workflow_stays_sequential(self):
+        probe = _Probe()
+        engine = _engine(probe)
+        _register(
+            engine,
+            {
+                "id": "branchy",
+                "max_parallel": 4,
+                "steps": [
+                    _tool("a", tool_args={"name": "a"}),
+                    {
+                        "id": "check",
+                        "type": "condition",
+                        "input": "{{ steps.a.status }}",
+                        "branches": [{"when": "value == 'completed'", "goto": "c"}],
+                    },
+                    _tool("b", tool_args={"name": "b"}),
+                    _tool("c", tool_args={"name": "c"}),
+                ],
+            },
+        )
+        run = await engine.execute("branchy")
+        assert run.status == RunStatus.COMPLETED
+        assert probe.peak == 1
+        assert probe.started == ["a", "c"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_default_runs_in_order(self):
+        probe = _Probe()
+        engine = _engine(probe)
+        _register(
+            engine,
+            {"id": "seq", "steps": [_tool(n, tool_args={"name": n}) for n in "cba"]},
+        )
+        run = await engine.execute("seq")
+        assert run.status == RunStatus.COMPLETED
+        assert probe.started == ["c", "b", "a"]
+        assert probe.peak == 1
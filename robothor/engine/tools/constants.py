@@ -33,6 +33,9 @@ BROWSER_TOOLS = frozenset({"browser"})
 # In-conversation todo list
 TODO_TOOLS = frozenset({"todo_write"})
 
+# Paging through offloaded tool results
+ARTIFACT_TOOLS = frozenset({"read_artifact"})
+
 # Desktop control tools (computer use)
 DESKTOP_TOOLS = frozenset(
     {
@@ -150,11 +153,13 @@ READONLY_TOOLS: frozenset[str] = frozenset(
         # File/system
         "read_file",
         "list_directory",
+        "read_artifact",
         # Web
         "web_fetch",
         "web_search",
         # Memory read-only tools
         "search_memory",
+        "search_memories",
         "get_entity",
         "get_knowledge_gaps",
         "memory_block_read",
@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
+import importlib
 import logging
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any, cast
 
 from robothor.constants import DEFAULT_TENANT
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Iterator
+
     from robothor.config import Config
 
 logger = logging.getLogger(__name__)
@@ -24,6 +28,10 @@ class ToolContext:
     user_id: str = ""
     user_role: str = ""
     accessible_tenant_ids: tuple[str, ...] = ()
+    # Receives incremental progress events from long-running handlers (e.g. exec output)
+    on_progress: Callable[[dict[str, Any]], Awaitable[None]] | None = field(
+        default=None, compare=False, repr=False
+    )
 
 
 def get_db() -> Any:
@@ -47,86 +55,278 @@ def _cfg() -> Config:
     return get_config()
 
 
-def _collect_handlers() -> dict[str, Any]:
-    """Collect all HANDLERS dicts from handler modules."""
-    from robothor.engine.tools.handlers import (  # noqa: E501
-        apollo,
-        benchmark,
-        browser,
-        crm,
-        desktop,
-        devops_metrics,
-        experiment,
-        federation,
-        filesystem,
-        git,
-        github_api,
-        gws,
-        identity,
-        jira,
-        mcp_client,
-        memory,
-        messaging,
-        observability,
-        pdf,
-        pf,
-        reasoning,
-        reports,
-        skills,
-        spawn,
-        timing,
-        todolist,
-        vault,
-        vision,
-        voice,
-        web,
-    )
-
-    all_handlers: dict[str, Any] = {}
-    for mod in [
-        memory,
-        vision,
-        web,
-        apollo,
-        filesystem,
-        crm,
-        browser,
-        desktop,
-        experiment,
-        benchmark,
-        git,
-        gws,
-        vault,
-        observability,
-        voice,
-        spawn,
-        pdf,
-        reasoning,
-        federation,
-        pf,
-        messaging,
-        skills,
-        jira,
-        github_api,
-        devops_metrics,
-        identity,
-        reports,
-        mcp_client,
-        timing,
-        todolist,
-    ]:
-        all_handlers.update(mod.HANDLERS)
-    return all_handlers
+# Static tool → handler module index. Handler modules are imported on the
+# first call to one of their tools, so processes that never touch e.g. the
+# browser or desktop tools never pay for their import stacks. Keep in sync
+# with each module's HANDLERS (enforced by test_tools.TestLazyHandlers).
+HANDLER_MODULES: dict[str, tuple[str, ...]] = {
+    "apollo": (
+        "apollo_search_people",
+        "apollo_enrich_person",
+        "apollo_search_companies",
+        "apollo_enrich_company",
+    ),
+    "benchmark": (
+        "benchmark_define",
+        "benchmark_run",
+        "benchmark_compare",
+    ),
+    "artifacts": ("read_artifact",),
+    "browser": ("browser",),
+    "crm": (
+        "create_person",
+        "get_person",
+        "update_person",
+        "list_people",
+        "delete_person",
+        "create_company",
+        "get_company",
+        "update_company",
+        "list_companies",
+        "delete_company",
+        "create_note",
+        "get_note",
+        "list_notes",
+        "update_note",
+        "delete_note",
+        "create_task",
+        "get_task",
+        "list_tasks",
+        "update_task",
+        "delete_task",
+        "resolve_task",
+        "list_agent_tasks",
+        "list_my_tasks",
+        "list_tasks_summary",
+        "approve_task",
+        "reject_task",
+        "send_notification",
+        "get_inbox",
+        "ack_notification",
+        "get_metadata_objects",
+        "get_object_metadata",
+        "search_records",
+        "list_conversations",
+        "get_conversation",
+        "list_messages",
+        "create_message",
+        "toggle_conversation_status",
+        "merge_people",
+        "merge_contacts",
+        "merge_companies",
+        "review_agent",
+        "get_agent_reviews",
+    ),
+    "desktop": (
+        "desktop_screenshot",
+        "desktop_click",
+        "desktop_double_click",
+        "desktop_right_click",
+        "desktop_mouse_move",
+        "desktop_drag",
+        "desktop_scroll",
+        "desktop_type",
+        "desktop_key",
+        "desktop_window_list",
+        "desktop_window_focus",
+        "desktop_launch",
+        "desktop_describe",
+    ),
+    "devops_metrics": (
+        "devops_store_metric",
+        "devops_query_metrics",
+    ),
+    "experiment": (
+        "experiment_create",
+        "experiment_measure",
+        "experiment_commit",
+        "experiment_status",
+    ),
+    "federation": (
+        "federation_query",
+        "federation_trigger",
+        "federation_sync_status",
+    ),
+    "filesystem": (
+        "exec",
+        "read_file",
+        "list_directory",
+        "write_file",
+    ),
+    "git": (
+        "git_status",
+        "git_diff",
+        "git_branch",
+        "git_commit",
+        "git_push",
+        "create_pull_request",
+    ),
+    "github_api": (
+        "github_list_prs",
+        "github_get_pr",
+        "github_pr_stats",
+        "github_commit_activity",
+        "github_review_stats",
+    ),
+    "gws": (
+        "gws_gmail_search",
+        "gws_gmail_get",
+        "gws_gmail_reply",
+        "gws_gmail_send",
+        "gws_gmail_modify",
+        "gws_calendar_list",
+        "gws_calendar_create",
+        "gws_calendar_delete",
+        "gws_chat_send",
+        "gws_chat_list_spaces",
+        "gws_chat_list_messages",
+    ),
+    "identity": (
+        "link_identity",
+        "resolve_identities",
+    ),
+    "jira": (
+        "jira_search",
+        "jira_get_issue",
+        "jira_get_sprint",
+        "jira_get_board_velocity",
+        "jira_list_boards",
+    ),
+    "mcp_client": (
+        "mcp_list_servers",
+        "mcp_list_tools",
+        "mcp_call_tool",
+        "mcp_read_resource",
+    ),
+    "memory": (
+        "search_memory",
+        "store_memory",
+        "search_memories",
+        "store_memories",
+        "get_entity",
+        "get_stats",
+        "memory_block_read",
+        "memory_block_write",
+        "memory_block_list",
+        "get_knowledge_gaps",
+        "record_procedure",
+        "find_procedure",
+        "report_procedure_outcome",
+        "leave_breadcrumb",
+        "append_to_block",
+    ),
+    "messaging": (
+        "send_agent_message",
+        "receive_agent_messages",
+        "create_team",
+        "team_scratchpad_write",
+        "team_scratchpad_read",
+    ),
+    "observability": (
+        "list_agent_runs",
+        "get_agent_run",
+        "list_agent_schedules",
+        "get_agent_stats",
+        "buddy_refresh",
+    ),
+    "pdf": ("analyze_pdf",),
+    "pf": ("pf_system_status",),
+    "reasoning": ("deep_reason",),
+    "reports": (
+        "render_report",
+        "render_devops_report",
+    ),
+    "skills": (
+        "invoke_skill",
+        "list_skills",
+        "create_skill",
+        "update_skill",
+    ),
+    "spawn": (
+        "spawn_agent",
+        "spawn_agents",
+    ),
+    "timing": ("wait_seconds",),
+    "todolist": ("todo_write",),
+    "vault": (
+        "vault_get",
+        "vault_set",
+        "vault_list",
+        "vault_delete",
+    ),
+    "vision": (
+        "look",
+        "who_is_here",
+        "enroll_face",
+        "enroll_face_from_image",
+        "list_enrolled_faces",
+        "unenroll_face",
+        "set_vision_mode",
+        "log_interaction",
+    ),
+    "voice": ("make_call",),
+    "web": (
+        "web_fetch",
+        "web_search",
+    ),
+}
+
+_TOOL_MODULE: dict[str, str] = {
+    tool: module for module, tools in HANDLER_MODULES.items() for tool in tools
+}
+
+
+class LazyHandlerMap(Mapping[str, Any]):
+    """Tool name → handler mapping that imports handler modules on demand."""
+
+    def __init__(self, index: dict[str, str]) -> None:
+        self._index = index
+        self._loaded: dict[str, Any] = {}
+        self._modules: set[str] = set()
+
+    def _load(self, module: str) -> None:
+        mod = importlib.import_module(f"robothor.engine.tools.handlers.{module}")
+        self._loaded.update(mod.HANDLERS)
+        self._modules.add(module)
+
+    def __getitem__(self, name: str) -> Any:
+        handler = self._loaded.get(name)
+        if handler is not None:
+            return handler
+        module = self._index[name]
+        if module not in self._modules:
+            self._load(module)
+        return self._loaded[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    @property
+    def loaded_modules(self) -> frozenset[str]:
+        return frozenset(self._modules)
+
+    def load_all(self) -> dict[str, Any]:
+        """Import every handler module (e.g. for warmup); returns the full map."""
+        for module in HANDLER_MODULES:
+            if module not in self._modules:
+                self._load(module)
+        return dict(self._loaded)
 
 
 # Lazily initialized handler map
-_handler_map: dict[str, Any] | None = None
+_handler_map: LazyHandlerMap | None = None
 
 
-def _get_handlers() -> dict[str, Any]:
+def _get_handlers() -> Mapping[str, Any]:
     global _handler_map
     if _handler_map is None:
-        _handler_map = _collect_handlers()
+        _handler_map = LazyHandlerMap(_TOOL_MODULE)
     return _handler_map
 
 
@@ -171,6 +371,7 @@ async def _execute_tool(
     user_id: str = "",
     user_role: str = "",
     accessible_tenant_ids: tuple[str, ...] = (),
+    on_progress: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
 ) -> dict[str, Any]:
     """Route tool call to the correct handler.
 
@@ -195,9 +396,7 @@ async def _execute_tool(
         from robothor.engine.mcp_client import get_mcp_client_pool
 
         try:
-            pool = get_mcp_client_pool()
-            session = await pool.get_session(route)
-            result: dict[str, Any] = await session.call_tool(name, args)
+            result: dict[str, Any] = await get_mcp_client_pool().call_tool(route, name, args)
             _audit_tool_call(name, agent_id, tenant_id, user_id=user_id)
             return result
         except Exception as e:
@@ -214,6 +413,7 @@ async def _execute_tool(
         user_id=user_id,
         user_role=user_role,
         accessible_tenant_ids=accessible_tenant_ids,
+        on_progress=on_progress,
     )
     handlers = _get_handlers()
     handler = handlers.get(name)
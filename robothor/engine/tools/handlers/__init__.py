@@ -1,36 +1,22 @@
-"""Tool handler modules — each exposes a HANDLERS dict mapping tool name → async handler."""
+"""Tool handler modules — each exposes a HANDLERS dict mapping tool name → async handler.
+
+Submodules are not imported here: dispatch loads each one on the first call
+to one of its tools (see ``dispatch.HANDLER_MODULES``). Attribute access
+(``handlers.gws``) still works and imports the submodule on demand.
+"""
 
 from __future__ import annotations
 
-from robothor.engine.tools.handlers import (  # noqa: F401
-    apollo,
-    benchmark,
-    browser,
-    crm,
-    desktop,
-    devops_metrics,
-    experiment,
-    federation,
-    filesystem,
-    git,
-    github_api,
-    gws,
-    identity,
-    jira,
-    mcp_client,
-    memory,
-    messaging,
-    observability,
-    pdf,
-    pf,
-    reasoning,
-    reports,
-    skills,
-    spawn,
-    timing,
-    todolist,
-    vault,
-    vision,
-    voice,
-    web,
-)
+import importlib
+from typing import Any
+
+
+def __getattr__(name: str) -> Any:
+    if name.startswith("_"):
+        raise AttributeError(name)
+    try:
+        return importlib.import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as e:
+        if e.name != f"{__name__}.{name}":
+            raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
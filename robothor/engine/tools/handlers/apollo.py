@@ -7,6 +7,8 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from robothor.engine.http_pool import http_client
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -93,7 +95,7 @@ async def _apollo_search_people(args: dict[str, Any], ctx: ToolContext) -> dict[
         payload["person_locations"] = v
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.post(
                 f"{_APOLLO_BASE}/mixed_people/search",
                 headers=_headers(api_key),
@@ -141,7 +143,7 @@ async def _apollo_enrich_person(args: dict[str, Any], ctx: ToolContext) -> dict[
     params["reveal_phone_number"] = args.get("reveal_phone_number", False)
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.post(
                 f"{_APOLLO_BASE}/people/match",
                 headers=_headers(api_key),
@@ -183,7 +185,7 @@ async def _apollo_search_companies(args: dict[str, Any], ctx: ToolContext) -> di
         payload["organization_num_employees_ranges"] = v
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.post(
                 f"{_APOLLO_BASE}/mixed_companies/search",
                 headers=_headers(api_key),
@@ -219,7 +221,7 @@ async def _apollo_enrich_company(args: dict[str, Any], ctx: ToolContext) -> dict
         return {"error": "domain is required."}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.get(
                 f"{_APOLLO_BASE}/organizations/enrich",
                 headers=_headers(api_key),
@@ -0,0 +1,37 @@
+"""Artifact tool handler — paging through offloaded tool results."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    from robothor.engine.tools.dispatch import ToolContext
+
+HANDLERS: dict[str, Any] = {}
+
+
+def _handler(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    def decorator(fn: Callable[..., Any]) -> Callable[..., Any]:
+        HANDLERS[name] = fn
+        return fn
+
+    return decorator
+
+
+@_handler("read_artifact")
+async def _read_artifact(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
+    from robothor.engine.artifacts import DEFAULT_PAGE_BYTES, get_artifact_store
+
+    artifact_id = str(args.get("id", "")).strip()
+    if not artifact_id:
+        return {"error": "No artifact id provided"}
+    try:
+        offset = int(args.get("offset") or 0)
+        length = int(args.get("length") or DEFAULT_PAGE_BYTES)
+    except (TypeError, ValueError):
+        return {"error": "offset and length must be integers"}
+
+    return await asyncio.to_thread(get_artifact_store().read_range, artifact_id, offset, length)
@@ -13,7 +13,7 @@ import time
 from pathlib import Path as _Path
 from typing import TYPE_CHECKING, Any
 
-import httpx
+from robothor.engine.http_pool import http_client
 
 if TYPE_CHECKING:
     from collections.abc import Callable
@@ -403,7 +403,7 @@ async def _describe(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
 
     # Try local Ollama vision model first
     try:
-        async with httpx.AsyncClient(timeout=120.0) as client:
+        async with http_client(timeout=120.0) as client:
             resp = await client.post(
                 f"http://{cfg.ollama.host}:{cfg.ollama.port}/api/generate",
                 json={
@@ -3,7 +3,6 @@
 from __future__ import annotations
 
 import asyncio
-import subprocess
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -24,44 +23,76 @@ def _handler(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
 
 @_handler("exec")
 async def _exec(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
+    from robothor.engine.process_exec import run_command
+
     command = args.get("command", "")
     if not command:
         return {"error": "No command provided"}
-
-    def _run() -> dict[str, Any]:
-        try:
-            proc = subprocess.run(
-                command,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=int(args.get("timeout", 30)),
-                cwd=ctx.workspace or None,
-            )
-            return {
-                "stdout": proc.stdout[:4000],
-                "stderr": proc.stderr[:2000],
-                "exit_code": proc.returncode,
-            }
-        except subprocess.TimeoutExpired:
-            return {"error": f"Command timed out ({int(args.get('timeout', 30))}s limit)"}
-        except Exception as e:
-            return {"error": f"Command failed: {e}"}
-
-    return await asyncio.to_thread(_run)
+    timeout = int(args.get("timeout", 30))
+
+    try:
+        result = await run_command(
+            command,
+            timeout=timeout,
+            cwd=ctx.workspace or None,
+            on_output=ctx.on_progress,
+        )
+    except Exception as e:
+        return {"error": f"Command failed: {e}"}
+
+    output: dict[str, Any] = {
+        "stdout": result.stdout,
+        "stderr": result.stderr,
+        "exit_code": result.exit_code,
+        "stdout_bytes": result.stdout_bytes,
+        "stderr_bytes": result.stderr_bytes,
+        "duration_ms": result.duration_ms,
+    }
+    if result.truncated:
+        output["truncated"] = True
+    if result.timed_out:
+        return {"error": f"Command timed out ({timeout}s limit)", **output}
+    return output
 
 
 @_handler("read_file")
 async def _read_file(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
     from pathlib import Path
 
+    from robothor.engine import file_reader
+
+    try:
+        offset = int(args.get("offset") or 0)
+        limit = int(args.get("limit") or file_reader.DEFAULT_LIMIT)
+        start_line = int(args["start_line"]) if args.get("start_line") is not None else None
+        end_line = int(args["end_line"]) if args.get("end_line") is not None else None
+        tail = int(args["tail"]) if args.get("tail") is not None else None
+    except (TypeError, ValueError):
+        return {"error": "offset, limit, start_line, end_line and tail must be integers"}
+    if offset < 0 or (tail is not None and tail < 1):
+        return {"error": "offset must be >= 0 and tail must be >= 1"}
+    limit = max(1, min(limit, file_reader.MAX_LIMIT))
+
     def _run() -> dict[str, Any]:
         path = Path(args.get("path", "")).expanduser()
         if not path.is_absolute() and ctx.workspace:
             path = Path(ctx.workspace) / path
         try:
-            content = path.read_text()
-            return {"content": content[:50000], "path": str(path), "chars": len(content)}
+            size = path.stat().st_size
+            if tail is not None:
+                result = file_reader.read_tail(path, tail, limit)
+            elif start_line is not None or end_line is not None:
+                result = file_reader.read_lines(path, start_line or 1, end_line, limit)
+            else:
+                with path.open("rb") as f:
+                    data, start, next_offset, size = file_reader.read_byte_range(f, offset, limit)
+                result = {
+                    "content": data.decode("utf-8"),
+                    "offset": start,
+                    "next_offset": next_offset,
+                    "truncated": next_offset is not None,
+                }
+            return {**result, "path": str(path), "size": size}
         except Exception as e:
             return {"error": f"Failed to read file: {e}"}
 
@@ -72,6 +103,18 @@ async def _read_file(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
 async def _list_directory(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
     from pathlib import Path
 
+    from robothor.engine import dir_walker
+
+    recursive = bool(args.get("recursive", False))
+    try:
+        max_depth = int(args["max_depth"]) if args.get("max_depth") is not None else None
+    except (TypeError, ValueError):
+        return {"error": "max_depth must be an integer"}
+    if max_depth is None and not recursive:
+        max_depth = 1
+    if max_depth is not None and max_depth < 1:
+        return {"error": "max_depth must be >= 1"}
+
     def _run() -> dict[str, Any]:
         path = Path(args.get("path", "")).expanduser()
         if not path.is_absolute() and ctx.workspace:
@@ -81,34 +124,14 @@ async def _list_directory(args: dict[str, Any], ctx: ToolContext) -> dict[str, A
         if not path.is_dir():
             return {"error": f"Not a directory: {path}"}
         try:
-            pattern = args.get("pattern", "")
-            recursive = args.get("recursive", False)
-            entries = []
-            max_entries = 200
-            if pattern:
-                gen = path.rglob(pattern) if recursive else path.glob(pattern)
-                for p in gen:
-                    entries.append(
-                        {
-                            "name": str(p.relative_to(path)),
-                            "type": "dir" if p.is_dir() else "file",
-                            "size": p.stat().st_size if p.is_file() else 0,
-                        }
-                    )
-                    if len(entries) >= max_entries:
-                        break
-            else:
-                for p in sorted(path.iterdir()):
-                    entries.append(
-                        {
-                            "name": p.name,
-                            "type": "dir" if p.is_dir() else "file",
-                            "size": p.stat().st_size if p.is_file() else 0,
-                        }
-                    )
-                    if len(entries) >= max_entries:
-                        break
-            truncated = len(entries) >= max_entries
+            entries, truncated = dir_walker.walk(
+                str(path),
+                max_depth=max_depth,
+                pattern=args.get("pattern", ""),
+                max_entries=200,
+                # Flat listings show everything; ignore rules prune recursive walks
+                respect_ignores=max_depth != 1 and not args.get("include_ignored", False),
+            )
             return {
                 "path": str(path),
                 "entries": entries,
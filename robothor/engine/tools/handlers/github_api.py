@@ -9,9 +9,12 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from robothor.engine.http_pool import http_client
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
+    from robothor.engine.http_pool import PooledClient
     from robothor.engine.tools.dispatch import ToolContext
 
 HANDLERS: dict[str, Any] = {}
@@ -62,7 +65,7 @@ def _slim_pr(pr: dict[str, Any]) -> dict[str, Any]:
 
 
 async def _paginate(
-    client: httpx.AsyncClient,
+    client: PooledClient,
     url: str,
     headers: dict[str, str],
     params: dict[str, Any],
@@ -109,7 +112,7 @@ async def _github_list_prs(args: dict[str, Any], ctx: ToolContext) -> dict[str,
     max_pages = min(args.get("max_pages", 3), 5)
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        async with http_client(timeout=15.0, follow_redirects=True) as client:
             prs = await _paginate(
                 client,
                 f"{_GITHUB_API}/repos/{repo}/pulls",
@@ -146,7 +149,7 @@ async def _github_get_pr(args: dict[str, Any], ctx: ToolContext) -> dict[str, An
         return {"error": "repo and pr_number are required"}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        async with http_client(timeout=15.0, follow_redirects=True) as client:
             # Get PR details
             resp = await client.get(
                 f"{_GITHUB_API}/repos/{repo}/pulls/{pr_number}",
@@ -234,7 +237,7 @@ async def _github_pr_stats(args: dict[str, Any], ctx: ToolContext) -> dict[str,
         period = days  # integer for legacy callers
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
+        async with http_client(timeout=20.0, follow_redirects=True) as client:
             # Get merged PRs
             prs = await _paginate(
                 client,
@@ -320,7 +323,7 @@ async def _github_commit_activity(args: dict[str, Any], ctx: ToolContext) -> dic
         return {"error": "repo is required (format: owner/repo)"}
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
+        async with http_client(timeout=20.0, follow_redirects=True) as client:
             # GitHub stats endpoint may return 202 on first call (computing)
             for _attempt in range(3):
                 resp = await client.get(
@@ -393,7 +396,7 @@ async def _github_review_stats(args: dict[str, Any], ctx: ToolContext) -> dict[s
     since = since - timedelta(days=days)
 
     try:
-        async with httpx.AsyncClient(timeout=20.0, follow_redirects=True) as client:
+        async with http_client(timeout=20.0, follow_redirects=True) as client:
             # Get recent closed PRs
             prs = await _paginate(
                 client,
@@ -8,6 +8,8 @@ from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from robothor.engine.http_pool import http_client
+
 if TYPE_CHECKING:
     from collections.abc import Callable
 
@@ -111,7 +113,7 @@ async def _jira_search(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]
     max_results = min(args.get("max_results", 50), 100)
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.post(
                 f"{base_url}/rest/api/3/search/jql",
                 headers=_headers(auth),
@@ -171,7 +173,7 @@ async def _jira_get_issue(args: dict[str, Any], ctx: ToolContext) -> dict[str, A
         return {"error": "issue_key is required"}
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.get(
                 f"{base_url}/rest/api/3/issue/{issue_key}",
                 headers=_headers(auth),
@@ -210,7 +212,7 @@ async def _jira_get_sprint(args: dict[str, Any], ctx: ToolContext) -> dict[str,
     state = args.get("state", "active")
 
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             # Get sprints for the board
             resp = await client.get(
                 f"{base_url}/rest/agile/1.0/board/{board_id}/sprint",
@@ -287,7 +289,7 @@ async def _jira_get_board_velocity(args: dict[str, Any], ctx: ToolContext) -> di
     num_sprints = min(args.get("num_sprints", 5), 10)
 
     try:
-        async with httpx.AsyncClient(timeout=20.0) as client:
+        async with http_client(timeout=20.0) as client:
             # Get closed sprints
             resp = await client.get(
                 f"{base_url}/rest/agile/1.0/board/{board_id}/sprint",
@@ -368,7 +370,7 @@ async def _jira_list_boards(args: dict[str, Any], ctx: ToolContext) -> dict[str,
         if project_key:
             params["projectKeyOrId"] = project_key
 
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.get(
                 f"{base_url}/rest/agile/1.0/board",
                 headers=_headers(auth),
@@ -21,21 +21,22 @@ def _handler(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     return decorator
 
 
-@_handler("search_memory")
-async def _search_memory(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
-    from robothor.memory.facts import search_facts
-    from robothor.memory.outcomes import log_fact_access
+def _memory_hit(r: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "fact": r.get("fact_text") or r.get("insight_text") or "",
+        "category": r.get("category", "")
+        if isinstance(r.get("category"), str)
+        else (r.get("categories") or [None])[0] or "",
+        "confidence": r.get("confidence", 0),
+        "similarity": round(r.get("similarity", 0), 4),
+        "source": r.get("source", "fact"),
+    }
 
-    results = await search_facts(
-        args.get("query", ""),
-        limit=args.get("limit", 10),
-        tenant_id=ctx.tenant_id,
-        expand_entities=True,
-        include_insights=True,
-        include_episodes=True,
-    )
 
-    # Log fact access for outcome attribution (best-effort).
+async def _log_fact_access(results: list[dict[str, Any]], ctx: ToolContext) -> None:
+    """Log fact access for outcome attribution (best-effort)."""
+    from robothor.memory.outcomes import log_fact_access
+
     run_id = getattr(ctx, "run_id", None)
     agent_id = getattr(ctx, "agent_id", None)
     if run_id:
@@ -47,20 +48,21 @@ async def _search_memory(args: dict[str, Any], ctx: ToolContext) -> dict[str, An
         if fact_ids:
             await asyncio.to_thread(log_fact_access, str(run_id), fact_ids, agent_id, ctx.tenant_id)
 
-    return {
-        "results": [
-            {
-                "fact": r.get("fact_text") or r.get("insight_text") or "",
-                "category": r.get("category", "")
-                if isinstance(r.get("category"), str)
-                else (r.get("categories") or [None])[0] or "",
-                "confidence": r.get("confidence", 0),
-                "similarity": round(r.get("similarity", 0), 4),
-                "source": r.get("source", "fact"),
-            }
-            for r in results
-        ]
-    }
+
+@_handler("search_memory")
+async def _search_memory(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
+    from robothor.memory.facts import search_facts
+
+    results = await search_facts(
+        args.get("query", ""),
+        limit=args.get("limit", 10),
+        tenant_id=ctx.tenant_id,
+        expand_entities=True,
+        include_insights=True,
+        include_episodes=True,
+    )
+    await _log_fact_access(results, ctx)
+    return {"results": [_memory_hit(r) for r in results]}
 
 
 @_handler("store_memory")
@@ -80,11 +82,60 @@ async def _store_memory(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any
     return {"id": fact_id, "facts_stored": 1}
 
 
+@_handler("search_memories")
+async def _search_memories(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
+    from robothor.memory.facts import MAX_BATCH_ITEMS, search_facts_batch
+
+    queries = [str(q) for q in args.get("queries") or []]
+    if not queries or len(queries) > MAX_BATCH_ITEMS:
+        return {"error": f"queries must hold 1 to {MAX_BATCH_ITEMS} queries"}
+    batches = await search_facts_batch(
+        queries,
+        limit=args.get("limit", 10),
+        tenant_id=ctx.tenant_id,
+        expand_entities=True,
+        include_insights=True,
+        include_episodes=True,
+    )
+    await _log_fact_access([r for results in batches for r in results], ctx)
+    return {
+        "results": [
+            {"query": query, "results": [_memory_hit(r) for r in results]}
+            for query, results in zip(queries, batches, strict=True)
+        ]
+    }
+
+
+@_handler("store_memories")
+async def _store_memories(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
+    from robothor.memory.facts import MAX_BATCH_ITEMS, store_memories_batch
+
+    items = args.get("items") or []
+    if not items or len(items) > MAX_BATCH_ITEMS:
+        return {"error": f"items must hold 1 to {MAX_BATCH_ITEMS} entries"}
+    stored = await store_memories_batch(
+        [(i.get("content", ""), i.get("content_type", "conversation")) for i in items],
+        tenant_id=ctx.tenant_id,
+    )
+    return {"results": stored, "facts_stored": sum(r.get("facts_stored", 0) for r in stored)}
+
+
 @_handler("get_entity")
 async def _get_entity(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
-    from robothor.memory.entities import get_entity
+    from robothor.memory.entities import get_entity, traverse_graph
 
     try:
+        depth = int(args.get("depth") or 1)
+        if depth > 1 or args.get("relation_types"):
+            graph = await traverse_graph(
+                args.get("name", ""),
+                max_depth=depth,
+                relation_types=args.get("relation_types"),
+                tenant_id=ctx.tenant_id,
+            )
+            if graph["root"] is None:
+                return {"name": args.get("name", ""), "found": False}
+            return graph
         result = await get_entity(args.get("name", ""), tenant_id=ctx.tenant_id)
         return result or {"name": args.get("name", ""), "found": False}
     except Exception:
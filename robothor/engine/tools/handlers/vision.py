@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Any
 
-import httpx
-
+from robothor.engine.http_pool import http_client
 from robothor.engine.tools.dispatch import ToolContext, _cfg
 
 if TYPE_CHECKING:
@@ -25,7 +24,7 @@ def _handler(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
 @_handler("look")
 async def _look(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
     prompt = args.get("prompt", "Describe what you see in this image in detail.")
-    async with httpx.AsyncClient(timeout=300.0) as client:
+    async with http_client(timeout=300.0) as client:
         resp = await client.post(f"{_cfg().vision_url}/look", json={"prompt": prompt})
         resp.raise_for_status()
         return dict(resp.json())
@@ -33,7 +32,7 @@ async def _look(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
 
 @_handler("who_is_here")
 async def _who_is_here(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client(timeout=10.0) as client:
         resp = await client.get(f"{_cfg().vision_url}/health")
         resp.raise_for_status()
         data = resp.json()
@@ -50,7 +49,7 @@ async def _enroll_face(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]
     face_name = args.get("name", "")
     if not face_name:
         return {"error": "Name is required for face enrollment"}
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(f"{_cfg().vision_url}/enroll", json={"name": face_name})
         resp.raise_for_status()
         return dict(resp.json())
@@ -64,7 +63,7 @@ async def _enroll_face_from_image(args: dict[str, Any], ctx: ToolContext) -> dic
         return {"error": "Name is required"}
     if not image_paths:
         return {"error": "image_paths is required"}
-    async with httpx.AsyncClient(timeout=60.0) as client:
+    async with http_client(timeout=60.0) as client:
         resp = await client.post(
             f"{_cfg().vision_url}/enroll-from-image",
             json={"name": face_name, "image_paths": image_paths},
@@ -75,7 +74,7 @@ async def _enroll_face_from_image(args: dict[str, Any], ctx: ToolContext) -> dic
 
 @_handler("list_enrolled_faces")
 async def _list_enrolled_faces(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client(timeout=10.0) as client:
         resp = await client.get(f"{_cfg().vision_url}/enrolled")
         resp.raise_for_status()
         return dict(resp.json())
@@ -86,7 +85,7 @@ async def _unenroll_face(args: dict[str, Any], ctx: ToolContext) -> dict[str, An
     face_name = args.get("name", "")
     if not face_name:
         return {"error": "Name is required"}
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client(timeout=10.0) as client:
         resp = await client.post(f"{_cfg().vision_url}/unenroll", json={"name": face_name})
         resp.raise_for_status()
         return dict(resp.json())
@@ -97,7 +96,7 @@ async def _set_vision_mode(args: dict[str, Any], ctx: ToolContext) -> dict[str,
     mode = args.get("mode", "")
     if mode not in ("disarmed", "basic", "armed"):
         return {"error": f"Invalid mode: {mode}. Valid: disarmed, basic, armed"}
-    async with httpx.AsyncClient(timeout=30.0) as client:
+    async with http_client(timeout=30.0) as client:
         resp = await client.post(f"{_cfg().vision_url}/mode", json={"mode": mode})
         resp.raise_for_status()
         return dict(resp.json())
@@ -105,7 +104,7 @@ async def _set_vision_mode(args: dict[str, Any], ctx: ToolContext) -> dict[str,
 
 @_handler("log_interaction")
 async def _log_interaction(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
-    async with httpx.AsyncClient(timeout=10.0) as client:
+    async with http_client(timeout=10.0) as client:
         resp = await client.post(
             f"{_cfg().bridge_url}/log-interaction",
             json={
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from typing import Any
 
-import httpx
-
+from robothor.engine.http_pool import http_client
 from robothor.engine.tools.dispatch import ToolContext, _cfg
 
 HANDLERS: dict[str, Any] = {}
@@ -20,7 +19,7 @@ async def _make_call(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
     if not purpose:
         return {"error": "Missing 'purpose' for the call"}
     try:
-        async with httpx.AsyncClient(timeout=15.0) as client:
+        async with http_client(timeout=15.0) as client:
             resp = await client.post(
                 f"{_cfg().voice_url}/call",
                 json={"to": to_number, "recipient": recipient, "purpose": purpose},
@@ -6,8 +6,7 @@ import ipaddress
 from typing import TYPE_CHECKING, Any
 from urllib.parse import urlparse
 
-import httpx
-
+from robothor.engine.http_pool import http_client
 from robothor.engine.tools.dispatch import ToolContext, _cfg
 
 if TYPE_CHECKING:
@@ -67,7 +66,7 @@ async def _web_fetch(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
     try:
         import html2text
 
-        async with httpx.AsyncClient(timeout=15.0, follow_redirects=True) as client:
+        async with http_client(timeout=15.0, follow_redirects=True) as client:
             resp = await client.get(url)
             resp.raise_for_status()
             import re as _re
@@ -103,7 +102,7 @@ async def _web_search(args: dict[str, Any], ctx: ToolContext) -> dict[str, Any]:
 
     # Fallback to SearXNG
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
+        async with http_client(timeout=10.0) as client:
             resp = await client.get(
                 f"{_cfg().searxng_url}/search",
                 params={"q": query, "format": "json", "pageno": 1},
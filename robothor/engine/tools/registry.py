@@ -6,11 +6,13 @@ import asyncio
 import logging
 from typing import TYPE_CHECKING, Any
 
-from robothor.engine.tools.constants import SPAWN_TOOLS, TODO_TOOLS
+from robothor.engine.tools.constants import ARTIFACT_TOOLS, SPAWN_TOOLS, TODO_TOOLS
 from robothor.engine.tools.dispatch import _execute_tool
 from robothor.engine.tools.schemas import get_engine_schemas
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
     from robothor.engine.models import AgentConfig
 
 logger = logging.getLogger(__name__)
@@ -50,7 +52,8 @@ class ToolRegistry:
         """Connect to adapter MCP servers, discover tools, register as first-class schemas.
 
         Resilience features:
-        - 5s timeout per adapter connection (don't block agent startup)
+        - 10s budget per adapter to connect and list tools (don't block agent startup)
+        - Tool lists are cached by the pool, so later runs skip the round trip
         - Failed adapters cached with exponential backoff (5min initial, 30min max)
         - Failures logged once at WARNING, then suppressed until retry window
         """
@@ -74,8 +77,7 @@ class ToolRegistry:
                     continue
 
             try:
-                session = await asyncio.wait_for(pool.get_session(adapter.name), timeout=5.0)
-                mcp_tools = await asyncio.wait_for(session.list_tools(), timeout=5.0)
+                mcp_tools = await asyncio.wait_for(pool.list_tools(adapter.name), timeout=10.0)
                 for tool in mcp_tools:
                     name = tool.get("name", "")
                     if not name:
@@ -146,6 +148,12 @@ class ToolRegistry:
         else:
             names = list(self._schemas.keys())
 
+        # Agents that offload tool results can always page through them
+        if config.tool_offload_threshold:
+            names += [n for n in ARTIFACT_TOOLS if n in self._schemas and n not in names]
+        else:
+            names = [n for n in names if n not in ARTIFACT_TOOLS]
+
         if config.tools_denied:
             # Support glob patterns (e.g. "mcp_*", "gws_*") in tools_denied
             has_globs = any(c in p for p in config.tools_denied for c in "*?[")
@@ -179,6 +187,7 @@ class ToolRegistry:
         user_role: str = "",
         accessible_tenant_ids: tuple[str, ...] = (),
         timeout: int = 120,
+        on_progress: Callable[[dict[str, Any]], Awaitable[None]] | None = None,
     ) -> dict[str, Any]:
         """Execute a tool and return the result dict.
 
@@ -186,6 +195,8 @@ class ToolRegistry:
             timeout: Per-tool timeout in seconds. 0 = unlimited.
             accessible_tenant_ids: Tenant IDs this run may access
                 (resolved from user role + tenant hierarchy).
+            on_progress: Optional callback for incremental progress events
+                from handlers that support them (e.g. exec output).
         """
         try:
             if timeout > 0:
@@ -199,6 +210,7 @@ class ToolRegistry:
                         user_id=user_id,
                         user_role=user_role,
                         accessible_tenant_ids=accessible_tenant_ids,
+                        on_progress=on_progress,
                     )
             else:
                 return await _execute_tool(
@@ -210,6 +222,7 @@ class ToolRegistry:
                     user_id=user_id,
                     user_role=user_role,
                     accessible_tenant_ids=accessible_tenant_ids,
+                    on_progress=on_progress,
                 )
         except TimeoutError:
             logger.warning("Tool %s timed out after %ds", tool_name, timeout)
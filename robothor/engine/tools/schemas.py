@@ -30,7 +30,12 @@ def get_engine_schemas() -> dict[str, dict[str, Any]]:
         "type": "function",
         "function": {
             "name": "read_file",
-            "description": "Read the contents of a file.",
+            "description": (
+                "Read the contents of a file. Returns up to `limit` bytes; when "
+                "truncated, continue from next_offset (or next_line for line ranges). "
+                "Use start_line/end_line for a line range or tail for the last N lines "
+                "of large files such as logs."
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -38,6 +43,26 @@ def get_engine_schemas() -> dict[str, dict[str, Any]]:
                         "type": "string",
                         "description": "File path (relative to workspace or absolute)",
                     },
+                    "offset": {
+                        "type": "integer",
+                        "description": "Byte offset to start reading at (default 0)",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "description": "Maximum bytes to return (default 50000, max 200000)",
+                    },
+                    "start_line": {
+                        "type": "integer",
+                        "description": "First line to read, 1-based (optional)",
+                    },
+                    "end_line": {
+                        "type": "integer",
+                        "description": "Last line to read, inclusive (optional)",
+                    },
+                    "tail": {
+                        "type": "integer",
+                        "description": "Read the last N lines instead (optional)",
+                    },
                 },
                 "required": ["path"],
             },
@@ -47,7 +72,11 @@ def get_engine_schemas() -> dict[str, dict[str, Any]]:
         "type": "function",
         "function": {
             "name": "list_directory",
-            "description": "List files and directories. Use to discover file paths before reading them.",
+            "description": (
+                "List files and directories. Use to discover file paths before reading them. "
+                "Recursive listings skip .gitignore'd paths and directories such as .git "
+                "and node_modules."
+            ),
             "parameters": {
                 "type": "object",
                 "properties": {
@@ -63,6 +92,14 @@ def get_engine_schemas() -> dict[str, dict[str, Any]]:
                         "type": "boolean",
                         "description": "Search subdirectories (default false)",
                     },
+                    "max_depth": {
+                        "type": "integer",
+                        "description": "Directory levels to descend; 1 lists only path (optional)",
+                    },
+                    "include_ignored": {
+                        "type": "boolean",
+                        "description": "Include ignored paths in recursive listings (default false)",
+                    },
                 },
                 "required": ["path"],
             },
@@ -2042,6 +2079,35 @@ def get_engine_schemas() -> dict[str, dict[str, Any]]:
         },
     }
 
+    # ── Offloaded tool results ──
+
+    schemas["read_artifact"] = {
+        "type": "function",
+        "function": {
+            "name": "read_artifact",
+            "description": (
+                "Read one page of an offloaded tool result. Large tool outputs are "
+                "replaced by a summary and an artifact id; call this with the id and "
+                "the returned next_offset to page through the full output."
+            ),
+            "parameters": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "string", "description": "Artifact id from the tool result"},
+                    "offset": {
+                        "type": "integer",
+                        "description": "Byte offset to start at (default 0)",
+                    },
+                    "length": {
+                        "type": "integer",
+                        "description": "Bytes to read (default 20000, max 100000)",
+                    },
+                },
+                "required": ["id"],
+            },
+        },
+    }
+
     # ── Identity mapping tools ──
 
     schemas["link_identity"] = {
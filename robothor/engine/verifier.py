@@ -12,10 +12,13 @@ import json
 import logging
 from dataclasses import dataclass, field
 
-import litellm
+from robothor.engine.llm_client import llm_call
 
 logger = logging.getLogger(__name__)
 
+# Verdicts for identical output and criteria are reused for this long.
+VERIFY_CACHE_TTL_S = 24 * 3600
+
 DEFAULT_CRITERIA = "Task completed successfully without errors."
 
 VERIFICATION_PROMPT = """Evaluate whether this agent's execution met the success criteria.
@@ -74,12 +77,13 @@ async def verify_output(
 
     for m in models:
         try:
-            response = await litellm.acompletion(
+            response = await llm_call(
+                [{"role": "user", "content": prompt}],
                 model=m,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.1,
+                temperature=0.0,
+                json_mode=True,
                 max_tokens=300,
-                response_format={"type": "json_object"},
+                cache_ttl=VERIFY_CACHE_TTL_S,
             )
             content = response.choices[0].message.content
             if not content:
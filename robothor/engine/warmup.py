@@ -7,14 +7,22 @@ Builds a preamble string from:
 3. Context files (status files agents would otherwise waste tool calls reading)
 4. Peer agent status (what related agents did recently)
 
-Every section wrapped in try/except — never crashes, silently degrades.
+Sections are built concurrently, each with its own timeout, and never
+crash the preamble — a failed or slow section is simply left out. Sections
+with a cheap version stamp (file mtimes) are cached until the stamp changes.
+Per-section build times are reported so slow sections show up in run traces.
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -22,7 +30,7 @@ from typing import TYPE_CHECKING, Any
 from robothor.constants import DEFAULT_TENANT
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Hashable
 
     from robothor.engine.models import AgentConfig
 
@@ -72,91 +80,180 @@ def _run_context_hooks() -> str:
     return "--- SITUATIONAL CONTEXT ---\n" + "\n".join(results)
 
 
-def build_warmth_preamble(
-    config: AgentConfig,
-    workspace: Path,
-    tenant_id: str = DEFAULT_TENANT,
-) -> str:
-    """Build a warmth preamble string for an agent run.
+# ── Section builders ──────────────────────────────────────────────
+# Each preamble section is built on a shared thread pool so the DB queries,
+# file reads and subprocesses behind them overlap. A section that misses its
+# timeout is dropped from this preamble (its thread finishes in the
+# background). Sections with a ``stamp`` are cached: while the stamp (file
+# mtimes, version numbers) compares equal, the previous text is reused.
 
-    Returns up to MAX_WARMTH_CHARS of pre-loaded context. Empty string
-    if no warmup config or all sections fail.
-    """
-    sections: list[str] = []
+SECTION_TIMEOUT_S = 2.0
+SECTION_WORKERS = 16
+SECTION_CACHE_SIZE = 256
 
-    # 1. Session history
-    try:
-        history = _build_history_section(config.id)
-        if history:
-            sections.append(history)
-    except Exception as e:
-        logger.debug("Warmup history failed for %s: %s", config.id, e)
+_section_pool: ThreadPoolExecutor | None = None
+_section_pool_lock = threading.Lock()
+_section_cache: OrderedDict[str, tuple[Hashable, str]] = OrderedDict()
+_section_cache_lock = threading.Lock()
 
-    # 2. Memory blocks
-    try:
-        blocks = _build_memory_blocks_section(config.warmup_memory_blocks, tenant_id=tenant_id)
-        if blocks:
-            sections.append(blocks)
-    except Exception as e:
-        logger.debug("Warmup memory blocks failed for %s: %s", config.id, e)
 
-    # 3. Context files
-    try:
-        files = _build_context_files_section(config.warmup_context_files, workspace)
-        if files:
-            sections.append(files)
-    except Exception as e:
-        logger.debug("Warmup context files failed for %s: %s", config.id, e)
+@dataclass
+class WarmupSection:
+    """One preamble section: a builder plus its timeout and optional cache stamp."""
 
-    # 4. Peer agent status
-    try:
-        peers = _build_peer_section(config.warmup_peer_agents)
-        if peers:
-            sections.append(peers)
-    except Exception as e:
-        logger.debug("Warmup peer status failed for %s: %s", config.id, e)
+    name: str
+    build: Callable[[], str | None]
+    timeout_s: float = SECTION_TIMEOUT_S
+    stamp: Callable[[], Hashable] | None = None
+    cache_key: str = ""  # defaults to name; include agent/tenant when the output depends on them
 
-    # 5. Dynamic context hooks (date, travel, weather, etc.)
-    try:
-        situational = _run_context_hooks()
-        if situational:
-            sections.append(situational)
-    except Exception as e:
-        logger.debug("Warmup context hooks failed for %s: %s", config.id, e)
 
-    # 5b. Agent breadcrumbs — mid-task state from recent runs of this agent.
-    try:
-        from robothor.memory.breadcrumbs import (
-            format_breadcrumbs_for_warmup,
-            load_recent_breadcrumbs,
-        )
+@dataclass
+class SectionTiming:
+    """How one section build went, for logs and run traces."""
 
-        breadcrumbs = load_recent_breadcrumbs(config.id, limit=5, tenant_id=tenant_id)
-        bc_section = format_breadcrumbs_for_warmup(breadcrumbs)
-        if bc_section:
-            sections.append(bc_section)
-    except Exception as e:
-        logger.debug("Warmup breadcrumbs failed for %s: %s", config.id, e)
+    name: str
+    status: str  # built, empty, cached, timeout, error
+    duration_ms: int
+    started_at: float  # epoch seconds
 
-    # 5c. Stale preferences — surface anything needing re-confirmation.
-    try:
-        from robothor.memory.preferences import get_stale_preferences
 
-        stale = get_stale_preferences(tenant_id=tenant_id)
-        if stale:
-            lines = ["# Preferences flagged as possibly stale (verify with operator)"]
-            lines.extend(f"- {p.get('preference', '?')}" for p in stale[:5])
-            sections.append("\n".join(lines))
-    except Exception as e:
-        logger.debug("Warmup preferences failed for %s: %s", config.id, e)
+def _get_section_pool() -> ThreadPoolExecutor:
+    global _section_pool
+    with _section_pool_lock:
+        if _section_pool is None:
+            _section_pool = ThreadPoolExecutor(
+                max_workers=SECTION_WORKERS, thread_name_prefix="warmup"
+            )
+        return _section_pool
 
-    # 6. Agent-aware context hooks (git status, etc.)
-    try:
-        agent_ctx = _run_agent_context_hooks(config)
-        if agent_ctx:
-            sections.append(agent_ctx)
-    except Exception as e:
-        logger.debug("Warmup agent hooks failed for %s: %s", config.id, e)
+
+def clear_section_cache() -> None:
+    """Drop all cached section text."""
+    with _section_cache_lock:
+        _section_cache.clear()
+
+
+def _stamp_cached(key: str, stamp: Hashable, build: Callable[[], str | None]) -> tuple[str, bool]:
+    """Return cached text for ``key`` if its stamp is unchanged, else build and store it."""
+    with _section_cache_lock:
+        hit = _section_cache.get(key)
+        if hit is not None and hit[0] == stamp:
+            _section_cache.move_to_end(key)
+            return hit[1], True
+
+    text = build() or ""
+    with _section_cache_lock:
+        _section_cache[key] = (stamp, text)
+        _section_cache.move_to_end(key)
+        while len(_section_cache) > SECTION_CACHE_SIZE:
+            _section_cache.popitem(last=False)
+    return text, False
+
+
+def _build_section(section: WarmupSection) -> tuple[str, bool]:
+    """Build one section, consulting the stamp cache. Returns (text, cached)."""
+    if section.stamp is None:
+        return section.build() or "", False
+    # Stamp is taken before building, so a change mid-build forces a rebuild next time
+    return _stamp_cached(section.cache_key or section.name, section.stamp(), section.build)
+
+
+def _timed_build(section: WarmupSection) -> tuple[str, bool, float, float]:
+    started = time.time()
+    t0 = time.monotonic()
+    text, cached = _build_section(section)
+    return text, cached, started, time.monotonic() - t0
+
+
+def build_sections(
+    sections: list[WarmupSection],
+    timings: list[SectionTiming] | None = None,
+) -> list[str]:
+    """Build sections concurrently; returns non-empty texts in section order.
+
+    Failed and timed-out sections are logged and left out. When ``timings``
+    is given, one SectionTiming per section is appended to it.
+    """
+    pool = _get_section_pool()
+    submitted_at = time.time()
+    t0 = time.monotonic()
+    futures = [(section, pool.submit(_timed_build, section)) for section in sections]
+
+    texts: list[str] = []
+    for section, future in futures:
+        remaining = section.timeout_s - (time.monotonic() - t0)
+        started, elapsed = submitted_at, section.timeout_s
+        try:
+            text, cached, started, elapsed = future.result(timeout=max(0.0, remaining))
+            status = "cached" if cached else "built" if text else "empty"
+        except FutureTimeout:
+            future.cancel()
+            text, status = "", "timeout"
+            logger.debug("Warmup section %s timed out after %.1fs", section.name, section.timeout_s)
+        except Exception as e:
+            text, status = "", "error"
+            elapsed = time.monotonic() - t0
+            logger.debug("Warmup section %s failed: %s", section.name, e)
+
+        if text:
+            texts.append(text)
+        if timings is not None:
+            timings.append(
+                SectionTiming(
+                    name=section.name,
+                    status=status,
+                    duration_ms=int(elapsed * 1000),
+                    started_at=started,
+                )
+            )
+    return texts
+
+
+def build_warmth_preamble(
+    config: AgentConfig,
+    workspace: Path,
+    tenant_id: str = DEFAULT_TENANT,
+    timings: list[SectionTiming] | None = None,
+) -> str:
+    """Build a warmth preamble string for an agent run.
+
+    Returns up to MAX_WARMTH_CHARS of pre-loaded context. Empty string
+    if no warmup config or all sections fail. Per-section timings are
+    appended to ``timings`` when given.
+    """
+    file_paths = config.warmup_context_files
+    sections = build_sections(
+        [
+            # 1. Session history
+            WarmupSection("history", lambda: _build_history_section(config.id)),
+            # 2. Memory blocks (already served from the block cache)
+            WarmupSection(
+                "memory_blocks",
+                lambda: _build_memory_blocks_section(
+                    config.warmup_memory_blocks, tenant_id=tenant_id
+                ),
+            ),
+            # 3. Context files — cached until a file's mtime/size or age label changes
+            WarmupSection(
+                "context_files",
+                lambda: _build_context_files_section(file_paths, workspace),
+                stamp=lambda: _context_files_stamp(file_paths, workspace),
+                cache_key=f"context_files:{workspace}:{','.join(file_paths)}",
+            ),
+            # 4. Peer agent status
+            WarmupSection("peers", lambda: _build_peer_section(config.warmup_peer_agents)),
+            # 5. Dynamic context hooks (date, travel, weather, etc.)
+            WarmupSection("context_hooks", _run_context_hooks),
+            # 5b. Agent breadcrumbs — mid-task state from recent runs of this agent.
+            WarmupSection("breadcrumbs", lambda: _build_breadcrumbs_section(config.id, tenant_id)),
+            # 5c. Stale preferences — surface anything needing re-confirmation.
+            WarmupSection("stale_preferences", lambda: _build_preferences_section(tenant_id)),
+            # 6. Agent-aware context hooks (git status, etc.)
+            WarmupSection("agent_hooks", lambda: _run_agent_context_hooks(config)),
+        ],
+        timings,
+    )
 
     if not sections:
         return ""
@@ -208,16 +305,22 @@ def _build_history_section(agent_id: str) -> str:
 
 
 def _build_memory_blocks_section(block_names: list[str], tenant_id: str = DEFAULT_TENANT) -> str:
-    """Read memory blocks and format them, flagging stale ones."""
+    """Read memory blocks (one cached batch query) and format them, flagging stale ones."""
     if not block_names:
         return ""
 
-    from robothor.memory.blocks import read_block
+    from robothor.memory.blocks import read_blocks
+
+    try:
+        blocks = read_blocks(block_names, tenant_id=tenant_id, use_cache=True)
+    except Exception as e:
+        logger.debug("Failed to read memory blocks %s: %s", block_names, e)
+        return ""
 
     lines = ["--- MEMORY BLOCKS ---"]
     for name in block_names:
         try:
-            result = read_block(name, tenant_id=tenant_id)
+            result = blocks.get(name)
             content = (
                 result.get("content", "")
                 if isinstance(result, dict)
@@ -252,6 +355,45 @@ def _build_memory_blocks_section(block_names: list[str], tenant_id: str = DEFAUL
     return "\n".join(lines) if len(lines) > 1 else ""
 
 
+def _build_breadcrumbs_section(agent_id: str, tenant_id: str) -> str:
+    from robothor.memory.breadcrumbs import (
+        format_breadcrumbs_for_warmup,
+        load_recent_breadcrumbs,
+    )
+
+    breadcrumbs = load_recent_breadcrumbs(agent_id, limit=5, tenant_id=tenant_id)
+    return format_breadcrumbs_for_warmup(breadcrumbs)
+
+
+def _build_preferences_section(tenant_id: str) -> str:
+    from robothor.memory.preferences import get_stale_preferences
+
+    stale = get_stale_preferences(tenant_id=tenant_id)
+    if not stale:
+        return ""
+    lines = ["# Preferences flagged as possibly stale (verify with operator)"]
+    lines.extend(f"- {p.get('preference', '?')}" for p in stale[:5])
+    return "\n".join(lines)
+
+
+def _file_age_label(mtime: float) -> str:
+    age_hours = (time.time() - mtime) / 3600
+    return f" (stale — {age_hours:.0f}h ago)" if age_hours > 4 else ""
+
+
+def _context_files_stamp(file_paths: list[str], workspace: Path) -> Hashable:
+    """Version stamp for the context files section: one stat() per file."""
+    parts: list[tuple[str, int, int, str] | tuple[str, None]] = []
+    for rel_path in file_paths:
+        try:
+            st = (workspace / rel_path).stat()
+        except OSError:
+            parts.append((rel_path, None))
+            continue
+        parts.append((rel_path, st.st_mtime_ns, st.st_size, _file_age_label(st.st_mtime)))
+    return tuple(parts)
+
+
 def _build_context_files_section(file_paths: list[str], workspace: Path) -> str:
     """Read context files (status files etc.) and format them."""
     if not file_paths:
@@ -269,8 +411,7 @@ def _build_context_files_section(file_paths: list[str], workspace: Path) -> str:
             truncated = content[:MAX_FILE_CHARS]
             if len(content) > MAX_FILE_CHARS:
                 truncated += "..."
-            age_hours = (time.time() - full_path.stat().st_mtime) / 3600
-            age_label = f" (stale — {age_hours:.0f}h ago)" if age_hours > 4 else ""
+            age_label = _file_age_label(full_path.stat().st_mtime)
             lines.append(f"[{rel_path}]{age_label}\n{truncated}")
         except Exception as e:
             logger.debug("Failed to read context file %s: %s", rel_path, e)
@@ -285,6 +426,7 @@ def build_interactive_preamble(
     tenant_id: str = DEFAULT_TENANT,
     extra_memory_blocks: list[str] | None = None,
     sender_name: str = "",
+    timings: list[SectionTiming] | None = None,
 ) -> str:
     """Build a lightweight warmup preamble for interactive (Telegram) sessions.
 
@@ -300,6 +442,7 @@ def build_interactive_preamble(
         sender_name: Display name of the current user. When set, injects an
             identity section and excludes the name from entity context search
             to avoid confusing the user with other people sharing the same name.
+        timings: If given, per-section SectionTiming records are appended.
 
     Returns:
         Warmup preamble string, or empty string if nothing to inject.
@@ -314,41 +457,40 @@ def build_interactive_preamble(
             f"Do not confuse them with other people who may share the same name."
         )
 
+    builders: list[WarmupSection] = []
+
     # Core memory blocks — only for new sessions (no prior history)
     if include_blocks:
         core_blocks = ["persona", "user_profile", "user_model", "working_context"]
         # Also include agent-configured warmup blocks (e.g. devops_latest_report)
         if extra_memory_blocks:
             core_blocks = list(dict.fromkeys(core_blocks + extra_memory_blocks))
-        try:
-            blocks_section = _build_memory_blocks_section(core_blocks, tenant_id=tenant_id)
-            if blocks_section:
-                sections.append(blocks_section)
-        except Exception as e:
-            logger.debug("Interactive warmup blocks failed: %s", e)
+        builders.append(
+            WarmupSection(
+                "memory_blocks",
+                lambda: _build_memory_blocks_section(core_blocks, tenant_id=tenant_id),
+            )
+        )
 
     # Entity-aware context — if user mentions a name, pull relevant facts
     # Exclude the sender's name to avoid pulling facts about other people
     # who share the same name — the sender's identity comes from their
     # tenant's persona/user_profile blocks, not from entity search.
     if user_message and len(user_message) > 5:
-        try:
-            exclude = {sender_name} if sender_name else None
-            context = _build_entity_context(
-                user_message, tenant_id=tenant_id, exclude_names=exclude
+        exclude = {sender_name} if sender_name else None
+        builders.append(
+            WarmupSection(
+                "entity_context",
+                lambda: _build_entity_context(
+                    user_message, tenant_id=tenant_id, exclude_names=exclude
+                ),
             )
-            if context:
-                sections.append(context)
-        except Exception as e:
-            logger.debug("Interactive warmup entity context failed: %s", e)
+        )
 
     # Dynamic context hooks (date, travel, weather, etc.)
-    try:
-        situational = _run_context_hooks()
-        if situational:
-            sections.append(situational)
-    except Exception as e:
-        logger.debug("Interactive warmup context hooks failed: %s", e)
+    builders.append(WarmupSection("context_hooks", _run_context_hooks))
+
+    sections.extend(build_sections(builders, timings))
 
     if not sections:
         return ""
@@ -557,15 +699,31 @@ def _weather_context() -> str | None:
     try:
         _ws = Path(os.environ.get("ROBOTHOR_WORKSPACE", str(Path.home() / "robothor")))
         weather_file = _ws / "brain" / "memory" / "weather-status.md"
-        if weather_file.exists():
-            content = weather_file.read_text().strip()
-            if content:
-                return f"Weather: {content[:200]}"
+        st = weather_file.stat()
+        content, _ = _stamp_cached(
+            f"weather:{weather_file}",
+            (st.st_mtime_ns, st.st_size),
+            lambda: weather_file.read_text().strip(),
+        )
+        if content:
+            return f"Weather: {content[:200]}"
     except Exception:
         pass
     return None
 
 
+def _git_head_stamp(workspace: Path) -> Hashable | None:
+    """Changes whenever HEAD moves (commit, checkout, reset); None if not a plain repo."""
+    git_dir = workspace / ".git"
+    try:
+        return (
+            (git_dir / "HEAD").stat().st_mtime_ns,
+            (git_dir / "logs" / "HEAD").stat().st_mtime_ns,
+        )
+    except OSError:
+        return None
+
+
 def _run_agent_context_hooks(config: AgentConfig) -> str:
     """Run agent-aware context hooks, collecting results."""
     results: list[str] = []
@@ -608,15 +766,23 @@ def _git_status_context(config: AgentConfig) -> str | None:
     except Exception:
         pass
     try:
-        log = subprocess.run(
-            ["git", "log", "--oneline", "-5"],
-            capture_output=True,
-            text=True,
-            timeout=0.08,
-            cwd=str(workspace),
-        )
-        if log.stdout.strip():
-            parts.append(f"Recent commits:\n{log.stdout.strip()}")
+
+        def _log() -> str:
+            log = subprocess.run(
+                ["git", "log", "--oneline", "-5"],
+                capture_output=True,
+                text=True,
+                timeout=0.08,
+                cwd=str(workspace),
+                check=True,  # never cache a failure's empty output
+            )
+            return log.stdout.strip()
+
+        # Working-tree status changes without touching .git, but the log only moves with HEAD
+        head = _git_head_stamp(workspace)
+        recent = _stamp_cached(f"git_log:{workspace}", head, _log)[0] if head else _log()
+        if recent:
+            parts.append(f"Recent commits:\n{recent}")
     except Exception:
         pass
     return "Git:\n" + "\n".join(parts) if parts else None
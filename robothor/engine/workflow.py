@@ -12,6 +12,12 @@ Step types:
   - transform: Reshape data between steps
   - noop:      Explicit pipeline end marker
 
+Steps run in file order by default. A workflow with ``max_parallel`` > 1 and
+no branching (no condition steps or ``next`` jumps) is scheduled as a DAG
+instead: each step waits for the steps named in its ``depends_on`` plus any
+step its templates reference (``{{ steps.X.output_text }}``), and up to
+``max_parallel`` ready steps run at once.
+
 Usage:
     engine = WorkflowEngine(config, runner)
     engine.load_workflows(Path("docs/workflows"))
@@ -90,6 +96,58 @@ def _render_template(template: str, context: dict[str, Any]) -> str:
     return str(_TEMPLATE_RE.sub(_replace, template))
 
 
+# Step references inside a template expression: steps.X or steps["X"]
+_STEP_REF_RE = re.compile(r"\bsteps\s*(?:\.\s*([A-Za-z_]\w*)|\[\s*['\"]([^'\"]+)['\"]\s*\])")
+
+
+def _template_step_refs(template: str) -> set[str]:
+    """Step IDs referenced by {{ expr }} templates in a string."""
+    refs: set[str] = set()
+    for match in _TEMPLATE_RE.finditer(template):
+        for ref in _STEP_REF_RE.finditer(match.group(1)):
+            refs.add(ref.group(1) or ref.group(2))
+    return refs
+
+
+def _step_dependencies(step: WorkflowStepDef) -> set[str]:
+    """Step IDs a step must wait for: explicit depends_on plus template references."""
+    deps = set(step.depends_on)
+    templates = [step.message, step.input_expr, step.transform_expr]
+    templates.extend(v for v in step.tool_args.values() if isinstance(v, str))
+    for template in templates:
+        if template:
+            deps |= _template_step_refs(template)
+    deps.discard(step.id)
+    return deps
+
+
+def _is_branching(wf: WorkflowDef) -> bool:
+    return any(s.type == WorkflowStepType.CONDITION or s.next for s in wf.steps)
+
+
+def _dependency_graph(wf: WorkflowDef) -> dict[str, set[str]]:
+    """Map step ID -> known step IDs it depends on. Raises ValueError on a cycle."""
+    ids = {s.id for s in wf.steps}
+    graph = {s.id: _step_dependencies(s) & ids for s in wf.steps}
+
+    # Kahn's algorithm — anything left unsorted sits on a cycle
+    waiting = {sid: set(deps) for sid, deps in graph.items()}
+    ready = [sid for sid, deps in waiting.items() if not deps]
+    while ready:
+        sid = ready.pop()
+        del waiting[sid]
+        for other, deps in waiting.items():
+            if sid in deps:
+                deps.discard(sid)
+                if not deps:
+                    ready.append(other)
+    if waiting:
+        raise ValueError(
+            f"Workflow {wf.id}: dependency cycle between steps {', '.join(sorted(waiting))}"
+        )
+    return graph
+
+
 def _eval_condition(expression: str, value: Any) -> bool:
     """Evaluate a condition expression with 'value' as the input variable."""
     try:
@@ -139,12 +197,13 @@ def parse_workflow(data: dict[str, Any]) -> WorkflowDef:
                 on_failure=s.get("on_failure", "abort"),
                 retry_count=s.get("retry_count", 0),
                 next=s.get("next", ""),
+                depends_on=list(s.get("depends_on", [])),
             )
         )
 
     delivery = data.get("delivery", {})
 
-    return WorkflowDef(
+    wf = WorkflowDef(
         id=data["id"],
         name=data.get("name", data["id"]),
         description=data.get("description", ""),
@@ -152,11 +211,30 @@ def parse_workflow(data: dict[str, Any]) -> WorkflowDef:
         triggers=triggers,
         steps=steps,
         timeout_seconds=data.get("timeout_seconds", 900),
+        max_parallel=max(1, int(data.get("max_parallel", 1))),
         delivery_mode=delivery.get("mode", "none"),
         delivery_channel=delivery.get("channel", ""),
         delivery_to=delivery.get("to", ""),
     )
 
+    step_ids = {s.id for s in steps}
+    for step in steps:
+        unknown = set(step.depends_on) - step_ids
+        if unknown:
+            raise ValueError(
+                f"Workflow {wf.id}: step '{step.id}' depends on unknown steps "
+                f"{', '.join(sorted(unknown))}"
+            )
+    if wf.max_parallel > 1:
+        if _is_branching(wf):
+            logger.warning(
+                "Workflow %s has condition/next steps; max_parallel ignored, running in order",
+                wf.id,
+            )
+        else:
+            _dependency_graph(wf)  # reject cycles at load time
+    return wf
+
 
 class WorkflowEngine:
     """Executes declarative multi-step workflows."""
@@ -320,6 +398,10 @@ class WorkflowEngine:
 
     async def _execute_steps(self, run: WorkflowRun, wf: WorkflowDef) -> None:
         """Execute workflow steps sequentially with flow control."""
+        if wf.max_parallel > 1 and not _is_branching(wf):
+            await self._execute_steps_parallel(run, wf)
+            return
+
         # Build step index for lookups
         step_index = {s.id: i for i, s in enumerate(wf.steps)}
         current_idx = 0
@@ -328,29 +410,8 @@ class WorkflowEngine:
             step = wf.steps[current_idx]
 
             result = await self._execute_step(step, run, wf)
-            run.step_results.append(result)
-
-            # Store result in context for template rendering
-            run.context["steps"][step.id] = {
-                "status": result.status.value,
-                "output_text": result.output_text or "",
-                "tool_output": result.tool_output,
-                "condition_branch": result.condition_branch,
-                "agent_run_id": result.agent_run_id,
-            }
-
-            # Persist step result
-            self._persist_step(run, result)
-
-            # Handle failure
-            if result.status == WorkflowStepStatus.FAILED:
-                if step.on_failure == "abort":
-                    run.error_message = f"Step '{step.id}' failed: {result.error_message}"
-                    run.status = RunStatus.FAILED
-                    return
-                if step.on_failure == "skip":
-                    result.status = WorkflowStepStatus.SKIPPED
-                    # Continue to next step
+            if not self._record_step(run, step, result):
+                return
 
             # Determine next step
             if result.condition_branch and result.condition_branch in step_index:
@@ -363,6 +424,74 @@ class WorkflowEngine:
                 # Sequential
                 current_idx += 1
 
+    async def _execute_steps_parallel(self, run: WorkflowRun, wf: WorkflowDef) -> None:
+        """Execute steps as a dependency graph, up to wf.max_parallel at a time.
+
+        Results are recorded and persisted as each step finishes. After an
+        aborting failure no new steps start; steps already running finish.
+        """
+        graph = _dependency_graph(wf)
+        pending = list(wf.steps)
+        order = {s.id: i for i, s in enumerate(wf.steps)}
+        finished: set[str] = set()
+        running: dict[asyncio.Task[WorkflowStepResult], WorkflowStepDef] = {}
+        aborted = False
+
+        try:
+            while True:
+                if not aborted:
+                    for step in list(pending):
+                        if len(running) >= wf.max_parallel:
+                            break
+                        if graph[step.id] <= finished:
+                            pending.remove(step)
+                            task = asyncio.create_task(self._execute_step(step, run, wf))
+                            running[task] = step
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in sorted(done, key=lambda t: order[running[t].id]):
+                    step = running.pop(task)
+                    finished.add(step.id)
+                    if not self._record_step(run, step, task.result()):
+                        aborted = True
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+
+    def _record_step(
+        self, run: WorkflowRun, step: WorkflowStepDef, result: WorkflowStepResult
+    ) -> bool:
+        """Store and persist a step result. Returns False if the run should abort."""
+        run.step_results.append(result)
+
+        # Store result in context for template rendering
+        run.context["steps"][step.id] = {
+            "status": result.status.value,
+            "output_text": result.output_text or "",
+            "tool_output": result.tool_output,
+            "condition_branch": result.condition_branch,
+            "agent_run_id": result.agent_run_id,
+        }
+
+        # Persist step result
+        self._persist_step(run, result)
+
+        # Handle failure
+        if result.status == WorkflowStepStatus.FAILED:
+            if step.on_failure == "abort":
+                if run.status != RunStatus.FAILED:
+                    run.error_message = f"Step '{step.id}' failed: {result.error_message}"
+                    run.status = RunStatus.FAILED
+                return False
+            if step.on_failure == "skip":
+                result.status = WorkflowStepStatus.SKIPPED
+                # Continue to next step
+        return True
+
     async def _execute_step(
         self, step: WorkflowStepDef, run: WorkflowRun, wf: WorkflowDef
     ) -> WorkflowStepResult:
@@ -306,6 +306,68 @@ def subscribe(
             time.sleep(1)  # Back off on error
 
 
+def tail(
+    stream: str,
+    *,
+    handler: Callable[[dict[str, Any]], None],
+    last_id: str = "$",
+    block_ms: int = 5000,
+    max_iterations: int | None = None,
+) -> None:
+    """Follow a stream without a consumer group — every caller sees every event.
+
+    Use for broadcast notifications (e.g. cache invalidation) where each
+    process must react, rather than work queues shared by a group. Nothing
+    is acknowledged; by default only events published after the call are read.
+
+    Args:
+        stream: Stream name
+        handler: Callback function receiving parsed event dicts
+        last_id: Stream ID to start after ("$" = only new events)
+        block_ms: How long to block waiting for new messages (ms)
+        max_iterations: Stop after N iterations (None = infinite, for testing)
+    """
+    if not EVENT_BUS_ENABLED:
+        return
+
+    r = _get_redis()
+    if r is None:
+        logger.warning("Event bus: cannot tail, Redis unavailable")
+        return
+
+    key = _stream_key(stream)
+    iteration = 0
+    while max_iterations is None or iteration < max_iterations:
+        iteration += 1
+        try:
+            messages = r.xread({key: last_id}, block=block_ms)
+            if not messages:
+                continue
+            for _stream_name, entries in messages:
+                for msg_id, fields in entries:
+                    last_id = msg_id
+                    try:
+                        handler(
+                            {
+                                "id": msg_id,
+                                "timestamp": fields.get("timestamp", ""),
+                                "type": fields.get("type", ""),
+                                "source": fields.get("source", ""),
+                                "actor": fields.get("actor", ""),
+                                "payload": json.loads(fields.get("payload", "{}")),
+                                "correlation_id": fields.get("correlation_id", ""),
+                                "tenant_id": fields.get("tenant_id", ""),
+                            }
+                        )
+                    except Exception as e:
+                        logger.error("Event bus: tail handler error for %s: %s", msg_id, e)
+        except Exception as e:
+            logger.warning("Event bus: tail loop error: %s", e)
+            if max_iterations is not None:
+                break
+            time.sleep(1)  # Back off on error
+
+
 def ack(stream: str, group: str, message_id: str) -> bool:
     """Manually acknowledge a message.
 
@@ -364,10 +364,29 @@ async def analyze_image(
         return content
 
 
+# Single-text embeddings in flight — in practice interactive query embeddings.
+# Background batch embedders (chat turn queue) defer while this is non-zero.
+_embeddings_in_flight = 0
+
+
+def embeddings_in_flight() -> int:
+    """Number of single-text embedding requests currently awaiting Ollama."""
+    return _embeddings_in_flight
+
+
 async def get_embedding_async(
     text: str, model: str | None = None, max_retries: int = 3
 ) -> list[float]:
     """Get embedding vector via Ollama (async version) with retry."""
+    global _embeddings_in_flight
+    _embeddings_in_flight += 1
+    try:
+        return await _get_embedding(text, model, max_retries)
+    finally:
+        _embeddings_in_flight -= 1
+
+
+async def _get_embedding(text: str, model: str | None, max_retries: int) -> list[float]:
     payload = {
         "model": model or _embedding_model(),
         "input": text,
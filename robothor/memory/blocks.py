@@ -4,10 +4,18 @@ Agent memory blocks — named persistent text blocks for structured working memo
 Provides read/write/list operations against the agent_memory_blocks table.
 Used by the MCP server to expose memory_block_read/write/list tools.
 
+read_blocks() fetches many blocks in one query and can serve them from an
+in-process cache. Cache entries are stamped with the block's write_count;
+write_block() drops the local entry and, when ROBOTHOR_BLOCK_CHANGE_EVENTS
+is enabled, publishes a change event so other processes running
+start_block_change_listener() drop theirs too. Entries also expire after
+BLOCK_CACHE_TTL_S as a backstop. read_block() is never cached.
+
 Usage:
-    from robothor.memory.blocks import read_block, write_block, list_blocks
+    from robothor.memory.blocks import read_block, read_blocks, write_block, list_blocks
 
     block = read_block("persona")
+    blocks = read_blocks(["persona", "user_profile"], use_cache=True)
     write_block("working_context", "Current task: ...")
     all_blocks = list_blocks()
 """
@@ -15,6 +23,9 @@ Usage:
 from __future__ import annotations
 
 import logging
+import os
+import threading
+import time
 from typing import Any
 
 from robothor.constants import DEFAULT_TENANT
@@ -73,10 +84,68 @@ def read_block(block_name: str, tenant_id: str = DEFAULT_TENANT) -> dict[str, An
             }
 
 
+def read_blocks(
+    block_names: list[str],
+    tenant_id: str = DEFAULT_TENANT,
+    *,
+    use_cache: bool = False,
+) -> dict[str, dict[str, Any]]:
+    """Read several memory blocks with a single query.
+
+    Args:
+        block_names: Blocks to read. Duplicates and empty names are ignored.
+        tenant_id: Tenant that owns the blocks.
+        use_cache: Serve blocks from the in-process cache when fresh and
+            only query the misses. Cache hits do not bump read_count.
+
+    Returns:
+        Mapping of block name to the same dict read_block() returns
+        (block_name, content, last_written_at — or error if not found),
+        in the order the names were requested.
+    """
+    names = list(dict.fromkeys(n for n in block_names if n))
+    results: dict[str, dict[str, Any]] = {}
+
+    misses = names
+    if use_cache:
+        misses = []
+        for name in names:
+            cached = _block_cache.get(tenant_id, name)
+            if cached is None:
+                misses.append(name)
+            else:
+                results[name] = cached
+
+    if misses:
+        with get_connection() as conn:
+            with conn.cursor() as cur:
+                cur.execute(
+                    "UPDATE agent_memory_blocks "
+                    "SET read_count = read_count + 1, last_read_at = NOW() "
+                    "WHERE tenant_id = %s AND block_name = ANY(%s) "
+                    "RETURNING block_name, content, last_written_at, write_count",
+                    (tenant_id, misses),
+                )
+                for name, content, last_written_at, write_count in cur.fetchall():
+                    result = {
+                        "block_name": name,
+                        "content": content or "",
+                        "last_written_at": last_written_at.isoformat() if last_written_at else None,
+                    }
+                    _block_cache.put(tenant_id, name, write_count or 0, result)
+                    results[name] = result
+
+    return {
+        name: dict(results.get(name) or {"error": f"Block '{name}' not found"}) for name in names
+    }
+
+
 def write_block(block_name: str, content: str, tenant_id: str = DEFAULT_TENANT) -> dict[str, Any]:
     """Write or update a named memory block.
 
     Uses UPSERT — creates the block if it doesn't exist, updates if it does.
+    Invalidates the block in the read cache and, when enabled, notifies
+    other processes over the event bus.
 
     Returns:
         dict with success status and block_name.
@@ -93,10 +162,13 @@ def write_block(block_name: str, content: str, tenant_id: str = DEFAULT_TENANT)
                 "ON CONFLICT (tenant_id, block_name) DO UPDATE "
                 "SET content = EXCLUDED.content, last_written_at = NOW(), "
                 "    write_count = agent_memory_blocks.write_count + 1 "
-                "RETURNING id",
+                "RETURNING write_count",
                 (tenant_id, block_name, content),
             )
-            return {"success": True, "block_name": block_name}
+            row = cur.fetchone()
+    version = int(row[0]) if row and isinstance(row[0], int) else None
+    block_changed(block_name, tenant_id, version=version)
+    return {"success": True, "block_name": block_name}
 
 
 def list_blocks(tenant_id: str = DEFAULT_TENANT) -> dict[str, Any]:
@@ -143,3 +215,148 @@ def seed_blocks_for_tenant(tenant_id: str) -> int:
                 )
                 count += cur.rowcount
     return count
+
+
+# ─── Read cache ──────────────────────────────────────────────────────────
+
+BLOCK_CACHE_TTL_S = float(os.environ.get("ROBOTHOR_BLOCK_CACHE_TTL", "60"))
+
+# Publish memory.block_written events so other processes can invalidate.
+BLOCK_CHANGE_EVENTS = os.environ.get("ROBOTHOR_BLOCK_CHANGE_EVENTS", "false").lower() in (
+    "true",
+    "1",
+    "yes",
+)
+BLOCK_CHANGE_STREAM = "agent"
+BLOCK_CHANGE_EVENT = "memory.block_written"
+
+
+class _BlockCache:
+    """Thread-safe (tenant, block) → result cache stamped with write_count.
+
+    Invalidations that carry a version also record it as a floor, so a read
+    that raced the write cannot re-populate the cache with older content.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[tuple[str, str], tuple[int, float, dict[str, Any]]] = {}
+        self._floors: dict[tuple[str, str], int] = {}
+
+    def get(self, tenant_id: str, block_name: str) -> dict[str, Any] | None:
+        with self._lock:
+            entry = self._entries.get((tenant_id, block_name))
+            if entry is None:
+                return None
+            _version, stored_at, result = entry
+            if time.monotonic() - stored_at > BLOCK_CACHE_TTL_S:
+                del self._entries[(tenant_id, block_name)]
+                return None
+            return result
+
+    def put(self, tenant_id: str, block_name: str, version: int, result: dict[str, Any]) -> None:
+        key = (tenant_id, block_name)
+        with self._lock:
+            if version < self._floors.get(key, 0):
+                return
+            current = self._entries.get(key)
+            if current is not None and current[0] > version:
+                return
+            self._entries[key] = (version, time.monotonic(), result)
+
+    def invalidate(self, tenant_id: str, block_name: str, version: int | None = None) -> None:
+        """Drop an entry older than ``version`` (any entry when version is None)."""
+        key = (tenant_id, block_name)
+        with self._lock:
+            if version is not None:
+                self._floors[key] = max(self._floors.get(key, 0), version)
+            current = self._entries.get(key)
+            if current is not None and (version is None or current[0] < version):
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._floors.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+_block_cache = _BlockCache()
+
+
+def clear_block_cache() -> None:
+    """Drop every cached block (tests, tenant resets)."""
+    _block_cache.clear()
+
+
+def block_changed(
+    block_name: str, tenant_id: str = DEFAULT_TENANT, version: int | None = None
+) -> None:
+    """Record that a block was written outside read_blocks()' view.
+
+    Drops the local cache entry and, when BLOCK_CHANGE_EVENTS is enabled,
+    publishes a change event for other processes. Called by write_block()
+    and by other writers of agent_memory_blocks (e.g. append_to_block).
+    """
+    _block_cache.invalidate(tenant_id, block_name, version)
+    if not BLOCK_CHANGE_EVENTS:
+        return
+    try:
+        from robothor.events.bus import publish
+
+        publish(
+            BLOCK_CHANGE_STREAM,
+            BLOCK_CHANGE_EVENT,
+            {"block_name": block_name, "version": version},
+            source="memory.blocks",
+            tenant_id=tenant_id,
+        )
+    except Exception as e:
+        logger.debug("Block change notification failed: %s", e)
+
+
+def handle_block_change_event(event: dict[str, Any]) -> None:
+    """Event bus handler — drop the cached copy of a block another process wrote."""
+    if event.get("type") != BLOCK_CHANGE_EVENT:
+        return
+    payload = event.get("payload") or {}
+    block_name = payload.get("block_name")
+    if not block_name:
+        return
+    version = payload.get("version")
+    _block_cache.invalidate(
+        event.get("tenant_id") or DEFAULT_TENANT,
+        block_name,
+        version if isinstance(version, int) else None,
+    )
+
+
+_listener_thread: threading.Thread | None = None
+
+
+def start_block_change_listener() -> bool:
+    """Follow block change events in a daemon thread (idempotent).
+
+    Returns:
+        True if a listener is running, False when change events are disabled.
+    """
+    global _listener_thread
+    if not BLOCK_CHANGE_EVENTS:
+        return False
+    if _listener_thread is not None and _listener_thread.is_alive():
+        return True
+
+    from robothor.events.bus import tail
+
+    _listener_thread = threading.Thread(
+        target=tail,
+        args=(BLOCK_CHANGE_STREAM,),
+        kwargs={"handler": handle_block_change_event},
+        name="block-cache-listener",
+        daemon=True,
+    )
+    _listener_thread.start()
+    return True
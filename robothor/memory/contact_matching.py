@@ -3,10 +3,16 @@ Pure-Python name matching utilities for contact reconciliation.
 
 No LLM, no DB, no I/O — just algorithmic name comparison.
 Used by periodic_analysis.py Phase 4 to link memory entities to CRM contacts.
+
+ContactMatchIndex adds candidate blocking for large directories: every
+candidate is bucketed under keys derived from the same signals
+name_similarity() scores on (tokens, nickname forms, name prefixes), so only
+candidates sharing a key with the query are scored.
 """
 
 import re
 import unicodedata
+from collections import defaultdict
 from typing import Any
 
 # Common nickname → canonical mappings
@@ -230,3 +236,105 @@ def find_best_match(
         return result
 
     return None
+
+
+# Shortest prefix name_similarity() accepts as a prefix match; also the
+# length of the prefix blocking key.
+_PREFIX_KEY_LEN = 3
+
+
+def _part_keys(family: str, parts: list[str]) -> set[str]:
+    """Exact, canonical-nickname and 3-char prefix keys for each name part."""
+    keys: set[str] = set()
+    for part in parts:
+        keys.add(f"{family}t:{part}")
+        keys.add(f"{family}c:{_canonical(part)}")
+        if len(part) >= _PREFIX_KEY_LEN:
+            keys.add(f"{family}p:{part[:_PREFIX_KEY_LEN]}")
+    return keys
+
+
+def blocking_keys(name: str) -> set[str]:
+    """Keys a candidate name is indexed under.
+
+    Multi-part names are indexed by last name (the only part two multi-part
+    names can match on — directly or reversed) and by every part's exact,
+    canonical and prefix key (for single-name lookups). Single names are
+    indexed by their exact, canonical and prefix keys in a separate family.
+    """
+    parts = _split_name(name)
+    if not parts:
+        return set()
+    if len(parts) == 1:
+        return _part_keys("s", parts)
+    return {f"l:{parts[-1]}"} | _part_keys("m", parts)
+
+
+def lookup_keys(name: str) -> set[str]:
+    """Keys to probe for a query name.
+
+    Every branch of name_similarity() that scores above 0.0 needs the two
+    names to share a key: multi-part pairs need the candidate's last name to
+    equal the query's first or last part; pairs involving a single name need
+    a shared exact token, canonical nickname form, or a prefix relation of at
+    least 3 characters. Blocking on these keys therefore never drops a match.
+    """
+    parts = _split_name(name)
+    if not parts:
+        return set()
+    if len(parts) == 1:
+        return _part_keys("s", parts) | _part_keys("m", parts)
+    return {f"l:{parts[0]}", f"l:{parts[-1]}"} | _part_keys("s", parts)
+
+
+class ContactMatchIndex:
+    """Blocking index over match candidates.
+
+    Build once per reconciliation pass, then call find_best_match() per
+    input name. Results are identical to the module-level find_best_match()
+    over the full candidate list: blocked candidates are scored in their
+    original order, so tiebreaks resolve the same way.
+    """
+
+    def __init__(self, candidates: list[dict[str, Any]] | None = None, name_key: str = "name"):
+        self.name_key = name_key
+        self._candidates: list[dict[str, Any]] = []
+        self._buckets: dict[str, list[int]] = defaultdict(list)
+        for candidate in candidates or []:
+            self.add(candidate)
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def add(self, candidate: dict[str, Any]) -> None:
+        """Index one candidate (appended after all existing candidates)."""
+        position = len(self._candidates)
+        self._candidates.append(candidate)
+        for key in blocking_keys(candidate.get(self.name_key) or ""):
+            self._buckets[key].append(position)
+
+    def candidates_for(self, name: str) -> list[dict[str, Any]]:
+        """Candidates sharing at least one blocking key with ``name``, in insertion order."""
+        positions: set[int] = set()
+        for key in lookup_keys(name):
+            bucket = self._buckets.get(key)
+            if bucket:
+                positions.update(bucket)
+        return [self._candidates[i] for i in sorted(positions)]
+
+    def find_best_match(
+        self,
+        name: str,
+        threshold: float = 0.75,
+        owner_candidate_id: Any = None,
+        owner_nicknames: frozenset[str] | set[str] | None = None,
+    ) -> dict[str, Any] | None:
+        """Indexed equivalent of the module-level find_best_match()."""
+        return find_best_match(
+            name,
+            self.candidates_for(name),
+            threshold=threshold,
+            name_key=self.name_key,
+            owner_candidate_id=owner_candidate_id,
+            owner_nicknames=owner_nicknames,
+        )
@@ -251,21 +251,252 @@ async def get_entity(name: str, *, tenant_id: str = "") -> dict[str, Any] | None
     return entity
 
 
-async def get_all_about(entity_name: str, *, tenant_id: str = "") -> dict[str, Any]:
+# Graph traversal limits — keep multi-hop lookups bounded on dense graphs.
+DEFAULT_TRAVERSAL_DEPTH = 2
+MAX_TRAVERSAL_DEPTH = 4
+DEFAULT_MAX_FANOUT = 50
+DEFAULT_MAX_NODES = 500
+
+# One recursive CTE walks relations in both directions from the root, one
+# breadth-first level per iteration. Every row of a level carries ``seen``,
+# the ids discovered so far, so each node is reached once, at its shallowest
+# depth, and expanded once. An expanded node follows at most max_fanout edges
+# to unseen nodes (highest confidence first), and a level stops adding nodes
+# once max_nodes are known; ``dropped`` counts what that cap cut. The edges
+# returned are the relations between walked nodes that touch an expanded one.
+_TRAVERSAL_SQL = """
+WITH RECURSIVE
+root AS (
+    SELECT id
+    FROM memory_entities
+    WHERE lower(name) = lower(%(name)s) AND tenant_id = %(tenant_id)s
+    ORDER BY mention_count DESC, id
+    LIMIT 1
+),
+edges AS (
+    SELECT r.id AS relation_id, r.source_entity_id AS from_id,
+           r.target_entity_id AS to_id, r.confidence
+    FROM memory_relations r
+    WHERE r.tenant_id = %(tenant_id)s
+      AND (%(relation_types)s::text[] IS NULL
+           OR r.relation_type = ANY(%(relation_types)s::text[]))
+    UNION ALL
+    SELECT r.id, r.target_entity_id, r.source_entity_id, r.confidence
+    FROM memory_relations r
+    WHERE r.tenant_id = %(tenant_id)s
+      AND (%(relation_types)s::text[] IS NULL
+           OR r.relation_type = ANY(%(relation_types)s::text[]))
+),
+walk AS (
+    SELECT id AS entity_id, 0 AS depth, ARRAY[id] AS seen, 0::bigint AS dropped
+    FROM root
+    UNION ALL
+    SELECT kept.to_id, kept.depth, kept.seen || array_agg(kept.to_id) OVER (),
+           kept.candidates - count(*) OVER ()
+    FROM (
+        SELECT fresh.to_id, fresh.depth, fresh.seen,
+               row_number() OVER (ORDER BY fresh.confidence DESC, fresh.to_id) AS node_rank,
+               count(*) OVER () AS candidates
+        FROM (
+            SELECT followed.to_id, followed.depth, followed.seen, followed.confidence,
+                   row_number() OVER (
+                       PARTITION BY followed.to_id
+                       ORDER BY followed.confidence DESC, followed.relation_id
+                   ) AS arrival_rank
+            FROM (
+                SELECT e.to_id, w.depth + 1 AS depth, w.seen, e.relation_id, e.confidence,
+                       row_number() OVER (
+                           PARTITION BY w.entity_id ORDER BY e.confidence DESC, e.relation_id
+                       ) AS fanout_rank
+                FROM walk w
+                JOIN edges e ON e.from_id = w.entity_id
+                WHERE w.depth < %(max_depth)s
+                  AND cardinality(w.seen) < %(max_nodes)s
+                  AND e.to_id <> ALL(w.seen)
+            ) followed
+            WHERE followed.fanout_rank <= %(max_fanout)s
+        ) fresh
+        WHERE fresh.arrival_rank = 1
+    ) kept
+    WHERE kept.node_rank <= %(max_nodes)s - cardinality(kept.seen)
+)
+SELECT 'node' AS kind, n.id, n.name, n.entity_type, n.mention_count, n.aliases,
+       n.last_seen, w.depth,
+       NULL::integer AS source_entity_id, NULL::integer AS target_entity_id,
+       NULL::text AS relation_type, NULL::float AS confidence, NULL::integer AS fact_id,
+       NULL::timestamptz AS created_at,
+       (SELECT COALESCE(sum(dropped), 0)::bigint
+        FROM (SELECT DISTINCT depth, dropped FROM walk) levels) AS dropped_count
+FROM walk w
+JOIN memory_entities n ON n.id = w.entity_id
+UNION ALL
+SELECT 'edge', r.id, NULL, NULL, NULL, NULL, NULL, least(a.depth, b.depth) + 1,
+       r.source_entity_id, r.target_entity_id, r.relation_type, r.confidence, r.fact_id,
+       r.created_at, NULL
+FROM memory_relations r
+JOIN walk a ON a.entity_id = r.source_entity_id
+JOIN walk b ON b.entity_id = r.target_entity_id
+WHERE r.tenant_id = %(tenant_id)s
+  AND (%(relation_types)s::text[] IS NULL
+       OR r.relation_type = ANY(%(relation_types)s::text[]))
+  AND least(a.depth, b.depth) < %(max_depth)s
+ORDER BY depth, kind DESC, id
+"""
+
+
+def _traverse_graph_sync(
+    cur: Any,
+    entity_name: str,
+    *,
+    tenant_id: str,
+    max_depth: int,
+    relation_types: list[str] | None,
+    max_fanout: int,
+    max_nodes: int,
+) -> dict[str, Any]:
+    """Run the traversal CTE on an open RealDictCursor and shape the result."""
+    cur.execute(
+        _TRAVERSAL_SQL,
+        {
+            "name": entity_name,
+            "tenant_id": tenant_id,
+            "relation_types": list(relation_types) if relation_types else None,
+            "max_depth": max(0, min(max_depth, MAX_TRAVERSAL_DEPTH)),
+            "max_fanout": max(1, max_fanout),
+            "max_nodes": max(1, max_nodes),
+        },
+    )
+    rows = [dict(r) for r in cur.fetchall()]
+
+    nodes: dict[int, dict[str, Any]] = {}
+    dropped_count = 0
+    for row in rows:
+        if row["kind"] == "node":
+            nodes[row["id"]] = {
+                "id": row["id"],
+                "name": row["name"],
+                "entity_type": row["entity_type"],
+                "mention_count": row["mention_count"],
+                "aliases": row["aliases"] or [],
+                "last_seen": row["last_seen"],
+                "depth": row["depth"],
+            }
+            dropped_count = row["dropped_count"] or 0
+
+    edges = []
+    for row in rows:
+        if row["kind"] != "edge":
+            continue
+        source = nodes.get(row["source_entity_id"], {})
+        target = nodes.get(row["target_entity_id"], {})
+        edges.append(
+            {
+                "id": row["id"],
+                "source_entity_id": row["source_entity_id"],
+                "target_entity_id": row["target_entity_id"],
+                "relation_type": row["relation_type"],
+                "confidence": row["confidence"],
+                "fact_id": row["fact_id"],
+                "created_at": row["created_at"],
+                "source_name": source.get("name"),
+                "source_type": source.get("entity_type"),
+                "target_name": target.get("name"),
+                "target_type": target.get("entity_type"),
+                "depth": row["depth"],
+            }
+        )
+
+    root = next((n for n in nodes.values() if n["depth"] == 0), None)
+    return {
+        "root": root,
+        "nodes": list(nodes.values()),
+        "edges": edges,
+        "truncated": dropped_count > 0,
+    }
+
+
+async def traverse_graph(
+    entity_name: str,
+    *,
+    max_depth: int = DEFAULT_TRAVERSAL_DEPTH,
+    relation_types: list[str] | None = None,
+    max_fanout: int = DEFAULT_MAX_FANOUT,
+    max_nodes: int = DEFAULT_MAX_NODES,
+    tenant_id: str = "",
+) -> dict[str, Any]:
+    """Walk the entity graph around an entity with a single recursive query.
+
+    Relations are followed in both directions, breadth first. Each node is
+    reached once, at its shallowest depth, and expands at most
+    ``max_fanout`` edges to unseen nodes (highest confidence first). The
+    walk stops adding nodes once ``max_nodes`` are known.
+
+    Args:
+        entity_name: Root entity name (case-insensitive).
+        max_depth: Number of hops to follow (capped at MAX_TRAVERSAL_DEPTH).
+        relation_types: Only follow these relation types (None = all).
+        max_fanout: Per-node cap on followed edges.
+        max_nodes: Cap on returned nodes.
+        tenant_id: Tenant scope for data isolation.
+
+    Returns:
+        Dict with 'root' (None if the entity is unknown), 'nodes' (each with
+        its hop depth), 'edges' (relations between returned nodes that touch
+        an expanded node, with source/target names and depth) and
+        'truncated' (True if ``max_nodes`` cut the walk short).
+    """
+    _tenant = tenant_id or DEFAULT_TENANT
+    with get_connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+        return _traverse_graph_sync(
+            cur,
+            entity_name,
+            tenant_id=_tenant,
+            max_depth=max_depth,
+            relation_types=relation_types,
+            max_fanout=max_fanout,
+            max_nodes=max_nodes,
+        )
+
+
+async def get_all_about(
+    entity_name: str,
+    *,
+    tenant_id: str = "",
+    depth: int = 1,
+    relation_types: list[str] | None = None,
+    max_fanout: int = DEFAULT_MAX_FANOUT,
+) -> dict[str, Any]:
     """Get everything known about an entity: entity info, facts, and relations.
 
     Args:
         entity_name: Entity name to look up.
         tenant_id: Tenant scope for data isolation.
+        depth: Hops of the relation graph to include (1 = direct relations).
+        relation_types: Only follow these relation types in the graph walk.
+        max_fanout: Per-node cap on followed edges in the graph walk.
 
     Returns:
-        Dict with 'entity', 'facts', and 'relations'.
+        Dict with 'entity', 'facts', and 'relations' (every direct relation,
+        as returned by ``get_entity``). When depth > 1 also 'graph' with the
+        ``traverse_graph`` nodes and edges.
     """
     _tenant = tenant_id or DEFAULT_TENANT
     entity = await get_entity(entity_name, tenant_id=tenant_id)
 
+    graph = None
     with get_connection() as conn:
         cur = conn.cursor(cursor_factory=RealDictCursor)
+        if depth > 1 and entity is not None:
+            graph = _traverse_graph_sync(
+                cur,
+                entity_name,
+                tenant_id=_tenant,
+                max_depth=depth,
+                relation_types=relation_types,
+                max_fanout=max_fanout,
+                max_nodes=DEFAULT_MAX_NODES,
+            )
         cur.execute(
             """
             SELECT id, fact_text, category, confidence, created_at
@@ -280,11 +511,18 @@ async def get_all_about(entity_name: str, *, tenant_id: str = "") -> dict[str, A
         )
         facts = [dict(r) for r in cur.fetchall()]
 
-    return {
+    result: dict[str, Any] = {
         "entity": entity,
         "facts": facts,
         "relations": entity["relations"] if entity else [],
     }
+    if graph is not None:
+        result["graph"] = {
+            "nodes": graph["nodes"],
+            "edges": graph["edges"],
+            "truncated": graph["truncated"],
+        }
+    return result
 
 
 async def extract_and_store_entities(
@@ -15,6 +15,7 @@ Dependencies:
 from __future__ import annotations
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -29,6 +30,13 @@ from robothor.llm import ollama as llm_client
 
 logger = logging.getLogger(__name__)
 
+# Items accepted by one batch store/search call
+MAX_BATCH_ITEMS = 50
+# Concurrent LLM extractions in store_memories_batch
+BATCH_EXTRACT_CONCURRENCY = 4
+# Concurrent searches (each holding a pooled DB connection) in search_facts_batch
+BATCH_SEARCH_CONCURRENCY = 4
+
 VALID_CATEGORIES = [
     "personal",
     "project",
@@ -228,6 +236,110 @@ async def extract_facts(content: str, max_retries: int = 3) -> list[dict[str, An
         return []
 
 
+_EXTRACTION_SYSTEM_PROMPT = "Extract facts from the content as a JSON array."
+
+
+def extraction_prompt_version() -> str:
+    """Short fingerprint of the extraction prompt, system prompt and schema.
+
+    Changes automatically whenever any of them is edited, so cached
+    extractions from an older prompt are never replayed.
+    """
+    spec = json.dumps(
+        [build_extraction_prompt(""), _EXTRACTION_SYSTEM_PROMPT, FACT_EXTRACTION_SCHEMA],
+        sort_keys=True,
+    )
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()[:16]
+
+
+def extraction_content_hash(content: str) -> str:
+    """SHA-256 of content with whitespace normalized (re-wrapped text still matches)."""
+    normalized = " ".join(content.split())
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def get_cached_extraction(content: str, model: str | None = None) -> list[dict[str, Any]] | None:
+    """Look up facts previously extracted from identical content.
+
+    Keyed by (content hash, extraction prompt version, generation model).
+    Returns None on a miss or if the cache is unavailable.
+    """
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                UPDATE memory_extraction_cache
+                SET hit_count = hit_count + 1, last_hit_at = NOW()
+                WHERE content_hash = %s AND prompt_version = %s AND model = %s
+                RETURNING facts
+                """,
+                (
+                    extraction_content_hash(content),
+                    extraction_prompt_version(),
+                    model or llm_client.GENERATION_MODEL,
+                ),
+            )
+            row = cur.fetchone()
+            conn.commit()
+    except Exception as e:
+        logger.debug("Extraction cache lookup failed: %s", e)
+        return None
+    if row is None:
+        return None
+    facts = row[0]
+    if isinstance(facts, str):
+        facts = json.loads(facts)
+    return list(facts)
+
+
+def store_cached_extraction(
+    content: str, facts: list[dict[str, Any]], model: str | None = None
+) -> None:
+    """Remember the facts extracted from content. Best-effort."""
+    try:
+        with get_connection() as conn:
+            cur = conn.cursor()
+            cur.execute(
+                """
+                INSERT INTO memory_extraction_cache
+                    (content_hash, prompt_version, model, facts)
+                VALUES (%s, %s, %s, %s)
+                ON CONFLICT (content_hash, prompt_version, model)
+                DO UPDATE SET facts = EXCLUDED.facts
+                """,
+                (
+                    extraction_content_hash(content),
+                    extraction_prompt_version(),
+                    model or llm_client.GENERATION_MODEL,
+                    json.dumps(facts),
+                ),
+            )
+            conn.commit()
+    except Exception as e:
+        logger.debug("Extraction cache store failed: %s", e)
+
+
+async def extract_facts_cached(content: str) -> tuple[list[dict[str, Any]], bool]:
+    """extract_facts() memoized in memory_extraction_cache.
+
+    Empty extractions are not cached — they are indistinguishable from
+    LLM failures and timeouts, which should be retried next time.
+
+    Returns:
+        (facts, cache_hit) — cache_hit is True when no LLM call was made.
+    """
+    model = llm_client.GENERATION_MODEL
+    cached = get_cached_extraction(content, model)
+    if cached is not None:
+        logger.info("extract_facts cache hit (%d facts)", len(cached))
+        return cached, True
+    facts = await extract_facts(content)
+    if facts:
+        store_cached_extraction(content, facts, model)
+    return facts, False
+
+
 async def _extract_facts_inner(
     content: str,
     max_retries: int,
@@ -239,7 +351,7 @@ async def _extract_facts_inner(
             logger.info("extract_facts attempt %d/%d", attempt + 1, max_retries)
             raw = await llm_client.generate(
                 prompt=prompt,
-                system="Extract facts from the content as a JSON array.",
+                system=_EXTRACTION_SYSTEM_PROMPT,
                 max_tokens=1024,
                 format=FACT_EXTRACTION_SCHEMA,
                 think=False,
@@ -373,6 +485,7 @@ async def search_insights(
     limit: int = 5,
     *,
     tenant_id: str = "",
+    embedding: list[float] | None = None,
 ) -> list[dict[str, Any]]:
     """Search cross-domain insights by vector similarity.
 
@@ -380,11 +493,13 @@ async def search_insights(
         query: Search query text.
         limit: Maximum number of results.
         tenant_id: Tenant scope for data isolation.
+        embedding: Precomputed embedding of ``query``, if already known.
 
     Returns:
         List of matching insight dictionaries sorted by similarity.
     """
-    embedding = await llm_client.get_embedding_async(query)
+    if embedding is None:
+        embedding = await llm_client.get_embedding_async(query)
 
     with get_connection() as conn:
         cur = conn.cursor(cursor_factory=RealDictCursor)
@@ -415,6 +530,50 @@ def _reranker_enabled_default() -> bool:
     return raw not in ("0", "false", "no", "off")
 
 
+def _hybrid_search_rows(
+    query: str,
+    embedding: list[float],
+    tenant_id: str,
+    active_clause: str,
+    fetch_limit: int,
+) -> tuple[list[dict[str, Any]], list[dict[str, Any]]]:
+    """Vector and BM25 candidate rows for ``search_facts`` (blocking)."""
+    with get_connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+
+        # Vector search
+        cur.execute(
+            f"""
+            SELECT id, fact_text, category, entities, confidence, source_type,
+                   metadata, created_at,
+                   1 - (embedding <=> %s::vector) as similarity
+            FROM memory_facts
+            WHERE embedding IS NOT NULL AND tenant_id = %s {active_clause}
+            ORDER BY embedding <=> %s::vector
+            LIMIT %s
+            """,
+            (embedding, tenant_id, embedding, fetch_limit),
+        )
+        vector_results = [dict(r) for r in cur.fetchall()]
+
+        # BM25 keyword search
+        cur.execute(
+            f"""
+            SELECT id, fact_text, category, entities, confidence, source_type,
+                   metadata, created_at,
+                   ts_rank(tsv, plainto_tsquery('english', %s)) as bm25_score
+            FROM memory_facts
+            WHERE tsv @@ plainto_tsquery('english', %s) AND tenant_id = %s
+              {active_clause}
+            ORDER BY ts_rank(tsv, plainto_tsquery('english', %s)) DESC
+            LIMIT %s
+            """,
+            (query, query, tenant_id, query, fetch_limit),
+        )
+        bm25_results = [dict(r) for r in cur.fetchall()]
+    return vector_results, bm25_results
+
+
 async def search_facts(
     query: str,
     limit: int = 10,
@@ -425,6 +584,7 @@ async def search_facts(
     include_episodes: bool = False,
     include_chat_turns: bool = False,
     tenant_id: str = "",
+    embedding: list[float] | None = None,
 ) -> list[dict[str, Any]]:
     """Hybrid search: vector similarity + BM25 keyword matching with RRF fusion.
 
@@ -442,6 +602,7 @@ async def search_facts(
         use_reranker: If True, run reranker on candidates. If None (default),
             honors MEMORY_RERANK_ENABLED env flag (on by default).
         expand_entities: If True, pull related entity facts.
+        embedding: Precomputed embedding of ``query`` (see ``search_facts_batch``).
 
     Returns:
         List of matching fact dictionaries sorted by relevance.
@@ -449,45 +610,17 @@ async def search_facts(
     if use_reranker is None:
         use_reranker = _reranker_enabled_default()
 
-    embedding = await llm_client.get_embedding_async(query)
+    if embedding is None:
+        embedding = await llm_client.get_embedding_async(query)
 
     active_clause = "AND is_active = TRUE" if active_only else ""
     fetch_limit = max(30, limit * 3)
     _tenant = tenant_id or DEFAULT_TENANT
 
-    with get_connection() as conn:
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        # Vector search
-        cur.execute(
-            f"""
-            SELECT id, fact_text, category, entities, confidence, source_type,
-                   metadata, created_at,
-                   1 - (embedding <=> %s::vector) as similarity
-            FROM memory_facts
-            WHERE embedding IS NOT NULL AND tenant_id = %s {active_clause}
-            ORDER BY embedding <=> %s::vector
-            LIMIT %s
-            """,
-            (embedding, _tenant, embedding, fetch_limit),
-        )
-        vector_results = [dict(r) for r in cur.fetchall()]
-
-        # BM25 keyword search
-        cur.execute(
-            f"""
-            SELECT id, fact_text, category, entities, confidence, source_type,
-                   metadata, created_at,
-                   ts_rank(tsv, plainto_tsquery('english', %s)) as bm25_score
-            FROM memory_facts
-            WHERE tsv @@ plainto_tsquery('english', %s) AND tenant_id = %s
-              {active_clause}
-            ORDER BY ts_rank(tsv, plainto_tsquery('english', %s)) DESC
-            LIMIT %s
-            """,
-            (query, query, _tenant, query, fetch_limit),
-        )
-        bm25_results = [dict(r) for r in cur.fetchall()]
+    # Blocking queries run in a worker thread so concurrent searches overlap
+    vector_results, bm25_results = await asyncio.to_thread(
+        _hybrid_search_rows, query, embedding, _tenant, active_clause, fetch_limit
+    )
 
     # Reciprocal Rank Fusion
     vector_ranks = {r["id"]: rank for rank, r in enumerate(vector_results)}
@@ -579,7 +712,9 @@ async def search_facts(
             )
             if include_insights:
                 try:
-                    insights = await search_insights(query, limit=3, tenant_id=tenant_id)
+                    insights = await search_insights(
+                        query, limit=3, tenant_id=tenant_id, embedding=embedding
+                    )
                     reranked.extend(insights)
                 except Exception:
                     pass
@@ -592,7 +727,9 @@ async def search_facts(
     # Append cross-domain insights if requested
     if include_insights:
         try:
-            insights = await search_insights(query, limit=3, tenant_id=tenant_id)
+            insights = await search_insights(
+                query, limit=3, tenant_id=tenant_id, embedding=embedding
+            )
             result.extend(insights)
         except Exception:
             pass  # Insight search is best-effort
@@ -627,6 +764,67 @@ async def search_facts(
     return result
 
 
+async def search_facts_batch(
+    queries: list[str], limit: int = 10, **kwargs: Any
+) -> list[list[dict[str, Any]]]:
+    """Run ``search_facts`` for several queries, embedding them in one call.
+
+    Keyword arguments are passed to ``search_facts``. At most
+    ``BATCH_SEARCH_CONCURRENCY`` searches run at a time; each one's vector
+    and BM25 queries run in a worker thread, so they overlap instead of
+    blocking the event loop. The optional entity, insight and episode
+    lookups still query inline. Returns one result list per query, in order.
+    """
+    embeddings = await llm_client.get_embeddings_batch_async(queries)
+    slots = asyncio.Semaphore(BATCH_SEARCH_CONCURRENCY)
+
+    async def one(query: str, embedding: list[float]) -> list[dict[str, Any]]:
+        async with slots:
+            return await search_facts(query, limit, embedding=embedding, **kwargs)
+
+    return list(
+        await asyncio.gather(
+            *(one(query, embedding) for query, embedding in zip(queries, embeddings, strict=True))
+        )
+    )
+
+
+async def store_memories_batch(
+    items: list[tuple[str, str]], *, tenant_id: str = ""
+) -> list[dict[str, Any]]:
+    """Extract and store facts for many ``(content, content_type)`` items.
+
+    Extraction runs concurrently, at most ``BATCH_EXTRACT_CONCURRENCY`` at a
+    time. Each item's facts are then stored with ``store_facts_batch`` (one
+    embedding call per item). Content with no extractable facts is stored
+    as a single low-confidence fact, like the store_memory tool does.
+
+    Returns one ``{"ids", "facts_stored"}`` or ``{"error"}`` dict per item.
+    """
+    slots = asyncio.Semaphore(BATCH_EXTRACT_CONCURRENCY)
+
+    async def one(content: str, content_type: str) -> dict[str, Any]:
+        try:
+            async with slots:
+                facts = await extract_facts(content)
+            if not facts:
+                facts = [
+                    {
+                        "fact_text": content,
+                        "category": "personal",
+                        "entities": [],
+                        "confidence": 0.5,
+                    }
+                ]
+            ids = await store_facts_batch(facts, content, content_type, tenant_id=tenant_id)
+            return {"ids": ids, "facts_stored": len(ids)}
+        except Exception as e:
+            logger.warning("store_memories_batch: item failed: %s", e)
+            return {"error": str(e)}
+
+    return list(await asyncio.gather(*(one(c, t) for c, t in items)))
+
+
 def get_memory_stats(tenant_id: str = "") -> dict[str, Any]:
     """Get memory system statistics from the facts-based memory system.
 
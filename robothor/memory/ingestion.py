@@ -5,7 +5,8 @@ Accepts content from multiple channels (discord, email, cli, api, telegram)
 and runs it through fact extraction and conflict resolution.
 
 Architecture:
-    Content + channel -> extract_facts -> resolve_and_store (each fact) -> result
+    Content + channel -> extract_facts (memoized by content hash)
+        -> resolve_and_store (each fact) -> result
 """
 
 from __future__ import annotations
@@ -17,7 +18,7 @@ from typing import Any
 from robothor.db.connection import get_connection
 from robothor.memory.conflicts import resolve_and_store
 from robothor.memory.entities import extract_entities_batch
-from robothor.memory.facts import extract_facts, store_fact
+from robothor.memory.facts import extract_facts_cached, store_fact
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +36,23 @@ VALID_CHANNELS = [
     "crm",
 ]
 
+# Process-wide extraction counters — see extraction_stats().
+_extraction_stats = {"llm_extractions": 0, "cache_hits": 0}
+
+
+def extraction_stats() -> dict[str, int]:
+    """Fact extraction counters since process start (or the last reset).
+
+    ``cache_hits`` is the number of LLM extraction calls saved by the
+    extraction cache.
+    """
+    return dict(_extraction_stats)
+
+
+def reset_extraction_stats() -> None:
+    for key in _extraction_stats:
+        _extraction_stats[key] = 0
+
 
 async def ingest_content(
     content: str,
@@ -65,8 +83,9 @@ async def ingest_content(
         len(content),
         source_channel,
     )
-    facts = await extract_facts(content)
-    logger.info("Extracted %d facts", len(facts))
+    facts, cache_hit = await extract_facts_cached(content)
+    _extraction_stats["cache_hits" if cache_hit else "llm_extractions"] += 1
+    logger.info("Extracted %d facts%s", len(facts), " (cached)" if cache_hit else "")
 
     stored_ids = []
     skipped = 0
@@ -110,6 +129,7 @@ async def ingest_content(
         "facts_processed": len(stored_ids),
         "facts_skipped": skipped,
         "fact_ids": stored_ids,
+        "extraction_cached": cache_hit,
         "entities_stored": entity_results.get("entities_stored", 0),
         "relations_stored": entity_results.get("relations_stored", 0),
     }
@@ -8,7 +8,7 @@ or marked as important resist decay.
 
 Architecture:
     Decay formula considers: recency, access frequency, reinforcement, importance
-    Maintenance: score importance -> compute decay -> prune low-quality -> consolidate -> insights
+    Maintenance: score importance (batched) -> decay (set-based SQL) -> prune -> consolidate -> insights
     Intra-day: lightweight consolidation after each ingest run (threshold >= 5 unconsolidated)
     Insights: cross-domain connection discovery from recent diverse-category facts
 """
@@ -41,6 +41,42 @@ IMPORTANCE_SCHEMA = {
     "required": ["score"],
 }
 
+# JSON schema for batched importance scoring (many facts per LLM call).
+IMPORTANCE_BATCH_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "scores": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "id": {"type": "integer"},
+                    "score": {"type": "number"},
+                },
+                "required": ["id", "score"],
+            },
+        },
+    },
+    "required": ["scores"],
+}
+
+# Facts sent to the LLM per batched importance call.
+_IMPORTANCE_BATCH_SIZE = 20
+
+# Decay formula constants — shared by compute_decay_score() and the
+# set-based SQL in update_decay_scores() so both stay equivalent.
+_DECAY_HALF_LIFE_HOURS = 72.0
+_ACCESS_BOOST_DIVISOR = 5.0
+_ACCESS_BOOST_CAP = 0.3
+_REINFORCEMENT_BOOST_DIVISOR = 5.0
+_REINFORCEMENT_BOOST_CAP = 0.2
+_IMPORTANCE_FLOOR_WEIGHT = 0.4
+
+# A fact whose recency (as of its last decay pass) had already fallen to
+# within this margin of its importance floor has a stable score until one
+# of its inputs changes, so incremental passes skip it.
+_DECAY_STABLE_EPSILON = 1e-4
+
 # JSON schema for cross-domain insight discovery structured output.
 INSIGHT_SCHEMA = {
     "type": "object",
@@ -96,12 +132,14 @@ def compute_decay_score(
     hours_since = max((now - last_accessed).total_seconds() / 3600, 0)
 
     # Exponential decay with half-life of 72 hours (3 days)
-    half_life = 72.0
-    recency = math.exp(-hours_since * math.log(2) / half_life)
+    recency = math.exp(-hours_since * math.log(2) / _DECAY_HALF_LIFE_HOURS)
 
-    access_boost = min(math.log(1 + access_count) / 5.0, 0.3)
-    reinforcement_boost = min(math.log(1 + reinforcement_count) / 5.0, 0.2)
-    importance_floor = importance_score * 0.4
+    access_boost = min(math.log(1 + access_count) / _ACCESS_BOOST_DIVISOR, _ACCESS_BOOST_CAP)
+    reinforcement_boost = min(
+        math.log(1 + reinforcement_count) / _REINFORCEMENT_BOOST_DIVISOR,
+        _REINFORCEMENT_BOOST_CAP,
+    )
+    importance_floor = importance_score * _IMPORTANCE_FLOOR_WEIGHT
 
     base = max(recency, importance_floor)
     score = base + access_boost + reinforcement_boost
@@ -156,6 +194,239 @@ Fact: "{content}" """
         return 0.5
 
 
+async def judge_importance_batch(
+    facts: list[dict[str, Any]],
+    timeout_s: float = 90.0,
+) -> dict[int, float]:
+    """Score the importance of many facts with a single LLM call.
+
+    Args:
+        facts: Fact dicts with 'id' and 'fact_text'.
+        timeout_s: Maximum seconds to wait for the LLM response.
+
+    Returns:
+        Mapping of fact id to importance score (0.0-1.0). Facts the model
+        skipped, or every fact on timeout/parse failure, are omitted so the
+        caller leaves them unscored for the next pass.
+    """
+    if not facts:
+        return {}
+
+    valid_ids = {int(f["id"]) for f in facts}
+    facts_block = "\n".join(f"[{f['id']}] {f['fact_text']}" for f in facts)
+
+    prompt = f"""Rate the long-term importance of each fact on a scale of 0.0 to 1.0.
+
+- 0.0-0.2: Trivial (weather, casual chat)
+- 0.3-0.5: Mildly useful (routine info)
+- 0.6-0.8: Important (decisions, preferences, project info)
+- 0.9-1.0: Critical (security, identity, relationships)
+
+Facts:
+{facts_block}
+
+Return one score per fact, using the fact ID shown in brackets."""
+
+    try:
+        raw = await asyncio.wait_for(
+            llm_client.generate(
+                prompt=prompt,
+                system="Rate the importance of each fact.",
+                max_tokens=32 * len(facts) + 64,
+                format=IMPORTANCE_BATCH_SCHEMA,
+                think=False,
+            ),
+            timeout=timeout_s,
+        )
+        parsed = json.loads(raw.strip())
+    except TimeoutError:
+        logger.warning(
+            "judge_importance_batch timed out after %.0fs (%d facts)", timeout_s, len(facts)
+        )
+        return {}
+    except Exception as e:
+        logger.warning("judge_importance_batch failed (%d facts): %s", len(facts), e)
+        return {}
+
+    scores: dict[int, float] = {}
+    for item in parsed.get("scores", []):
+        try:
+            fact_id = int(item["id"])
+            score = float(item["score"])
+        except (KeyError, TypeError, ValueError):
+            continue
+        if fact_id in valid_ids:
+            scores[fact_id] = max(0.0, min(1.0, score))
+    return scores
+
+
+def _sql_recency(ts_expr: str, as_of: str = "NOW()") -> str:
+    """SQL for the recency term of compute_decay_score() evaluated at ``as_of``."""
+    return (
+        f"EXP(-GREATEST(EXTRACT(EPOCH FROM ({as_of} - {ts_expr})) / 3600.0, 0)"
+        f" * LN(2) / {_DECAY_HALF_LIFE_HOURS})"
+    )
+
+
+def _decay_score_sql() -> str:
+    """SQL expression equivalent to compute_decay_score() over memory_facts columns."""
+    from robothor.memory.outcomes import _MAX_PENALTY, _PER_FAILURE_PENALTY
+
+    return f"""GREATEST(0.0, LEAST(1.0,
+        GREATEST({_sql_recency("COALESCE(last_accessed, created_at, NOW())")},
+                 COALESCE(importance_score, 0.5) * {_IMPORTANCE_FLOOR_WEIGHT})
+        + LEAST(LN(1 + GREATEST(COALESCE(access_count, 0), 0)) / {_ACCESS_BOOST_DIVISOR},
+                {_ACCESS_BOOST_CAP})
+        + LEAST(LN(1 + GREATEST(COALESCE(reinforcement_count, 0), 0))
+                / {_REINFORCEMENT_BOOST_DIVISOR}, {_REINFORCEMENT_BOOST_CAP})
+        - CASE WHEN COALESCE(outcome_failures, 0) > 0
+               THEN LEAST({_PER_FAILURE_PENALTY} * outcome_failures, {_MAX_PENALTY})
+               ELSE 0 END
+    ))"""
+
+
+# Fingerprint of every decay input except wall-clock time.
+_DECAY_INPUTS_SIG_SQL = """md5(concat_ws('|', last_accessed, access_count, reinforcement_count,
+                               importance_score, outcome_failures))"""
+
+
+def update_decay_scores(full: bool = False) -> dict[str, Any]:
+    """Recompute decay scores for active facts in one set-based UPDATE.
+
+    Incremental by default: a fact is rewritten only if one of its decay
+    inputs changed since the last pass, it has never been scored, or its
+    recency term (as of the last pass) was still above its importance
+    floor — once recency falls below the floor the score can only change
+    when an input does.
+
+    Args:
+        full: Recompute every active fact regardless of prior passes.
+
+    Returns:
+        Dict with 'updated' row count and 'elapsed_s'.
+    """
+    t0 = time.monotonic()
+    stale_recency = _sql_recency(
+        "COALESCE(last_accessed, created_at, NOW())", as_of="decay_computed_at"
+    )
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            f"""
+            UPDATE memory_facts
+            SET decay_score = {_decay_score_sql()},
+                decay_computed_at = NOW(),
+                decay_inputs_sig = {_DECAY_INPUTS_SIG_SQL}
+            WHERE is_active = TRUE
+              AND (
+                %(full)s
+                OR decay_computed_at IS NULL
+                OR decay_inputs_sig IS DISTINCT FROM {_DECAY_INPUTS_SIG_SQL}
+                OR {stale_recency} >
+                   COALESCE(importance_score, 0.5) * {_IMPORTANCE_FLOOR_WEIGHT}
+                   + {_DECAY_STABLE_EPSILON}
+              )
+            """,
+            {"full": full},
+        )
+        updated = int(cur.rowcount)
+    return {"updated": updated, "elapsed_s": time.monotonic() - t0}
+
+
+async def score_unscored_importance(
+    limit: int = 200,
+    budget_s: float = 600.0,
+    batch_size: int = _IMPORTANCE_BATCH_SIZE,
+) -> dict[str, Any]:
+    """Judge importance for unscored facts in batched LLM calls.
+
+    Fast-path: events older than 30 days auto-score 0.3 without an LLM call.
+    Remaining unscored facts (importance_score = 0.5) are scored
+    ``batch_size`` at a time until ``limit`` or the wall-clock budget is hit.
+
+    Returns:
+        Dict with 'scored', 'auto_scored', 'skipped_budget', 'llm_calls'.
+    """
+    from psycopg2.extras import execute_values
+
+    t0 = time.monotonic()
+    with get_connection() as conn:
+        cur = conn.cursor(cursor_factory=RealDictCursor)
+
+        cur.execute(
+            """
+            UPDATE memory_facts SET importance_score = 0.3
+            WHERE is_active = TRUE AND importance_score = 0.5
+              AND category = 'event'
+              AND created_at < NOW() - INTERVAL '30 days'
+            """
+        )
+        auto_scored = cur.rowcount
+
+        cur.execute(
+            """
+            SELECT id, fact_text FROM memory_facts
+            WHERE is_active = TRUE AND importance_score = 0.5
+            ORDER BY created_at DESC
+            LIMIT %s
+            """,
+            (limit,),
+        )
+        unscored = [dict(r) for r in cur.fetchall()]
+
+    scored = 0
+    attempted = 0
+    llm_calls = 0
+    skipped_budget = 0
+    for start in range(0, len(unscored), batch_size):
+        elapsed = time.monotonic() - t0
+        if elapsed > budget_s:
+            skipped_budget = len(unscored) - attempted
+            logger.warning(
+                "Importance scoring budget exhausted (%.0fs): scored %d, skipping %d",
+                elapsed,
+                scored,
+                skipped_budget,
+            )
+            break
+        batch = unscored[start : start + batch_size]
+        attempted += len(batch)
+        llm_calls += 1
+        scores = await judge_importance_batch(batch)
+        if not scores:
+            continue
+        try:
+            with get_connection() as conn:
+                cur = conn.cursor()
+                execute_values(
+                    cur,
+                    """
+                    UPDATE memory_facts AS f SET importance_score = v.score
+                    FROM (VALUES %s) AS v(id, score)
+                    WHERE f.id = v.id
+                    """,
+                    list(scores.items()),
+                    template="(%s::int, %s::float)",
+                )
+            scored += len(scores)
+        except Exception as e:
+            logger.warning("Failed to store importance batch: %s", e)
+
+    return {
+        "scored": scored,
+        "auto_scored": auto_scored,
+        "skipped_budget": skipped_budget,
+        "llm_calls": llm_calls,
+    }
+
+
+def _throughput(count: int, seconds: float) -> float:
+    """Items per second for a maintenance phase (0.0 for empty/instant phases)."""
+    if count <= 0 or seconds <= 0:
+        return 0.0
+    return round(count / seconds, 2)
+
+
 async def find_consolidation_candidates(
     min_group_size: int = 3,
     similarity_threshold: float = 0.8,
@@ -739,15 +1010,16 @@ async def run_lifecycle_maintenance() -> dict[str, Any]:
     Steps:
         1. Score importance for unscored facts (200 per run, 600s budget)
            - Fast-path: events older than 30 days auto-score 0.3
-           - Each judge_importance() wrapped in try/except with 30s timeout
-        2. Compute and update decay scores for all active facts
+           - Batched judge_importance_batch() calls, 20 facts per prompt
+        2. Recompute decay scores in SQL for facts whose inputs changed
         3. Prune low-quality facts (garbage collection)
         4. Find and consolidate similar fact groups
         5. Sweep any remaining unconsolidated facts
         6. Cross-domain insight discovery (72h window)
 
     Returns:
-        Dict with maintenance statistics.
+        Dict with maintenance statistics, per-step timings and per-phase
+        throughput (items per second).
     """
     # Acquire distributed lock via Redis SETNX
     try:
@@ -772,62 +1044,17 @@ async def run_lifecycle_maintenance() -> dict[str, Any]:
 
     step_timings: dict[str, float] = {}
 
-    # Step 1: Score importance
+    # Step 1: Score importance (batched LLM calls, 600s wall-clock budget)
     t0 = time.monotonic()
-    scoring_budget_s = 600.0  # Wall-clock budget for importance scoring
-
-    with get_connection() as conn:
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-
-        # Fast-path: events older than 30 days auto-score 0.3 (skip LLM call)
-        cur.execute(
-            """
-            UPDATE memory_facts SET importance_score = 0.3
-            WHERE is_active = TRUE AND importance_score = 0.5
-              AND category = 'event'
-              AND created_at < NOW() - INTERVAL '30 days'
-            """
-        )
-        auto_scored = cur.rowcount
-
-        cur.execute(
-            """
-            SELECT id, fact_text FROM memory_facts
-            WHERE is_active = TRUE AND importance_score = 0.5
-            ORDER BY created_at DESC
-            LIMIT 200
-            """
-        )
-        unscored = cur.fetchall()
-        facts_scored = 0
-        facts_skipped_budget = 0
-
-        for fact in unscored:
-            # Check wall-clock budget
-            elapsed = time.monotonic() - t0
-            if elapsed > scoring_budget_s:
-                facts_skipped_budget = len(unscored) - facts_scored
-                logger.warning(
-                    "Importance scoring budget exhausted (%.0fs): scored %d, skipping %d",
-                    elapsed,
-                    facts_scored,
-                    facts_skipped_budget,
-                )
-                break
-            try:
-                score = await judge_importance(fact["fact_text"])
-                cur.execute(
-                    "UPDATE memory_facts SET importance_score = %s WHERE id = %s",
-                    (score, fact["id"]),
-                )
-                facts_scored += 1
-            except Exception as e:
-                logger.warning("Failed to score fact %d: %s", fact["id"], e)
-
+    importance_result = await score_unscored_importance(limit=200, budget_s=600.0)
+    facts_scored = importance_result["scored"]
+    auto_scored = importance_result["auto_scored"]
+    facts_skipped_budget = importance_result["skipped_budget"]
     step_timings["importance_scoring"] = time.monotonic() - t0
     logger.info(
-        "Step 1 (importance): %d scored, %d auto, %d skipped (%.1fs)",
+        "Step 1 (importance): %d scored in %d calls, %d auto, %d skipped (%.1fs)",
         facts_scored,
+        importance_result["llm_calls"],
         auto_scored,
         facts_skipped_budget,
         step_timings["importance_scoring"],
@@ -844,34 +1071,13 @@ async def run_lifecycle_maintenance() -> dict[str, Any]:
     except Exception as e:
         logger.warning("Failed to unload generation model: %s", e)
 
-    # Step 2: Update decay scores
+    # Step 2: Update decay scores (single set-based UPDATE, changed rows only)
     t1 = time.monotonic()
-    with get_connection() as conn:
-        cur = conn.cursor(cursor_factory=RealDictCursor)
-        cur.execute(
-            """
-            SELECT id, last_accessed, access_count, reinforcement_count,
-                   importance_score, outcome_failures
-            FROM memory_facts
-            WHERE is_active = TRUE
-            """
-        )
-        all_facts = cur.fetchall()
-        decay_updated = 0
-
-        for fact in all_facts:
-            score = compute_decay_score(
-                last_accessed=fact["last_accessed"],
-                access_count=fact["access_count"],
-                reinforcement_count=fact["reinforcement_count"],
-                importance_score=fact["importance_score"],
-                outcome_failures=fact.get("outcome_failures", 0) or 0,
-            )
-            cur.execute(
-                "UPDATE memory_facts SET decay_score = %s WHERE id = %s", (score, fact["id"])
-            )
-            decay_updated += 1
-
+    decay_updated = 0
+    try:
+        decay_updated = update_decay_scores()["updated"]
+    except Exception as e:
+        logger.warning("Decay update failed: %s", e)
     step_timings["decay"] = time.monotonic() - t1
     logger.info("Step 2 (decay): %d updated (%.1fs)", decay_updated, step_timings["decay"])
 
@@ -1135,4 +1341,14 @@ async def run_lifecycle_maintenance() -> dict[str, Any]:
         "insights": insight_result,
         "relations_inferred": len(inferred_relations),
         "step_timings": step_timings,
+        "phase_throughput": {
+            "importance_facts_per_s": _throughput(facts_scored, step_timings["importance_scoring"]),
+            "decay_rows_per_s": _throughput(decay_updated, step_timings["decay"]),
+            "prune_rows_per_s": _throughput(
+                prune_result.get("total_pruned", 0), step_timings["prune"]
+            ),
+            "consolidation_groups_per_s": _throughput(
+                consolidation_groups, step_timings["consolidation"]
+            ),
+        },
     }
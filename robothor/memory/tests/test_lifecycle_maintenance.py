@@ -0,0 +1,138 @@
+"""Tests for set-based decay and batched importance scoring in lifecycle maintenance."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from robothor.memory.lifecycle import (
+    _ACCESS_BOOST_CAP,
+    _DECAY_HALF_LIFE_HOURS,
+    _IMPORTANCE_FLOOR_WEIGHT,
+    _decay_score_sql,
+    _throughput,
+    judge_importance_batch,
+    score_unscored_importance,
+    update_decay_scores,
+)
+
+
+@pytest.fixture
+def mock_db():
+    """Mock get_connection for DB operations."""
+    with patch("robothor.memory.lifecycle.get_connection") as mock_conn:
+        conn = MagicMock()
+        cur = MagicMock()
+        conn.__enter__ = MagicMock(return_value=conn)
+        conn.__exit__ = MagicMock(return_value=False)
+        conn.cursor.return_value = cur
+        mock_conn.return_value = conn
+        yield cur
+
+
+class TestDecaySql:
+    def test_uses_shared_constants(self):
+        sql = _decay_score_sql()
+        assert str(_DECAY_HALF_LIFE_HOURS) in sql
+        assert str(_IMPORTANCE_FLOOR_WEIGHT) in sql
+        assert str(_ACCESS_BOOST_CAP) in sql
+        assert "outcome_failures" in sql
+
+    def test_single_update_statement(self, mock_db):
+        mock_db.rowcount = 42
+        result = update_decay_scores()
+        assert result["updated"] == 42
+        assert mock_db.execute.call_count == 1
+        sql, params = mock_db.execute.call_args[0]
+        assert sql.strip().startswith("UPDATE memory_facts")
+        assert "decay_inputs_sig IS DISTINCT FROM" in sql
+        assert params == {"full": False}
+
+    def test_full_pass_flag(self, mock_db):
+        mock_db.rowcount = 0
+        update_decay_scores(full=True)
+        assert mock_db.execute.call_args[0][1] == {"full": True}
+
+
+class TestJudgeImportanceBatch:
+    @pytest.mark.asyncio
+    async def test_parses_scores_and_clamps(self):
+        facts = [{"id": 1, "fact_text": "a"}, {"id": 2, "fact_text": "b"}]
+        raw = json.dumps({"scores": [{"id": 1, "score": 0.9}, {"id": 2, "score": 1.7}]})
+        with patch(
+            "robothor.memory.lifecycle.llm_client.generate",
+            new_callable=AsyncMock,
+            return_value=raw,
+        ) as gen:
+            scores = await judge_importance_batch(facts)
+        assert scores == {1: 0.9, 2: 1.0}
+        assert gen.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_ignores_unknown_ids(self):
+        raw = json.dumps({"scores": [{"id": 99, "score": 0.9}, {"id": 1, "score": 0.2}]})
+        with patch(
+            "robothor.memory.lifecycle.llm_client.generate",
+            new_callable=AsyncMock,
+            return_value=raw,
+        ):
+            scores = await judge_importance_batch([{"id": 1, "fact_text": "a"}])
+        assert scores == {1: 0.2}
+
+    @pytest.mark.asyncio
+    async def test_failure_returns_empty(self):
+        with patch(
+            "robothor.memory.lifecycle.llm_client.generate",
+            new_callable=AsyncMock,
+            side_effect=RuntimeError("down"),
+        ):
+            assert await judge_importance_batch([{"id": 1, "fact_text": "a"}]) == {}
+
+    @pytest.mark.asyncio
+    async def test_empty_input_skips_llm(self):
+        with patch("robothor.memory.lifecycle.llm_client.generate", new_callable=AsyncMock) as gen:
+            assert await judge_importance_batch([]) == {}
+        gen.assert_not_awaited()
+
+
+class TestScoreUnscoredImportance:
+    @pytest.mark.asyncio
+    async def test_batches_llm_calls(self, mock_db):
+        mock_db.rowcount = 3
+        mock_db.fetchall.return_value = [{"id": i, "fact_text": f"fact {i}"} for i in range(45)]
+
+        async def fake_batch(batch):
+            return {f["id"]: 0.7 for f in batch}
+
+        with (
+            patch("robothor.memory.lifecycle.judge_importance_batch", side_effect=fake_batch),
+            patch("psycopg2.extras.execute_values") as ev,
+        ):
+            result = await score_unscored_importance(batch_size=20)
+
+        assert result["llm_calls"] == 3
+        assert result["scored"] == 45
+        assert result["auto_scored"] == 3
+        assert ev.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_budget_exhausted(self, mock_db):
+        mock_db.fetchall.return_value = [{"id": i, "fact_text": "x"} for i in range(10)]
+        with patch(
+            "robothor.memory.lifecycle.judge_importance_batch", new_callable=AsyncMock
+        ) as judge:
+            result = await score_unscored_importance(budget_s=-1.0)
+        judge.assert_not_awaited()
+        assert result["skipped_budget"] == 10
+        assert result["scored"] == 0
+
+
+class TestThroughput:
+    def test_rate(self):
+        assert _throughput(100, 2.0) == 50.0
+
+    def test_zero_guard(self):
+        assert _throughput(0, 1.0) == 0.0
+        assert _throughput(10, 0.0) == 0.0
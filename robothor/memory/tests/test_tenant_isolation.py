@@ -233,7 +233,7 @@ def test_add_relation_includes_tenant_id(mock_get_conn):
 @patch("robothor.memory.entities.get_entity")
 @patch("robothor.memory.entities.get_connection")
 def test_get_all_about_filters_facts_by_tenant(mock_get_conn, mock_get_entity):
-    """get_all_about must filter memory_facts by tenant_id."""
+    """get_all_about must filter the graph walk and memory_facts by tenant_id."""
     from robothor.memory.entities import get_all_about
 
     async def _fake_get_entity(*a, **kw):
@@ -250,10 +250,12 @@ def test_get_all_about_filters_facts_by_tenant(mock_get_conn, mock_get_entity):
     mock_conn.__exit__ = MagicMock(return_value=False)
     mock_get_conn.return_value = mock_conn
 
-    _run(get_all_about("Alice", tenant_id="tenant_z"))
+    _run(get_all_about("Alice", tenant_id="tenant_z", depth=2))
 
-    # Verify get_entity was called with tenant_id
+    # Verify get_entity and the graph traversal are scoped to the tenant
     mock_get_entity.assert_called_once_with("Alice", tenant_id="tenant_z")
+    traversal_params = mock_cur.execute.call_args_list[0][0][1]
+    assert traversal_params["tenant_id"] == "tenant_z"
 
     # Verify facts query includes tenant_id
     sql = mock_cur.execute.call_args[0][0]
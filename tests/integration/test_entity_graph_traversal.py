@@ -0,0 +1,139 @@
+"""Integration benchmark: recursive-CTE graph traversal vs per-node lookups.
+
+Builds a synthetic 200k-edge entity graph in a scratch tenant and compares
+traverse_graph() (one recursive query) against the previous approach of
+walking the graph with get_entity() per frontier node. Requires a real
+database with migrations applied.
+"""
+
+from __future__ import annotations
+
+import random
+import time
+
+import pytest
+
+TENANT = "__graph_bench__"
+N_ENTITIES = 20_000
+N_EDGES = 200_000
+DEPTH = 2
+FANOUT = 50
+
+
+def _build_graph() -> int:
+    """Insert the synthetic graph; returns the id of the root entity."""
+    from psycopg2.extras import execute_values
+
+    from robothor.db.connection import get_connection
+
+    rng = random.Random(42)
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "INSERT INTO crm_tenants (id, display_name) VALUES (%s, %s) "
+            "ON CONFLICT (id) DO NOTHING",
+            (TENANT, "Graph traversal benchmark"),
+        )
+        execute_values(
+            cur,
+            "INSERT INTO memory_entities (name, entity_type, tenant_id) VALUES %s",
+            [(f"bench-entity-{i}", "person", TENANT) for i in range(N_ENTITIES)],
+            page_size=5000,
+        )
+        cur.execute("SELECT id FROM memory_entities WHERE tenant_id = %s ORDER BY id", (TENANT,))
+        ids = [row[0] for row in cur.fetchall()]
+
+        pairs: set[tuple[int, int]] = set()
+        while len(pairs) < N_EDGES:
+            a, b = rng.sample(ids, 2)
+            pairs.add((a, b))
+        execute_values(
+            cur,
+            "INSERT INTO memory_relations "
+            "(source_entity_id, target_entity_id, relation_type, confidence, tenant_id) "
+            "VALUES %s",
+            [(a, b, "knows", round(rng.random(), 4), TENANT) for a, b in pairs],
+            page_size=10_000,
+        )
+        cur.execute("ANALYZE memory_entities")
+        cur.execute("ANALYZE memory_relations")
+        conn.commit()
+    return ids[0]
+
+
+def _drop_graph() -> None:
+    from robothor.db.connection import get_connection
+
+    with get_connection() as conn:
+        cur = conn.cursor()
+        cur.execute("DELETE FROM memory_relations WHERE tenant_id = %s", (TENANT,))
+        cur.execute("DELETE FROM memory_entities WHERE tenant_id = %s", (TENANT,))
+        cur.execute("DELETE FROM crm_tenants WHERE id = %s", (TENANT,))
+        conn.commit()
+
+
+async def _legacy_traverse(name: str) -> set[int]:
+    """Breadth-first walk with get_entity(), using the same rules as the CTE."""
+    from robothor.memory.entities import get_entity
+
+    root = await get_entity(name, tenant_id=TENANT)
+    assert root is not None
+    seen = {root["id"]}
+    frontier = [root]
+    for hop in range(DEPTH):
+        reached: dict[int, str] = {}
+        for entity in frontier:
+            neighbours = []
+            for rel in entity["relations"]:
+                outgoing = rel["source_entity_id"] == entity["id"]
+                other = rel["target_entity_id"] if outgoing else rel["source_entity_id"]
+                other_name = rel["target_name"] if outgoing else rel["source_name"]
+                if other not in seen:
+                    neighbours.append((-rel["confidence"], rel["id"], other, other_name))
+            reached.update((other, nm) for _conf, _rid, other, nm in sorted(neighbours)[:FANOUT])
+        seen |= set(reached)
+        if hop + 1 == DEPTH:
+            break
+        frontier = []
+        for other_name in reached.values():
+            entity = await get_entity(other_name, tenant_id=TENANT)
+            if entity is not None:
+                frontier.append(entity)
+    return seen
+
+
+@pytest.mark.integration
+@pytest.mark.slow
+@pytest.mark.timeout(900)
+class TestGraphTraversalBenchmark:
+    @pytest.mark.asyncio
+    async def test_cte_matches_and_beats_per_node_walk(self):
+        from robothor.memory.entities import traverse_graph
+
+        _build_graph()
+        try:
+            root_name = "bench-entity-0"
+
+            start = time.perf_counter()
+            legacy_nodes = await _legacy_traverse(root_name)
+            legacy_s = time.perf_counter() - start
+
+            start = time.perf_counter()
+            graph = await traverse_graph(
+                root_name,
+                max_depth=DEPTH,
+                max_fanout=FANOUT,
+                max_nodes=N_ENTITIES,
+                tenant_id=TENANT,
+            )
+            cte_s = time.perf_counter() - start
+
+            assert {n["id"] for n in graph["nodes"]} == legacy_nodes
+            print(
+                f"\n{N_EDGES} edges, depth {DEPTH}: per-node walk {legacy_s * 1000:.1f}ms, "
+                f"recursive CTE {cte_s * 1000:.1f}ms ({legacy_s / cte_s:.1f}x), "
+                f"{len(legacy_nodes)} nodes"
+            )
+            assert cte_s < legacy_s
+        finally:
+            _drop_graph()
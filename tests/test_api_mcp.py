@@ -1,8 +1,11 @@
 """Tests for robothor.api.mcp — MCP tool definitions and handlers."""
 
+import json
+from unittest.mock import AsyncMock, patch
+
 import pytest
 
-from robothor.api.mcp import get_tool_definitions, handle_tool_call
+from robothor.api.mcp import _rpc_call_tool, get_tool_definitions, handle_tool_call
 
 # ─── Tool Definitions ────────────────────────────────────────────────
 
@@ -12,10 +15,10 @@ class TestToolDefinitions:
         tools = get_tool_definitions()
         assert isinstance(tools, list)
 
-    def test_has_52_tools(self):
-        """52 MCP tools: CRM/memory/vision/tenancy/notifications/vault."""
+    def test_has_54_tools(self):
+        """54 MCP tools: CRM/memory/vision/tenancy/notifications/vault."""
         tools = get_tool_definitions()
-        assert len(tools) == 52
+        assert len(tools) == 54
 
     def test_tool_structure(self):
         tools = get_tool_definitions()
@@ -139,3 +142,51 @@ class TestHandleToolCall:
         result = await handle_tool_call("enroll_face", {})
         assert "error" in result
         assert "required" in result["error"].lower() or "Name" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_search_memories_requires_queries(self):
+        result = await handle_tool_call("search_memories", {"queries": []})
+        assert "queries" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_store_memories_rejects_oversized_batch(self):
+        items = [{"content": f"note {i}"} for i in range(51)]
+        result = await handle_tool_call("store_memories", {"items": items})
+        assert "items" in result["error"]
+
+    @pytest.mark.asyncio
+    async def test_search_memories_groups_results_by_query(self):
+        hit = {"fact_text": "Alice leads Q3", "category": "work", "confidence": 0.9}
+        batch = AsyncMock(return_value=[[hit], []])
+        with patch("robothor.memory.facts.search_facts_batch", batch):
+            result = await handle_tool_call("search_memories", {"queries": ["alice", "bob"]})
+        batch.assert_awaited_once_with(["alice", "bob"], limit=10)
+        assert result["results"][0]["query"] == "alice"
+        assert result["results"][0]["results"][0]["fact"] == "Alice leads Q3"
+        assert result["results"][1] == {"query": "bob", "results": []}
+
+    @pytest.mark.asyncio
+    async def test_store_memories_sums_facts(self):
+        stored = [{"ids": [1, 2], "facts_stored": 2}, {"error": "db down"}]
+        batch = AsyncMock(return_value=stored)
+        with patch("robothor.memory.facts.store_memories_batch", batch):
+            result = await handle_tool_call(
+                "store_memories",
+                {"items": [{"content": "a"}, {"content": "b", "content_type": "email"}]},
+            )
+        batch.assert_awaited_once_with([("a", "conversation"), ("b", "email")])
+        assert result == {"results": stored, "facts_stored": 2}
+
+
+class TestRpcCallTool:
+    @pytest.mark.asyncio
+    async def test_result_wrapped_as_text_content(self):
+        result = await _rpc_call_tool({"name": "nonexistent_tool", "arguments": {}})
+        assert result["isError"] is False
+        assert "Unknown tool" in json.loads(result["content"][0]["text"])["error"]
+
+    @pytest.mark.asyncio
+    async def test_exception_reported_as_error(self):
+        with patch("robothor.api.mcp.handle_tool_call", AsyncMock(side_effect=RuntimeError("x"))):
+            result = await _rpc_call_tool({"name": "search_memory"})
+        assert result == {"content": [{"type": "text", "text": "x"}], "isError": True}
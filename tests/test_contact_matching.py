@@ -1,7 +1,16 @@
 """Tests for robothor.memory.contact_matching — pure Python, no deps."""
 
+import random
+import time
+
+import pytest
+
 from robothor.memory.contact_matching import (
+    NICKNAMES,
+    ContactMatchIndex,
+    blocking_keys,
     find_best_match,
+    lookup_keys,
     name_similarity,
     normalize_name,
 )
@@ -100,3 +109,133 @@ class TestFindBestMatch:
         result = find_best_match("John Smith", candidates)
         assert result is not None
         assert result["mention_count"] == 10
+
+
+_FIRST = [*NICKNAMES, *set(NICKNAMES.values()), "maria", "priya", "wei", "olu", "ana", "li"]
+_LAST = ["smith", "jones", "garcia", "nguyen", "patel", "okafor", "kim", "li", "ng", "muller"]
+
+
+def _synthetic_directory(n: int, seed: int = 7) -> list[dict]:
+    """Synthetic contacts with realistic name collisions and unique surnames."""
+    rng = random.Random(seed)
+    contacts = []
+    for i in range(n):
+        first = rng.choice(_FIRST)
+        # Mostly-unique surnames keep bucket sizes realistic at 100k scale
+        last = rng.choice(_LAST) if i % 10 == 0 else f"{rng.choice(_LAST)}{i:x}"
+        name = f"{first} {last}" if i % 25 else first
+        contacts.append({"id": i, "name": name.title(), "mention_count": rng.randint(0, 50)})
+    return contacts
+
+
+def _queries(contacts: list[dict], n: int, seed: int = 11) -> list[str]:
+    rng = random.Random(seed)
+    queries = []
+    for c in rng.sample(contacts, n):
+        parts = c["name"].split()
+        variant = rng.randint(0, 3)
+        if variant == 0 or len(parts) == 1:
+            queries.append(c["name"])
+        elif variant == 1:
+            queries.append(parts[0])
+        elif variant == 2:
+            queries.append(f"{parts[-1]} {parts[0]}")
+        else:
+            queries.append(f"{parts[0][:3]} {parts[-1]}")
+    queries += ["Zebulon Quixote", "", "Al"]
+    return queries
+
+
+class TestBlockingKeys:
+    def test_empty(self):
+        assert blocking_keys("") == set()
+        assert lookup_keys("") == set()
+
+    def test_nickname_shares_canonical_key(self):
+        assert lookup_keys("Bob") & blocking_keys("Robert Smith")
+
+    def test_prefix_shares_key(self):
+        assert lookup_keys("Greg") & blocking_keys("Gregory Jones")
+
+    def test_reversed_shares_key(self):
+        assert lookup_keys("Smith John") & blocking_keys("John Smith")
+
+    def test_full_names_block_on_last_name(self):
+        assert not lookup_keys("Alice Smith") & blocking_keys("Alice Jones")
+
+    def test_unrelated_names_disjoint(self):
+        assert not lookup_keys("Alice Smith") & blocking_keys("Wei Nguyen")
+
+    def test_keys_cover_every_nonzero_pair(self):
+        names = [c["name"] for c in _synthetic_directory(400)]
+        names += ["Ed", "Edward Kim", "Li", "Li Wei", "Sammy", "Samantha Ng"]
+        for a in names[:150] + names[-6:]:
+            keys_a = lookup_keys(a)
+            for b in names:
+                if name_similarity(a, b) > 0:
+                    assert keys_a & blocking_keys(b), (a, b)
+
+
+class TestContactMatchIndex:
+    def test_matches_brute_force(self):
+        contacts = _synthetic_directory(400)
+        index = ContactMatchIndex(contacts)
+        assert len(index) == 400
+        for query in _queries(contacts, 100):
+            for threshold in (0.75, 0.85):
+                assert index.find_best_match(query, threshold=threshold) == find_best_match(
+                    query, contacts, threshold=threshold
+                )
+
+    def test_owner_tiebreak_preserved(self):
+        candidates = [
+            {"id": "other", "name": "Alice Example", "mention_count": 50},
+            {"id": "owner", "name": "Alice Owner", "mention_count": 1},
+        ]
+        index = ContactMatchIndex(candidates)
+        result = index.find_best_match(
+            "Alice", owner_candidate_id="owner", owner_nicknames={"alice"}
+        )
+        assert result is not None
+        assert result["id"] == "owner"
+
+    def test_add_after_build(self):
+        index = ContactMatchIndex()
+        assert index.find_best_match("Greg Smith") is None
+        index.add({"name": "Gregory Smith"})
+        result = index.find_best_match("Greg Smith")
+        assert result is not None
+        assert result["match_score"] == 0.9
+
+    def test_custom_name_key(self):
+        index = ContactMatchIndex([{"display": "John Smith"}], name_key="display")
+        assert index.find_best_match("John Smith") is not None
+
+
+@pytest.mark.slow
+@pytest.mark.timeout(300)
+class TestContactMatchIndexBenchmark:
+    def test_100k_directory(self):
+        """Indexed lookup over 100k contacts agrees with brute force and is much faster."""
+        contacts = _synthetic_directory(100_000)
+        queries = _queries(contacts, 20)
+
+        t0 = time.perf_counter()
+        brute = [find_best_match(q, contacts) for q in queries]
+        brute_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        index = ContactMatchIndex(contacts)
+        build_s = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        indexed = [index.find_best_match(q) for q in queries]
+        indexed_s = time.perf_counter() - t0
+
+        print(
+            f"\n100k contacts, {len(queries)} queries: brute={brute_s:.2f}s "
+            f"index_build={build_s:.2f}s indexed={indexed_s:.3f}s "
+            f"speedup={brute_s / max(indexed_s, 1e-9):.0f}x"
+        )
+        assert indexed == brute
+        assert indexed_s * 5 < brute_s
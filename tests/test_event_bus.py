@@ -12,6 +12,7 @@ from robothor.events.bus import (
     publish,
     reset_client,
     set_redis_client,
+    tail,
 )
 
 
@@ -103,3 +104,27 @@ class TestPublish:
         for stream in VALID_STREAMS:
             msg_id = publish(stream, f"{stream}.test", {"key": "value"}, source="test")
             assert msg_id == "1-0"
+
+
+class TestTail:
+    def test_tail_delivers_and_advances_cursor(self):
+        mock_redis = MagicMock()
+        mock_redis.xread.side_effect = [
+            [
+                (
+                    "robothor:events:agent",
+                    [("5-0", {"type": "memory.block_written", "payload": '{"block_name": "x"}'})],
+                )
+            ],
+            [],
+        ]
+        set_redis_client(mock_redis)
+
+        seen = []
+        tail("agent", handler=seen.append, max_iterations=2)
+
+        assert seen[0]["type"] == "memory.block_written"
+        assert seen[0]["payload"] == {"block_name": "x"}
+        assert mock_redis.xread.call_args_list[0][0][0] == {"robothor:events:agent": "$"}
+        assert mock_redis.xread.call_args_list[1][0][0] == {"robothor:events:agent": "5-0"}
+        mock_redis.xack.assert_not_called()
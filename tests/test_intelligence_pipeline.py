@@ -0,0 +1,209 @@
+"""Tests for Phase 2.5 contact enrichment in brain/memory_system/intelligence_pipeline.py."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import sys
+import threading
+import types
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+
+_PIPELINE_PATH = (
+    Path(__file__).resolve().parents[1] / "brain" / "memory_system" / "intelligence_pipeline.py"
+)
+
+GOOD_REPLY = json.dumps({"job_title": "CTO", "city": "Oslo", "confidence": 0.9})
+
+
+class FakeLLM:
+    """Counts calls, peak concurrency and peak running tasks of ``generate``."""
+
+    def __init__(self, reply: str = GOOD_REPLY, delay: float = 0) -> None:
+        self.reply = reply
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.peak = 0
+        self.peak_tasks = 0
+
+    async def generate(self, **kwargs: Any) -> str:
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        self.peak_tasks = max(self.peak_tasks, len(asyncio.all_tasks()))
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return self.reply
+
+
+def _contact(n: int) -> dict[str, Any]:
+    return {
+        "id": f"p{n}",
+        "firstName": "Person",
+        "lastName": str(n),
+        "email": f"person{n}@example.org",
+        "company": "Example",
+    }
+
+
+@pytest.fixture
+def pipeline(tmp_path, monkeypatch):
+    """Import the pipeline with its home-directory paths under tmp_path."""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    (tmp_path / "robothor" / "brain" / "memory_system").mkdir(parents=True)
+    (tmp_path / "robothor" / "brain" / "memory").mkdir(parents=True)
+    monkeypatch.setattr(sys, "path", list(sys.path))
+
+    spec = importlib.util.spec_from_file_location("intelligence_pipeline", _PIPELINE_PATH)
+    assert spec is not None and spec.loader is not None
+    mod = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(mod)
+
+    def no_db():
+        raise ConnectionError("no database in tests")
+
+    monkeypatch.setattr(mod, "_get_dal_connection", no_db)
+    return mod
+
+
+@pytest.fixture
+def crm(pipeline, monkeypatch):
+    """Stub CRM modules; ``crm.contacts`` feeds fetch_all_contacts()."""
+    crm_dal = MagicMock()
+    crm_dal.update_person.return_value = True
+    crm_dal.contacts = []
+    crm_fetcher = types.ModuleType("crm_fetcher")
+    crm_fetcher.fetch_all_contacts = lambda: crm_dal.contacts  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "crm_dal", crm_dal)
+    monkeypatch.setitem(sys.modules, "crm_fetcher", crm_fetcher)
+    return crm_dal
+
+
+def _set_contacts(pipeline, crm, contacts: list[dict[str, Any]]) -> None:
+    """Register contacts and give each one an email as extraction evidence."""
+    crm.contacts = contacts
+    entries = {
+        c["id"]: {"from": f"<{c['email']}>", "subject": f"Hello from {c['id']}"} for c in contacts
+    }
+    (pipeline.MEMORY_DIR / "email-log.json").write_text(json.dumps({"entries": entries}))
+
+
+class TestEnrichmentMemo:
+    async def test_unchanged_evidence_skips_llm(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(1)])
+        llm = FakeLLM()
+
+        first = await pipeline.phase_2_5_contact_enrichment(llm)
+        second = await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert first["fields_updated"] == 2
+        assert second["skipped_unchanged"] == 1
+        assert llm.calls == 1
+
+    async def test_changed_evidence_reextracts(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(1)])
+        llm = FakeLLM()
+        await pipeline.phase_2_5_contact_enrichment(llm)
+
+        crm.contacts[0]["email"] = "new-address@example.org"
+        _set_contacts(pipeline, crm, crm.contacts)
+        await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert llm.calls == 2
+
+    async def test_unparseable_reply_not_memoized(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(1)])
+        llm = FakeLLM(reply="Sorry, I can't help with that.")
+
+        await pipeline.phase_2_5_contact_enrichment(llm)
+        result = await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert result["skipped_unchanged"] == 0
+        assert llm.calls == 2
+
+    async def test_failed_update_not_memoized(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(1)])
+        crm.update_person.return_value = False
+        llm = FakeLLM()
+
+        await pipeline.phase_2_5_contact_enrichment(llm)
+        await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert llm.calls == 2
+
+    async def test_update_error_not_memoized(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(1)])
+        crm.update_person.side_effect = RuntimeError("CRM down")
+        llm = FakeLLM()
+
+        first = await pipeline.phase_2_5_contact_enrichment(llm)
+        await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert first["errors"] == ["update:Person 1:CRM down"]
+        assert llm.calls == 2
+
+
+class TestEnrichmentConcurrency:
+    async def test_llm_calls_bounded(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(n) for n in range(10)])
+        llm = FakeLLM(delay=0.01)
+
+        result = await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert llm.calls == 10
+        assert llm.peak == pipeline.LLM_CONCURRENCY
+        assert result["fields_updated"] == 20
+
+    async def test_tasks_bounded_by_worker_pool(self, pipeline, crm):
+        _set_contacts(pipeline, crm, [_contact(n) for n in range(50)])
+        llm = FakeLLM(delay=0.01)
+
+        await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert llm.calls == 50
+        # The workers plus the test's own task
+        assert llm.peak_tasks <= pipeline.LLM_CONCURRENCY + 1
+
+    async def test_blocking_calls_run_off_the_event_loop(self, pipeline, crm, monkeypatch):
+        _set_contacts(pipeline, crm, [_contact(1)])
+        crm.contacts[0]["company"] = ""
+        threads: dict[str, int] = {}
+
+        def record(name: str, result: Any) -> Any:
+            def call(*args: Any, **kwargs: Any) -> Any:
+                threads[name] = threading.get_ident()
+                return result
+
+            return call
+
+        monkeypatch.setattr(pipeline, "_facts_mentioning", record("facts", ["Works in Oslo"]))
+        crm.find_or_create_company.side_effect = record("company", "c1")
+        crm.update_person.side_effect = record("update", True)
+
+        result = await pipeline.phase_2_5_contact_enrichment(FakeLLM())
+
+        assert result["fields_updated"] == 3
+        assert set(threads) == {"facts", "company", "update"}
+        assert threading.get_ident() not in threads.values()
+
+    async def test_one_bad_contact_does_not_stop_the_rest(self, pipeline, crm):
+        contacts = [_contact(1), _contact(2)]
+        _set_contacts(pipeline, crm, contacts)
+        crm.contacts = [{"id": "broken", "email": "broken@example.org"}, *contacts]
+        llm = FakeLLM()
+
+        result = await pipeline.phase_2_5_contact_enrichment(llm)
+
+        assert result["fields_updated"] == 4
+        assert result["errors"] == ["contact_enrichment:broken@example.org:'firstName'"]
+        # The run still finished and saved its memo
+        state = json.loads(pipeline.EVIDENCE_STATE_PATH.read_text())
+        assert set(state["enrichment"]) == {"p1", "p2"}
@@ -0,0 +1,182 @@
+"""Tests for robothor.api.mcp_stdio — the concurrent stdio JSON-RPC transport."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any
+
+import pytest
+
+from robothor.api.mcp_stdio import (
+    INTERNAL_ERROR,
+    METHOD_NOT_FOUND,
+    PARSE_ERROR,
+    JsonRpcError,
+    StdioJsonRpcServer,
+)
+
+
+class Harness:
+    """Feeds raw bytes to a server and collects the responses it writes."""
+
+    def __init__(self, server: StdioJsonRpcServer) -> None:
+        self.server = server
+        self.reader = asyncio.StreamReader()
+        self.output: list[bytes] = []
+        self.task: asyncio.Task[None] | None = None
+
+    async def _write(self, data: bytes) -> None:
+        self.output.append(data)
+
+    def start(self) -> None:
+        self.task = asyncio.create_task(self.server.serve(self.reader, self._write))
+
+    def send(self, message: Any) -> None:
+        self.reader.feed_data(json.dumps(message).encode() + b"\n")
+
+    async def close(self) -> None:
+        self.reader.feed_eof()
+        assert self.task is not None
+        await asyncio.wait_for(self.task, 5)
+
+    async def finish(self) -> list[dict[str, Any]]:
+        await self.close()
+        return [json.loads(chunk) for chunk in self.output]
+
+
+def _request(request_id: int, method: str, **params: Any) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+
+
+def _server(max_concurrency: int = 8) -> tuple[StdioJsonRpcServer, dict[str, int]]:
+    counters = {"in_flight": 0, "peak": 0}
+
+    async def sleep(params: dict[str, Any]) -> dict[str, Any]:
+        counters["in_flight"] += 1
+        counters["peak"] = max(counters["peak"], counters["in_flight"])
+        try:
+            await asyncio.sleep(params.get("delay", 0))
+        finally:
+            counters["in_flight"] -= 1
+        return {"n": params.get("n")}
+
+    async def fail(params: dict[str, Any]) -> None:
+        if params.get("rpc"):
+            raise JsonRpcError(-32602, "bad params")
+        raise RuntimeError("boom")
+
+    handlers = {"sleep": sleep, "fail": fail}
+    return StdioJsonRpcServer(handlers, max_concurrency=max_concurrency), counters
+
+
+class TestConcurrency:
+    @pytest.mark.asyncio
+    async def test_fast_response_overtakes_slow_one(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.send(_request(1, "sleep", delay=0.3, n="slow"))
+        h.send(_request(2, "sleep", delay=0, n="fast"))
+        responses = await h.finish()
+        assert [r["id"] for r in responses] == [2, 1]
+        assert responses[1]["result"] == {"n": "slow"}
+
+    @pytest.mark.asyncio
+    async def test_parallelism_bounded(self):
+        server, counters = _server(max_concurrency=2)
+        h = Harness(server)
+        h.start()
+        for i in range(6):
+            h.send(_request(i, "sleep", delay=0.05, n=i))
+        responses = await h.finish()
+        assert sorted(r["id"] for r in responses) == list(range(6))
+        assert counters["peak"] == 2
+
+    @pytest.mark.asyncio
+    async def test_eof_waits_for_in_flight_requests(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.send(_request(1, "sleep", delay=0.1, n=1))
+        responses = await h.finish()
+        assert responses == [{"jsonrpc": "2.0", "id": 1, "result": {"n": 1}}]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_request_gets_no_response(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.send(_request(1, "sleep", delay=5))
+        h.send(_request(2, "sleep", delay=0, n=2))
+        await asyncio.sleep(0.05)
+        h.send({"jsonrpc": "2.0", "method": "notifications/cancelled", "params": {"requestId": 1}})
+        responses = await h.finish()
+        assert [r["id"] for r in responses] == [2]
+        assert server._tasks == {}
+
+    @pytest.mark.asyncio
+    async def test_batch_dispatched_concurrently(self):
+        server, counters = _server()
+        h = Harness(server)
+        h.start()
+        h.send([_request(i, "sleep", delay=0.05, n=i) for i in range(3)])
+        responses = await h.finish()
+        assert sorted(r["id"] for r in responses) == [0, 1, 2]
+        assert counters["peak"] == 3
+
+
+class TestErrors:
+    @pytest.mark.asyncio
+    async def test_unknown_method(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.send(_request(1, "nope"))
+        (response,) = await h.finish()
+        assert response["error"]["code"] == METHOD_NOT_FOUND
+
+    @pytest.mark.asyncio
+    async def test_handler_errors_mapped(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.send(_request(1, "fail", rpc=True))
+        h.send(_request(2, "fail"))
+        responses = {r["id"]: r for r in await h.finish()}
+        assert responses[1]["error"] == {"code": -32602, "message": "bad params"}
+        assert responses[2]["error"] == {"code": INTERNAL_ERROR, "message": "boom"}
+
+    @pytest.mark.asyncio
+    async def test_parse_error_does_not_stop_server(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.reader.feed_data(b"{not json\n")
+        h.send(_request(1, "sleep", n=1))
+        responses = await h.finish()
+        assert responses[0]["error"]["code"] == PARSE_ERROR
+        assert responses[1]["result"] == {"n": 1}
+
+    @pytest.mark.asyncio
+    async def test_client_responses_ignored(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        h.send({"jsonrpc": "2.0", "id": 9, "result": {}})
+        assert await h.finish() == []
+
+
+class TestFraming:
+    @pytest.mark.asyncio
+    async def test_content_length_framing_answered_in_kind(self):
+        server, _ = _server()
+        h = Harness(server)
+        h.start()
+        body = json.dumps(_request(1, "sleep", n=1)).encode()
+        h.reader.feed_data(b"Content-Length: %d\r\n\r\n" % len(body) + body)
+        await h.close()
+        (chunk,) = h.output
+        head, payload = chunk.split(b"\r\n\r\n", 1)
+        assert head == b"Content-Length: %d" % len(payload)
+        assert json.loads(payload)["result"] == {"n": 1}
@@ -2,10 +2,42 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import UTC, datetime
 from unittest.mock import MagicMock, patch
 
-from robothor.memory.blocks import list_blocks, read_block, write_block
+import pytest
+
+from robothor.memory.blocks import (
+    BLOCK_CHANGE_EVENT,
+    clear_block_cache,
+    handle_block_change_event,
+    list_blocks,
+    read_block,
+    read_blocks,
+    write_block,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_block_cache():
+    clear_block_cache()
+    yield
+    clear_block_cache()
+
+
+def _mock_db(fetchall=None, fetchone=None):
+    """Patch get_connection; returns (patcher, cursor)."""
+    mock_conn = MagicMock()
+    mock_cur = MagicMock()
+    mock_cur.fetchall.return_value = fetchall or []
+    mock_cur.fetchone.return_value = fetchone
+    mock_conn.cursor.return_value.__enter__ = MagicMock(return_value=mock_cur)
+    mock_conn.cursor.return_value.__exit__ = MagicMock(return_value=False)
+    patcher = patch("robothor.memory.blocks.get_connection")
+    mock_get_conn = patcher.start()
+    mock_get_conn.return_value.__enter__ = MagicMock(return_value=mock_conn)
+    mock_get_conn.return_value.__exit__ = MagicMock(return_value=False)
+    return patcher, mock_cur
 
 
 class TestReadBlock:
@@ -100,6 +132,111 @@ class TestWriteBlock:
         assert "write_count" in sql
 
 
+class TestReadBlocks:
+    ROWS = [
+        ("working_context", "ctx", datetime(2026, 1, 2, tzinfo=UTC), 4),
+        ("persona", "me", datetime(2026, 1, 1, tzinfo=UTC), 2),
+    ]
+
+    def test_single_query_in_requested_order(self):
+        patcher, cur = _mock_db(fetchall=self.ROWS)
+        try:
+            result = read_blocks(["persona", "working_context", "missing"])
+        finally:
+            patcher.stop()
+
+        assert cur.execute.call_count == 1
+        sql, params = cur.execute.call_args[0]
+        assert "ANY(%s)" in sql
+        assert "read_count" in sql
+        assert params[1] == ["persona", "working_context", "missing"]
+        assert list(result) == ["persona", "working_context", "missing"]
+        assert result["persona"]["content"] == "me"
+        assert result["working_context"]["last_written_at"] == "2026-01-02T00:00:00+00:00"
+        assert "not found" in result["missing"]["error"]
+
+    def test_empty_names_skip_query(self):
+        with patch("robothor.memory.blocks.get_connection") as mock_get_conn:
+            assert read_blocks(["", ""]) == {}
+        mock_get_conn.assert_not_called()
+
+    def test_cache_hit_avoids_query(self):
+        patcher, cur = _mock_db(fetchall=self.ROWS)
+        try:
+            read_blocks(["persona", "working_context"], use_cache=True)
+            cur.fetchall.return_value = []
+            result = read_blocks(["persona", "working_context"], use_cache=True)
+        finally:
+            patcher.stop()
+
+        assert cur.execute.call_count == 1
+        assert result["persona"]["content"] == "me"
+
+    def test_uncached_read_always_queries(self):
+        patcher, cur = _mock_db(fetchall=self.ROWS)
+        try:
+            read_blocks(["persona"], use_cache=True)
+            read_blocks(["persona"])
+        finally:
+            patcher.stop()
+
+        assert cur.execute.call_count == 2
+
+    def test_write_invalidates_cache(self):
+        patcher, cur = _mock_db(fetchall=self.ROWS, fetchone=(3,))
+        try:
+            read_blocks(["persona"], use_cache=True)
+            write_block("persona", "new me")
+            cur.fetchall.return_value = [("persona", "new me", datetime(2026, 1, 3, tzinfo=UTC), 3)]
+            result = read_blocks(["persona"], use_cache=True)
+        finally:
+            patcher.stop()
+
+        assert result["persona"]["content"] == "new me"
+
+    def test_stale_row_not_cached_after_newer_write(self):
+        """A read that raced a write must not repopulate the cache with old content."""
+        patcher, cur = _mock_db(fetchall=[("persona", "old", datetime(2026, 1, 1, tzinfo=UTC), 2)])
+        try:
+            handle_block_change_event(
+                {
+                    "type": BLOCK_CHANGE_EVENT,
+                    "tenant_id": "",
+                    "payload": {"block_name": "persona", "version": 3},
+                }
+            )
+            read_blocks(["persona"], use_cache=True)
+            read_blocks(["persona"], use_cache=True)
+        finally:
+            patcher.stop()
+
+        assert cur.execute.call_count == 2
+
+    def test_change_event_invalidates_cache(self):
+        patcher, cur = _mock_db(fetchall=self.ROWS)
+        try:
+            read_blocks(["persona"], use_cache=True)
+            handle_block_change_event(
+                {"type": BLOCK_CHANGE_EVENT, "payload": {"block_name": "persona"}}
+            )
+            read_blocks(["persona"], use_cache=True)
+        finally:
+            patcher.stop()
+
+        assert cur.execute.call_count == 2
+
+    def test_unrelated_event_ignored(self):
+        patcher, cur = _mock_db(fetchall=self.ROWS)
+        try:
+            read_blocks(["persona"], use_cache=True)
+            handle_block_change_event({"type": "other", "payload": {"block_name": "persona"}})
+            read_blocks(["persona"], use_cache=True)
+        finally:
+            patcher.stop()
+
+        assert cur.execute.call_count == 1
+
+
 class TestListBlocks:
     def test_list_blocks_returns_all(self):
         mock_conn = MagicMock()
@@ -1,11 +1,79 @@
-"""Tests for robothor.memory.entities — entity schemas and types."""
+"""Tests for robothor.memory.entities — entity schemas, types and graph traversal."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from robothor.memory.entities import (
     ENTITY_EXTRACTION_SCHEMA,
+    MAX_TRAVERSAL_DEPTH,
     VALID_ENTITY_TYPES,
+    get_all_about,
+    traverse_graph,
 )
 
 
+def _node(eid, name, depth, dropped=0):
+    return {
+        "kind": "node",
+        "id": eid,
+        "name": name,
+        "entity_type": "person",
+        "mention_count": 1,
+        "aliases": None,
+        "last_seen": None,
+        "depth": depth,
+        "source_entity_id": None,
+        "target_entity_id": None,
+        "relation_type": None,
+        "confidence": None,
+        "fact_id": None,
+        "created_at": None,
+        "dropped_count": dropped,
+    }
+
+
+def _edge(rid, src, tgt, depth, rel="knows"):
+    return {
+        "kind": "edge",
+        "id": rid,
+        "name": None,
+        "entity_type": None,
+        "mention_count": None,
+        "aliases": None,
+        "last_seen": None,
+        "depth": depth,
+        "source_entity_id": src,
+        "target_entity_id": tgt,
+        "relation_type": rel,
+        "confidence": 0.9,
+        "fact_id": None,
+        "created_at": None,
+        "dropped_count": None,
+    }
+
+
+GRAPH_ROWS = [
+    _node(1, "Alice", 0),
+    _node(2, "Acme", 1),
+    _node(3, "Bob", 2),
+    _edge(10, 1, 2, 1, "works_at"),
+    _edge(11, 3, 2, 2, "works_at"),
+]
+
+
+@pytest.fixture
+def graph_db():
+    with patch("robothor.memory.entities.get_connection") as mock_conn:
+        conn = MagicMock()
+        cur = MagicMock()
+        conn.__enter__ = MagicMock(return_value=conn)
+        conn.__exit__ = MagicMock(return_value=False)
+        conn.cursor.return_value = cur
+        mock_conn.return_value = conn
+        yield cur
+
+
 class TestEntityTypes:
     def test_valid_types(self):
         expected = {"person", "project", "organization", "technology", "location", "event"}
@@ -29,3 +97,93 @@ class TestExtractionSchema:
         assert "target" in rel_schema["properties"]
         assert "relation" in rel_schema["properties"]
         assert set(rel_schema["required"]) == {"source", "target", "relation"}
+
+
+class TestTraverseGraph:
+    @pytest.mark.asyncio
+    async def test_single_query_and_shape(self, graph_db):
+        graph_db.fetchall.return_value = GRAPH_ROWS
+        graph = await traverse_graph("alice", max_depth=2, tenant_id="t1")
+
+        assert graph_db.execute.call_count == 1
+        sql, params = graph_db.execute.call_args[0]
+        assert "WITH RECURSIVE" in sql
+        assert params["tenant_id"] == "t1"
+        assert params["max_depth"] == 2
+        assert graph["root"]["name"] == "Alice"
+        assert [n["depth"] for n in graph["nodes"]] == [0, 1, 2]
+        assert graph["edges"][1]["source_name"] == "Bob"
+        assert graph["edges"][1]["target_name"] == "Acme"
+        assert graph["truncated"] is False
+
+    def test_frontier_deduplicated_and_capped_inside_recursion(self):
+        from robothor.memory.entities import _TRAVERSAL_SQL
+
+        recursive_term = _TRAVERSAL_SQL.split("UNION ALL", 2)[2].split("\n)\n", 1)[0]
+        # Each node is reached once per walk, not once per path
+        assert "PARTITION BY followed.to_id" in recursive_term
+        assert "e.to_id <> ALL(w.seen)" in recursive_term
+        assert "%(max_nodes)s - cardinality(kept.seen)" in recursive_term
+
+    @pytest.mark.asyncio
+    async def test_limits_are_clamped(self, graph_db):
+        graph_db.fetchall.return_value = []
+        graph = await traverse_graph("x", max_depth=99, max_fanout=0, relation_types=["uses"])
+        params = graph_db.execute.call_args[0][1]
+        assert params["max_depth"] == MAX_TRAVERSAL_DEPTH
+        assert params["max_fanout"] == 1
+        assert params["relation_types"] == ["uses"]
+        assert graph["root"] is None
+
+    @pytest.mark.asyncio
+    async def test_truncated_when_node_cap_drops_nodes(self, graph_db):
+        graph_db.fetchall.return_value = [_node(1, "Alice", 0, dropped=899)]
+        graph = await traverse_graph("alice", max_nodes=1)
+        assert graph["truncated"] is True
+
+
+ALICE = {
+    "id": 1,
+    "name": "Alice",
+    "entity_type": "person",
+    "relations": [
+        {"id": 10, "source_entity_id": 1, "target_entity_id": 2, "target_name": "Acme"},
+        {"id": 12, "source_entity_id": 1, "target_entity_id": 1, "target_name": "Alice"},
+    ],
+}
+
+
+class TestGetAllAbout:
+    @pytest.mark.asyncio
+    async def test_direct_relations_come_from_get_entity(self, graph_db):
+        graph_db.fetchall.return_value = [{"id": 5, "fact_text": "f"}]
+        with patch("robothor.memory.entities.get_entity", AsyncMock(return_value=ALICE)):
+            result = await get_all_about("Alice")
+
+        # No traversal at depth 1: every relation, self-loops and names included
+        assert graph_db.execute.call_count == 1
+        assert "memory_facts" in graph_db.execute.call_args[0][0]
+        assert result["entity"] is ALICE
+        assert result["relations"] == ALICE["relations"]
+        assert result["facts"] == [{"id": 5, "fact_text": "f"}]
+        assert "graph" not in result
+
+    @pytest.mark.asyncio
+    async def test_multi_hop_graph(self, graph_db):
+        graph_db.fetchall.side_effect = [GRAPH_ROWS, []]
+        with patch("robothor.memory.entities.get_entity", AsyncMock(return_value=ALICE)):
+            result = await get_all_about("Alice", depth=2, relation_types=["works_at"])
+
+        params = graph_db.execute.call_args_list[0][0][1]
+        assert params["relation_types"] == ["works_at"]
+        assert params["max_depth"] == 2
+        assert result["relations"] == ALICE["relations"]
+        assert len(result["graph"]["nodes"]) == 3
+        assert len(result["graph"]["edges"]) == 2
+
+    @pytest.mark.asyncio
+    async def test_unknown_entity(self, graph_db):
+        graph_db.fetchall.return_value = []
+        with patch("robothor.memory.entities.get_entity", AsyncMock(return_value=None)):
+            result = await get_all_about("Nobody", depth=3)
+        assert result == {"entity": None, "facts": [], "relations": []}
@@ -1,13 +1,40 @@
 """Tests for robothor.memory.facts — fact extraction and parsing."""
 
+import asyncio
 import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
 
 from robothor.memory.facts import (
     VALID_CATEGORIES,
     build_extraction_prompt,
+    extract_facts_cached,
+    extraction_content_hash,
+    extraction_prompt_version,
     parse_extraction_response,
 )
 
+CACHED_FACT = {
+    "fact_text": "Alice forwarded the Q3 roadmap to Bob",
+    "category": "project",
+    "entities": ["Alice", "Bob"],
+    "confidence": 0.9,
+}
+
+
+@pytest.fixture
+def cache_db():
+    """Mock get_connection for the extraction cache."""
+    with patch("robothor.memory.facts.get_connection") as mock_conn:
+        conn = MagicMock()
+        cur = MagicMock()
+        conn.__enter__ = MagicMock(return_value=conn)
+        conn.__exit__ = MagicMock(return_value=False)
+        conn.cursor.return_value = cur
+        mock_conn.return_value = conn
+        yield cur
+
 
 class TestBuildExtractionPrompt:
     def test_includes_content(self):
@@ -198,3 +225,182 @@ class TestExtractionSchema:
         assert "category" in item_props
         assert "entities" in item_props
         assert "confidence" in item_props
+
+
+class TestExtractionCacheKey:
+    def test_content_hash_ignores_whitespace(self):
+        assert extraction_content_hash("Alice  met\nBob ") == extraction_content_hash(
+            "Alice met Bob"
+        )
+
+    def test_content_hash_distinguishes_text(self):
+        assert extraction_content_hash("Alice met Bob") != extraction_content_hash(
+            "Alice met Carol"
+        )
+
+    def test_prompt_version_tracks_prompt(self):
+        version = extraction_prompt_version()
+        assert version == extraction_prompt_version()
+        with patch(
+            "robothor.memory.facts.build_extraction_prompt", return_value="a different prompt"
+        ):
+            assert extraction_prompt_version() != version
+
+
+class TestExtractFactsCached:
+    @pytest.mark.asyncio
+    async def test_hit_skips_llm(self, cache_db):
+        cache_db.fetchone.return_value = ([CACHED_FACT],)
+        with patch("robothor.memory.facts.extract_facts", new_callable=AsyncMock) as extract:
+            facts, hit = await extract_facts_cached("Fwd: roadmap")
+        extract.assert_not_awaited()
+        assert hit is True
+        assert facts == [CACHED_FACT]
+        params = cache_db.execute.call_args[0][1]
+        assert params[0] == extraction_content_hash("Fwd: roadmap")
+        assert params[1] == extraction_prompt_version()
+
+    @pytest.mark.asyncio
+    async def test_miss_extracts_and_stores(self, cache_db):
+        cache_db.fetchone.return_value = None
+        with patch(
+            "robothor.memory.facts.extract_facts",
+            new_callable=AsyncMock,
+            return_value=[CACHED_FACT],
+        ) as extract:
+            facts, hit = await extract_facts_cached("roadmap")
+        extract.assert_awaited_once()
+        assert hit is False
+        assert facts == [CACHED_FACT]
+        insert_sql, insert_params = cache_db.execute.call_args[0]
+        assert "INSERT INTO memory_extraction_cache" in insert_sql
+        assert json.loads(insert_params[3]) == [CACHED_FACT]
+
+    @pytest.mark.asyncio
+    async def test_empty_extraction_not_cached(self, cache_db):
+        cache_db.fetchone.return_value = None
+        with patch("robothor.memory.facts.extract_facts", new_callable=AsyncMock, return_value=[]):
+            facts, hit = await extract_facts_cached("nothing here")
+        assert (facts, hit) == ([], False)
+        assert cache_db.execute.call_count == 1  # lookup only
+
+    @pytest.mark.asyncio
+    async def test_cache_unavailable_falls_back_to_llm(self):
+        with (
+            patch("robothor.memory.facts.get_connection", side_effect=RuntimeError("db down")),
+            patch(
+                "robothor.memory.facts.extract_facts",
+                new_callable=AsyncMock,
+                return_value=[CACHED_FACT],
+            ),
+        ):
+            facts, hit = await extract_facts_cached("roadmap")
+        assert facts == [CACHED_FACT]
+        assert hit is False
+
+
+class TestIngestContentExtractionCache:
+    @pytest.mark.asyncio
+    async def test_cached_facts_replayed_through_storage(self):
+        from robothor.memory import ingestion
+
+        ingestion.reset_extraction_stats()
+        with (
+            patch(
+                "robothor.memory.ingestion.extract_facts_cached",
+                new_callable=AsyncMock,
+                return_value=([CACHED_FACT], True),
+            ),
+            patch(
+                "robothor.memory.ingestion.resolve_and_store",
+                new_callable=AsyncMock,
+                return_value={"new_id": 7},
+            ) as resolve,
+            patch("robothor.memory.ingestion._set_source_channel"),
+            patch(
+                "robothor.memory.ingestion.extract_entities_batch",
+                new_callable=AsyncMock,
+                return_value={},
+            ),
+        ):
+            result = await ingestion.ingest_content("Fwd: roadmap", "email", "email")
+
+        resolve.assert_awaited_once()
+        assert result["fact_ids"] == [7]
+        assert result["extraction_cached"] is True
+        assert ingestion.extraction_stats() == {"llm_extractions": 0, "cache_hits": 1}
+
+
+class TestBatchTools:
+    @pytest.mark.asyncio
+    async def test_search_batch_embeds_queries_once(self):
+        from robothor.memory.facts import search_facts_batch
+
+        with (
+            patch(
+                "robothor.memory.facts.llm_client.get_embeddings_batch_async",
+                new_callable=AsyncMock,
+                return_value=[[0.1], [0.2]],
+            ) as embed,
+            patch(
+                "robothor.memory.facts.search_facts",
+                new_callable=AsyncMock,
+                side_effect=lambda q, limit, **kw: [{"q": q, "emb": kw["embedding"]}],
+            ),
+        ):
+            results = await search_facts_batch(["a", "b"], limit=3)
+        embed.assert_awaited_once_with(["a", "b"])
+        assert results == [[{"q": "a", "emb": [0.1]}], [{"q": "b", "emb": [0.2]}]]
+
+    @pytest.mark.asyncio
+    async def test_search_batch_concurrency_bounded(self):
+        from robothor.memory.facts import BATCH_SEARCH_CONCURRENCY, search_facts_batch
+
+        running = {"now": 0, "peak": 0}
+
+        async def search(query, limit, **kwargs):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0.01)
+            running["now"] -= 1
+            return [{"q": query}]
+
+        queries = [f"q{i}" for i in range(10)]
+        with (
+            patch(
+                "robothor.memory.facts.llm_client.get_embeddings_batch_async",
+                new_callable=AsyncMock,
+                return_value=[[0.1]] * 10,
+            ),
+            patch("robothor.memory.facts.search_facts", side_effect=search),
+        ):
+            results = await search_facts_batch(queries)
+        assert results == [[{"q": q}] for q in queries]
+        assert running["peak"] == BATCH_SEARCH_CONCURRENCY
+
+    @pytest.mark.asyncio
+    async def test_store_batch_falls_back_and_isolates_failures(self):
+        from robothor.memory.facts import store_memories_batch
+
+        async def extract(content):
+            if content == "bad":
+                raise RuntimeError("llm down")
+            return [CACHED_FACT] if content == "roadmap" else []
+
+        with (
+            patch("robothor.memory.facts.extract_facts", side_effect=extract),
+            patch(
+                "robothor.memory.facts.store_facts_batch",
+                new_callable=AsyncMock,
+                side_effect=lambda facts, *a, **kw: list(range(len(facts))),
+            ) as store,
+        ):
+            results = await store_memories_batch(
+                [("roadmap", "email"), ("hello", "conversation"), ("bad", "conversation")]
+            )
+        assert results[0] == {"ids": [0], "facts_stored": 1}
+        assert results[1] == {"ids": [0], "facts_stored": 1}
+        assert results[2] == {"error": "llm down"}
+        fallback = store.await_args_list[1].args[0][0]
+        assert fallback["fact_text"] == "hello"
+        assert fallback["confidence"] == 0.5